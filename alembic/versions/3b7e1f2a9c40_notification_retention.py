@@ -0,0 +1,43 @@
+"""Notification retention: archive table and read/created_at index
+
+Revision ID: 3b7e1f2a9c40
+Revises: d25904925edc
+Create Date: 2026-10-19 09:12:41.108233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e1f2a9c40'
+down_revision: Union[str, None] = 'd25904925edc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_notifications_read_created', 'notifications',
+        ['read_status', 'created_at'], unique=False
+    )
+    op.create_table('notifications_archive',
+    sa.Column('id', sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('read_status', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=True),
+    sa.Column('archived_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notifications_archive_user_id'), 'notifications_archive', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_notifications_archive_user_id'), table_name='notifications_archive')
+    op.drop_table('notifications_archive')
+    op.drop_index('ix_notifications_read_created', table_name='notifications')
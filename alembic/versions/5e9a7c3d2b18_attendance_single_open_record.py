@@ -0,0 +1,43 @@
+"""Attendance single open record per user
+
+Revision ID: 5e9a7c3d2b18
+Revises: 8c2d4e6f1a93
+Create Date: 2026-10-19 14:05:12.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9a7c3d2b18'
+down_revision: Union[str, None] = '8c2d4e6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Close duplicate open records left by concurrent check-ins, keeping the newest one open
+    op.execute(
+        "UPDATE attendance a "
+        "JOIN (SELECT user_id, MAX(id) AS keep_id FROM attendance "
+        "WHERE check_out IS NULL GROUP BY user_id) o ON o.user_id = a.user_id "
+        "SET a.check_out = a.check_in "
+        "WHERE a.check_out IS NULL AND a.id <> o.keep_id"
+    )
+    op.add_column('attendance', sa.Column(
+        'open_user_id',
+        sa.BigInteger(),
+        sa.Computed('CASE WHEN check_out IS NULL THEN user_id END', persisted=False),
+        nullable=True
+    ))
+    op.create_index('uq_attendance_open_user', 'attendance', ['open_user_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_attendance_open_user', table_name='attendance')
+    op.drop_column('attendance', 'open_user_id')
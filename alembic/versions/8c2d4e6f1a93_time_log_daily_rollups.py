@@ -0,0 +1,51 @@
+"""Time log daily rollups
+
+Revision ID: 8c2d4e6f1a93
+Revises: 3b7e1f2a9c40
+Create Date: 2026-10-19 11:40:05.532911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2d4e6f1a93'
+down_revision: Union[str, None] = '3b7e1f2a9c40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('time_log_daily_rollups',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('task_id', sa.BigInteger(), nullable=False),
+    sa.Column('project_id', sa.BigInteger(), nullable=False),
+    sa.Column('total_minutes', sa.BigInteger(), nullable=False),
+    sa.Column('log_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'user_id', 'task_id')
+    )
+    op.create_index('ix_time_log_rollups_user_day', 'time_log_daily_rollups', ['user_id', 'day'], unique=False)
+    op.create_index('ix_time_log_rollups_task_day', 'time_log_daily_rollups', ['task_id', 'day'], unique=False)
+    op.create_index('ix_time_log_rollups_project_day', 'time_log_daily_rollups', ['project_id', 'day'], unique=False)
+
+    # Backfill from existing time logs
+    op.execute(
+        "INSERT INTO time_log_daily_rollups (day, user_id, task_id, project_id, total_minutes, log_count) "
+        "SELECT DATE(tl.start_time), tl.user_id, tl.task_id, t.project_id, "
+        "SUM(COALESCE(tl.duration, 0)), COUNT(*) "
+        "FROM time_logs tl JOIN tasks t ON t.id = tl.task_id "
+        "GROUP BY DATE(tl.start_time), tl.user_id, tl.task_id, t.project_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_time_log_rollups_project_day', table_name='time_log_daily_rollups')
+    op.drop_index('ix_time_log_rollups_task_day', table_name='time_log_daily_rollups')
+    op.drop_index('ix_time_log_rollups_user_day', table_name='time_log_daily_rollups')
+    op.drop_table('time_log_daily_rollups')
@@ -0,0 +1,44 @@
+"""Time log rollup foreign keys
+
+Revision ID: a4f6b8d0c2e5
+Revises: 5e9a7c3d2b18
+Create Date: 2026-10-19 18:20:41.307265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f6b8d0c2e5'
+down_revision: Union[str, None] = '5e9a7c3d2b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop rollups left behind by users/tasks deleted before the cascade existed
+    op.execute(
+        "DELETE r FROM time_log_daily_rollups r "
+        "LEFT JOIN users u ON u.id = r.user_id "
+        "LEFT JOIN tasks t ON t.id = r.task_id "
+        "WHERE u.id IS NULL OR t.id IS NULL"
+    )
+    # Re-file rollups of tasks that moved project
+    op.execute(
+        "UPDATE time_log_daily_rollups r JOIN tasks t ON t.id = r.task_id "
+        "SET r.project_id = t.project_id WHERE r.project_id <> t.project_id"
+    )
+    op.create_foreign_key('fk_time_log_rollups_user', 'time_log_daily_rollups', 'users',
+                          ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('fk_time_log_rollups_task', 'time_log_daily_rollups', 'tasks',
+                          ['task_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_time_log_rollups_task', 'time_log_daily_rollups', type_='foreignkey')
+    op.drop_constraint('fk_time_log_rollups_user', 'time_log_daily_rollups', type_='foreignkey')
@@ -0,0 +1,45 @@
+"""Notification task id
+
+Revision ID: c7d9e1f3a5b6
+Revises: a4f6b8d0c2e5
+Create Date: 2026-10-19 21:05:12.418903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d9e1f3a5b6'
+down_revision: Union[str, None] = 'a4f6b8d0c2e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notifications', sa.Column('task_id', sa.BigInteger(), nullable=True))
+    op.create_foreign_key('fk_notifications_task', 'notifications', 'tasks',
+                          ['task_id'], ['id'], ondelete='SET NULL')
+    op.create_index('ix_notifications_user_task', 'notifications', ['user_id', 'task_id'])
+    # Attach existing task update notifications to their task, where the name
+    # identifies a single task among the user's assignments; ambiguous rows keep
+    # a NULL task_id and are never compacted
+    op.execute(
+        "UPDATE notifications n JOIN ("
+        "  SELECT a.user_id, t.name, MIN(t.id) AS task_id FROM tasks t "
+        "  JOIN task_assignments a ON a.task_id = t.id "
+        "  GROUP BY a.user_id, t.name HAVING COUNT(*) = 1"
+        ") m ON m.user_id = n.user_id "
+        "AND n.message = CONCAT('Theres an update on task: ', m.name) "
+        "SET n.task_id = m.task_id WHERE n.task_id IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_notifications_task', 'notifications', type_='foreignkey')
+    op.drop_index('ix_notifications_user_task', table_name='notifications')
+    op.drop_column('notifications', 'task_id')
@@ -1,24 +1,38 @@
+from functools import lru_cache
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
 from fastapi.openapi.utils import get_openapi
+from starlette.responses import Response
 from app.views import routers
-from app.middleware import MultiTenantMiddleware, AuthorizationMiddleware 
+from app.middleware import (
+    MultiTenantMiddleware, AuthorizationMiddleware, CompressionMiddleware, QueryStatsMiddleware, MetricsMiddleware,
+    TracingMiddleware
+)
+from app.services.notification_retention import NotificationRetentionWorker
+from app.utils.response_utils import FastJSONResponse
+from app.utils.env_utils import EnvironmentVariable, get_env
+from app.utils.auth_utils import shutdown_hash_pool
+from app.utils.metrics_utils import metrics_directory
+from app.utils.tracing_utils import exporter_from_env
 
-app = FastAPI()
+# The OpenAPI schema and docs pages are served by the routes below
+app = FastAPI(default_response_class=FastJSONResponse, openapi_url=None, docs_url=None, redoc_url=None)
 
 # CORS Configuration
 allowed_origins = ["http://localhost:3000", "https://taskeri-frontend.vercel.app"]
 
 
 
+# Response compression (Brotli/gzip). Middleware added later wraps the earlier
+# ones, so this sits inside the tenant/authorization middleware: those only
+# pass the already compressed bytes along.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=allowed_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["Authorization", "Content-Type", "Accept"],  
-    expose_headers=["*"],
-    max_age=3600,
+    CompressionMiddleware,
+    minimum_size=int(get_env(EnvironmentVariable.COMPRESSION_MINIMUM_SIZE, "1024")),
+    gzip_level=int(get_env(EnvironmentVariable.COMPRESSION_GZIP_LEVEL, "6")),
+    brotli_quality=int(get_env(EnvironmentVariable.COMPRESSION_BROTLI_QUALITY, "4")),
 )
 
 # Define public routes that don't require authentication
@@ -26,6 +40,7 @@ PUBLIC_ROUTES = [
     "/login", 
     "/register", 
     "/docs", 
+    "/redoc", 
     "/openapi.json", 
     "/token", 
     "/tenant-users/"
@@ -59,9 +74,15 @@ ROUTE_PERMISSIONS = {
     r"^/users/?$": {
         "GET": ["read_any_user"],
     },
+    r"^/users/list$": {
+        "GET": ["read_any_user"],
+    },
     r"^/users/create$": {
         "POST": ["create_user"]
     },
+    r"^/users/import$": {
+        "POST": ["create_user"]
+    },
     r"^/users/\d+$": {
         "GET": ["read_user", "read_any_user"],
         "PUT": ["update_user", "update_any_user"],
@@ -99,6 +120,13 @@ ROUTE_PERMISSIONS = {
     r"^/tasks/statistics$": {
         "GET": ["view_statistics"]
     },
+    r"^/tasks/export$": {
+        "GET": ["read_task"]
+    },
+    r"^/tasks/bulk$": {
+        "POST": ["create_task"],
+        "PATCH": ["update_task", "update_any_task"]
+    },
     
     # Permission routes
     r"^/permissions$": {
@@ -137,6 +165,12 @@ ROUTE_PERMISSIONS = {
     r"^/attendance/user/\d+$": {
         "GET": ["read_any_user_attendance"]
     },
+    r"^/attendance/my/export$": {
+        "GET": ["read_own_attendance"]
+    },
+    r"^/attendance/user/\d+/export$": {
+        "GET": ["read_any_user_attendance"]
+    },
 
     #Company Settings routes
     r"^/company-settings/?$": {
@@ -172,6 +206,9 @@ ROUTE_PERMISSIONS = {
     r"^/attachments/task/\d+$": {
         "GET": ["read_attachment"]
     },
+    r"^/attachments/export$": {
+        "GET": ["read_attachment"]
+    },
 
     # Invoice routes
     r"^/invoices/?$": {
@@ -252,6 +289,15 @@ ROUTE_PERMISSIONS = {
     r"^/time-logs/user/\d+/by-time$": {
         "GET": ["read_time_log", "read_user_time_log"]
     },
+    r"^/time-logs/totals$": {
+        "GET": ["read_time_log"]
+    },
+    r"^/time-logs/my/export$": {
+        "GET": ["read_own_time_log"]
+    },
+    r"^/time-logs/user/\d+/export$": {
+        "GET": ["read_time_log", "read_user_time_log"]
+    },
 
     # User Profile routes
     r"^/profiles/?$": {
@@ -285,6 +331,19 @@ ROUTE_PERMISSIONS = {
     },
     r"^/project-users/me/projects$": {
         "GET": ["read_user_projects"]
+    },
+
+    # Report routes
+    r"^/reports/utilization$": {
+        "GET": ["view_statistics"]
+    },
+    r"^/reports/cache$": {
+        "GET": ["view_statistics"]
+    },
+
+    # Notification routes
+    r"^/notifications/retention/stats$": {
+        "GET": ["view_statistics"]
     }
 }
 
@@ -298,9 +357,52 @@ app.add_middleware(
     route_permissions=ROUTE_PERMISSIONS
 )
 
-# Add MultiTenantMiddleware first (handles authentication)
+# Add MultiTenantMiddleware first (handles authentication). Each request's
+# writes are committed once at its end unless DB_UNIT_OF_WORK=false.
+app.add_middleware(
+    MultiTenantMiddleware,
+    unit_of_work=get_env(EnvironmentVariable.DB_UNIT_OF_WORK, "true").lower() != "false",
+)
 
-app.add_middleware(MultiTenantMiddleware)
+# CORS wraps the tenant middleware, so preflight requests are answered before
+# any token check or database work, and error responses carry CORS headers
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=allowed_origins,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+    allow_headers=["Authorization", "Content-Type", "Accept", "If-None-Match"],
+    expose_headers=["*"],
+    max_age=3600,
+)
+
+# Request metrics on /metrics (Prometheus text format), answered before any
+# authentication. Inside QueryStatsMiddleware, whose statement counts it reports.
+app.add_middleware(
+    MetricsMiddleware,
+    router=app.router,
+    max_tenants=int(get_env(EnvironmentVariable.METRICS_MAX_TENANTS, "256")),
+    directory=metrics_directory(),
+    auth_token=get_env(EnvironmentVariable.METRICS_AUTH_TOKEN) or None,
+)
+
+# Counts every SQL statement of the request, including the tenant
+# lookup and the permission checks, and reports it in a Server-Timing header
+app.add_middleware(
+    QueryStatsMiddleware,
+    repeat_threshold=int(get_env(EnvironmentVariable.QUERY_STATS_REPEAT_THRESHOLD, "5")),
+)
+
+# Tracing, when TRACE_EXPORTER is set: wraps everything else, so the root span
+# covers the whole request. Slow requests are exported whatever the sample rate.
+span_exporter = exporter_from_env()
+if span_exporter is not None:
+    app.add_middleware(
+        TracingMiddleware,
+        exporter=span_exporter,
+        sample_rate=float(get_env(EnvironmentVariable.TRACE_SAMPLE_RATE, "0.01")),
+        slow_seconds=int(get_env(EnvironmentVariable.TRACE_SLOW_MS, "500")) / 1000,
+    )
 
 
 # Include routers
@@ -308,3 +410,53 @@ for router in routers:
     app.include_router(router)
 
 
+# OpenAPI schema, rendered once and served as pre-encoded bytes
+@lru_cache(maxsize=1)
+def openapi_body() -> bytes:
+    app.openapi_schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+    return orjson.dumps(app.openapi_schema)
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json() -> Response:
+    return Response(openapi_body(), media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui() -> Response:
+    return get_swagger_ui_html(
+        openapi_url="/openapi.json", title=f"{app.title} - Swagger UI", oauth2_redirect_url="/docs/oauth2-redirect"
+    )
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+async def swagger_ui_redirect() -> Response:
+    return get_swagger_ui_oauth2_redirect_html()
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc() -> Response:
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
+
+@app.on_event("startup")
+def render_openapi_schema():
+    openapi_body()
+
+
+# Background retention job for tenant notifications
+notification_retention_worker = NotificationRetentionWorker()
+
+@app.on_event("startup")
+async def start_notification_retention():
+    # serve.py runs retention in a process of its own rather than in every worker
+    if get_env(EnvironmentVariable.NOTIFICATION_RETENTION_IN_APP, "true").lower() != "false":
+        notification_retention_worker.start()
+
+@app.on_event("shutdown")
+async def stop_notification_retention():
+    await notification_retention_worker.stop()
+
+@app.on_event("shutdown")
+def stop_password_hash_pool():
+    shutdown_hash_pool()
+
+@app.on_event("shutdown")
+def flush_traces():
+    if span_exporter is not None:
+        span_exporter.shutdown()
@@ -15,15 +15,8 @@ class AuthService:
     and extracting user details from the token.
     """
 
-    # Load environment variables from env_utils
-    SECRET_KEY: str = get_env(EnvironmentVariable.SECRET_KEY, "")
-    ALGORITHM: str = get_env(EnvironmentVariable.ALGORITHM, "")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(get_env(EnvironmentVariable.ACCESS_TOKEN_EXPIRE_MINUTES, "30"))
-
-    if not SECRET_KEY or not ALGORITHM or not ACCESS_TOKEN_EXPIRE_MINUTES:
-        raise ValueError("Missing required environment variables: SECRET_KEY, ALGORITHM, or ACCESS_TOKEN_EXPIRE_MINUTES")
-
-    ALGORITHM_SET: set[str] = {ALGORITHM}  # Preload as a set for faster lookup
+    # SECRET_KEY, ALGORITHM and ACCESS_TOKEN_EXPIRE_MINUTES are read from the
+    # environment on first use (see _load_settings), not at import time
 
     @lru_cache()
     def get_oauth2_scheme() -> OAuth2PasswordBearer:
@@ -32,6 +25,32 @@ class AuthService:
 
     oauth2_scheme: OAuth2PasswordBearer = get_oauth2_scheme()
 
+    def __getattr__(self, name: str):
+        # Only called for attributes not set yet: the lazily loaded settings
+        if name in ("SECRET_KEY", "ALGORITHM", "ACCESS_TOKEN_EXPIRE_MINUTES", "ALGORITHM_SET"):
+            self._load_settings()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def _load_settings(self) -> None:
+        """
+        Read the token settings from the environment and cache them on the instance.
+
+        Raises:
+            ValueError: If SECRET_KEY, ALGORITHM or ACCESS_TOKEN_EXPIRE_MINUTES is missing.
+        """
+        secret_key = get_env(EnvironmentVariable.SECRET_KEY, "")
+        algorithm = get_env(EnvironmentVariable.ALGORITHM, "")
+        expire_minutes = int(get_env(EnvironmentVariable.ACCESS_TOKEN_EXPIRE_MINUTES, "30"))
+
+        if not secret_key or not algorithm or not expire_minutes:
+            raise ValueError("Missing required environment variables: SECRET_KEY, ALGORITHM, or ACCESS_TOKEN_EXPIRE_MINUTES")
+
+        self.SECRET_KEY: str = secret_key
+        self.ALGORITHM: str = algorithm
+        self.ACCESS_TOKEN_EXPIRE_MINUTES: int = expire_minutes
+        self.ALGORITHM_SET: set[str] = {algorithm}  # Preload as a set for faster lookup
+
     def create_access_token(self, user_id: int, tenant_id: int, tenant_name: str) -> str:
         """
         Generate a JWT access token containing `user_id`, `tenant_id`, and `tenant_name`.
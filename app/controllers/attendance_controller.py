@@ -6,9 +6,14 @@ from typing import List
 
 from app.repositories.attendance_repository import AttendanceRepository
 from app.models.attendance import Attendance
-from app.utils import get_db
+from app.utils import get_db, hand_off
+from app.utils.export_utils import export_response
+from app.models.dtos.export_dtos import ExportFormat
+from fastapi.responses import StreamingResponse
+from app.utils.tracing_utils import traced
 
 
+@traced
 class AttendanceController:
     """Controller class for handling attendance operations."""
 
@@ -18,7 +23,13 @@ class AttendanceController:
     def create_attendance(self, user_id: int) -> Attendance:
         try:
             now = datetime.utcnow()
-            return self.repository.create_attendance(user_id=user_id, check_in=now)
+            attendance = self.repository.create_attendance(user_id=user_id, check_in=now)
+            if not attendance:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="User is already checked in"
+                )
+            return attendance
         except SQLAlchemyError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -57,4 +68,24 @@ class AttendanceController:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error retrieving attendance: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    def export_user_attendance(self, user_id: int, export_format: ExportFormat) -> StreamingResponse:
+        """
+        Stream all attendance records of a user as CSV or NDJSON.
+
+        Args:
+            user_id (int): ID of the user
+            export_format (ExportFormat): Output format
+
+        Returns:
+            StreamingResponse: Export streamed page by page from the database
+        """
+        rows = self.repository.iter_attendance_for_user(user_id)
+        return export_response(
+            rows,
+            [column.key for column in self.repository.EXPORT_COLUMNS],
+            export_format,
+            filename=f"attendance_user_{user_id}",
+            on_close=hand_off(self.repository.db_session)
+        )
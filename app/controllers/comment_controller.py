@@ -8,8 +8,10 @@ from app.repositories.comment_repository import CommentRepository
 from app.models.comment import Comment
 from app.models.user import User
 from app.utils.db_utils import get_db
+from app.utils.tracing_utils import traced
 
 
+@traced
 class CommentController:
     """Controller class for handling comment-related operations."""
 
@@ -37,9 +39,8 @@ class CommentController:
         """
         try:
             comment = self.repository.create_comment(data)
-            # Fetch the created comment with user information
-            comment_with_user = self.repository.get_comment_by_id(comment.id)
-            return self._map_to_response(*comment_with_user)
+            # The new comment is fully loaded; only its author is looked up
+            return self._map_to_response(comment, self.repository.get_author(comment.user_id))
         except SQLAlchemyError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -138,7 +139,7 @@ class CommentController:
         """
         try:
             # Check if comment exists
-            comment, _ = self.repository.get_comment_by_id(comment_id)
+            comment, user = self.repository.get_comment_by_id(comment_id)
             if not comment:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -152,11 +153,9 @@ class CommentController:
                     detail="You can only edit your own comments"
                 )
 
-            # Update the comment
+            # Update the comment; it stays loaded after the commit
             updated_comment = self.repository.update_comment(comment_id, data)
-            # Fetch the updated comment with user information
-            comment_with_user = self.repository.get_comment_by_id(comment_id)
-            return self._map_to_response(*comment_with_user)
+            return self._map_to_response(updated_comment, user)
         except HTTPException:
             raise
         except SQLAlchemyError as e:
@@ -3,7 +3,9 @@ from app.repositories import CompanyRepository
 from app.models.dtos import CompanyCreate, CompanyUpdate
 from typing import List, Optional
 from app.models.company import Company
+from app.utils.tracing_utils import traced
 
+@traced
 class CompanyController:
     """
     Controller for handling business logic related to companies.
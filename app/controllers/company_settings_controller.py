@@ -3,7 +3,9 @@ from app.repositories.company_settings_repository import CompanySettingsReposito
 from app.models.dtos.company_settings_dtos import CompanySettingsCreate, CompanySettingsUpdate
 from app.models.company_settings import CompanySettings
 from typing import Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class CompanySettingsController:
     """
     Controller for handling business logic around company settings.
@@ -3,8 +3,10 @@ from typing import List, Optional
 from app.repositories.department_repository import DepartmentRepository
 from app.models.dtos.department_dtos import DepartmentCreate, DepartmentUpdate
 from app.models.department import Department
+from app.utils.tracing_utils import traced
 
 
+@traced
 class DepartmentController:
     """
     Controller for handling business logic related to departments.
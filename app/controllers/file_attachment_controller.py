@@ -1,9 +1,17 @@
 from sqlalchemy.orm import Session
 from app.repositories.file_attachment_repository import FileAttachmentRepository
-from app.models.dtos.file_attachment_dtos import FileAttachmentCreate, FileAttachmentUpdate
+from app.models.dtos.file_attachment_dtos import FileAttachmentCreate, FileAttachmentUpdate, FileAttachmentResponse
 from app.models.file_attachment import FileAttachment
-from typing import List, Optional
+from app.utils.db_utils import hand_off
+from app.utils.export_utils import export_response
+from app.utils.projection_utils import read_model
+from app.utils.response_utils import validate_list
+from app.models.dtos.export_dtos import ExportFormat
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, FrozenSet
+from app.utils.tracing_utils import traced
 
+@traced
 class FileAttachmentController:
     """
     Controller for handling file attachment logic.
@@ -18,11 +26,23 @@ class FileAttachmentController:
         """
         return self.repo.create(data)
 
-    def get_all_attachments(self) -> List[FileAttachment]:
+    def get_all_attachments(self, fields: Optional[FrozenSet[str]] = None) -> List[FileAttachmentResponse]:
         """
-        Retrieve all file attachments.
+        Retrieve all file attachments (only `fields` of them when given).
         """
-        return self.repo.get_all()
+        return validate_list(read_model(FileAttachmentResponse, fields), self.repo.get_all(fields))
+
+    def export_attachments(self, export_format: ExportFormat) -> StreamingResponse:
+        """
+        Stream all file attachments as CSV or NDJSON.
+        """
+        return export_response(
+            self.repo.iter_all(),
+            [column.key for column in self.repo.EXPORT_COLUMNS],
+            export_format,
+            filename="attachments",
+            on_close=hand_off(self.repo.db)
+        )
 
     def get_attachment_by_id(self, attachment_id: int) -> Optional[FileAttachment]:
         """
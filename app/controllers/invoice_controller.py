@@ -3,7 +3,9 @@ from app.repositories.invoice_repository import InvoiceRepository
 from app.models.dtos.invoice_dtos import InvoiceCreate, InvoiceUpdate
 from app.models.invoice import Invoice
 from typing import List, Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class InvoiceController:
     """
     Handles business logic related to invoice processing.
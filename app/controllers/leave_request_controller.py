@@ -7,8 +7,10 @@ from app.repositories.leave_request_repository import LeaveRequestRepository
 from app.models.leave_request import LeaveRequest
 from app.models.dtos.leave_request_dtos import LeaveRequestCreate, LeaveRequestResponse, LeaveRequestListResponse
 from app.utils import get_db
+from app.utils.tracing_utils import traced
 
 
+@traced
 class LeaveRequestController:
     """Controller class for handling leave request operations."""
 
@@ -5,7 +5,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 import re
 from app.utils.env_utils import EnvironmentVariable, get_env
+from app.utils.tracing_utils import traced
 
+@traced
 class LoginController:
     """
     Controller class that contains the business logic for user authentication.
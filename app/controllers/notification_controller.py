@@ -4,8 +4,11 @@ from sqlalchemy.exc import SQLAlchemyError
 from typing import List
 from app.repositories.notification_repository import NotificationRepository
 from app.utils import get_db
-from app.models.dtos.notification_dtos import NotificationCreate, NotificationResponse
+from app.models.dtos.notification_dtos import NotificationCreate, NotificationResponse, NotificationRetentionStats
+from app.services.notification_retention import retention_metrics
+from app.utils.tracing_utils import traced
 
+@traced
 class NotificationController:
     """Controller class for handling notification operations."""
 
@@ -111,3 +114,18 @@ class NotificationController:
         except SQLAlchemyError as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                                 detail=f"Database error: {str(e)}")
+
+    def get_retention_stats(self, tenant_schema: str) -> NotificationRetentionStats:
+        """
+        Retrieve notification retention counters for a tenant.
+
+        Args:
+            tenant_schema (str): Full tenant schema name.
+
+        Returns:
+            NotificationRetentionStats: Rows pruned and compacted by the retention job.
+        """
+        stats = retention_metrics.get(tenant_schema)
+        if not stats:
+            return NotificationRetentionStats(tenant_schema=tenant_schema)
+        return NotificationRetentionStats(**stats)
@@ -4,7 +4,9 @@ from app.repositories import PermissionRepository
 from app.utils import get_db
 from typing import List
 from app.models.dtos import PermissionCreate, PermissionUpdate, PermissionResponse
+from app.utils.tracing_utils import traced
 
+@traced
 class PermissionController:
     """Controller class for handling permission operations."""
 
@@ -3,11 +3,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.repositories.project_repository import ProjectRepository
 from app.utils import get_db
+from app.utils.response_utils import validate_list
+from app.utils.projection_utils import read_model
 from app.models.user import User
 from app.models.dtos.project_dtos import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectStatistics
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet
+from app.utils.tracing_utils import traced
 
 
+@traced
 class ProjectController:
     """Controller class for handling project operations."""
 
@@ -44,7 +48,7 @@ class ProjectController:
                 status=project_create.status or "Not Started",
                 assigned_user_ids=project_create.assigned_user_ids
             )
-            return ProjectResponse.from_orm(project)
+            return ProjectResponse.model_validate(project)
         except SQLAlchemyError as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                                 detail=f"Database error: {str(e)}")
@@ -66,15 +70,18 @@ class ProjectController:
             project = self.repository.get_project_by_id(project_id)
             if not project:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-            return ProjectResponse.from_orm(project)
+            return ProjectResponse.model_validate(project)
         except SQLAlchemyError as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                                 detail=f"Database error: {str(e)}")
 
-    def get_all_projects(self) -> List[ProjectResponse]:
+    def get_all_projects(self, fields: Optional[FrozenSet[str]] = None) -> List[ProjectResponse]:
         """
         Retrieve all projects in the system.
 
+        Args:
+            fields (Optional[FrozenSet[str]]): Only load these response fields (partial DTOs).
+
         Returns:
             List[ProjectResponse]: List of all projects.
 
@@ -82,8 +89,8 @@ class ProjectController:
             HTTPException: If a database error occurs.
         """
         try:
-            projects = self.repository.get_all_projects()
-            return [ProjectResponse.from_orm(project) for project in projects]
+            projects = self.repository.get_all_projects(fields)
+            return validate_list(read_model(ProjectResponse, fields), projects)
         except SQLAlchemyError as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                                 detail=f"Database error: {str(e)}")
@@ -114,7 +121,7 @@ class ProjectController:
             )
             if not project:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-            return ProjectResponse.from_orm(project)
+            return ProjectResponse.model_validate(project)
         except SQLAlchemyError as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                                 detail=f"Database error: {str(e)}")
@@ -0,0 +1,178 @@
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import date, datetime, time
+from typing import Optional
+import numpy as np
+
+from app.repositories.report_repository import ReportRepository
+from app.services.utilization import period_edges, compute_utilization, to_epoch_seconds
+from app.utils.cache_utils import reference_cache
+from app.models.dtos.report_dtos import (
+    ReportPeriod, ReportGroupBy, UtilizationRow, UtilizationReportResponse, ReferenceCacheStats
+)
+from app.utils.tracing_utils import traced
+
+# Longest range a single report may cover
+MAX_REPORT_DAYS = 366 * 2
+
+
+@traced
+class ReportController:
+    """Controller class for timesheet and utilization reports."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the ReportController.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+        """
+        self.repository = ReportRepository(db_session)
+
+    def get_utilization_report(self,
+                               period: ReportPeriod,
+                               group_by: ReportGroupBy,
+                               start: date,
+                               end: date,
+                               team_id: Optional[int] = None,
+                               department_id: Optional[int] = None,
+                               company_id: Optional[int] = None) -> UtilizationReportResponse:
+        """
+        Build a weekly or monthly utilization report per user, team or department.
+
+        Logged minutes (time logs), attended minutes (closed attendance records) and
+        expected minutes (working days x `work_hours_per_day`) are computed with
+        vectorized interval arithmetic over column arrays.
+
+        Args:
+            period (ReportPeriod): Week or month buckets.
+            group_by (ReportGroupBy): Aggregate per user, team or department.
+            start (date): First day of the report.
+            end (date): Last day of the report.
+            team_id (Optional[int]): Only include users of this team.
+            department_id (Optional[int]): Only include users of this department.
+            company_id (Optional[int]): Company whose settings define the work day.
+
+        Returns:
+            UtilizationReportResponse: One row per group and period.
+
+        Raises:
+            HTTPException: If the date range is invalid or a database error occurs.
+        """
+        if end < start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_date must not be before start_date"
+            )
+        if (end - start).days > MAX_REPORT_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Reports can cover at most {MAX_REPORT_DAYS} days"
+            )
+
+        try:
+            edge_dates = period_edges(start, end, period.value)
+            range_start = datetime.combine(edge_dates[0], time.min)
+            range_end = datetime.combine(edge_dates[-1], time.min)
+
+            users = self.repository.get_users(team_id=team_id, department_id=department_id)
+            logs = self.repository.get_time_log_intervals(range_start, range_end)
+            attendance = self.repository.get_attendance_intervals(range_start, range_end)
+            work_hours = self.repository.get_work_hours_per_day(company_id)
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+        group_keys = {
+            ReportGroupBy.USER: users["id"],
+            ReportGroupBy.TEAM: users["team_id"],
+            ReportGroupBy.DEPARTMENT: users["department_id"],
+        }[group_by]
+        valid = group_keys >= 0
+        group_ids = np.unique(group_keys[valid])
+        user_group = np.full(group_keys.size, -1, dtype=np.int64)
+        user_group[valid] = np.searchsorted(group_ids, group_keys[valid])
+
+        log_user, log_mask = self._user_index(users["id"], logs["user_id"])
+        attendance_user, attendance_mask = self._user_index(users["id"], attendance["user_id"])
+        edges = to_epoch_seconds(edge_dates).astype(np.int64)
+
+        totals = compute_utilization(
+            user_group=user_group,
+            group_count=group_ids.size,
+            log_user=log_user,
+            log_start=logs["start"][log_mask],
+            log_end=logs["end"][log_mask],
+            attendance_user=attendance_user,
+            attendance_start=attendance["start"][attendance_mask],
+            attendance_end=attendance["end"][attendance_mask],
+            edges=edges,
+            work_minutes_per_day=work_hours * 60
+        )
+
+        effective = totals["logged"] - totals["overlap"]
+        utilization = self._ratio(effective, totals["expected"])
+        attendance_ratio = self._ratio(totals["attended"], totals["expected"])
+        logged_vs_attended = self._ratio(effective, totals["attended"])
+
+        rows = [
+            UtilizationRow(
+                group_id=int(group_ids[g]),
+                period_start=edge_dates[b],
+                period_end=edge_dates[b + 1],
+                logged_minutes=round(float(totals["logged"][g, b]), 2),
+                overlap_minutes=round(float(totals["overlap"][g, b]), 2),
+                overlapping_logs=int(totals["overlapping_logs"][g, b]),
+                attended_minutes=round(float(totals["attended"][g, b]), 2),
+                expected_minutes=float(totals["expected"][g, b]),
+                utilization=utilization[g][b],
+                attendance_ratio=attendance_ratio[g][b],
+                logged_vs_attended=logged_vs_attended[g][b]
+            )
+            for g in range(group_ids.size)
+            for b in range(len(edge_dates) - 1)
+        ]
+
+        return UtilizationReportResponse(
+            period=period,
+            group_by=group_by,
+            start_date=start,
+            end_date=end,
+            work_hours_per_day=work_hours,
+            rows=rows
+        )
+
+    def get_cache_stats(self, tenant_schema: str) -> ReferenceCacheStats:
+        """
+        Retrieve reference cache counters for a tenant.
+
+        Args:
+            tenant_schema (str): Tenant schema name.
+
+        Returns:
+            ReferenceCacheStats: Hits, misses and invalidations, in total and per namespace.
+        """
+        return ReferenceCacheStats(**reference_cache.stats(tenant_schema))
+
+    @staticmethod
+    def _user_index(user_ids: np.ndarray, values: np.ndarray):
+        """Map user ids to positions in the sorted `user_ids`; returns (positions, mask of known ids)."""
+        if user_ids.size == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(values.size, dtype=bool)
+        position = np.clip(np.searchsorted(user_ids, values), 0, user_ids.size - 1)
+        mask = user_ids[position] == values
+        return position[mask], mask
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> list:
+        """Element-wise ratio rounded to 4 places, None where the denominator is 0."""
+        safe = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+        rounded = np.round(safe, 4).tolist()
+        zero = (denominator <= 0).tolist()
+        return [
+            [None if is_zero else value for value, is_zero in zip(row, zero_row)]
+            for row, zero_row in zip(rounded, zero)
+        ]
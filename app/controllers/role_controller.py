@@ -4,7 +4,9 @@ from app.repositories import RoleRepository
 from app.utils import get_db
 from typing import List
 from app.models.dtos import RoleCreate, RoleUpdate, RoleResponse
+from app.utils.tracing_utils import traced
 
+@traced
 class RoleController:
     """Controller class for handling role operations."""
 
@@ -4,7 +4,9 @@ from app.models.dtos.role_permission_dto import RolePermissionCreate
 from app.models.role_permission import RolePermission
 from app.models.permission import Permission  # if not already imported
 from typing import List
+from app.utils.tracing_utils import traced
 
+@traced
 class RolePermissionController:
     """
     Controller for managing role-permission assignments.
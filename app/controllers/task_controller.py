@@ -2,17 +2,29 @@ from fastapi import HTTPException, Depends, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.repositories import TaskRepository
-from app.utils import get_db
+from app.utils import get_db, hand_off
 from app.models.dtos import (
     TaskCreate, TaskUpdate, TaskResponse, TaskDetailResponse, 
     TaskListResponse, TaskFilterParams, TaskStatistics
 )
-from typing import List, Dict, Any, Optional
+from app.models.dtos.task_dtos import (
+    TaskBulkCreateRequest, TaskBulkPatchRequest, TaskBulkItemResult, TaskBulkResponse
+)
+from app.models.dtos.export_dtos import ExportFormat
+from app.models.project import Project
+from app.models.user import User
+from app.utils.export_utils import export_response
+from app.utils.response_utils import validate_list
+from app.utils.projection_utils import read_model
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional, FrozenSet
 from datetime import date, datetime
 import logging
+from app.utils.tracing_utils import traced
 
 logger = logging.getLogger(__name__)
 
+@traced
 class TaskController:
     """Controller class for handling task operations."""
 
@@ -50,11 +62,12 @@ class TaskController:
             )
             
             
+            # The assignments were just written; no need to read them back
             assigned_users = None
             if task_create.assigned_user_ids:
-                assigned_users = self.repository.get_task_assignments(task.id)
+                assigned_users = sorted(set(task_create.assigned_user_ids))
                 
-            response = TaskResponse.from_orm(task)
+            response = TaskResponse.model_validate(task)
             response.assigned_users = assigned_users
             
             return response
@@ -137,16 +150,13 @@ class TaskController:
             HTTPException: If task not found or database error
         """
         try:
-            task = self.repository.get_task_by_id(task_id)
-            if not task:
+            task_details = self.repository.get_task_with_details(task_id)
+            if not task_details:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Task not found"
                 )
-            
-           
-            task_details = self.repository.get_task_with_details(task_id)
-            
+
             return task_details
             
         except HTTPException:
@@ -157,12 +167,13 @@ class TaskController:
                 detail=f"Database error: {str(e)}"
             )
             
-    def get_tasks_by_project(self, project_id: int) -> List[TaskResponse]:
+    def get_tasks_by_project(self, project_id: int, fields: Optional[FrozenSet[str]] = None) -> List[TaskResponse]:
         """
         Get all tasks for a specific project.
         
         Args:
             project_id (int): Project ID
+            fields (Optional[FrozenSet[str]]): Only load these response fields (partial DTOs)
             
         Returns:
             List[TaskResponse]: List of tasks in the project
@@ -171,8 +182,8 @@ class TaskController:
             HTTPException: If database error occurs
         """
         try:
-            tasks = self.repository.get_tasks_by_project(project_id)
-            return [TaskResponse.from_orm(task) for task in tasks]
+            tasks = self.repository.get_tasks_by_project(project_id, fields)
+            return validate_list(read_model(TaskResponse, fields), tasks)
         except SQLAlchemyError as e:
             
             raise HTTPException(
@@ -180,6 +191,27 @@ class TaskController:
                 detail=f"Database error: {str(e)}"
             )
             
+    def export_tasks(self, export_format: ExportFormat, project_id: Optional[int] = None) -> StreamingResponse:
+        """
+        Stream tasks as CSV or NDJSON, page by page from the database.
+        
+        Args:
+            export_format (ExportFormat): Output format
+            project_id (Optional[int]): Only export tasks of this project
+            
+        Returns:
+            StreamingResponse: Streamed export
+        """
+        rows = self.repository.iter_tasks(project_id=project_id)
+        filename = f"tasks_project_{project_id}" if project_id else "tasks"
+        return export_response(
+            rows,
+            [column.key for column in self.repository.EXPORT_COLUMNS],
+            export_format,
+            filename=filename,
+            on_close=hand_off(self.repository.db_session)
+        )
+            
     def get_tasks_by_user(self, user_id: int) -> List[TaskResponse]:
         """
         Get all tasks assigned to a specific user.
@@ -195,7 +227,7 @@ class TaskController:
         """
         try:
             tasks = self.repository.get_tasks_by_user(user_id)
-            return [TaskResponse.from_orm(task) for task in tasks]
+            return validate_list(TaskResponse, tasks)
         except SQLAlchemyError as e:
            
             raise HTTPException(
@@ -235,7 +267,7 @@ class TaskController:
             )
             
             return TaskListResponse(
-                items=[TaskResponse.from_orm(task) for task in tasks],
+                items=validate_list(TaskResponse, tasks),
                 total=total,
                 page=page,
                 page_size=page_size
@@ -283,11 +315,15 @@ class TaskController:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Task not found"
                 )
-                
-            
-            assigned_users = self.repository.get_task_assignments(task_id)
-            
-            response = TaskResponse.from_orm(task)
+
+
+            # Replaced assignments are known; otherwise they are unchanged and read once
+            if task_update.assigned_user_ids is not None:
+                assigned_users = sorted(set(task_update.assigned_user_ids))
+            else:
+                assigned_users = self.repository.get_task_assignments(task_id)
+
+            response = TaskResponse.model_validate(task)
             response.assigned_users = assigned_users
             
             return response
@@ -367,4 +403,138 @@ class TaskController:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    def _bulk_response(self, results: List[TaskBulkItemResult], succeeded_ids: List[int]) -> TaskBulkResponse:
+        """Attach the current state of the succeeded tasks (two queries) and count outcomes."""
+        rows = self.repository.get_task_rows(succeeded_ids)
+        assignments = self.repository.get_assignments_for_tasks(succeeded_ids)
+        for result in results:
+            if result.id in rows and result.error is None:
+                result.task = TaskResponse.model_validate(rows[result.id])
+                result.task.assigned_users = assignments.get(result.id, [])
+        succeeded = sum(1 for result in results if result.error is None)
+        return TaskBulkResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+    def bulk_create_tasks(self, request: TaskBulkCreateRequest) -> TaskBulkResponse:
+        """
+        Create many tasks in one transaction.
+
+        Items referencing a missing project or user are reported as failed and
+        skipped; the others are created together.
+
+        Args:
+            request (TaskBulkCreateRequest): Tasks to create.
+
+        Returns:
+            TaskBulkResponse: Result per item, in request order.
+
+        Raises:
+            HTTPException: If a database error occurs.
+        """
+        try:
+            items = request.items
+            projects = self.repository.get_existing_ids(Project, {item.project_id for item in items})
+            users = self.repository.get_existing_ids(
+                User, {user_id for item in items for user_id in (item.assigned_user_ids or [])}
+            )
+
+            results: List[TaskBulkItemResult] = []
+            to_create = []
+            for index, item in enumerate(items):
+                missing_users = sorted(set(item.assigned_user_ids or []) - users)
+                if item.project_id not in projects:
+                    results.append(TaskBulkItemResult(index=index, outcome="failed", error="Project not found"))
+                elif missing_users:
+                    results.append(TaskBulkItemResult(
+                        index=index, outcome="failed", error=f"Users not found: {missing_users}"
+                    ))
+                else:
+                    result = TaskBulkItemResult(index=index, outcome="created")
+                    results.append(result)
+                    to_create.append((result, {
+                        "project_id": item.project_id,
+                        "name": item.name,
+                        "description": item.description,
+                        "priority": item.priority.value,
+                        "status": item.status.value,
+                        "due_date": item.due_date,
+                        "assigned_user_ids": item.assigned_user_ids,
+                    }))
+
+            task_ids = self.repository.bulk_create_tasks([data for _, data in to_create]) if to_create else []
+            for (result, _), task_id in zip(to_create, task_ids):
+                result.id = task_id
+
+            return self._bulk_response(results, task_ids)
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+    def bulk_patch_tasks(self, request: TaskBulkPatchRequest) -> TaskBulkResponse:
+        """
+        Change status, priority, due date and assignees of many tasks in one transaction.
+
+        Items for missing tasks, repeated task IDs or unknown users are reported as
+        failed and skipped; the others are applied together.
+
+        Args:
+            request (TaskBulkPatchRequest): Changes per task.
+
+        Returns:
+            TaskBulkResponse: Result per item, in request order.
+
+        Raises:
+            HTTPException: If a database error occurs.
+        """
+        try:
+            items = request.items
+            task_names = self.repository.get_task_names({item.id for item in items})
+            users = self.repository.get_existing_ids(
+                User, {user_id for item in items for user_id in (item.assigned_user_ids or [])}
+            )
+
+            results: List[TaskBulkItemResult] = []
+            field_updates: Dict[int, Dict[str, Any]] = {}
+            assignments: Dict[int, List[int]] = {}
+            seen = set()
+            for index, item in enumerate(items):
+                missing_users = sorted(set(item.assigned_user_ids or []) - users)
+                error = None
+                if item.id not in task_names:
+                    error = "Task not found"
+                elif item.id in seen:
+                    error = "Task appears more than once in the request"
+                elif missing_users:
+                    error = f"Users not found: {missing_users}"
+                seen.add(item.id)
+                if error:
+                    outcome = "not_found" if error == "Task not found" else "failed"
+                    results.append(TaskBulkItemResult(index=index, id=item.id, outcome=outcome, error=error))
+                    continue
+
+                values = item.model_dump(include={"status", "priority", "due_date"}, exclude_unset=True)
+                # status/priority can't be cleared; due_date can, with an explicit null
+                values = {
+                    key: value.value if hasattr(value, "value") else value
+                    for key, value in values.items()
+                    if value is not None or key == "due_date"
+                }
+                if values:
+                    field_updates[item.id] = values
+                if item.assigned_user_ids is not None:
+                    assignments[item.id] = list(dict.fromkeys(item.assigned_user_ids))
+                results.append(TaskBulkItemResult(index=index, id=item.id, outcome="updated"))
+
+            if field_updates or assignments:
+                self.repository.bulk_update_tasks(field_updates, assignments, task_names)
+
+            updated_ids = [result.id for result in results if result.error is None]
+            return self._bulk_response(results, updated_ids)
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
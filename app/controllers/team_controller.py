@@ -7,8 +7,10 @@ from app.utils import get_db
 from app.models.dtos.team_dtos import TeamCreate, TeamUpdate, TeamResponse, TeamStatistics
 from app.models.dtos.user_dtos import UserResponse
 from typing import List, Dict
+from app.utils.tracing_utils import traced
 
 
+@traced
 class TeamController:
     """Controller class for handling team operations."""
 
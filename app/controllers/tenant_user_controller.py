@@ -10,7 +10,9 @@ from app.services.tenant_provisioning import create_new_tenant
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.utils import hash_password
+from app.utils.tracing_utils import traced
 
+@traced
 class TenantUserController:
     def __init__(self, db: Session):
         self.repo = TenantUserRepository(db)
@@ -2,14 +2,22 @@ from typing import Optional, List
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime
+from datetime import datetime, date
 
-from app.models.dtos.timelog_dtos import TimeLogCreate, TimeLogUpdate, TimeLogResponse
+from app.models.dtos.timelog_dtos import (
+    TimeLogCreate, TimeLogUpdate, TimeLogResponse,
+    TimeLogTotal, TimeLogTotalsGroupBy, TimeLogTotalsResponse
+)
 from app.repositories.timelog_repository import TimeLogRepository
 from app.models.time_log import TimeLog
-from app.utils.db_utils import get_db
+from app.utils.db_utils import get_db, hand_off
+from app.utils.export_utils import export_response
+from app.models.dtos.export_dtos import ExportFormat
+from fastapi.responses import StreamingResponse
+from app.utils.tracing_utils import traced
 
 
+@traced
 class TimeLogController:
     """Controller class for handling time log-related operations."""
 
@@ -123,3 +131,46 @@ class TimeLogController:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error: {str(e)}"
             )
+
+    def export_time_logs_by_user(self, user_id: int, export_format: ExportFormat) -> StreamingResponse:
+        """Stream all time logs of a user as CSV or NDJSON without loading them into memory."""
+        rows = self.repository.iter_time_logs_by_user(user_id)
+        return export_response(
+            rows,
+            [column.key for column in self.repository.EXPORT_COLUMNS],
+            export_format,
+            filename=f"time_logs_user_{user_id}",
+            on_close=hand_off(self.repository.db_session)
+        )
+
+    def get_totals(self,
+                   group_by: TimeLogTotalsGroupBy,
+                   start: date,
+                   end: date,
+                   user_id: Optional[int] = None,
+                   task_id: Optional[int] = None,
+                   project_id: Optional[int] = None) -> TimeLogTotalsResponse:
+        """Get logged-minute totals over a date range, read from the daily rollups."""
+        if end < start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_date must not be before start_date"
+            )
+        try:
+            rows = self.repository.rollups.get_totals(
+                group_by.value, start, end, user_id=user_id, task_id=task_id, project_id=project_id
+            )
+            return TimeLogTotalsResponse(
+                group_by=group_by,
+                start_date=start,
+                end_date=end,
+                items=[
+                    TimeLogTotal(key=key, total_minutes=int(minutes or 0), log_count=int(count or 0))
+                    for key, minutes, count in rows
+                ]
+            )
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
@@ -1,17 +1,37 @@
 from fastapi import HTTPException, Depends, status
 from sqlalchemy.orm import Session
 from app.repositories import UserRepository
-from app.utils import get_db, get_global_db
-from app.models.dtos import UserCreate, UserUpdate, UserResponse, TenantUserCreate
+from app.utils import get_db, get_global_db, commit_now
+from app.models.dtos import UserCreate, UserUpdate, UserResponse, UserListResponse, TenantUserCreate
+from app.models.dtos.user_dtos import UserImportRow, UserImportRowResult, UserImportResponse
+from app.models.role import Role
+from app.models.team import Team
+from app.models.department import Department
 from typing import List, Optional
 from app.repositories.tenant_user_repository import TenantUserRepository
 from app.models.dtos.role_dtos import RoleResponse
-from app.utils import hash_password
+from app.utils import hash_password, hash_passwords
+from app.utils.env_utils import EnvironmentVariable, get_env
 from fastapi import BackgroundTasks
-from app.utils.email_utils import send_account_creation_email
+from app.utils.email_utils import send_account_creation_email, send_account_creation_emails_async
+from app.utils.user_import_utils import parse_user_import
+from app.utils.response_utils import validate_list
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 import asyncio
+import logging
+import secrets
+from app.utils.tracing_utils import traced
 
+logger = logging.getLogger(__name__)
 
+# Users inserted per tenant/global transaction during a bulk import
+IMPORT_BATCH_SIZE = 500
+# Largest accepted bulk import
+MAX_IMPORT_ROWS = 10000
+
+
+@traced
 class UserController:
     """Controller class for handling user operations."""
 
@@ -46,6 +66,9 @@ class UserController:
                     detail="Default 'Employee' role not found. Unable to assign default role."
                 )
 
+        # The tenant user must be durable before it is registered globally and emailed
+        commit_now(self.repository.db_session)
+
         # Global DB for tenant linkage
         schema_name = current_user["tenant_name"]
         with get_global_db() as global_db:
@@ -67,7 +90,7 @@ class UserController:
         roles = self.repository.get_user_roles(user.id)
         role_id = roles[0].id if roles else None
 
-        response = UserResponse.from_orm(user)
+        response = UserResponse.model_validate(user)
         response.role_id = role_id
         return response
 
@@ -80,7 +103,7 @@ class UserController:
         roles = self.repository.get_user_roles(user.id)
         role_id = roles[0].id if roles else None
 
-        response = UserResponse.from_orm(user)
+        response = UserResponse.model_validate(user)
         response.role_id = role_id
         return response
 
@@ -99,7 +122,7 @@ class UserController:
         roles = self.repository.get_user_roles(user.id)
         role_id = roles[0].id if roles else None
 
-        response = UserResponse.from_orm(user)
+        response = UserResponse.model_validate(user)
         response.role_id = role_id
         return response
 
@@ -131,7 +154,7 @@ class UserController:
             raise HTTPException(status_code=404, detail="User not found")
 
         roles = self.repository.get_user_roles(user_id)
-        return [RoleResponse.from_orm(role) for role in roles]
+        return validate_list(RoleResponse, roles)
 
     def get_user_by_email(self, email: str) -> UserResponse:
         """Get a user by email."""
@@ -142,21 +165,206 @@ class UserController:
         roles = self.repository.get_user_roles(user.id)
         role_id = roles[0].id if roles else None
 
-        response = UserResponse.from_orm(user)
+        response = UserResponse.model_validate(user)
         response.role_id = role_id
         return response
 
     def get_all_users(self) -> List[UserResponse]:
         """Retrieve all users in the system."""
-        users = self.repository.get_all_users()
-        responses = []
+        rows, _ = self.repository.list_users()
+        return validate_list(UserResponse, rows)
+
+    def list_users(self,
+                   page: int = 1,
+                   page_size: int = 50,
+                   team_id: Optional[int] = None,
+                   department_id: Optional[int] = None,
+                   role_id: Optional[int] = None) -> UserListResponse:
+        """
+        Retrieve a page of users with their primary role.
+
+        Args:
+            page (int): Page number (1-based).
+            page_size (int): Number of users per page.
+            team_id (Optional[int]): Only users of this team.
+            department_id (Optional[int]): Only users of this department.
+            role_id (Optional[int]): Only users holding this role.
+
+        Returns:
+            UserListResponse: Paginated users.
+        """
+        rows, total = self.repository.list_users(
+            team_id=team_id,
+            department_id=department_id,
+            role_id=role_id,
+            page=page,
+            page_size=page_size
+        )
+        return UserListResponse(
+            items=validate_list(UserResponse, rows),
+            total=total,
+            page=page,
+            page_size=page_size
+        )
+
+    def parse_import(self, body: bytes, content_type: str) -> List[dict]:
+        """Parse a CSV or JSON import payload, rejecting malformed or oversized ones."""
+        try:
+            rows = parse_user_import(body, content_type)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if len(rows) > MAX_IMPORT_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Import is limited to {MAX_IMPORT_ROWS} users"
+            )
+        return rows
+
+    def import_users(self, rows: List[dict], current_user: dict,
+                     background_tasks: BackgroundTasks) -> UserImportResponse:
+        """
+        Create many users at once and report the outcome of every row.
+
+        Rows are validated up front (format, duplicates, existing accounts, unknown
+        role/team/department), passwords are hashed in parallel worker processes and
+        valid users are inserted in batches: users and `user_roles` in the tenant,
+        `tenant_users` in the global database. Welcome emails are queued as a
+        background task once the response is sent.
+
+        Args:
+            rows (List[dict]): Parsed import rows.
+            current_user (dict): The importing user (provides the tenant).
+            background_tasks (BackgroundTasks): Queue for the welcome emails.
+
+        Returns:
+            UserImportResponse: Totals and a result per row.
+        """
+        results: List[Optional[UserImportRowResult]] = [None] * len(rows)
+
+        def fail(index: int, email: Optional[str], error: str):
+            results[index] = UserImportRowResult(row=index + 1, email=email, status="failed", error=error)
+
+        # Field validation and duplicates within the file
+        valid = {}
+        seen = set()
+        for index, raw in enumerate(rows):
+            try:
+                row = UserImportRow(**raw)
+            except ValidationError as e:
+                error = e.errors()[0]
+                email = raw.get("email")
+                fail(index, str(email) if email is not None else None,
+                     f"{'.'.join(map(str, error['loc']))}: {error['msg']}")
+                continue
+            key = row.email.lower()
+            if key in seen:
+                fail(index, row.email, "Duplicate email in import")
+                continue
+            seen.add(key)
+            valid[index] = row
+
+        # Existing accounts and references, one query each
+        emails = [row.email for row in valid.values()]
+        taken = {email.lower() for email in self.repository.get_existing_emails(emails)}
+        with get_global_db() as global_db:
+            taken |= {email.lower() for email in TenantUserRepository(global_db).get_existing_emails(emails)}
 
-        for user in users:
-            roles = self.repository.get_user_roles(user.id)
-            role_id = roles[0].id if roles else None
+        default_role_id = None
+        if any(row.role_id is None for row in valid.values()):
+            employee_role = self.repository.get_role_by_name("Employee")
+            if not employee_role:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Default 'Employee' role not found. Unable to assign default role."
+                )
+            default_role_id = employee_role.id
+
+        references = {
+            "role": (Role, "role_id"),
+            "team": (Team, "team_id"),
+            "department": (Department, "department_id"),
+        }
+        existing = {
+            name: self.repository.get_existing_ids(
+                model, {getattr(row, field) for row in valid.values() if getattr(row, field) is not None}
+            )
+            for name, (model, field) in references.items()
+        }
 
-            response = UserResponse.from_orm(user)
-            response.role_id = role_id
-            responses.append(response)
+        for index, row in list(valid.items()):
+            error = None
+            if row.email.lower() in taken:
+                error = "Email already registered"
+            else:
+                for name, (_, field) in references.items():
+                    value = getattr(row, field)
+                    if value is not None and value not in existing[name]:
+                        error = f"Unknown {name}: {value}"
+                        break
+            if error:
+                fail(index, row.email, error)
+                del valid[index]
 
-        return responses
+        # Hash all passwords in parallel, generating missing ones
+        indexes = list(valid)
+        passwords = [valid[i].password or secrets.token_urlsafe(12) for i in indexes]
+        workers = get_env(EnvironmentVariable.USER_IMPORT_HASH_WORKERS)
+        hashes = hash_passwords(passwords, max_workers=int(workers) if workers else None)
+
+        recipients = []
+        schema_name = current_user["tenant_name"]
+        with get_global_db() as global_db:
+            tenant_user_repo = TenantUserRepository(global_db)
+            for start in range(0, len(indexes), IMPORT_BATCH_SIZE):
+                batch = indexes[start:start + IMPORT_BATCH_SIZE]
+                users = [
+                    {
+                        "email": valid[i].email,
+                        "password_hash": hashes[start + offset],
+                        "first_name": valid[i].first_name,
+                        "last_name": valid[i].last_name,
+                        "department_id": valid[i].department_id,
+                        "team_id": valid[i].team_id,
+                    }
+                    for offset, i in enumerate(batch)
+                ]
+                emails = [user["email"] for user in users]
+                registered = False
+                try:
+                    ids = self.repository.bulk_create_users(
+                        users, [valid[i].role_id or default_role_id for i in batch]
+                    )
+                    # Tenant rows stay uncommitted until the global registration succeeded
+                    tenant_user_repo.bulk_create(emails, schema_name)
+                    registered = True
+                    # Each batch is committed on its own, whatever the request's unit of work
+                    commit_now(self.repository.db_session)
+                except SQLAlchemyError as e:
+                    self.repository.db_session.rollback()
+                    logger.error("User import batch starting at row %d failed: %s", batch[0] + 1, e)
+                    if registered:
+                        # The global registration is already committed; undo it so the emails can be imported again
+                        try:
+                            tenant_user_repo.bulk_delete(emails, schema_name)
+                        except SQLAlchemyError as cleanup_error:
+                            logger.error("Could not unregister emails of the failed batch: %s", cleanup_error)
+                    for i in batch:
+                        fail(i, valid[i].email, "Database error while creating user")
+                    continue
+
+                for offset, i in enumerate(batch):
+                    results[i] = UserImportRowResult(
+                        row=i + 1, email=valid[i].email, status="created", user_id=ids.get(valid[i].email)
+                    )
+                    recipients.append((valid[i].email, valid[i].first_name, passwords[start + offset]))
+
+        if recipients:
+            background_tasks.add_task(send_account_creation_emails_async, recipients)
+
+        created = len(recipients)
+        return UserImportResponse(
+            total=len(rows),
+            created=created,
+            failed=len(rows) - created,
+            results=results
+        )
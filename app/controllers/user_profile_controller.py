@@ -3,7 +3,9 @@ from typing import Optional
 from app.repositories.user_profile_repository import UserProfileRepository
 from app.models.dtos.user_profile_dtos import UserProfileCreate, UserProfileUpdate
 from app.models.user_profile import UserProfile
+from app.utils.tracing_utils import traced
 
+@traced
 class UserProfileController:
     """
     Controller for handling business logic related to user profiles.
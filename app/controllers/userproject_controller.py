@@ -5,7 +5,12 @@ from app.models.dtos.user_dtos import UserResponse
 from app.models.dtos.project_dtos import ProjectResponse
 from app.repositories.userproject_repository import UserProjectRepository
 from app.utils import get_db
+from app.utils.projection_utils import read_model
+from app.utils.response_utils import validate_list
+from typing import FrozenSet, Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class UserProjectController:
     """Controller class for assigning/removing users from projects."""
 
@@ -27,10 +32,10 @@ class UserProjectController:
         except SQLAlchemyError as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-    def get_users(self, project_id: int) -> list[UserResponse]:
+    def get_users(self, project_id: int, fields: Optional[FrozenSet[str]] = None) -> list[UserResponse]:
         try:
-            users = self.repository.get_users_for_project(project_id)
-            return [UserResponse.from_orm(user) for user in users]
+            users = self.repository.get_users_for_project(project_id, fields)
+            return validate_list(read_model(UserResponse, fields), users)
         except SQLAlchemyError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,2 +1,6 @@
 from .multi_tenant_middleware import MultiTenantMiddleware
-from .authorization_middleware import AuthorizationMiddleware
\ No newline at end of file
+from .authorization_middleware import AuthorizationMiddleware
+from .compression_middleware import CompressionMiddleware
+from .query_stats_middleware import QueryStatsMiddleware
+from .metrics_middleware import MetricsMiddleware
+from .tracing_middleware import TracingMiddleware
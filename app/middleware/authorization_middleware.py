@@ -1,6 +1,6 @@
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
-from sqlalchemy import select, exists, and_, or_
+from sqlalchemy import select, exists, and_, or_, bindparam
 from starlette.responses import Response
 from typing import Awaitable, Callable, Dict, Any, List, Optional, Set
 import logging
@@ -13,11 +13,60 @@ from app.models.task import Task
 from app.models.task_assignment import TaskAssignment
 from app.models.project import Project
 from fastapi.responses import JSONResponse
+from app.utils.tracing_utils import span
 
 # Setup basic logging configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Authorization statements run on nearly every request. They are built once with
+# bound parameters so SQLAlchemy reuses the construct, its cache key and the
+# compiled SQL instead of rebuilding them per call.
+_IS_ADMIN_OR_MANAGER = select(exists().where(
+    and_(
+        UserRole.user_id == bindparam("user_id"),
+        UserRole.role_id == Role.id,
+        Role.name.in_(['Admin', 'Manager'])
+    )
+)).scalar_subquery()
+
+PERMISSION_EXISTS = select(exists().where(
+    and_(
+        UserRole.user_id == bindparam("user_id"),
+        UserRole.role_id == RolePermission.role_id,
+        RolePermission.permission_id == Permission.id,
+        Permission.name == bindparam("permission")
+    )
+))
+
+TASK_ACCESS = select(exists().where(
+    and_(
+        Task.id == bindparam("resource_id"),
+        or_(
+            and_(
+                TaskAssignment.task_id == Task.id,
+                TaskAssignment.user_id == bindparam("user_id")
+            ),
+            _IS_ADMIN_OR_MANAGER
+        )
+    )
+))
+
+PROJECT_ACCESS = select(exists().where(
+    and_(
+        Project.id == bindparam("resource_id"),
+        _IS_ADMIN_OR_MANAGER
+    )
+))
+
+IS_ADMIN = select(exists().where(
+    and_(
+        UserRole.user_id == bindparam("user_id"),
+        UserRole.role_id == Role.id,
+        Role.name == 'Admin'
+    )
+))
+
 class AuthorizationMiddleware(BaseHTTPMiddleware):
     """
     Middleware for handling authorization in a centralized way.
@@ -81,10 +130,12 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
         # Check permissions for this route
         required_permissions = self._get_required_permissions(path, method)
         
-        if required_permissions and not await self._check_permissions(db, user_id, required_permissions, request=request):
+        with span("AuthorizationMiddleware.check_permissions", permissions=",".join(required_permissions)):
+            allowed = not required_permissions or await self._check_permissions(
+                db, user_id, required_permissions, request=request
+            )
             # Check if this is a resource ownership route
-            is_owner = await self._check_resource_ownership(request, path, user_id)
-            if not is_owner:
+            if not allowed and not await self._check_resource_ownership(request, path, user_id):
                 return JSONResponse(
                     status_code=status.HTTP_403_FORBIDDEN,
                     content={"detail": "You don't have permission to access this resource"}
@@ -145,16 +196,7 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
                 continue
                 
             # If not in cache, check database using ORM
-            stmt = select(exists().where(
-                and_(
-                    UserRole.user_id == user_id,
-                    UserRole.role_id == RolePermission.role_id,
-                    RolePermission.permission_id == Permission.id,
-                    Permission.name == permission
-                )
-            ))
-            
-            result = db.scalar(stmt)
+            result = db.scalar(PERMISSION_EXISTS, {"user_id": user_id, "permission": permission})
             
             # Cache the result
             cache[cache_key] = result
@@ -195,45 +237,11 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
         # Check ownership based on resource type
         if resource_type == "task":
             # Check if user is assigned to the task or has admin/manager role
-            admin_manager_stmt = select(exists().where(
-                and_(
-                    UserRole.user_id == user_id,
-                    UserRole.role_id == Role.id,
-                    Role.name.in_(['Admin', 'Manager'])
-                )
-            ))
-            
-            task_access_stmt = select(exists().where(
-                and_(
-                    Task.id == resource_id,
-                    or_(
-                        and_(
-                            TaskAssignment.task_id == Task.id,
-                            TaskAssignment.user_id == user_id
-                        ),
-                        admin_manager_stmt.scalar_subquery()
-                    )
-                )
-            ))
-            
-            result = db.scalar(task_access_stmt)
+            result = db.scalar(TASK_ACCESS, {"resource_id": resource_id, "user_id": user_id})
             
         elif resource_type == "project":
             # Check if user has admin/manager role for project access
-            project_access_stmt = select(exists().where(
-                and_(
-                    Project.id == resource_id,
-                    select(exists().where(
-                        and_(
-                            UserRole.user_id == user_id,
-                            UserRole.role_id == Role.id,
-                            Role.name.in_(['Admin', 'Manager'])
-                        )
-                    )).scalar_subquery()
-                )
-            ))
-            
-            result = db.scalar(project_access_stmt)
+            result = db.scalar(PROJECT_ACCESS, {"resource_id": resource_id, "user_id": user_id})
             
         elif resource_type == "user":
             # Special case for user resources - users can access their own profile
@@ -241,14 +249,6 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
                 db, user_id, ["read_any_user"], False)
         else:
             # Default to admin check for unknown resource types
-            admin_check_stmt = select(exists().where(
-                and_(
-                    UserRole.user_id == user_id,
-                    UserRole.role_id == Role.id,
-                    Role.name == 'Admin'
-                )
-            ))
-            
-            result = db.scalar(admin_check_stmt)
+            result = db.scalar(IS_ADMIN, {"user_id": user_id})
             
         return result
\ No newline at end of file
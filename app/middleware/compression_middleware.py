@@ -0,0 +1,210 @@
+"""
+Response compression negotiated from the request's Accept-Encoding header.
+
+Brotli is preferred when the client accepts it and the `brotli` package is
+installed, gzip otherwise. Only textual content types (JSON, NDJSON, CSV, ...)
+are compressed, and only once the body reaches `minimum_size` bytes: the body
+is buffered up to that threshold, so small responses are sent unchanged even
+when they arrive in several chunks.
+
+Streaming responses (exports) are compressed chunk by chunk; each chunk is
+flushed so the client receives data as soon as it is produced.
+"""
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/x-ndjson", "application/javascript",
+    "application/xml", "image/svg+xml"
+)
+
+
+class GzipEncoder:
+    """Streaming gzip encoder."""
+
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    """Streaming Brotli encoder."""
+
+    def __init__(self, quality: int = 4):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding listed in an Accept-Encoding header to its q-value."""
+    codings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        codings[coding.strip().lower()] = quality
+    return codings
+
+
+def choose_encoding(header: str, available: Tuple[str, ...]) -> Optional[str]:
+    """
+    Pick the content coding to use for a request.
+
+    Args:
+        header (str): The request's Accept-Encoding value.
+        available (Tuple[str, ...]): Supported codings, most preferred first.
+
+    Returns:
+        Optional[str]: The accepted coding with the highest q-value (server order
+            breaks ties), or None to send the body as is.
+    """
+    accepted = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "").lower()
+    return (
+        "content-encoding" not in headers
+        and "no-transform" not in headers.get("cache-control", "").lower()
+        and content_type.startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with Brotli or gzip.
+
+    Args:
+        app (ASGIApp): Wrapped application.
+        minimum_size (int): Bodies shorter than this are sent uncompressed.
+        gzip_level (int): zlib compression level (1-9).
+        brotli_quality (int): Brotli quality (0-11); low values suit dynamic responses.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders: Dict[str, Callable] = {}
+        if brotli is not None:
+            self.encoders["br"] = lambda: BrotliEncoder(brotli_quality)
+        self.encoders["gzip"] = lambda: GzipEncoder(gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), tuple(self.encoders))
+        responder = CompressionResponder(send, encoding, self.encoders.get(encoding), self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """Per-request `send` wrapper that decides whether, and then how, to compress the body."""
+
+    def __init__(self, send: Send, encoding: Optional[str], encoder_factory: Optional[Callable], minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.buffer = bytearray()
+        self.encoder = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = MutableHeaders(scope=message)
+            if not is_compressible(headers) or message["status"] in (204, 304):
+                self.passthrough = True
+                return
+            headers.add_vary_header("Accept-Encoding")
+            self.passthrough = self.encoding is None
+            return
+
+        if message["type"] != "http.response.body":
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is not None:
+            data = self.encoder.compress(body) + (self.encoder.flush() if more_body else self.encoder.finish())
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        self.buffer.extend(body)
+        if len(self.buffer) < self.minimum_size:
+            if more_body:
+                return
+            # Ended below the threshold: send it unchanged
+            await self._flush_start()
+            await self._send({"type": "http.response.body", "body": bytes(self.buffer), "more_body": False})
+            return
+
+        self.encoder = self.encoder_factory()
+        headers = MutableHeaders(scope=self.start)
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed bytes differ from the identity representation
+            headers["ETag"] = f"W/{etag}"
+        data = self.encoder.compress(bytes(self.buffer))
+        self.buffer.clear()
+        if more_body:
+            del headers["Content-Length"]
+            data += self.encoder.flush()
+        else:
+            data += self.encoder.finish()
+            headers["Content-Length"] = str(len(data))
+        await self._flush_start()
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    async def _flush_start(self) -> None:
+        if self.start is not None:
+            await self._send(self.start)
+            self.start = None
@@ -0,0 +1,121 @@
+"""
+Request metrics and the Prometheus `/metrics` endpoint.
+
+Each HTTP request is recorded in a `RequestMetrics` (see
+app/utils/metrics_utils.py) once its response has been sent, under the route
+template FastAPI matched (`/tasks/{task_id}`). Requests rejected before routing
+(missing token, CORS preflight) are matched against the routes here, so they
+are still reported under their template.
+
+The middleware runs inside `QueryStatsMiddleware`, whose per-request statement
+count and database time it reads. GET `/metrics` is answered by the middleware
+itself, before any authentication or database work; set METRICS_AUTH_TOKEN to
+require `Authorization: Bearer <token>` on it.
+"""
+import secrets
+import time
+from typing import Optional
+
+from starlette.routing import Match, Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.db_utils import global_engine, pool_stats
+from app.utils.metrics_utils import RequestMetrics, route_templates
+from app.utils.query_stats_utils import compiled_cache_stats, current_query_stats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request metrics and serving them on `path`.
+
+    Args:
+        app (ASGIApp): Wrapped application.
+        router (Router): The application's router; its routes define the series.
+        path (str): Path of the exposition endpoint.
+        max_tenants (int): Tenants with their own request series.
+        directory (Optional[str]): Shared directory for multi-process mode, or None.
+        auth_token (Optional[str]): Bearer token required on `path`, or None.
+    """
+
+    def __init__(self, app: ASGIApp, router: Router, path: str = "/metrics", max_tenants: int = 256,
+                 directory: Optional[str] = None, auth_token: Optional[str] = None):
+        self.app = app
+        self.router = router
+        self.path = path
+        self.max_tenants = max_tenants
+        self.directory = directory
+        self.auth_token = auth_token
+        self._metrics: Optional[RequestMetrics] = None
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        # Built on first use, once every router has been included
+        if self._metrics is None:
+            self._metrics = RequestMetrics(route_templates(self.router.routes), self.max_tenants, self.directory)
+        return self._metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == self.path and scope["method"] == "GET":
+            await self._expose(scope, send)
+            return
+
+        metrics = self.metrics
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.request_started()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._record(metrics, scope, status, time.perf_counter() - started)
+
+    def _record(self, metrics: RequestMetrics, scope: Scope, status: int, elapsed: float) -> None:
+        route = scope.get("route")
+        template = route.path if route is not None else self._match(scope)
+        stats = current_query_stats()
+        metrics.request_finished(
+            metrics.route_slot(scope["method"], template), status, elapsed,
+            statements=stats.count if stats is not None else 0,
+            db_seconds=stats.duration if stats is not None else 0.0,
+            tenant=scope.get("state", {}).get("tenant_schema"),
+        )
+        # QueuePool.overflow() is negative until pool_size connections are open
+        overflow = max(global_engine.pool.overflow(), 0) if hasattr(global_engine.pool, "overflow") else 0
+        metrics.set_pool_gauges(pool_stats.checked_out, overflow)
+        metrics.set_cache_outcomes(compiled_cache_stats.hits, compiled_cache_stats.misses, compiled_cache_stats.uncached)
+
+    def _match(self, scope: Scope) -> Optional[str]:
+        """Route template of a request that never reached the router."""
+        for route in self.router.routes:
+            match, _ = route.matches(scope)
+            if match is not Match.NONE:
+                return getattr(route, "path", None)
+        return None
+
+    async def _expose(self, scope: Scope, send: Send) -> None:
+        if self.auth_token is not None:
+            authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+            if not secrets.compare_digest(authorization, f"Bearer {self.auth_token}"):
+                await self._respond(send, 401, b"Unauthorized", "text/plain; charset=utf-8")
+                return
+        await self._respond(send, 200, self.metrics.render().encode(), CONTENT_TYPE)
+
+    @staticmethod
+    async def _respond(send: Send, status: int, body: bytes, content_type: str) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,40 +1,56 @@
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
-from sqlalchemy.orm import Session
+from functools import partial
 from typing import Awaitable, Callable
 import logging
 
 from app.auth import auth_service
-from app.utils.db_utils import get_tenant_session, switch_schema, get_global_db
+from app.utils.db_utils import RequestSession, get_tenant_session
+from app.utils.tracing_utils import span
 
 # Setup basic logging configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Public routes that don't require authentication
+PUBLIC_PATHS = frozenset({
+    "/login", "/register", "/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json", "/token", "/tenant-users/"
+})
+
 class MultiTenantMiddleware(BaseHTTPMiddleware):
     """
     Middleware for handling multi-tenancy by extracting tenant-specific information from JWT tokens.
+
+    OPTIONS requests and public routes pass through without a database session;
+    the endpoints that need the global schema (login, `/tenant-users/`) get a
+    lazily connected one from `get_db`.
+
+    Authenticated requests get a `RequestSession` on their tenant schema. It
+    connects on first use and is always closed: rolled back and closed when the
+    request fails, otherwise closed before the response body is sent (streamed
+    exports take it over and close it themselves).
+
+    Args:
+        app: The FastAPI application
+        unit_of_work (bool): Commit each request's writes once, at its end
+            (see `RequestSession`), instead of at every repository commit.
     """
 
+    def __init__(self, app, unit_of_work: bool = True):
+        super().__init__(app)
+        self.unit_of_work = unit_of_work
+
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         """
         Process incoming requests, verify authentication, and dynamically set the tenant schema.
         """
-        # Public routes that don't require authentication
-        public_paths = {
-            "/login", "/register", "/docs", "/openapi.json", "/token", "/tenant-users/"
-        }
-
-        # Allow OPTIONS method (CORS preflight) and public routes
-        if request.method == "OPTIONS" or request.url.path in public_paths:
-            with get_global_db() as db:
-                switch_schema(db, "taskeri_global")
-                request.state.db = db
-                response = await call_next(request)
-                return response
+        # Allow OPTIONS method and public routes (CORS preflights are already
+        # answered by CORSMiddleware, which runs before this middleware)
+        if request.method == "OPTIONS" or request.url.path in PUBLIC_PATHS:
+            return await call_next(request)
         
         # Extract token
         try:
@@ -48,7 +64,8 @@ class MultiTenantMiddleware(BaseHTTPMiddleware):
 
         try:
             # Verify token and extract user & tenant info
-            user_data: dict = auth_service.verify_token(token)
+            with span("MultiTenantMiddleware.verify_token"):
+                user_data: dict = auth_service.verify_token(token)
             user_id: int = user_data["user_id"]
             tenant_id: int = user_data["tenant_id"]
             tenant_schema: str = user_data["tenant_name"]
@@ -58,14 +75,18 @@ class MultiTenantMiddleware(BaseHTTPMiddleware):
             request.state.tenant_id = tenant_id
             request.state.tenant_schema = tenant_schema
 
-            # Get tenant session and switch schema
+            # Tenant session, created on first use. Its engine URL already selects
+            # the tenant schema; the engine and its pool are shared by the tenant's requests.
             schema_name = f"tenant_{tenant_schema}"
-            db: Session = get_tenant_session(schema_name)
-            switch_schema(db, schema_name)
+            db = RequestSession(partial(get_tenant_session, schema_name), unit_of_work=self.unit_of_work)
             request.state.db = db
 
-            response: Response = await call_next(request)
-            db.close()
+            try:
+                response: Response = await call_next(request)
+            except Exception:
+                db.close(rollback=True)
+                raise
+            db.release()
             return response
 
         except HTTPException as e:
@@ -0,0 +1,64 @@
+"""
+Per-request SQL statement statistics.
+
+Wraps every HTTP request in `track_queries()`. When the response starts, a
+`Server-Timing: db;dur=<ms>;desc="<n> statements"` header is added (visible in
+the browser's network panel). Once the response has been sent, the request is
+logged with its statement count and database time, and any statement
+fingerprint repeated `repeat_threshold` times or more is logged as a likely
+N+1 pattern. The log line also shows how many statements had to be compiled
+because they were not in SQLAlchemy's compiled cache. The cache belongs to
+each engine, and each tenant has its own (see `get_tenant_engine`), so a
+tenant's first requests in a worker compile their statements; after that this
+should stay at zero.
+
+Statements run while a streaming body is produced (exports) happen after the
+headers are sent, so they only show up in the log line.
+"""
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.query_stats_utils import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware counting the SQL statements of each request.
+
+    Args:
+        app (ASGIApp): Wrapped application.
+        repeat_threshold (int): Executions of one statement fingerprint that are reported as N+1.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 5):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, stats, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, stats, elapsed: float) -> None:
+        route = f"{scope['method']} {scope['path']}"
+        logger.debug("%s: %d SQL statements (%d compiled), %.1f ms in the database, %.1f ms total",
+                     route, stats.count, stats.cache_misses, stats.duration * 1000, elapsed * 1000)
+        for statement, count in stats.repeated(self.repeat_threshold):
+            logger.warning("Possible N+1 in %s: statement ran %d times: %s", route, count, statement)
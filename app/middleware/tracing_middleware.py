@@ -0,0 +1,93 @@
+"""
+Request tracing.
+
+Opens the root span of each HTTP request (see app/utils/tracing_utils.py) and,
+once the response has been sent, decides whether the trace is exported:
+
+- picked at `sample_rate` (0.01 keeps one request in a hundred),
+- asked for by the caller through a sampled W3C `traceparent` header, whose
+  trace id is then reused so the spans join the caller's trace,
+- or slower than `slow_seconds`, whatever the rate.
+
+The root span is named after the route template (`GET /tasks/{task_id}`) and
+carries the method, path, status code and tenant.
+"""
+import random
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.tracing_utils import KIND_SERVER, Span, SpanExporter, Trace, activate, parse_traceparent
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware tracing each request and exporting the sampled traces.
+
+    Args:
+        app (ASGIApp): Wrapped application.
+        exporter (SpanExporter): Destination of the sampled traces.
+        sample_rate (float): Share of requests exported regardless of duration.
+        slow_seconds (float): Requests taking at least this long are always exported.
+    """
+
+    def __init__(self, app: ASGIApp, exporter: SpanExporter, sample_rate: float = 0.01, slow_seconds: float = 0.5):
+        self.app = app
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        root = self._start(scope)
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            with activate(root):
+                await self.app(scope, receive, send_with_status)
+        finally:
+            self._finish(scope, root, status)
+
+    def _start(self, scope: Scope) -> Span:
+        headers = dict(scope["headers"])
+        parent = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+            trace = Trace(trace_id, sampled=sampled or random.random() < self.sample_rate)
+        else:
+            parent_id = None
+            trace = Trace(sampled=random.random() < self.sample_rate)
+        return trace.add(Span(trace, f"{scope['method']} {scope['path']}", parent_id, KIND_SERVER, {
+            "http.method": scope["method"],
+            "http.target": scope["path"],
+        }))
+
+    def _finish(self, scope: Scope, root: Span, status: int) -> None:
+        route = scope.get("route")
+        if route is not None:
+            root.name = f"{scope['method']} {route.path}"
+            root.attributes["http.route"] = route.path
+        root.attributes["http.status_code"] = status
+        tenant: Optional[str] = scope.get("state", {}).get("tenant_schema")
+        if tenant is not None:
+            root.attributes["tenant"] = tenant
+
+        trace = root.trace
+        if root.duration >= self.slow_seconds:
+            root.attributes["sampling.reason"] = "slow"
+        elif trace.sampled:
+            root.attributes["sampling.reason"] = "rate"
+        else:
+            return
+        if trace.dropped:
+            root.attributes["spans.dropped"] = trace.dropped
+        self.exporter.export(trace)
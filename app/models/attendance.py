@@ -1,11 +1,20 @@
-from sqlalchemy import Column, BigInteger, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, BigInteger, TIMESTAMP, ForeignKey, Computed, Index
 from app.utils.db_utils import Base
 
 class Attendance(Base):
     __tablename__ = "attendance"
-    __table_args__ = {"schema": None}
+    __table_args__ = (
+        # At most one open (not checked out) attendance per user
+        Index("uq_attendance_open_user", "open_user_id", unique=True),
+        {"schema": None}
+    )
 
     id = Column(BigInteger, primary_key=True)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     check_in = Column(TIMESTAMP, nullable=False)
-    check_out = Column(TIMESTAMP)
\ No newline at end of file
+    check_out = Column(TIMESTAMP)
+    # user_id while the record is open, NULL once checked out (NULLs don't collide in unique indexes)
+    open_user_id = Column(
+        BigInteger,
+        Computed("CASE WHEN check_out IS NULL THEN user_id END", persisted=False)
+    )
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, BigInteger, Text, TIMESTAMP, ForeignKey, func
-from app.utils.db_utils import Base
+from app.utils.db_utils import Base, current_timestamp
 
 class Comment(Base):
     __tablename__ = "comments"
@@ -9,4 +9,4 @@ class Comment(Base):
     task_id = Column(BigInteger, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
\ No newline at end of file
+    created_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
\ No newline at end of file
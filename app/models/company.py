@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Integer, BigInteger, TIMESTAMP, func
-from app.utils import Base
+from app.utils import Base, current_timestamp
 
 class Company(Base):
     __tablename__ = "companies"
@@ -8,4 +8,4 @@ class Company(Base):
     name = Column(String(255), unique=True, nullable=False)
     industry = Column(String(100))
     country = Column(String(100))
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
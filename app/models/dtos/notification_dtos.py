@@ -15,4 +15,15 @@ class NotificationResponse(BaseModel):
 class NotificationCreate(BaseModel):
     user_id: int
     message: str
+    task_id: Optional[int] = None
     read_status: Optional[bool] = False  # default unread when creating notification
+
+class NotificationRetentionStats(BaseModel):
+    tenant_schema: str
+    runs: int = 0
+    pruned_total: int = 0
+    compacted_total: int = 0
+    archived_total: int = 0
+    last_pruned: int = 0
+    last_compacted: int = 0
+    last_run_at: Optional[datetime] = None
@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+from datetime import date
+from enum import Enum
+from typing import Dict, List, Optional
+
+class ReportPeriod(str, Enum):
+    WEEK = "week"
+    MONTH = "month"
+
+class ReportGroupBy(str, Enum):
+    USER = "user"
+    TEAM = "team"
+    DEPARTMENT = "department"
+
+class UtilizationRow(BaseModel):
+    group_id: int
+    period_start: date
+    period_end: date
+    logged_minutes: float
+    overlap_minutes: float
+    overlapping_logs: int
+    attended_minutes: float
+    expected_minutes: float
+    utilization: Optional[float] = None        # logged (minus overlap) / expected
+    attendance_ratio: Optional[float] = None   # attended / expected
+    logged_vs_attended: Optional[float] = None # logged (minus overlap) / attended
+
+class UtilizationReportResponse(BaseModel):
+    period: ReportPeriod
+    group_by: ReportGroupBy
+    start_date: date
+    end_date: date
+    work_hours_per_day: int
+    rows: List[UtilizationRow]
+
+class ReferenceCacheNamespaceStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+class ReferenceCacheStats(BaseModel):
+    tenant_schema: str
+    backend: str
+    ttl_seconds: int
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    hit_ratio: float = 0.0
+    namespaces: Dict[str, ReferenceCacheNamespaceStats] = {}
@@ -130,6 +130,36 @@ class CommentListResponse(BaseModel):
     page: int
     page_size: int
 
+class TaskBulkCreateRequest(BaseModel):
+    """Request model for creating many tasks in one transaction"""
+    items: List[TaskCreate] = Field(..., min_length=1, max_length=500)
+
+class TaskBulkPatchItem(BaseModel):
+    """Changes for one task of a bulk patch; omitted fields are left unchanged"""
+    id: int
+    status: Optional[StatusEnum] = None
+    priority: Optional[PriorityEnum] = None
+    due_date: Optional[date] = Field(None, description="Send null explicitly to clear the due date")
+    assigned_user_ids: Optional[List[int]] = None
+
+class TaskBulkPatchRequest(BaseModel):
+    """Request model for changing many tasks in one transaction"""
+    items: List[TaskBulkPatchItem] = Field(..., min_length=1, max_length=500)
+
+class TaskBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk request"""
+    index: int
+    id: Optional[int] = None
+    outcome: str
+    error: Optional[str] = None
+    task: Optional[TaskResponse] = None
+
+class TaskBulkResponse(BaseModel):
+    """Response model for bulk task operations"""
+    succeeded: int
+    failed: int
+    results: List[TaskBulkItemResult]
+
 class TaskFilterParams(BaseModel):
     """Parameters for filtering tasks in search operations"""
     status: Optional[List[StatusEnum]] = None
@@ -1,6 +1,7 @@
-from datetime import datetime
+from datetime import datetime, date
+from enum import Enum
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List, Union
 
 class TimeLogCreate(BaseModel):
     task_id: int
@@ -21,4 +22,21 @@ class TimeLogResponse(BaseModel):
     duration: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TimeLogTotalsGroupBy(str, Enum):
+    USER = "user"
+    TASK = "task"
+    PROJECT = "project"
+    DAY = "day"
+
+class TimeLogTotal(BaseModel):
+    key: Union[int, date]
+    total_minutes: int
+    log_count: int
+
+class TimeLogTotalsResponse(BaseModel):
+    group_by: TimeLogTotalsGroupBy
+    start_date: date
+    end_date: date
+    items: List[TimeLogTotal]
@@ -1,6 +1,6 @@
 # app/schemas/user_schema.py
-from pydantic import BaseModel, validator
-from typing import Optional
+from pydantic import BaseModel, EmailStr, validator
+from typing import Optional, List
 from datetime import datetime
 
 class UserBase(BaseModel):
@@ -35,3 +35,35 @@ class UserResponse(UserBase):
         if isinstance(v, datetime):
             return v.isoformat()  # Converts datetime to ISO 8601 string
         return v
+
+class UserListResponse(BaseModel):
+    """Response model for paginated user lists"""
+    items: List[UserResponse]
+    total: int
+    page: int
+    page_size: int
+
+class UserImportRow(BaseModel):
+    """A single user of a bulk import; a password is generated when omitted"""
+    email: EmailStr
+    first_name: str
+    last_name: str
+    password: Optional[str] = None
+    department_id: Optional[int] = None
+    team_id: Optional[int] = None
+    role_id: Optional[int] = None
+
+class UserImportRowResult(BaseModel):
+    """Outcome of one import row (row numbers start at 1)"""
+    row: int
+    email: Optional[str] = None
+    status: str
+    user_id: Optional[int] = None
+    error: Optional[str] = None
+
+class UserImportResponse(BaseModel):
+    """Summary of a bulk user import"""
+    total: int
+    created: int
+    failed: int
+    results: List[UserImportRowResult]
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, BigInteger, String, TIMESTAMP, ForeignKey, func
-from app.utils.db_utils import Base
+from app.utils.db_utils import Base, current_timestamp
 
 class FileAttachment(Base):
     __tablename__ = "file_attachments"
@@ -8,4 +8,4 @@ class FileAttachment(Base):
     id = Column(BigInteger, primary_key=True)
     task_id = Column(BigInteger, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     file_path = Column(String(255), nullable=False)
-    uploaded_at = Column(TIMESTAMP, server_default=func.now())
\ No newline at end of file
+    uploaded_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
\ No newline at end of file
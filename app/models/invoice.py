@@ -1,5 +1,5 @@
 from sqlalchemy import Column, BigInteger, DECIMAL, TIMESTAMP, Enum, ForeignKey, func
-from app.utils.db_utils import Base
+from app.utils.db_utils import Base, current_timestamp
 
 class Invoice(Base):
     __tablename__ = "invoices"
@@ -8,5 +8,5 @@ class Invoice(Base):
     id = Column(BigInteger, primary_key=True)
     company_id = Column(BigInteger, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
     amount = Column(DECIMAL(10, 2), nullable=False)
-    issued_at = Column(TIMESTAMP, server_default=func.now())
+    issued_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
     status = Column(Enum("Pending", "Paid"), default="Pending")
\ No newline at end of file
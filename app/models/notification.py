@@ -1,12 +1,18 @@
-from sqlalchemy import Column, BigInteger, Text, Boolean, TIMESTAMP, ForeignKey, func
-from app.utils.db_utils import Base
+from sqlalchemy import Column, BigInteger, Text, Boolean, TIMESTAMP, ForeignKey, Index, func
+from app.utils.db_utils import Base, current_timestamp
 
 class Notification(Base):
     __tablename__ = "notifications"
-    __table_args__ = {"schema": None}  
+    __table_args__ = (
+        Index("ix_notifications_read_created", "read_status", "created_at"),
+        Index("ix_notifications_user_task", "user_id", "task_id"),
+        {"schema": None}
+    )
 
     id = Column(BigInteger, primary_key=True)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # Task the notification is about, if any; used to collapse repeated task updates
+    task_id = Column(BigInteger, ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True)
     message = Column(Text, nullable=False)
     read_status = Column(Boolean, default=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
\ No newline at end of file
+    created_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
\ No newline at end of file
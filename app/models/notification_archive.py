@@ -0,0 +1,13 @@
+from sqlalchemy import Column, BigInteger, Text, Boolean, TIMESTAMP, func
+from app.utils.db_utils import Base
+
+class NotificationArchive(Base):
+    __tablename__ = "notifications_archive"
+    __table_args__ = {"schema": None}
+
+    id = Column(BigInteger, primary_key=True, autoincrement=False)
+    user_id = Column(BigInteger, nullable=False, index=True)
+    message = Column(Text, nullable=False)
+    read_status = Column(Boolean, default=True)
+    created_at = Column(TIMESTAMP)
+    archived_at = Column(TIMESTAMP, server_default=func.now())
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Text, BigInteger, Date, Enum, TIMESTAMP, func
-from app.utils.db_utils import Base
+from app.utils.db_utils import Base, current_timestamp
 
 class Project(Base):
     __tablename__ = "projects"
@@ -11,4 +11,4 @@ class Project(Base):
     start_date = Column(Date, nullable=False)
     end_date = Column(Date)
     status = Column(Enum("Not Started", "In Progress", "Completed", "On Hold"), default="Not Started")
-    created_at = Column(TIMESTAMP, server_default=func.now())
\ No newline at end of file
+    created_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
\ No newline at end of file
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Text, BigInteger, Date, Enum, TIMESTAMP, ForeignKey, func
-from app.utils.db_utils import Base
+from app.utils.db_utils import Base, current_timestamp
 
 class Task(Base):
     __tablename__ = "tasks"
@@ -12,5 +12,5 @@ class Task(Base):
     priority = Column(Enum("Low", "Medium", "High"), default="Medium")
     status = Column(Enum("To Do", "In Progress", "Technical Review", "Done"), default="To Do")
     due_date = Column(Date)
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    created_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
+    updated_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now(), onupdate=current_timestamp)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Text, Integer, TIMESTAMP, func
-from app.utils import Base
+from app.utils import Base, current_timestamp
 
 
 class TenantUser(Base):
@@ -8,4 +8,4 @@ class TenantUser(Base):
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False)
     tenant_schema = Column(String(255), nullable=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(TIMESTAMP, default=current_timestamp, server_default=func.now())
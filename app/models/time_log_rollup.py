@@ -0,0 +1,21 @@
+from sqlalchemy import Column, BigInteger, Integer, Date, ForeignKey, Index, PrimaryKeyConstraint
+from app.utils.db_utils import Base
+
+class TimeLogDailyRollup(Base):
+    """Per-day totals of logged minutes for a (user, task) pair, maintained from `time_logs`."""
+    __tablename__ = "time_log_daily_rollups"
+    __table_args__ = (
+        PrimaryKeyConstraint("day", "user_id", "task_id"),
+        Index("ix_time_log_rollups_user_day", "user_id", "day"),
+        Index("ix_time_log_rollups_task_day", "task_id", "day"),
+        Index("ix_time_log_rollups_project_day", "project_id", "day"),
+        {"schema": None}
+    )
+
+    day = Column(Date, nullable=False)
+    # Cascades mirror time_logs, so deleting a user or task drops their rollups too
+    user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_id = Column(BigInteger, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(BigInteger, nullable=False)
+    total_minutes = Column(BigInteger, nullable=False, default=0)
+    log_count = Column(Integer, nullable=False, default=0)
@@ -1,10 +1,9 @@
 # app/models/user.py
 from sqlalchemy import Column, String, Integer, BigInteger, ForeignKey, TIMESTAMP
 from sqlalchemy.orm import relationship
-from app.utils import Base  
+from app.utils import Base, current_timestamp  
 from .department import Department
 from .team import Team
-from sqlalchemy.sql import func
 
 class User(Base):
     __tablename__ = "users"
@@ -17,8 +16,8 @@ class User(Base):
     last_name = Column(String(100), nullable=False)
     department_id = Column(BigInteger, ForeignKey('departments.id', ondelete="SET NULL"))
     team_id = Column(BigInteger, ForeignKey('teams.id', ondelete="SET NULL"))
-    created_at = Column(TIMESTAMP, default=func.now())
-    updated_at = Column(TIMESTAMP, default=func.now(), onupdate=func.now())
+    created_at = Column(TIMESTAMP, default=current_timestamp)
+    updated_at = Column(TIMESTAMP, default=current_timestamp, onupdate=current_timestamp)
 
     department = relationship("Department", backref="users") 
     team = relationship("Team", backref="users")  
@@ -0,0 +1,150 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert, or_, and_
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from app.models.dtos.notification_dtos import NotificationCreate
+from app.repositories.notification_repository import NotificationRepository
+from app.utils.tracing_utils import traced
+
+
+class AssignmentDiff(NamedTuple):
+    """Users added to and removed from one owner (task, project, ...)."""
+    added: List[int]
+    removed: List[int]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def diff_assignments(current: Iterable[int], wanted: Iterable[int]) -> AssignmentDiff:
+    """
+    Compare the current and wanted members of an assignment.
+
+    Args:
+        current (Iterable[int]): User IDs assigned now.
+        wanted (Iterable[int]): User IDs that should be assigned.
+
+    Returns:
+        AssignmentDiff: Sorted user IDs to add and to remove.
+    """
+    current, wanted = set(current), set(wanted)
+    return AssignmentDiff(added=sorted(wanted - current), removed=sorted(current - wanted))
+
+
+@traced
+class AssignmentRepository:
+    """
+    Keeps a user link table (task assignments, project members, ...) in sync.
+
+    Only the difference between the stored and the wanted members is written:
+    one DELETE for all removed links and one multi-row INSERT for all new ones,
+    however many owners are synced at once. Nothing is committed here; callers
+    run this inside their own transaction.
+    """
+
+    def __init__(self, db_session: Session, model, owner_column: str, user_column: str = "user_id",
+                 notification_column: Optional[str] = None):
+        """
+        Initialize the AssignmentRepository.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            model: Mapped link class (e.g. TaskAssignment, UserProject).
+            owner_column (str): Column referencing the owner (e.g. "task_id").
+            user_column (str): Column referencing the user.
+            notification_column (Optional[str]): Notification column the owner ID is stored in
+                (e.g. "task_id"), if notifications reference the owner.
+        """
+        self.db_session = db_session
+        self.model = model
+        self.owner_column = owner_column
+        self.user_column = user_column
+        self.notification_column = notification_column
+
+    def get_assignments(self, owner_ids: Iterable[int]) -> Dict[int, Set[int]]:
+        """
+        Get the assigned user IDs of many owners in a single query.
+
+        Args:
+            owner_ids (Iterable[int]): Owner IDs.
+
+        Returns:
+            Dict[int, Set[int]]: Assigned user IDs by owner ID (every requested owner is present).
+        """
+        owner_ids = list(owner_ids)
+        assignments: Dict[int, Set[int]] = {owner_id: set() for owner_id in owner_ids}
+        if not owner_ids:
+            return assignments
+        owner = getattr(self.model, self.owner_column)
+        user = getattr(self.model, self.user_column)
+        for owner_id, user_id in self.db_session.execute(select(owner, user).where(owner.in_(owner_ids))):
+            assignments[owner_id].add(user_id)
+        return assignments
+
+    def sync(self, wanted: Dict[int, Iterable[int]], current: Dict[int, Set[int]] = None) -> Dict[int, AssignmentDiff]:
+        """
+        Make the stored assignments of each owner match the wanted user IDs.
+
+        Args:
+            wanted (Dict[int, Iterable[int]]): Full list of wanted user IDs by owner ID.
+            current (Dict[int, Set[int]]): Stored assignments, if already known
+                (e.g. empty for owners that were just created); read otherwise.
+
+        Returns:
+            Dict[int, AssignmentDiff]: What changed, by owner ID.
+        """
+        if current is None:
+            current = self.get_assignments(wanted)
+        diffs = {
+            owner_id: diff_assignments(current.get(owner_id, ()), user_ids)
+            for owner_id, user_ids in wanted.items()
+        }
+
+        owner = getattr(self.model, self.owner_column)
+        user = getattr(self.model, self.user_column)
+        removed = [
+            and_(owner == owner_id, user.in_(diff.removed))
+            for owner_id, diff in diffs.items() if diff.removed
+        ]
+        if removed:
+            self.db_session.execute(
+                delete(self.model).where(or_(*removed)).execution_options(synchronize_session=False)
+            )
+
+        added = [
+            {self.owner_column: owner_id, self.user_column: user_id}
+            for owner_id, diff in diffs.items() for user_id in diff.added
+        ]
+        if added:
+            self.db_session.execute(insert(self.model), added)
+        return diffs
+
+    def notify(self,
+               diffs: Dict[int, AssignmentDiff],
+               names: Dict[int, str],
+               added_message: str,
+               removed_message: str) -> int:
+        """
+        Notify only the users whose assignment changed, with one multi-row INSERT.
+
+        Args:
+            diffs (Dict[int, AssignmentDiff]): Result of `sync`.
+            names (Dict[int, str]): Owner names by owner ID, used in the messages.
+            added_message (str): Message for added users, formatted with `name`.
+            removed_message (str): Message for removed users, formatted with `name`.
+
+        Returns:
+            int: Number of notifications created.
+        """
+        notifications = []
+        for owner_id, diff in diffs.items():
+            owner = {self.notification_column: owner_id} if self.notification_column else {}
+            notifications += [
+                NotificationCreate(user_id=user_id, message=added_message.format(name=names[owner_id]), **owner)
+                for user_id in diff.added
+            ]
+            notifications += [
+                NotificationCreate(user_id=user_id, message=removed_message.format(name=names[owner_id]), **owner)
+                for user_id in diff.removed
+            ]
+        return NotificationRepository(self.db_session).create_notifications(notifications)
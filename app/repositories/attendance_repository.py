@@ -1,13 +1,23 @@
-from typing import List, Optional
+from typing import List, Optional, Iterator, Tuple
+from sqlalchemy import select, insert, update
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from datetime import datetime
 from app.models.attendance import Attendance
+from app.utils.db_utils import iter_keyset
+from app.utils.tracing_utils import traced
 
 
+@traced
 class AttendanceRepository:
     """Repository class for handling attendance-related database operations."""
 
+    # Columns written by the streaming export, in output order
+    EXPORT_COLUMNS = (Attendance.id, Attendance.user_id, Attendance.check_in, Attendance.check_out)
+
+    # Unique index whose violation means the user already has an open record
+    OPEN_RECORD_INDEX = "uq_attendance_open_user"
+
     def __init__(self, db_session: Session):
         """
         Initialize the AttendanceRepository.
@@ -17,30 +27,50 @@ class AttendanceRepository:
         """
         self.db_session = db_session
 
-    def create_attendance(self, user_id: int, check_in: datetime) -> Attendance:
+    def create_attendance(self, user_id: int, check_in: datetime) -> Optional[Attendance]:
         """
         Create a new attendance record with check-in time.
 
+        The unique index on `open_user_id` allows a single open record per user,
+        so concurrent check-ins cannot both succeed.
+
         Args:
             user_id (int): ID of the user
             check_in (datetime): Check-in timestamp
 
         Returns:
-            Attendance: The created attendance record
+            Optional[Attendance]: The created attendance record, or None if the
+            user already has an open attendance
         """
+        check_in = check_in.replace(microsecond=0)
         try:
-            attendance = Attendance(
-                user_id=user_id,
-                check_in=check_in
+            result = self.db_session.execute(
+                insert(Attendance).values(user_id=user_id, check_in=check_in)
             )
-            self.db_session.add(attendance)
             self.db_session.commit()
-            self.db_session.refresh(attendance)
-            return attendance
+        except IntegrityError as e:
+            self.db_session.rollback()
+            if not self._is_open_record_conflict(e):
+                raise e
+            return None
         except SQLAlchemyError as e:
             self.db_session.rollback()
             raise e
 
+        # Every column is known here, no need to read the row back
+        return Attendance(
+            id=result.inserted_primary_key[0],
+            user_id=user_id,
+            check_in=check_in,
+            check_out=None
+        )
+
+    @classmethod
+    def _is_open_record_conflict(cls, error: IntegrityError) -> bool:
+        # MySQL names the violated index in the message, SQLite the indexed column
+        message = str(error.orig)
+        return cls.OPEN_RECORD_INDEX in message or "attendance.open_user_id" in message
+
     def get_attendance_for_user(self, user_id: int) -> List[Attendance]:
         """
         Get all attendance records for a specific user.
@@ -54,31 +84,61 @@ class AttendanceRepository:
         return self.db_session.query(Attendance).filter(
             Attendance.user_id == user_id
         ).order_by(Attendance.check_in.desc()).all()
+
+    def iter_attendance_for_user(self, user_id: int, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream attendance records for a user as plain row tuples.
+
+        Args:
+            user_id (int): User ID
+            batch_size (int): Number of rows fetched per round trip
+
+        Returns:
+            Iterator[Tuple]: Rows in `EXPORT_COLUMNS` order
+        """
+        stmt = select(*self.EXPORT_COLUMNS).where(Attendance.user_id == user_id)
+        return iter_keyset(self.db_session, stmt, Attendance.id, batch_size)
         
     def close_open_attendance(self, user_id: int, check_out: datetime) -> Optional[Attendance]:
         """
-        Find the latest open attendance (where check_out is NULL) and set check_out.
+        Set check_out on the user's open attendance (where check_out is NULL).
+
+        The record is closed with a single conditional UPDATE, so of several
+        concurrent check-outs exactly one succeeds.
 
         Args:
             user_id (int): User ID
             check_out (datetime): Time to set as check_out
 
         Returns:
-            Optional[Attendance]: Updated attendance record
+            Optional[Attendance]: Updated attendance record, or None if nothing was open
         """
+        # TIMESTAMP columns store whole seconds; match the stored value below
+        check_out = check_out.replace(microsecond=0)
         try:
-            open_attendance = self.db_session.query(Attendance).filter(
-                Attendance.user_id == user_id,
-                Attendance.check_out.is_(None)
-            ).order_by(Attendance.check_in.desc()).first()
-
-            if not open_attendance:
+            result = self.db_session.execute(
+                update(Attendance)
+                .where(Attendance.user_id == user_id, Attendance.check_out.is_(None))
+                .values(check_out=check_out)
+                .with_dialect_options(mysql_limit=1)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                # Nothing written here; earlier writes of the request stay pending
                 return None
 
-            open_attendance.check_out = check_out
+            # Read the closed row back inside the same transaction. Check-in is refused
+            # while a record is open, so the open record is always the user's newest one.
+            closed = self.db_session.execute(
+                select(Attendance)
+                .where(Attendance.user_id == user_id, Attendance.check_out == check_out)
+                .order_by(Attendance.id.desc())
+                .limit(1)
+            ).scalar_one()
+            # Detach so the commit doesn't expire it and trigger a refresh on access
+            self.db_session.expunge(closed)
             self.db_session.commit()
-            self.db_session.refresh(open_attendance)
-            return open_attendance
+            return closed
         except SQLAlchemyError as e:
             self.db_session.rollback()
             raise e
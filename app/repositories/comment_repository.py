@@ -4,8 +4,10 @@ from typing import List, Optional, Dict, Any, Tuple
 from app.models.comment import Comment
 from app.models.user import User
 from app.models.dtos.task_dtos import CommentCreate, CommentUpdate
+from app.utils.tracing_utils import traced
 
 
+@traced
 class CommentRepository:
     """Repository class for handling comment-related database operations."""
 
@@ -39,7 +41,6 @@ class CommentRepository:
             )
             self.db_session.add(comment)
             self.db_session.commit()
-            self.db_session.refresh(comment)
             return comment
         except Exception as e:
             self.db_session.rollback()
@@ -55,13 +56,25 @@ class CommentRepository:
         Returns:
             Tuple[Optional[Comment], Optional[User]]: Tuple of (Comment, User) if found, (None, None) otherwise.
         """
-        comment = self.db_session.query(Comment).filter(Comment.id == comment_id).first()
+        comment = self.db_session.get(Comment, comment_id)
         if not comment:
             return None, None
             
-        user = self.db_session.query(User).filter(User.id == comment.user_id).first()
+        user = self.db_session.get(User, comment.user_id)
         return comment, user
 
+    def get_author(self, user_id: int) -> Optional[User]:
+        """
+        Get the author of a comment by primary key (served from the session when already loaded).
+
+        Args:
+            user_id (int): User ID of the author.
+
+        Returns:
+            Optional[User]: The user if found, otherwise None.
+        """
+        return self.db_session.get(User, user_id)
+
     def get_comments_by_task(self, task_id: int, page: int = 1, page_size: int = 20) -> Tuple[List[Tuple[Comment, User]], int]:
         """
         Get paginated comments for a specific task along with user information.
@@ -120,13 +133,12 @@ class CommentRepository:
             Exception: If database operation fails.
         """
         try:
-            comment, _ = self.get_comment_by_id(comment_id)
+            comment = self.db_session.get(Comment, comment_id)
             if not comment:
                 return None
 
             comment.content = data.content
             self.db_session.commit()
-            self.db_session.refresh(comment)
             return comment
         except Exception as e:
             self.db_session.rollback()
@@ -146,7 +158,7 @@ class CommentRepository:
             Exception: If database operation fails.
         """
         try:
-            comment, _ = self.get_comment_by_id(comment_id)
+            comment = self.db_session.get(Comment, comment_id)
             if not comment:
                 return False
 
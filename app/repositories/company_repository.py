@@ -1,8 +1,14 @@
 from sqlalchemy.orm import Session
 from app.models.company import Company
 from app.models.dtos import CompanyCreate, CompanyUpdate
+from app.repositories.company_settings_repository import CompanySettingsRepository
+from app.repositories.department_repository import DepartmentRepository
+from app.repositories.team_repository import TeamRepository
+from app.utils.cache_utils import reference_cache
 from typing import List, Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class CompanyRepository:
     """
     Repository class for handling database operations related to Company.
@@ -18,7 +24,6 @@ class CompanyRepository:
         company = Company(**data.model_dump())
         self.db.add(company)
         self.db.commit()
-        self.db.refresh(company)
         return company
 
     def get_all(self) -> List[Company]:
@@ -31,7 +36,7 @@ class CompanyRepository:
         """
         Retrieve a single company by its ID.
         """
-        return self.db.query(Company).filter(Company.id == company_id).first()
+        return self.db.get(Company, company_id)
 
     def update(self, company_id: int, data: CompanyUpdate) -> Optional[Company]:
         """
@@ -43,7 +48,6 @@ class CompanyRepository:
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(company, key, value)
         self.db.commit()
-        self.db.refresh(company)
         return company
 
     def delete(self, company_id: int) -> bool:
@@ -55,4 +59,9 @@ class CompanyRepository:
             return False
         self.db.delete(company)
         self.db.commit()
+        # Settings, departments and their teams go with the company (ON DELETE CASCADE)
+        for namespace in (CompanySettingsRepository.CACHE_NAMESPACE,
+                          DepartmentRepository.CACHE_NAMESPACE,
+                          TeamRepository.CACHE_NAMESPACE):
+            reference_cache.invalidate(self.db, namespace)
         return True
\ No newline at end of file
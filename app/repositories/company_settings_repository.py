@@ -1,13 +1,18 @@
 from sqlalchemy.orm import Session
 from app.models.company_settings import CompanySettings
 from app.models.dtos.company_settings_dtos import CompanySettingsCreate, CompanySettingsUpdate
+from app.utils.cache_utils import reference_cache
 from typing import Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class CompanySettingsRepository:
     """
     Repository for managing company settings in the database.
     """
 
+    CACHE_NAMESPACE = "company_settings"
+
     def __init__(self, db: Session):
         """
         Initialize with DB session.
@@ -24,16 +29,27 @@ class CompanySettingsRepository:
         settings = CompanySettings(**data.model_dump())
         self.db.add(settings)
         self.db.commit()
-        self.db.refresh(settings)
+        reference_cache.invalidate(self.db, self.CACHE_NAMESPACE)
         return settings
 
     def get_by_company_id(self, company_id: int) -> Optional[CompanySettings]:
         """
         Get settings for a specific company.
 
+        Served from the tenant's reference cache; an instance returned on a cache
+        hit is detached from the session and must not be modified.
+
         :param company_id: ID of the company
         :return: CompanySettings instance or None
         """
+        rows = reference_cache.get_rows(
+            self.db, CompanySettings, self.CACHE_NAMESPACE, str(company_id),
+            lambda: self.db.query(CompanySettings).filter_by(company_id=company_id).limit(1).all()
+        )
+        return rows[0] if rows else None
+
+    def _get_for_write(self, company_id: int) -> Optional[CompanySettings]:
+        """Load the session-bound settings row, bypassing the cache."""
         return self.db.query(CompanySettings).filter_by(company_id=company_id).first()
 
     def update(self, company_id: int, data: CompanySettingsUpdate) -> Optional[CompanySettings]:
@@ -44,13 +60,13 @@ class CompanySettingsRepository:
         :param data: CompanySettingsUpdate DTO
         :return: Updated CompanySettings instance or None
         """
-        settings = self.get_by_company_id(company_id)
+        settings = self._get_for_write(company_id)
         if not settings:
             return None
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(settings, key, value)
         self.db.commit()
-        self.db.refresh(settings)
+        reference_cache.invalidate(self.db, self.CACHE_NAMESPACE)
         return settings
 
     def delete(self, company_id: int) -> bool:
@@ -60,9 +76,10 @@ class CompanySettingsRepository:
         :param company_id: ID of the company
         :return: True if deleted, False if not found
         """
-        settings = self.get_by_company_id(company_id)
+        settings = self._get_for_write(company_id)
         if not settings:
             return False
         self.db.delete(settings)
         self.db.commit()
+        reference_cache.invalidate(self.db, self.CACHE_NAMESPACE)
         return True
\ No newline at end of file
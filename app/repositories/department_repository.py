@@ -2,10 +2,16 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import Optional, List, Dict, Any
 from app.models.department import Department
+from app.repositories.team_repository import TeamRepository
+from app.utils.cache_utils import reference_cache
+from app.utils.tracing_utils import traced
 
+@traced
 class DepartmentRepository:
     """Repository for managing department-related database operations."""
 
+    CACHE_NAMESPACE = "departments"
+
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
@@ -24,7 +30,7 @@ class DepartmentRepository:
             department = Department(name=name, company_id=company_id)
             self.db_session.add(department)
             self.db_session.commit()
-            self.db_session.refresh(department)
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return department
         except Exception as e:
             self.db_session.rollback()
@@ -32,11 +38,14 @@ class DepartmentRepository:
 
     def get_department_by_id(self, department_id: int) -> Optional[Department]:
         """Retrieve a department by its ID."""
-        return self.db_session.query(Department).filter(Department.id == department_id).first()
+        return self.db_session.get(Department, department_id)
 
     def get_all_departments(self) -> List[Department]:
-        """Retrieve all departments."""
-        return self.db_session.query(Department).all()
+        """Retrieve all departments (cached per tenant; cache hits are detached, read-only instances)."""
+        return reference_cache.get_rows(
+            self.db_session, Department, self.CACHE_NAMESPACE, "all",
+            lambda: self.db_session.query(Department).all()
+        )
 
     def update_department(self, department_id: int, update_data: Dict[str, Any]) -> Optional[Department]:
         """
@@ -59,7 +68,8 @@ class DepartmentRepository:
                     setattr(department, key, value)
 
             self.db_session.commit()
-            self.db_session.refresh(department)
+
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return department
         except Exception as e:
             self.db_session.rollback()
@@ -77,6 +87,9 @@ class DepartmentRepository:
             if department:
                 self.db_session.delete(department)
                 self.db_session.commit()
+                reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
+                # Teams of the department are removed by ON DELETE CASCADE
+                reference_cache.invalidate(self.db_session, TeamRepository.CACHE_NAMESPACE)
                 return department
             return None
         except Exception as e:
@@ -1,13 +1,25 @@
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from app.models.file_attachment import FileAttachment
 from app.models.dtos.file_attachment_dtos import FileAttachmentCreate, FileAttachmentUpdate
-from typing import List, Optional
+from app.utils.db_utils import iter_keyset
+from app.utils.projection_utils import projection_columns
+from typing import List, Optional, Iterator, Tuple, FrozenSet
+from app.utils.tracing_utils import traced
 
+@traced
 class FileAttachmentRepository:
     """
     Repository for managing file attachments in the database.
     """
 
+    # Columns written by the streaming export, in output order
+    EXPORT_COLUMNS = (FileAttachment.id, FileAttachment.task_id, FileAttachment.file_path, FileAttachment.uploaded_at)
+
+    # Columns read by FileAttachmentResponse, selected by the list queries
+    LIST_COLUMNS = EXPORT_COLUMNS
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -18,20 +30,25 @@ class FileAttachmentRepository:
         attachment = FileAttachment(**data.model_dump())
         self.db.add(attachment)
         self.db.commit()
-        self.db.refresh(attachment)
         return attachment
 
-    def get_all(self) -> List[FileAttachment]:
+    def get_all(self, fields: Optional[FrozenSet[str]] = None) -> List[Row]:
+        """
+        Retrieve all file attachments as plain rows (only `fields` of `LIST_COLUMNS` when given).
+        """
+        return self.db.execute(select(*projection_columns(self.LIST_COLUMNS, fields))).all()
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Tuple]:
         """
-        Retrieve all file attachments.
+        Stream all file attachments as plain row tuples, `batch_size` rows per round trip.
         """
-        return self.db.query(FileAttachment).all()
+        return iter_keyset(self.db, select(*self.EXPORT_COLUMNS), FileAttachment.id, batch_size)
 
     def get_by_id(self, attachment_id: int) -> Optional[FileAttachment]:
         """
         Retrieve a file attachment by its ID.
         """
-        return self.db.query(FileAttachment).filter_by(id=attachment_id).first()
+        return self.db.get(FileAttachment, attachment_id)
 
     def get_by_task_id(self, task_id: int) -> List[FileAttachment]:
         """
@@ -49,7 +66,6 @@ class FileAttachmentRepository:
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(attachment, key, value)
         self.db.commit()
-        self.db.refresh(attachment)
         return attachment
 
     def delete(self, attachment_id: int) -> bool:
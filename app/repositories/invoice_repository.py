@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 from app.models.invoice import Invoice
 from app.models.dtos.invoice_dtos import InvoiceCreate, InvoiceUpdate
 from typing import List, Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class InvoiceRepository:
     """
     Repository for interacting with the Invoice table in the database.
@@ -18,7 +20,6 @@ class InvoiceRepository:
         invoice = Invoice(**data.model_dump())
         self.db.add(invoice)
         self.db.commit()
-        self.db.refresh(invoice)
         return invoice
 
     def get_all(self) -> List[Invoice]:
@@ -31,7 +32,7 @@ class InvoiceRepository:
         """
         Retrieve a specific invoice by its ID.
         """
-        return self.db.query(Invoice).filter(Invoice.id == invoice_id).first()
+        return self.db.get(Invoice, invoice_id)
 
     def update(self, invoice_id: int, data: InvoiceUpdate) -> Optional[Invoice]:
         """
@@ -43,7 +44,6 @@ class InvoiceRepository:
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(invoice, key, value)
         self.db.commit()
-        self.db.refresh(invoice)
         return invoice
 
     def delete(self, invoice_id: int) -> bool:
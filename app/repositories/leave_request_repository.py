@@ -2,7 +2,9 @@ from typing import Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.models.leave_request import LeaveRequest
+from app.utils.tracing_utils import traced
 
+@traced
 class LeaveRequestRepository:
     """Repository class for handling leave request-related database operations."""
 
@@ -46,7 +48,6 @@ class LeaveRequestRepository:
             )
             self.db_session.add(leave)
             self.db_session.commit()
-            self.db_session.refresh(leave)
             return leave
         except Exception as e:
             self.db_session.rollback()
@@ -62,7 +63,7 @@ class LeaveRequestRepository:
         Returns:
             Optional[LeaveRequest]: Leave request if found, otherwise None.
         """
-        return self.db_session.query(LeaveRequest).filter(LeaveRequest.id == leave_id).first()
+        return self.db_session.get(LeaveRequest, leave_id)
 
     def get_leave_requests_by_user(self, user_id: int) -> List[LeaveRequest]:
         """
@@ -93,7 +94,6 @@ class LeaveRequestRepository:
                 return None
             leave.status = status
             self.db_session.commit()
-            self.db_session.refresh(leave)
             return leave
         except Exception as e:
             self.db_session.rollback()
@@ -1,9 +1,18 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, delete, insert, exists, and_
 from app.models.notification import Notification
+from app.models.notification_archive import NotificationArchive
 from app.models.dtos.notification_dtos import NotificationCreate
 from typing import Optional, List
+from datetime import datetime
+from app.utils.tracing_utils import traced
 
+# Prefix of the message older versions wrote for every assignee on each task edit;
+# existing rows are still collapsed by `compact_task_update_notifications`
+TASK_UPDATE_MESSAGE_PREFIX = "Theres an update on task: "
+
+@traced
 class NotificationRepository:
     """Repository class for handling database operations related to notifications."""
 
@@ -28,14 +37,40 @@ class NotificationRepository:
         """
         new_notification = Notification(
             user_id=notification_create.user_id,
+            task_id=notification_create.task_id,
             message=notification_create.message,
             read_status=notification_create.read_status or False
         )
         self.db.add(new_notification)
         self.db.commit()
-        self.db.refresh(new_notification)
         return new_notification
 
+    def create_notifications(self, notifications: List[NotificationCreate]) -> int:
+        """
+        Insert many notifications with a single multi-row INSERT.
+
+        Unlike `create_notification` this does not commit; the caller owns the
+        transaction, so the notifications land together with the change they describe.
+
+        Args:
+            notifications (List[NotificationCreate]): Notifications to create.
+
+        Returns:
+            int: Number of notifications inserted.
+        """
+        if not notifications:
+            return 0
+        self.db.execute(insert(Notification), [
+            {
+                "user_id": notification.user_id,
+                "task_id": notification.task_id,
+                "message": notification.message,
+                "read_status": notification.read_status or False,
+            }
+            for notification in notifications
+        ])
+        return len(notifications)
+
     def get_notification_by_id(self, notification_id: int) -> Optional[Notification]:
         """
         Retrieve a notification by its ID.
@@ -46,7 +81,7 @@ class NotificationRepository:
         Returns:
             Optional[Notification]: Notification instance if found, otherwise None.
         """
-        return self.db.query(Notification).filter(Notification.id == notification_id).first()
+        return self.db.get(Notification, notification_id)
 
     def get_notifications_by_user(self, user_id: int) -> List[Notification]:
         """
@@ -74,7 +109,6 @@ class NotificationRepository:
         if notification:
             notification.read_status = True
             self.db.commit()
-            self.db.refresh(notification)
         return notification
 
     def delete_notification(self, notification_id: int) -> bool:
@@ -93,3 +127,111 @@ class NotificationRepository:
             self.db.commit()
             return True
         return False
+
+    def prune_read_notifications(self, older_than: datetime, batch_size: int = 1000,
+                                 archive: bool = False) -> int:
+        """
+        Delete (or archive) read notifications created before a cutoff.
+
+        Rows are processed in batches of at most `batch_size` ids, each committed
+        on its own, so no single statement holds locks on a large range.
+
+        Args:
+            older_than (datetime): Only notifications created before this are pruned.
+            batch_size (int): Maximum number of rows handled per statement.
+            archive (bool): Copy rows into `notifications_archive` before deleting.
+
+        Returns:
+            int: Number of notifications removed from the notifications table.
+        """
+        stmt = (
+            select(Notification.id)
+            .where(
+                Notification.read_status.is_(True),
+                Notification.created_at < older_than
+            )
+            .order_by(Notification.id)
+            .limit(batch_size)
+        )
+        return self._delete_in_batches(stmt, batch_size, archive)
+
+    def compact_task_update_notifications(self, batch_size: int = 1000) -> int:
+        """
+        Collapse duplicate task update notifications into the newest one.
+
+        A user receives a "Theres an update on task" row on every edit of a task
+        they are assigned to; only the most recent row per user and task is kept.
+        Rows are matched on `task_id` (indexed with `user_id`), never on the task
+        name, so two tasks sharing a name are kept apart. Rows whose task is
+        unknown (task deleted, or a name the migration could not resolve) are left alone.
+
+        Args:
+            batch_size (int): Maximum number of rows handled per statement.
+
+        Returns:
+            int: Number of duplicate notifications removed.
+        """
+        newer = aliased(Notification)
+        stmt = (
+            select(Notification.id)
+            .where(
+                Notification.task_id.is_not(None),
+                Notification.message.startswith(TASK_UPDATE_MESSAGE_PREFIX),
+                exists().where(and_(
+                    newer.user_id == Notification.user_id,
+                    newer.task_id == Notification.task_id,
+                    newer.id > Notification.id,
+                    newer.message.startswith(TASK_UPDATE_MESSAGE_PREFIX)
+                ))
+            )
+            .order_by(Notification.id)
+            .limit(batch_size)
+        )
+        return self._delete_in_batches(stmt, batch_size, archive=False)
+
+    def _delete_in_batches(self, id_stmt, batch_size: int, archive: bool) -> int:
+        """
+        Repeatedly select a batch of notification ids and delete them.
+
+        Args:
+            id_stmt: SELECT statement returning at most `batch_size` notification ids.
+            batch_size (int): Batch size used by `id_stmt`.
+            archive (bool): Copy the rows into `notifications_archive` first.
+
+        Returns:
+            int: Total number of deleted rows.
+        """
+        total = 0
+        while True:
+            try:
+                ids = self.db.scalars(id_stmt).all()
+                if not ids:
+                    break
+
+                if archive:
+                    self.db.execute(
+                        insert(NotificationArchive).from_select(
+                            ["id", "user_id", "message", "read_status", "created_at"],
+                            select(
+                                Notification.id,
+                                Notification.user_id,
+                                Notification.message,
+                                Notification.read_status,
+                                Notification.created_at
+                            ).where(Notification.id.in_(ids))
+                        )
+                    )
+                self.db.execute(
+                    delete(Notification)
+                    .where(Notification.id.in_(ids))
+                    .execution_options(synchronize_session=False)
+                )
+                self.db.commit()
+            except SQLAlchemyError as e:
+                self.db.rollback()
+                raise e
+
+            total += len(ids)
+            if len(ids) < batch_size:
+                break
+        return total
@@ -1,10 +1,15 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.permission import Permission
+from app.utils.cache_utils import reference_cache
+from app.utils.tracing_utils import traced
 
+@traced
 class PermissionRepository:
     """Repository class for handling permission-related database operations."""
 
+    CACHE_NAMESPACE = "permissions"
+
     def __init__(self, db_session: Session):
         """
         Initialize the PermissionRepository.
@@ -27,7 +32,7 @@ class PermissionRepository:
         permission = Permission(name=name)
         self.db_session.add(permission)
         self.db_session.commit()
-        self.db_session.refresh(permission)
+        reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
         return permission
     
     def create_permissions_bulk(self, names: List[str]) -> List[Permission]:
@@ -41,8 +46,10 @@ class PermissionRepository:
             List[Permission]: List of created Permission objects.
         """
         permissions = [Permission(name=name) for name in names]
-        self.db_session.bulk_save_objects(permissions)
+        # add_all (not bulk_save_objects) so the flush events bump the table version
+        self.db_session.add_all(permissions)
         self.db_session.commit()
+        reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
 
         # Optional: re-query to get full objects with IDs
         return self.db_session.query(Permission).filter(Permission.name.in_(names)).all()
@@ -58,7 +65,7 @@ class PermissionRepository:
         Returns:
             Optional[Permission]: Permission object if found, otherwise None.
         """
-        return self.db_session.query(Permission).filter(Permission.id == permission_id).first()
+        return self.db_session.get(Permission, permission_id)
 
     def get_permission_by_name(self, name: str) -> Optional[Permission]:
         """
@@ -76,10 +83,16 @@ class PermissionRepository:
         """
         List all permissions.
 
+        Served from the tenant's reference cache; permissions returned on a cache
+        hit are detached from the session and must not be modified.
+
         Returns:
             List[Permission]: All permission objects.
         """
-        return self.db_session.query(Permission).all()
+        return reference_cache.get_rows(
+            self.db_session, Permission, self.CACHE_NAMESPACE, "all",
+            lambda: self.db_session.query(Permission).all()
+        )
 
     def update_permission(self, permission_id: int, name: str) -> Optional[Permission]:
         """
@@ -96,7 +109,7 @@ class PermissionRepository:
         if permission:
             permission.name = name
             self.db_session.commit()
-            self.db_session.refresh(permission)
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return permission
         return None
 
@@ -114,5 +127,6 @@ class PermissionRepository:
         if permission:
             self.db_session.delete(permission)
             self.db_session.commit()
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return permission
         return None
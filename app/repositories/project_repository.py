@@ -1,17 +1,31 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Optional, List, Tuple, Dict, Any
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from typing import Optional, List, Tuple, Dict, Any, FrozenSet
 from app.models.project import Project
 from app.models.user_project import UserProject
 from datetime import date
-from app.models.dtos.notification_dtos import NotificationCreate
-from app.controllers.notification_controller import NotificationController
+from app.repositories.assignment_repository import AssignmentRepository
+from app.utils.projection_utils import projection_columns
+from app.utils.tracing_utils import traced
 
+@traced
 class ProjectRepository:
     """Repository for managing project-related database operations."""
 
+    # Notifications sent to users added to / removed from a project
+    ASSIGNED_MESSAGE = "You have been assigned to the project '{name}'"
+    UNASSIGNED_MESSAGE = "You have been removed from the project '{name}'"
+
+    # Columns read by ProjectResponse, selected by the list queries
+    LIST_COLUMNS = (
+        Project.id, Project.name, Project.description, Project.start_date,
+        Project.end_date, Project.status, Project.created_at
+    )
+
     def __init__(self, db_session: Session):
         self.db_session = db_session
+        self.assignments = AssignmentRepository(db_session, UserProject, "project_id")
 
     def create_project(
         self,
@@ -46,15 +60,11 @@ class ProjectRepository:
             )
             self.db_session.add(project)
             self.db_session.flush()  # To get project.id before assigning users
-            notf_controller = NotificationController(self.db_session)
             if assigned_user_ids:
-                for user_id in assigned_user_ids:
-                    self.db_session.add(UserProject(user_id=user_id, project_id=project.id))
-                    notif = NotificationCreate(user_id=user_id, message=f"You have been assigned to the project '{name}'")
-                    notf_controller.create_notification(notif)
+                diffs = self.assignments.sync({project.id: assigned_user_ids}, current={project.id: set()})
+                self.assignments.notify(diffs, {project.id: name}, self.ASSIGNED_MESSAGE, self.UNASSIGNED_MESSAGE)
 
             self.db_session.commit()
-            self.db_session.refresh(project)
             return project
         except Exception as e:
             self.db_session.rollback()
@@ -62,11 +72,20 @@ class ProjectRepository:
 
     def get_project_by_id(self, project_id: int) -> Optional[Project]:
         """Retrieve a project by its ID."""
-        return self.db_session.query(Project).filter(Project.id == project_id).first()
+        return self.db_session.get(Project, project_id)
 
-    def get_all_projects(self) -> List[Project]:
-        """Retrieve all projects."""
-        return self.db_session.query(Project).order_by(Project.created_at.desc()).all()
+    def get_all_projects(self, fields: Optional[FrozenSet[str]] = None) -> List[Row]:
+        """
+        Retrieve all projects as plain rows, newest first.
+
+        Args:
+            fields (Optional[FrozenSet[str]]): Only select these `LIST_COLUMNS` (plus the id).
+
+        Returns:
+            List[Row]: Project rows; no ORM objects are loaded.
+        """
+        stmt = select(*projection_columns(self.LIST_COLUMNS, fields)).order_by(Project.created_at.desc())
+        return self.db_session.execute(stmt).all()
 
     def update_project(
         self,
@@ -93,33 +112,12 @@ class ProjectRepository:
             for key, value in update_data.items():
                 if hasattr(project, key) and value is not None:
                     setattr(project, key, value)
-            notif_controller = NotificationController(self.db_session)
             if assigned_user_ids is not None:
-                current_assignments = self.db_session.query(UserProject).filter(
-                    UserProject.project_id == project_id
-                ).all()
-                current_user_ids = {up.user_id for up in current_assignments}
-                new_user_ids = set(assigned_user_ids)
-                for user_id in new_user_ids:
-                    notif = NotificationCreate(user_id=user_id, message=f"Theres a change in '{project.name}' project")
-                    notif_controller.create_notification(notif)
-
-                users_to_remove = current_user_ids - new_user_ids
-                users_to_add = new_user_ids - current_user_ids
-
-                if users_to_remove:
-                    self.db_session.query(UserProject).filter(
-                        UserProject.project_id == project_id,
-                        UserProject.user_id.in_(users_to_remove)
-                    ).delete(synchronize_session=False)
-
-                for user_id in users_to_add:
-                    self.db_session.add(UserProject(user_id=user_id, project_id=project_id))
-                    notif = NotificationCreate(user_id=user_id, message=f"You have been assigned to the project '{project.name}'")
-                    notif_controller.create_notification(notif)
+                # Only added/removed members are written and notified
+                diffs = self.assignments.sync({project_id: assigned_user_ids})
+                self.assignments.notify(diffs, {project_id: project.name}, self.ASSIGNED_MESSAGE, self.UNASSIGNED_MESSAGE)
 
             self.db_session.commit()
-            self.db_session.refresh(project)
             return project
         except Exception as e:
             self.db_session.rollback()
@@ -0,0 +1,109 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from typing import Dict, Optional
+from datetime import datetime
+import numpy as np
+
+from app.models.user import User
+from app.models.time_log import TimeLog
+from app.models.attendance import Attendance
+from app.models.company_settings import CompanySettings
+from app.services.utilization import to_epoch_seconds
+from app.utils.tracing_utils import traced
+
+DEFAULT_WORK_HOURS_PER_DAY = 8
+
+
+@traced
+class ReportRepository:
+    """Repository pulling report inputs as column arrays instead of ORM objects."""
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def get_users(self, team_id: Optional[int] = None, department_id: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Fetch user ids with their team and department ids.
+
+        Missing team/department ids are returned as -1.
+        """
+        stmt = select(
+            User.id,
+            func.coalesce(User.team_id, -1),
+            func.coalesce(User.department_id, -1)
+        ).order_by(User.id)
+        if team_id is not None:
+            stmt = stmt.where(User.team_id == team_id)
+        if department_id is not None:
+            stmt = stmt.where(User.department_id == department_id)
+
+        rows = self.db_session.execute(stmt).all()
+        columns = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        return {"id": columns[:, 0], "team_id": columns[:, 1], "department_id": columns[:, 2]}
+
+    def get_time_log_intervals(self, start: datetime, end: datetime) -> Dict[str, np.ndarray]:
+        """
+        Fetch (user_id, start, end) of every time log overlapping [start, end).
+
+        Logs without an end time end `duration` minutes after they start.
+        """
+        rows = self.db_session.execute(
+            select(
+                TimeLog.user_id,
+                TimeLog.start_time,
+                TimeLog.end_time,
+                func.coalesce(TimeLog.duration, 0)
+            ).where(
+                TimeLog.start_time < end,
+                (TimeLog.end_time.is_(None)) | (TimeLog.end_time > start)
+            )
+        ).all()
+        if not rows:
+            return self._empty_intervals()
+
+        user_ids, starts, ends, durations = zip(*rows)
+        start_seconds = to_epoch_seconds(starts).astype(np.int64)
+        end_seconds = to_epoch_seconds(ends)
+        fallback = start_seconds + np.asarray(durations, dtype=np.int64) * 60
+        end_seconds = np.where(np.isnat(end_seconds), fallback, end_seconds.astype(np.int64))
+        return {
+            "user_id": np.asarray(user_ids, dtype=np.int64),
+            "start": start_seconds,
+            "end": end_seconds,
+        }
+
+    def get_attendance_intervals(self, start: datetime, end: datetime) -> Dict[str, np.ndarray]:
+        """
+        Fetch (user_id, check_in, check_out) of closed attendance records overlapping [start, end).
+
+        Open records (no check-out yet) are left out.
+        """
+        rows = self.db_session.execute(
+            select(Attendance.user_id, Attendance.check_in, Attendance.check_out).where(
+                Attendance.check_out.is_not(None),
+                Attendance.check_in < end,
+                Attendance.check_out > start
+            )
+        ).all()
+        if not rows:
+            return self._empty_intervals()
+
+        user_ids, check_ins, check_outs = zip(*rows)
+        return {
+            "user_id": np.asarray(user_ids, dtype=np.int64),
+            "start": to_epoch_seconds(check_ins).astype(np.int64),
+            "end": to_epoch_seconds(check_outs).astype(np.int64),
+        }
+
+    def get_work_hours_per_day(self, company_id: Optional[int] = None) -> int:
+        """Return the configured work hours per day, falling back to 8."""
+        stmt = select(CompanySettings.work_hours_per_day)
+        if company_id is not None:
+            stmt = stmt.where(CompanySettings.company_id == company_id)
+        hours = self.db_session.execute(stmt.limit(1)).scalar()
+        return hours or DEFAULT_WORK_HOURS_PER_DAY
+
+    @staticmethod
+    def _empty_intervals() -> Dict[str, np.ndarray]:
+        empty = np.zeros(0, dtype=np.int64)
+        return {"user_id": empty, "start": empty, "end": empty}
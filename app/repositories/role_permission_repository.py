@@ -3,7 +3,9 @@ from app.models.role_permission import RolePermission
 from app.models.dtos.role_permission_dto import RolePermissionCreate
 from app.models.permission import Permission
 from typing import List
+from app.utils.tracing_utils import traced
 
+@traced
 class RolePermissionRepository:
     """
     Repository for handling role-permission relationship data.
@@ -25,7 +27,6 @@ class RolePermissionRepository:
         role_permission = RolePermission(**data.model_dump())
         self.db.add(role_permission)
         self.db.commit()
-        self.db.refresh(role_permission)
         return role_permission
     
     def create_bulk(self, data_list: List[RolePermissionCreate]) -> List[RolePermission]:
@@ -36,7 +37,8 @@ class RolePermissionRepository:
         :return: List of created RolePermission instances
         """
         role_permissions = [RolePermission(**data.model_dump()) for data in data_list]
-        self.db.bulk_save_objects(role_permissions)
+        # add_all (not bulk_save_objects) so the flush events bump the table version
+        self.db.add_all(role_permissions)
         self.db.commit()
 
         # Optional: return all role-permissions just inserted
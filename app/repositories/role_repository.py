@@ -1,10 +1,15 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.role import Role  # Adjust path if needed
+from app.utils.cache_utils import reference_cache
+from app.utils.tracing_utils import traced
 
+@traced
 class RoleRepository:
     """Repository class for handling role-related database operations."""
 
+    CACHE_NAMESPACE = "roles"
+
     def __init__(self, db_session: Session):
         """
         Initialize the RoleRepository.
@@ -27,7 +32,7 @@ class RoleRepository:
         role = Role(name=name)
         self.db_session.add(role)
         self.db_session.commit()
-        self.db_session.refresh(role)
+        reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
         return role
     
     def create_roles_bulk(self, names: List[str]) -> List[Role]:
@@ -41,8 +46,10 @@ class RoleRepository:
             List[Role]: List of created roles objects.
         """
         roles = [Role(name=name) for name in names]
-        self.db_session.bulk_save_objects(roles)
+        # add_all (not bulk_save_objects) so the flush events bump the table version
+        self.db_session.add_all(roles)
         self.db_session.commit()
+        reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
 
         # Optional: re-query to get full objects with IDs
         return self.db_session.query(Role).filter(Role.name.in_(names)).all()
@@ -57,7 +64,7 @@ class RoleRepository:
         Returns:
             Optional[Role]: Role object if found, otherwise None.
         """
-        return self.db_session.query(Role).filter(Role.id == role_id).first()
+        return self.db_session.get(Role, role_id)
 
     def get_role_by_name(self, name: str) -> Optional[Role]:
         """
@@ -75,10 +82,16 @@ class RoleRepository:
         """
         List all roles.
 
+        Served from the tenant's reference cache; roles returned on a cache hit
+        are detached from the session and must not be modified.
+
         Returns:
             List[Role]: All role objects.
         """
-        return self.db_session.query(Role).all()
+        return reference_cache.get_rows(
+            self.db_session, Role, self.CACHE_NAMESPACE, "all",
+            lambda: self.db_session.query(Role).all()
+        )
 
     def update_role(self, role_id: int, name: str) -> Optional[Role]:
         """
@@ -95,7 +108,7 @@ class RoleRepository:
         if role:
             role.name = name
             self.db_session.commit()
-            self.db_session.refresh(role)
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return role
         return None
 
@@ -113,5 +126,6 @@ class RoleRepository:
         if role:
             self.db_session.delete(role)
             self.db_session.commit()
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return role
         return None
\ No newline at end of file
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import update, func, or_, and_, desc, text, case
-from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import update, func, or_, and_, desc, text, case, select, bindparam
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Iterable, Set, FrozenSet
+from sqlalchemy.engine import Row
 from app.models.task import Task
 from app.models.task_assignment import TaskAssignment
 from app.models.comment import Comment
@@ -8,14 +9,35 @@ from app.models.file_attachment import FileAttachment
 from app.models.user import User
 from app.models.project import Project
 from app.models.dtos import TaskDetailResponse, TaskStatistics, StatusEnum, TaskResponse
-from app.models.dtos.notification_dtos import NotificationCreate
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.timelog_rollup_repository import TimeLogRollupRepository
 from datetime import date, datetime
 import logging
-from app.controllers.notification_controller import NotificationController
+from app.utils.db_utils import iter_keyset
+from app.utils.projection_utils import projection_columns
+from app.utils.tracing_utils import traced
 
+@traced
 class TaskRepository:
     """Repository class for handling task-related database operations."""
 
+    # Columns written by the streaming export, in output order
+    EXPORT_COLUMNS = (
+        Task.id, Task.project_id, Task.name, Task.description, Task.priority,
+        Task.status, Task.due_date, Task.created_at, Task.updated_at
+    )
+
+    # Columns read by TaskResponse, selected by the list queries
+    LIST_COLUMNS = EXPORT_COLUMNS
+
+    # Hot lookup, built once with a bound parameter so every call reuses the
+    # same construct and SQLAlchemy's compiled SQL
+    TASK_ASSIGNEES = select(TaskAssignment.user_id).where(TaskAssignment.task_id == bindparam("task_id"))
+
+    # Notifications sent to users added to / removed from a task
+    ASSIGNED_MESSAGE = "You have been assigned to task '{name}'"
+    UNASSIGNED_MESSAGE = "You have been removed from task '{name}'"
+
     def __init__(self, db_session: Session):
         """
         Initialize the TaskRepository.
@@ -24,6 +46,7 @@ class TaskRepository:
             db_session (Session): SQLAlchemy database session.
         """
         self.db_session = db_session
+        self.assignments = AssignmentRepository(db_session, TaskAssignment, "task_id", notification_column="task_id")
 
     def create_task(self, 
                    project_id: int, 
@@ -59,23 +82,12 @@ class TaskRepository:
                 due_date=due_date
             )
             self.db_session.add(task)
-            self.db_session.flush() 
-            
-            notif_controller = NotificationController(self.db_session)
+            self.db_session.flush()
 
             if assigned_user_ids:
-                for user_id in assigned_user_ids:
-                    assignment = TaskAssignment(
-                        task_id=task.id,
-                        user_id=user_id
-                    )
-                    self.db_session.add(assignment)
-                    notif=NotificationCreate(
-                        user_id=user_id,
-                        message=f"You have been assigned to task '{name}'",)
-                    notif_controller.create_notification(notif )
+                diffs = self.assignments.sync({task.id: assigned_user_ids}, current={task.id: set()})
+                self.assignments.notify(diffs, {task.id: name}, self.ASSIGNED_MESSAGE, self.UNASSIGNED_MESSAGE)
             self.db_session.commit()
-            self.db_session.refresh(task)
             return task
         except Exception as e:
             self.db_session.rollback()
@@ -83,7 +95,7 @@ class TaskRepository:
 
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
-        Retrieve a task by ID.
+        Retrieve a task by ID (served from the session when already loaded).
 
         Args:
             task_id (int): Task ID.
@@ -91,7 +103,7 @@ class TaskRepository:
         Returns:
             Optional[Task]: Task object if found, otherwise None.
         """
-        return self.db_session.query(Task).filter(Task.id == task_id).first()
+        return self.db_session.get(Task, task_id)
     
     def get_task_with_details(self, task_id: int) -> Optional[TaskDetailResponse]:
         """
@@ -103,8 +115,8 @@ class TaskRepository:
         Returns:
             Optional[TaskDetailResponse]: Detailed task response if found
         """
-        # Get the basic task
-        task = self.db_session.query(Task).filter(Task.id == task_id).first()
+        # Get the basic task (no query when the caller already loaded it)
+        task = self.get_task_by_id(task_id)
         
         if not task:
             return None
@@ -127,12 +139,10 @@ class TaskRepository:
         ).all()
         
         # Get project info
-        project = self.db_session.query(Project).filter(
-            Project.id == task.project_id
-        ).first()
+        project = self.db_session.get(Project, task.project_id)
         
         # Create response DTO
-        task_base = TaskDetailResponse.from_orm(task)
+        task_base = TaskDetailResponse.model_validate(task)
         
         # Add relationships
         task_base.assigned_users_details = assigned_users
@@ -155,24 +165,38 @@ class TaskRepository:
         Returns:
             List[int]: List of assigned user IDs
         """
-        assignments = self.db_session.query(TaskAssignment.user_id).filter(
-            TaskAssignment.task_id == task_id
-        ).all() 
-        
-        return [assignment[0] for assignment in assignments]
+        return list(self.db_session.scalars(self.TASK_ASSIGNEES, {"task_id": task_id}))
     
-    def get_tasks_by_project(self, project_id: int) -> List[Task]:
+    def get_tasks_by_project(self, project_id: int, fields: Optional[FrozenSet[str]] = None) -> List[Row]:
         """
-        Get all tasks for a specific project.
+        Get all tasks for a specific project as plain rows.
 
         Args:
             project_id (int): Project ID
+            fields (Optional[FrozenSet[str]]): Only select these `LIST_COLUMNS` (plus the id)
 
         Returns:
-            List[Task]: List of tasks in the project
+            List[Row]: Task rows; no ORM objects are loaded
         """
-        return self.db_session.query(Task).filter(Task.project_id == project_id).all()
+        stmt = select(*projection_columns(self.LIST_COLUMNS, fields)).where(Task.project_id == project_id)
+        return self.db_session.execute(stmt).all()
     
+    def iter_tasks(self, project_id: Optional[int] = None, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream tasks as plain row tuples, `batch_size` rows per round trip.
+
+        Args:
+            project_id (Optional[int]): Only export tasks of this project
+            batch_size (int): Number of rows fetched per page
+
+        Returns:
+            Iterator[Tuple]: Rows in `EXPORT_COLUMNS` order
+        """
+        stmt = select(*self.EXPORT_COLUMNS)
+        if project_id:
+            stmt = stmt.where(Task.project_id == project_id)
+        return iter_keyset(self.db_session, stmt, Task.id, batch_size)
+
     def get_tasks_by_user(self, user_id: int) -> List[Task]:
         """
         Get all tasks assigned to a specific user.
@@ -237,12 +261,13 @@ class TaskRepository:
 
         offset = (page - 1) * page_size
 
-        # Eagerly load assignments to reduce number of queries
         tasks = query.order_by(Task.updated_at.desc()).offset(offset).limit(page_size).all()
 
+        # Assignments of the whole page in one query
+        assignments = self.get_assignments_for_tasks(task.id for task in tasks)
         task_responses = []
         for task in tasks:
-            assigned_user_ids = self.get_task_assignments(task.id)
+            assigned_user_ids = assignments.get(task.id, [])
             task_responses.append(TaskResponse(
                 id=task.id,
                 name=task.name,
@@ -277,38 +302,188 @@ class TaskRepository:
             task = self.get_task_by_id(task_id)
             if not task:
                 return None
+            previous_project_id = task.project_id
             
             # Update task fields
             for key, value in update_data.items():
                 if hasattr(task, key) and value is not None:
                     setattr(task, key, value)
+            if task.project_id != previous_project_id:
+                TimeLogRollupRepository(self.db_session).move_task(task_id, task.project_id)
                     
-            # Update task assignments (nese jon)
+            # Update task assignments (nese jon), touching only the changed ones
             if assigned_user_ids is not None:
-                # Remove existing assignments
-                self.db_session.query(TaskAssignment).filter(
-                    TaskAssignment.task_id == task_id
-                ).delete()
-                notif_controller = NotificationController(self.db_session)
-                # Create new assignments
-                for user_id in assigned_user_ids:
-                    assignment = TaskAssignment(
-                        task_id=task_id,
-                        user_id=user_id
-                    )
-                    self.db_session.add(assignment)
-                    notif=NotificationCreate(
-                        user_id=user_id,
-                        message=f"Theres an update on task: '{task.name}'",)
-                    notif_controller.create_notification(notif )
-            
+                diffs = self.assignments.sync({task_id: assigned_user_ids})
+                self.assignments.notify(diffs, {task_id: task.name}, self.ASSIGNED_MESSAGE, self.UNASSIGNED_MESSAGE)
+
             self.db_session.commit()
-            self.db_session.refresh(task)
             return task
         except Exception as e:
             self.db_session.rollback()
             raise e
 
+    def get_existing_ids(self, model, ids: Iterable[int]) -> Set[int]:
+        """
+        Return which of the given primary keys exist for a model.
+
+        Args:
+            model: Mapped class with an `id` column (e.g. User, Project).
+            ids (Iterable[int]): IDs to check.
+
+        Returns:
+            Set[int]: The IDs that exist.
+        """
+        ids = list(ids)
+        if not ids:
+            return set()
+        return set(self.db_session.execute(select(model.id).where(model.id.in_(ids))).scalars())
+
+    def get_task_names(self, task_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Get the names of the given tasks; missing tasks are left out.
+
+        Args:
+            task_ids (Iterable[int]): Task IDs
+
+        Returns:
+            Dict[int, str]: Task name by ID
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+        return dict(self.db_session.execute(
+            select(Task.id, Task.name).where(Task.id.in_(task_ids))
+        ).all())
+
+    def get_task_rows(self, task_ids: Iterable[int]) -> Dict[int, Any]:
+        """
+        Read tasks as plain rows (no ORM objects) in a single query.
+
+        Args:
+            task_ids (Iterable[int]): Task IDs
+
+        Returns:
+            Dict[int, Any]: Row with the task columns, by task ID
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+        rows = self.db_session.execute(
+            select(
+                Task.id, Task.project_id, Task.name, Task.description, Task.priority,
+                Task.status, Task.due_date, Task.created_at, Task.updated_at
+            ).where(Task.id.in_(task_ids))
+        ).all()
+        return {row.id: row for row in rows}
+
+    def get_assignments_for_tasks(self, task_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """
+        Get the assigned user IDs of many tasks in a single query.
+
+        Args:
+            task_ids (Iterable[int]): Task IDs
+
+        Returns:
+            Dict[int, List[int]]: Assigned user IDs by task ID (tasks without assignees are left out)
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+        assignments: Dict[int, List[int]] = {}
+        rows = self.db_session.execute(
+            select(TaskAssignment.task_id, TaskAssignment.user_id)
+            .where(TaskAssignment.task_id.in_(task_ids))
+            .order_by(TaskAssignment.task_id, TaskAssignment.user_id)
+        )
+        for task_id, user_id in rows:
+            assignments.setdefault(task_id, []).append(user_id)
+        return assignments
+
+    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many tasks, their assignments and notifications in one transaction.
+
+        Assignments and notifications are written with one multi-row INSERT each and
+        everything is committed once. Tasks themselves are inserted row by row during
+        the flush because MySQL cannot return the generated ids of a multi-row INSERT.
+
+        Args:
+            tasks (List[Dict[str, Any]]): Task column values, each optionally with
+                `assigned_user_ids`.
+
+        Returns:
+            List[int]: IDs of the created tasks, in input order
+        """
+        try:
+            created = []
+            for data in tasks:
+                data = dict(data)
+                assigned_user_ids = data.pop("assigned_user_ids", None) or []
+                created.append((Task(**data), assigned_user_ids))
+            self.db_session.add_all([task for task, _ in created])
+            self.db_session.flush()
+
+            diffs = self.assignments.sync(
+                {task.id: user_ids for task, user_ids in created if user_ids},
+                current={task.id: set() for task, _ in created}
+            )
+            self.assignments.notify(
+                diffs, {task.id: task.name for task, _ in created}, self.ASSIGNED_MESSAGE, self.UNASSIGNED_MESSAGE
+            )
+
+            task_ids = [task.id for task, _ in created]
+            self.db_session.commit()
+            return task_ids
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
+
+    def bulk_update_tasks(self,
+                          field_updates: Dict[int, Dict[str, Any]],
+                          assignments: Dict[int, List[int]],
+                          task_names: Dict[int, str]) -> None:
+        """
+        Apply field and assignment changes to many tasks in one transaction.
+
+        All field changes go into a single UPDATE (one CASE per changed column);
+        assignments are diffed against the current ones so only removed pairs are
+        deleted and only new pairs inserted. Only added and removed users are
+        notified, with one multi-row INSERT.
+
+        Args:
+            field_updates (Dict[int, Dict[str, Any]]): Column values to set, by task ID
+            assignments (Dict[int, List[int]]): New full assignee list, by task ID
+            task_names (Dict[int, str]): Names of the tasks, used in notifications
+        """
+        try:
+            columns = {}
+            for task_id, values in field_updates.items():
+                for column, value in values.items():
+                    columns.setdefault(column, {})[task_id] = value
+            if columns:
+                self.db_session.execute(
+                    update(Task)
+                    .where(Task.id.in_(list(field_updates)))
+                    .values({
+                        column: case(values, value=Task.id, else_=getattr(Task, column))
+                        for column, values in columns.items()
+                    })
+                    .execution_options(synchronize_session=False)
+                )
+            rollups = TimeLogRollupRepository(self.db_session)
+            for task_id, values in field_updates.items():
+                if values.get("project_id") is not None:
+                    rollups.move_task(task_id, values["project_id"])
+
+            if assignments:
+                diffs = self.assignments.sync(assignments)
+                self.assignments.notify(diffs, task_names, self.ASSIGNED_MESSAGE, self.UNASSIGNED_MESSAGE)
+
+            self.db_session.commit()
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
+
     def delete_task(self, task_id: int) -> Optional[Task]:
         """
         Delete a task and its assignments by ID.
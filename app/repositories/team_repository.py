@@ -3,11 +3,16 @@ from sqlalchemy import func
 from typing import Optional, List, Dict, Any
 from app.models.team import Team
 from app.models.department import Department
+from app.utils.cache_utils import reference_cache
+from app.utils.tracing_utils import traced
 
 
+@traced
 class TeamRepository:
     """Repository for managing team-related database operations."""
 
+    CACHE_NAMESPACE = "teams"
+
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
@@ -26,7 +31,7 @@ class TeamRepository:
             team = Team(name=name, department_id=department_id)
             self.db_session.add(team)
             self.db_session.commit()
-            self.db_session.refresh(team)
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return team
         except Exception as e:
             self.db_session.rollback()
@@ -34,11 +39,14 @@ class TeamRepository:
 
     def get_team_by_id(self, team_id: int) -> Optional[Team]:
         """Retrieve a team by its ID."""
-        return self.db_session.query(Team).filter(Team.id == team_id).first()
+        return self.db_session.get(Team, team_id)
 
     def get_all_teams(self) -> List[Team]:
-        """Retrieve all teams."""
-        return self.db_session.query(Team).order_by(Team.id).all()
+        """Retrieve all teams (cached per tenant; cache hits are detached, read-only instances)."""
+        return reference_cache.get_rows(
+            self.db_session, Team, self.CACHE_NAMESPACE, "all",
+            lambda: self.db_session.query(Team).order_by(Team.id).all()
+        )
 
     def update_team(self, team_id: int, update_data: Dict[str, Any]) -> Optional[Team]:
         """
@@ -61,7 +69,8 @@ class TeamRepository:
                     setattr(team, key, value)
 
             self.db_session.commit()
-            self.db_session.refresh(team)
+
+            reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
             return team
         except Exception as e:
             self.db_session.rollback()
@@ -79,6 +88,7 @@ class TeamRepository:
             if team:
                 self.db_session.delete(team)
                 self.db_session.commit()
+                reference_cache.invalidate(self.db_session, self.CACHE_NAMESPACE)
                 return team
             return None
         except Exception as e:
@@ -1,9 +1,12 @@
+from sqlalchemy import select, insert, delete
 from sqlalchemy.orm import Session
 from app.models.tenant_user import TenantUser
 from app.models.dtos import TenantUserCreate
 from app.utils import hash_password
+from app.utils.tracing_utils import traced
 
 
+@traced
 class TenantUserRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -18,8 +21,45 @@ class TenantUserRepository:
 
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
         return user
 
     def get_by_email(self, email: str) -> TenantUser | None:
         return self.db.query(TenantUser).filter(TenantUser.email == email).first()
+
+    def list_tenant_schemas(self) -> list[str]:
+        """Return the distinct tenant schema names (without the `tenant_` prefix)."""
+        rows = self.db.query(TenantUser.tenant_schema).distinct().all()
+        return [row[0] for row in rows]
+
+    def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """Return which of the given emails are already registered with any tenant."""
+        if not emails:
+            return set()
+        rows = self.db.execute(select(TenantUser.email).where(TenantUser.email.in_(emails)))
+        return {row[0] for row in rows}
+
+    def bulk_create(self, emails: list[str], tenant_schema: str) -> None:
+        """Register many emails with a tenant in one multi-row insert and commit."""
+        if not emails:
+            return
+        try:
+            self.db.execute(insert(TenantUser), [
+                {"email": email, "tenant_schema": tenant_schema} for email in emails
+            ])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def bulk_delete(self, emails: list[str], tenant_schema: str) -> None:
+        """Unregister emails from a tenant (undoes `bulk_create`) and commit."""
+        if not emails:
+            return
+        try:
+            self.db.execute(
+                delete(TenantUser).where(TenantUser.email.in_(emails), TenantUser.tenant_schema == tenant_schema)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
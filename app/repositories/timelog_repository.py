@@ -1,17 +1,28 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional, Tuple
-from sqlalchemy import desc
+from typing import List, Optional, Tuple, Iterator
+from sqlalchemy import desc, select
 from datetime import datetime
 
 from app.models.time_log import TimeLog 
 from app.models.dtos.timelog_dtos import TimeLogCreate, TimeLogUpdate  
+from app.utils.db_utils import iter_keyset
+from app.repositories.timelog_rollup_repository import TimeLogRollupRepository
+from app.utils.tracing_utils import traced
 
 
+@traced
 class TimeLogRepository:
     """Repository class for handling time log-related database operations."""
 
+    # Columns written by the streaming export, in output order
+    EXPORT_COLUMNS = (
+        TimeLog.id, TimeLog.user_id, TimeLog.task_id,
+        TimeLog.start_time, TimeLog.end_time, TimeLog.duration
+    )
+
     def __init__(self, db_session: Session):
         self.db_session = db_session
+        self.rollups = TimeLogRollupRepository(db_session)
 
     from datetime import timedelta
 
@@ -28,8 +39,8 @@ class TimeLogRepository:
                 duration=duration,
             )
             self.db_session.add(time_log)
+            self.rollups.apply_delta(user_id, data.task_id, data.start_time, duration, 1)
             self.db_session.commit()
-            self.db_session.refresh(time_log)
             return time_log
         except Exception as e:
             self.db_session.rollback()
@@ -39,12 +50,17 @@ class TimeLogRepository:
 
     def get_time_log_by_id(self, time_log_id: int) -> Optional[TimeLog]:
         """Get a time log by its ID."""
-        return self.db_session.query(TimeLog).filter(TimeLog.id == time_log_id).first()
+        return self.db_session.get(TimeLog, time_log_id)
 
     def get_time_logs_by_user(self, user_id: int) -> List[TimeLog]:
         """Get all time logs for a specific user."""
         return self.db_session.query(TimeLog).filter(TimeLog.user_id == user_id).order_by(desc(TimeLog.start_time)).all()
 
+    def iter_time_logs_by_user(self, user_id: int, batch_size: int = 1000) -> Iterator[Tuple]:
+        """Stream a user's time logs as plain row tuples, one page of `batch_size` at a time."""
+        stmt = select(*self.EXPORT_COLUMNS).where(TimeLog.user_id == user_id)
+        return iter_keyset(self.db_session, stmt, TimeLog.id, batch_size)
+
     def get_time_logs_by_task(self, task_id: int) -> List[TimeLog]:
         """Get all time logs for a specific task."""
         return self.db_session.query(TimeLog).filter(TimeLog.task_id == task_id).order_by(desc(TimeLog.start_time)).all()
@@ -56,12 +72,19 @@ class TimeLogRepository:
             if not time_log:
                 return None
 
+            # Move the old contribution out of its rollup before changing the log
+            self.rollups.apply_delta(
+                time_log.user_id, time_log.task_id, time_log.start_time, -(time_log.duration or 0), -1
+            )
+            self.rollups.apply_delta(
+                time_log.user_id, time_log.task_id, data.start_time, data.duration or 0, 1
+            )
+
             time_log.start_time = data.start_time
             time_log.end_time = data.end_time
             time_log.duration = data.duration
 
             self.db_session.commit()
-            self.db_session.refresh(time_log)
             return time_log
         except Exception as e:
             self.db_session.rollback()
@@ -74,6 +97,9 @@ class TimeLogRepository:
             if not time_log:
                 return False
 
+            self.rollups.apply_delta(
+                time_log.user_id, time_log.task_id, time_log.start_time, -(time_log.duration or 0), -1
+            )
             self.db_session.delete(time_log)
             self.db_session.commit()
             return True
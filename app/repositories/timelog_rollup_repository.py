@@ -0,0 +1,159 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, update, func, literal, and_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from typing import List, Optional, Tuple
+from datetime import date, datetime
+
+from app.models.task import Task
+from app.models.time_log import TimeLog
+from app.models.time_log_rollup import TimeLogDailyRollup
+from app.utils.tracing_utils import traced
+
+
+@traced
+class TimeLogRollupRepository:
+    """Repository maintaining and querying the daily time log rollups."""
+
+    # Column each supported grouping aggregates on
+    GROUP_COLUMNS = {
+        "user": TimeLogDailyRollup.user_id,
+        "task": TimeLogDailyRollup.task_id,
+        "project": TimeLogDailyRollup.project_id,
+        "day": TimeLogDailyRollup.day,
+    }
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def apply_delta(self, user_id: int, task_id: int, start_time: datetime,
+                    minutes: int, log_count: int) -> None:
+        """
+        Add (or with negative values, subtract) a time log's contribution to its daily rollup.
+
+        Runs as a single `INSERT ... SELECT ... ON DUPLICATE KEY UPDATE`, which also picks
+        up the task's project id. The caller owns the transaction and commits.
+
+        Args:
+            user_id (int): Owner of the time log.
+            task_id (int): Task the time was logged against.
+            start_time (datetime): Start of the log; the rollup day is its date.
+            minutes (int): Minutes to add to the day's total.
+            log_count (int): Number of logs to add to the day's count (1 or -1).
+        """
+        day = start_time.date()
+        stmt = mysql_insert(TimeLogDailyRollup).from_select(
+            ["day", "user_id", "task_id", "project_id", "total_minutes", "log_count"],
+            select(
+                literal(day),
+                literal(user_id),
+                Task.id,
+                Task.project_id,
+                literal(minutes),
+                literal(log_count)
+            ).where(Task.id == task_id)
+        )
+        stmt = stmt.on_duplicate_key_update(
+            total_minutes=TimeLogDailyRollup.total_minutes + stmt.inserted.total_minutes,
+            log_count=TimeLogDailyRollup.log_count + stmt.inserted.log_count
+        )
+        self.db_session.execute(stmt)
+
+        if log_count < 0:
+            # Drop rollup rows that no longer represent any time log
+            self.db_session.execute(
+                delete(TimeLogDailyRollup).where(
+                    TimeLogDailyRollup.day == day,
+                    TimeLogDailyRollup.user_id == user_id,
+                    TimeLogDailyRollup.task_id == task_id,
+                    TimeLogDailyRollup.log_count <= 0
+                )
+            )
+
+    def move_task(self, task_id: int, project_id: int) -> None:
+        """
+        Re-file a task's rollups under the project it was moved to.
+
+        The caller owns the transaction and commits.
+
+        Args:
+            task_id (int): Task that changed project.
+            project_id (int): The task's new project.
+        """
+        self.db_session.execute(
+            update(TimeLogDailyRollup)
+            .where(TimeLogDailyRollup.task_id == task_id)
+            .values(project_id=project_id)
+        )
+
+    def get_totals(self,
+                   group_by: str,
+                   start: date,
+                   end: date,
+                   user_id: Optional[int] = None,
+                   task_id: Optional[int] = None,
+                   project_id: Optional[int] = None) -> List[Tuple]:
+        """
+        Sum logged minutes over a day range with one aggregate query on the rollups.
+
+        Args:
+            group_by (str): One of `GROUP_COLUMNS` ("user", "task", "project", "day").
+            start (date): First day (inclusive).
+            end (date): Last day (inclusive).
+            user_id (Optional[int]): Restrict to one user.
+            task_id (Optional[int]): Restrict to one task.
+            project_id (Optional[int]): Restrict to one project.
+
+        Returns:
+            List[Tuple]: Rows of (key, total_minutes, log_count).
+        """
+        key = self.GROUP_COLUMNS[group_by]
+        conditions = [TimeLogDailyRollup.day >= start, TimeLogDailyRollup.day <= end]
+        if user_id is not None:
+            conditions.append(TimeLogDailyRollup.user_id == user_id)
+        if task_id is not None:
+            conditions.append(TimeLogDailyRollup.task_id == task_id)
+        if project_id is not None:
+            conditions.append(TimeLogDailyRollup.project_id == project_id)
+
+        stmt = (
+            select(
+                key,
+                func.sum(TimeLogDailyRollup.total_minutes),
+                func.sum(TimeLogDailyRollup.log_count)
+            )
+            .where(and_(*conditions))
+            .group_by(key)
+            .order_by(key)
+        )
+        return self.db_session.execute(stmt).all()
+
+    def rebuild(self) -> int:
+        """
+        Regenerate all rollups from the raw time logs.
+
+        Returns:
+            int: Number of rollup rows written.
+        """
+        try:
+            self.db_session.execute(delete(TimeLogDailyRollup))
+            day = func.date(TimeLog.start_time)
+            result = self.db_session.execute(
+                mysql_insert(TimeLogDailyRollup).from_select(
+                    ["day", "user_id", "task_id", "project_id", "total_minutes", "log_count"],
+                    select(
+                        day,
+                        TimeLog.user_id,
+                        TimeLog.task_id,
+                        Task.project_id,
+                        func.sum(func.coalesce(TimeLog.duration, 0)),
+                        func.count(TimeLog.id)
+                    )
+                    .join(Task, Task.id == TimeLog.task_id)
+                    .group_by(day, TimeLog.user_id, TimeLog.task_id, Task.project_id)
+                )
+            )
+            self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
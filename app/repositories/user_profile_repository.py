@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 from app.models.user_profile import UserProfile
 from app.models.dtos.user_profile_dtos import UserProfileCreate, UserProfileUpdate
 from typing import Optional
+from app.utils.tracing_utils import traced
 
+@traced
 class UserProfileRepository:
     """
     Repository for managing database operations related to user profiles.
@@ -21,7 +23,6 @@ class UserProfileRepository:
         profile = UserProfile(**data.model_dump())
         self.db.add(profile)
         self.db.commit()
-        self.db.refresh(profile)
         return profile
 
     def get_by_user_id(self, user_id: int) -> Optional[UserProfile]:
@@ -40,7 +41,6 @@ class UserProfileRepository:
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(profile, key, value)
         self.db.commit()
-        self.db.refresh(profile)
         return profile
 
     def delete(self, user_id: int) -> bool:
@@ -1,21 +1,29 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import select, func, exists, insert, bindparam
+from sqlalchemy.engine import Row
+from typing import Optional, List, Tuple, Dict, Set, Iterable
 from app.models.user import User
 from app.models.role import Role
 from app.models.user_role import UserRole
 from app.models.tenant_user import TenantUser
 from app.models.task_assignment import TaskAssignment
-from app.utils.db_utils import switch_schema, get_global_db
+from app.utils.db_utils import commit_now, get_global_db
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 import logging
+from app.utils.tracing_utils import traced
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+@traced
 class UserRepository:
     """Repository class for handling user-related database operations."""
 
+    # Login and registration lookup, built once with a bound parameter so every
+    # call reuses the same construct and SQLAlchemy's compiled SQL
+    USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+
     def __init__(self, db_session: Session):
         """
         Initialize the UserRepository.
@@ -51,7 +59,6 @@ class UserRepository:
         )
         self.db_session.add(user)
         self.db_session.commit()
-        self.db_session.refresh(user)
         return user
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
@@ -64,7 +71,7 @@ class UserRepository:
         Returns:
             Optional[User]: User object if found, otherwise None.
         """
-        return self.db_session.query(User).filter(User.id == user_id).first()
+        return self.db_session.get(User, user_id)
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -76,7 +83,7 @@ class UserRepository:
         Returns:
             Optional[User]: User object if found, otherwise None.
         """
-        return self.db_session.query(User).filter(User.email == email).first()
+        return self.db_session.scalars(self.USER_BY_EMAIL, {"email": email}).first()
 
     def update_user(self, user_id: int, first_name: Optional[str] = None, last_name: Optional[str] = None, department_id: Optional[int] = None, team_id: Optional[int] = None) -> Optional[User]:
         """
@@ -103,7 +110,6 @@ class UserRepository:
             if team_id:
                 user.team_id = team_id
             self.db_session.commit()
-            self.db_session.refresh(user)
             return user
         return None
 
@@ -121,18 +127,19 @@ class UserRepository:
         if user:
             try:
                 
-                # Delete the user
+                # Delete the user. Committed right away (not at the end of the
+                # request) so its table versions are bumped for this tenant
+                # before the global schema is touched.
                 self.db_session.delete(user)
-                self.db_session.commit()
+                commit_now(self.db_session)
 
-                # Switch to the global schema
-                switch_schema(self.db_session, "taskeri_global")
+                # Delete the user from tenant_users, on its own global session
+                with get_global_db() as global_db:
+                    tenant_user = global_db.query(TenantUser).filter(TenantUser.email == user.email).first()
+                    if tenant_user:
+                        global_db.delete(tenant_user)
+                        global_db.commit()
 
-                # Delete the user from tenant_users using ORM
-                tenant_user = self.db_session.query(TenantUser).filter(TenantUser.email == user.email).first()
-                if tenant_user:
-                    self.db_session.delete(tenant_user)
-                        
                 return user
             except SQLAlchemyError as e:
                 self.db_session.rollback()
@@ -186,7 +193,7 @@ class UserRepository:
         """
         try:
             user = self.get_user_by_id(user_id)
-            role = self.db_session.query(Role).filter(Role.id == role_id).first()
+            role = self.db_session.get(Role, role_id)
 
             if not user or not role:
                 return False
@@ -269,3 +276,124 @@ class UserRepository:
         """
         return self.db_session.query(User).all()
 
+    # Columns of the compact user listing; the primary role is appended as `role_id`
+    LIST_COLUMNS = (
+        User.id, User.email, User.first_name, User.last_name,
+        User.department_id, User.team_id, User.created_at, User.updated_at
+    )
+
+    def list_users(self,
+                   team_id: Optional[int] = None,
+                   department_id: Optional[int] = None,
+                   role_id: Optional[int] = None,
+                   page: Optional[int] = None,
+                   page_size: Optional[int] = None) -> Tuple[List[Row], int]:
+        """
+        List users with their primary role (lowest role id) in a single query.
+
+        Only the `LIST_COLUMNS` are selected, no ORM objects are built. The total
+        is computed with a window function in the same statement.
+
+        Args:
+            team_id (Optional[int]): Only users of this team.
+            department_id (Optional[int]): Only users of this department.
+            role_id (Optional[int]): Only users holding this role.
+            page (Optional[int]): Page number (1-based); all users when omitted.
+            page_size (Optional[int]): Number of users per page.
+
+        Returns:
+            Tuple[List[Row], int]: Rows with `LIST_COLUMNS` plus `role_id`, and the total count.
+        """
+        primary_role = (
+            select(UserRole.user_id, func.min(UserRole.role_id).label("role_id"))
+            .group_by(UserRole.user_id)
+            .subquery()
+        )
+        stmt = (
+            select(*self.LIST_COLUMNS, primary_role.c.role_id, func.count().over().label("total"))
+            .outerjoin(primary_role, primary_role.c.user_id == User.id)
+            .order_by(User.id)
+        )
+        if team_id is not None:
+            stmt = stmt.where(User.team_id == team_id)
+        if department_id is not None:
+            stmt = stmt.where(User.department_id == department_id)
+        if role_id is not None:
+            stmt = stmt.where(exists().where(UserRole.user_id == User.id, UserRole.role_id == role_id))
+        if page is not None and page_size is not None:
+            stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+
+        rows = self.db_session.execute(stmt).all()
+        if rows:
+            return rows, rows[0].total
+        if page is not None and page > 1:
+            # Past the last page the window total is unavailable; count separately
+            total = self.db_session.execute(
+                select(func.count()).select_from(stmt.limit(None).offset(None).subquery())
+            ).scalar_one()
+            return rows, total
+        return rows, 0
+
+    def get_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given emails already belong to a user.
+
+        Args:
+            emails (Iterable[str]): Emails to check.
+
+        Returns:
+            Set[str]: The emails that are taken.
+        """
+        emails = list(emails)
+        if not emails:
+            return set()
+        rows = self.db_session.execute(select(User.email).where(User.email.in_(emails)))
+        return {row[0] for row in rows}
+
+    def get_existing_ids(self, model, ids: Iterable[int]) -> Set[int]:
+        """
+        Return which of the given primary keys exist for a model.
+
+        Args:
+            model: Mapped class with an `id` column (e.g. Role, Team, Department).
+            ids (Iterable[int]): IDs to check.
+
+        Returns:
+            Set[int]: The IDs that exist.
+        """
+        ids = list(ids)
+        if not ids:
+            return set()
+        rows = self.db_session.execute(select(model.id).where(model.id.in_(ids)))
+        return {row[0] for row in rows}
+
+    def bulk_create_users(self, users: List[dict], role_ids: List[int]) -> Dict[str, int]:
+        """
+        Insert many users and their role assignments with batched statements.
+
+        Issues one multi-row INSERT for the users, one SELECT to read back their ids
+        and one multi-row INSERT for `user_roles`. The caller owns the transaction
+        and commits (or rolls back).
+
+        Args:
+            users (List[dict]): Column values per user (email, password_hash, first_name,
+                last_name, department_id, team_id).
+            role_ids (List[int]): Role to assign to each user, in the same order.
+
+        Returns:
+            Dict[str, int]: New user id by email.
+        """
+        if not users:
+            return {}
+        self.db_session.execute(insert(User), users)
+
+        emails = [user["email"] for user in users]
+        ids = dict(self.db_session.execute(
+            select(User.email, User.id).where(User.email.in_(emails))
+        ).all())
+
+        self.db_session.execute(insert(UserRole), [
+            {"user_id": ids[email], "role_id": role_id}
+            for email, role_id in zip(emails, role_ids)
+        ])
+        return ids
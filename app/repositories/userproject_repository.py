@@ -1,8 +1,15 @@
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from typing import FrozenSet, Optional
 from app.models.user_project import UserProject
 from app.models.user import User
 from app.models.project import Project
+from app.repositories.user_repository import UserRepository
+from app.utils.projection_utils import projection_columns
+from app.utils.tracing_utils import traced
 
+@traced
 class UserProjectRepository:
     """Handles operations related to project-user assignments."""
 
@@ -25,14 +32,14 @@ class UserProjectRepository:
         self.db_session.commit()
         return deleted > 0
 
-    def get_users_for_project(self, project_id: int) -> list[User]:
-        """Get full user details for users assigned to a specific project."""
-        return (
-            self.db_session.query(User)
+    def get_users_for_project(self, project_id: int, fields: Optional[FrozenSet[str]] = None) -> list[Row]:
+        """Get the users assigned to a specific project as plain rows of `UserRepository.LIST_COLUMNS`."""
+        stmt = (
+            select(*projection_columns(UserRepository.LIST_COLUMNS, fields))
             .join(UserProject, User.id == UserProject.user_id)
-            .filter(UserProject.project_id == project_id)
-            .all()
+            .where(UserProject.project_id == project_id)
         )
+        return self.db_session.execute(stmt).all()
     
     def get_projects_for_user(self, user_id: int) -> list[Project]:
         """Get full project details for projects a user is assigned to."""
@@ -0,0 +1,256 @@
+"""
+Scheduled retention for tenant notifications.
+
+Each run walks every tenant schema and
+- collapses duplicate "Theres an update on task" notifications per user and task,
+- deletes (or archives) read notifications older than the configured age.
+
+Work is done in bounded batches with a commit per batch, so the job never holds
+long locks on the notifications table. Per-tenant counters can be read back
+through `retention_metrics`.
+
+Under main.py the job runs on the application's event loop. serve.py instead
+runs it in one process of its own (`run_retention_forever`), so its workers do
+not sweep every tenant at the same time; the counters are then shared with the
+workers through NOTIFICATION_RETENTION_STATS_FILE.
+
+Run once from the command line with:
+
+    python -m app.services.notification_retention
+
+or every NOTIFICATION_RETENTION_INTERVAL_SECONDS with `--forever`.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.repositories.notification_repository import NotificationRepository
+from app.repositories.tenant_user_repository import TenantUserRepository
+from app.utils.db_utils import current_timestamp, get_global_db, get_tenant_session, switch_schema
+from app.utils.env_utils import EnvironmentVariable, get_env
+
+logger = logging.getLogger(__name__)
+
+RETENTION_MODES = ("delete", "archive")
+
+
+class RetentionSettings:
+    """Retention configuration, read from the environment."""
+
+    def __init__(self,
+                 retention_days: int = 30,
+                 mode: str = "delete",
+                 batch_size: int = 1000,
+                 interval_seconds: int = 3600):
+        if mode not in RETENTION_MODES:
+            raise ValueError(f"Invalid notification retention mode: {mode}")
+        self.retention_days = retention_days
+        self.mode = mode
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+
+    @classmethod
+    def from_env(cls) -> "RetentionSettings":
+        return cls(
+            retention_days=int(get_env(EnvironmentVariable.NOTIFICATION_RETENTION_DAYS, "30")),
+            mode=get_env(EnvironmentVariable.NOTIFICATION_RETENTION_MODE, "delete").lower(),
+            batch_size=int(get_env(EnvironmentVariable.NOTIFICATION_RETENTION_BATCH_SIZE, "1000")),
+            interval_seconds=int(get_env(EnvironmentVariable.NOTIFICATION_RETENTION_INTERVAL_SECONDS, "3600")),
+        )
+
+
+class RetentionMetrics:
+    """
+    Thread-safe per-tenant counters for the retention job.
+
+    With a `path`, the process running the job writes the counters to that JSON
+    file after every tenant, and every process reads them back from it.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._tenants: Dict[str, dict] = {}
+
+    def record(self, schema_name: str, pruned: int, compacted: int, archived: bool) -> None:
+        with self._lock:
+            stats = self._tenants.setdefault(schema_name, {
+                "tenant_schema": schema_name,
+                "runs": 0,
+                "pruned_total": 0,
+                "compacted_total": 0,
+                "archived_total": 0,
+                "last_pruned": 0,
+                "last_compacted": 0,
+                "last_run_at": None,
+            })
+            stats["runs"] += 1
+            stats["pruned_total"] += pruned
+            stats["compacted_total"] += compacted
+            if archived:
+                stats["archived_total"] += pruned
+            stats["last_pruned"] = pruned
+            stats["last_compacted"] = compacted
+            stats["last_run_at"] = datetime.now()
+            if self.path:
+                self._save()
+
+    def get(self, schema_name: str) -> Optional[dict]:
+        with self._lock:
+            stats = self._current().get(schema_name)
+            return dict(stats) if stats else None
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return [dict(stats) for stats in self._current().values()]
+
+    def _save(self) -> None:
+        # Written to a temporary file and renamed, so readers never see a partial file
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(self._tenants, file, default=datetime.isoformat)
+        os.replace(temporary, self.path)
+
+    def _current(self) -> Dict[str, dict]:
+        if not self.path:
+            return self._tenants
+        try:
+            with open(self.path) as file:
+                tenants = json.load(file)
+        except (OSError, ValueError):
+            return self._tenants
+        for stats in tenants.values():
+            if stats["last_run_at"]:
+                stats["last_run_at"] = datetime.fromisoformat(stats["last_run_at"])
+        return tenants
+
+
+retention_metrics = RetentionMetrics(get_env(EnvironmentVariable.NOTIFICATION_RETENTION_STATS_FILE) or None)
+
+
+def run_retention_for_tenant(schema_name: str, settings: RetentionSettings) -> dict:
+    """
+    Apply compaction and retention to a single tenant schema.
+
+    Args:
+        schema_name (str): Full tenant schema name (e.g. `tenant_acme`).
+        settings (RetentionSettings): Retention configuration.
+
+    Returns:
+        dict: Number of rows compacted and pruned in this run.
+    """
+    db = get_tenant_session(schema_name)
+    try:
+        switch_schema(db, schema_name)
+        repository = NotificationRepository(db)
+
+        compacted = repository.compact_task_update_notifications(batch_size=settings.batch_size)
+        pruned = repository.prune_read_notifications(
+            # created_at is written in UTC (see current_timestamp)
+            older_than=current_timestamp() - timedelta(days=settings.retention_days),
+            batch_size=settings.batch_size,
+            archive=settings.mode == "archive"
+        )
+    finally:
+        db.close()
+
+    retention_metrics.record(schema_name, pruned, compacted, archived=settings.mode == "archive")
+    logger.info(
+        "Notification retention for %s: compacted=%d pruned=%d mode=%s",
+        schema_name, compacted, pruned, settings.mode
+    )
+    return {"compacted": compacted, "pruned": pruned}
+
+
+def run_retention_for_all_tenants(settings: Optional[RetentionSettings] = None) -> Dict[str, dict]:
+    """
+    Run notification retention for every known tenant.
+
+    A failure in one tenant is logged and does not stop the others.
+
+    Args:
+        settings (Optional[RetentionSettings]): Configuration; read from env if omitted.
+
+    Returns:
+        Dict[str, dict]: Per-tenant results keyed by schema name.
+    """
+    settings = settings or RetentionSettings.from_env()
+
+    with get_global_db() as global_db:
+        tenants = TenantUserRepository(global_db).list_tenant_schemas()
+
+    results = {}
+    for tenant in tenants:
+        schema_name = f"tenant_{tenant}"
+        try:
+            results[schema_name] = run_retention_for_tenant(schema_name, settings)
+        except Exception:
+            logger.error("Notification retention failed for %s", schema_name, exc_info=True)
+    return results
+
+
+class NotificationRetentionWorker:
+    """Runs `run_retention_for_all_tenants` periodically on the event loop."""
+
+    def __init__(self, settings: Optional[RetentionSettings] = None):
+        self.settings = settings or RetentionSettings.from_env()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background loop; a non-positive interval disables the worker."""
+        if self.settings.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.settings.interval_seconds)
+            try:
+                # Blocking DB work stays off the event loop
+                await asyncio.to_thread(run_retention_for_all_tenants, self.settings)
+            except Exception:
+                logger.error("Notification retention run failed", exc_info=True)
+
+
+def run_retention_forever(settings: Optional[RetentionSettings] = None) -> None:
+    """Run retention every `interval_seconds` until interrupted (the loop of serve.py's retention process)."""
+    settings = settings or RetentionSettings.from_env()
+    if settings.interval_seconds <= 0:
+        return
+    try:
+        while True:
+            time.sleep(settings.interval_seconds)
+            try:
+                run_retention_for_all_tenants(settings)
+            except Exception:
+                logger.error("Notification retention run failed", exc_info=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Notification retention for every tenant.")
+    parser.add_argument("--forever", action="store_true",
+                        help="keep running every NOTIFICATION_RETENTION_INTERVAL_SECONDS")
+    if parser.parse_args().forever:
+        run_retention_forever()
+    else:
+        run_retention_for_all_tenants()
@@ -0,0 +1,74 @@
+"""
+Rebuild command for the daily time log rollups.
+
+The rollups are maintained incrementally by `TimeLogRepository`; this command
+regenerates them from the raw `time_logs` table, e.g. after a bulk import or a
+manual data fix:
+
+    python -m app.services.timelog_rollups            # every tenant
+    python -m app.services.timelog_rollups --tenant acme
+"""
+import argparse
+import logging
+from typing import Dict, Optional
+
+from app.repositories.timelog_rollup_repository import TimeLogRollupRepository
+from app.repositories.tenant_user_repository import TenantUserRepository
+from app.utils.db_utils import get_global_db, get_tenant_session, switch_schema
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_rollups_for_tenant(schema_name: str) -> int:
+    """
+    Regenerate the rollups of one tenant schema.
+
+    Args:
+        schema_name (str): Full tenant schema name (e.g. `tenant_acme`).
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    db = get_tenant_session(schema_name)
+    try:
+        switch_schema(db, schema_name)
+        rows = TimeLogRollupRepository(db).rebuild()
+    finally:
+        db.close()
+
+    logger.info("Rebuilt %d time log rollup rows for %s", rows, schema_name)
+    return rows
+
+
+def rebuild_rollups_for_all_tenants(tenant: Optional[str] = None) -> Dict[str, int]:
+    """
+    Regenerate rollups for one tenant or for every known tenant.
+
+    Args:
+        tenant (Optional[str]): Tenant name without the `tenant_` prefix.
+
+    Returns:
+        Dict[str, int]: Rows written, keyed by schema name.
+    """
+    if tenant:
+        tenants = [tenant]
+    else:
+        with get_global_db() as global_db:
+            tenants = TenantUserRepository(global_db).list_tenant_schemas()
+
+    results = {}
+    for name in tenants:
+        schema_name = f"tenant_{name}"
+        try:
+            results[schema_name] = rebuild_rollups_for_tenant(schema_name)
+        except Exception:
+            logger.error("Rollup rebuild failed for %s", schema_name, exc_info=True)
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Rebuild daily time log rollups from raw time logs.")
+    parser.add_argument("--tenant", help="Tenant name (without the tenant_ prefix); defaults to all tenants")
+    args = parser.parse_args()
+    rebuild_rollups_for_all_tenants(args.tenant)
@@ -0,0 +1,197 @@
+"""
+Vectorized interval arithmetic for timesheet and utilization reports.
+
+All functions work on NumPy arrays of epoch seconds (int64) and never loop over
+individual time logs or attendance rows in Python:
+
+- `split_intervals` cuts intervals at period boundaries (weeks, months) so each
+  piece falls into exactly one period,
+- `overlap_seconds` finds, per user, how much of each time log overlaps with
+  earlier logs of the same user,
+- `compute_utilization` aggregates logged, overlapping, attended and expected
+  minutes into (group, period) matrices.
+"""
+from datetime import date, timedelta
+from typing import Dict, List
+
+import numpy as np
+
+SECONDS_PER_MINUTE = 60
+
+
+def period_edges(start: date, end: date, period: str) -> List[date]:
+    """
+    Build the boundaries of the reporting periods covering [start, end].
+
+    Weeks start on Monday and months on the 1st; the first and last periods
+    are clipped to the requested range.
+
+    Args:
+        start (date): First day of the report (inclusive).
+        end (date): Last day of the report (inclusive).
+        period (str): "week" or "month".
+
+    Returns:
+        List[date]: Sorted edges; period i covers [edges[i], edges[i + 1]).
+    """
+    stop = end + timedelta(days=1)
+    edges = [start]
+    if period == "week":
+        boundary = start + timedelta(days=7 - start.weekday())
+        while boundary < stop:
+            edges.append(boundary)
+            boundary += timedelta(days=7)
+    elif period == "month":
+        boundary = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        while boundary < stop:
+            edges.append(boundary)
+            boundary = date(boundary.year + boundary.month // 12, boundary.month % 12 + 1, 1)
+    else:
+        raise ValueError(f"Unsupported period: {period}")
+    edges.append(stop)
+    return edges
+
+
+def to_epoch_seconds(values) -> np.ndarray:
+    """Convert a sequence of datetimes/dates (None allowed) to int64 epoch seconds; None becomes NaT."""
+    return np.asarray(values, dtype="datetime64[s]")
+
+
+def split_intervals(start: np.ndarray, end: np.ndarray, edges: np.ndarray):
+    """
+    Split half-open intervals [start, end) at the given edges.
+
+    Intervals are first clipped to [edges[0], edges[-1]); empty ones are dropped.
+
+    Args:
+        start (np.ndarray): int64 interval starts.
+        end (np.ndarray): int64 interval ends.
+        edges (np.ndarray): Sorted int64 period edges.
+
+    Returns:
+        tuple: (source index, period index, seconds) arrays, one entry per piece.
+    """
+    start = np.clip(start, edges[0], edges[-1])
+    end = np.clip(end, edges[0], edges[-1])
+    source = np.flatnonzero(end > start)
+    s, e = start[source], end[source]
+
+    first = np.searchsorted(edges, s, side="right") - 1
+    last = np.searchsorted(edges, e, side="left") - 1
+    counts = last - first + 1
+
+    # One row per (interval, period) piece
+    piece = np.repeat(np.arange(s.size), counts)
+    offset = np.arange(piece.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    bucket = first[piece] + offset
+
+    seconds = np.minimum(e[piece], edges[bucket + 1]) - np.maximum(s[piece], edges[bucket])
+    return source[piece], bucket, seconds
+
+
+def overlap_seconds(user: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """
+    For each interval, the seconds already covered by earlier intervals of the same user.
+
+    Intervals are ordered by (user, start); summing the result gives the amount of
+    double-counted time, i.e. total length minus the length of the per-user union.
+
+    Args:
+        user (np.ndarray): Integer user index per interval.
+        start (np.ndarray): int64 interval starts.
+        end (np.ndarray): int64 interval ends.
+
+    Returns:
+        np.ndarray: int64 overlap per interval, in the input order.
+    """
+    if start.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    order = np.lexsort((start, user))
+    u, s, e = user[order].astype(np.int64), start[order], end[order]
+
+    # Shift every user onto its own disjoint time range, so one global running
+    # maximum behaves like a per-user running maximum.
+    base = s.min()
+    span = int(max(e.max(), s.max()) - base) + 1
+    shifted_start = (s - base) + u * span
+    shifted_end = (e - base) + u * span
+
+    running_end = np.maximum.accumulate(shifted_end)
+    previous_end = np.empty_like(running_end)
+    previous_end[0] = shifted_start[0]
+    previous_end[1:] = running_end[:-1]
+
+    overlap = np.clip(np.minimum(shifted_end, previous_end) - shifted_start, 0, None)
+
+    result = np.empty_like(overlap)
+    result[order] = overlap
+    return result
+
+
+def compute_utilization(user_group: np.ndarray,
+                        group_count: int,
+                        log_user: np.ndarray,
+                        log_start: np.ndarray,
+                        log_end: np.ndarray,
+                        attendance_user: np.ndarray,
+                        attendance_start: np.ndarray,
+                        attendance_end: np.ndarray,
+                        edges: np.ndarray,
+                        work_minutes_per_day: int) -> Dict[str, np.ndarray]:
+    """
+    Aggregate time logs and attendance into per-(group, period) minute totals.
+
+    Args:
+        user_group (np.ndarray): Group index of every user index (-1 = excluded).
+        group_count (int): Number of groups.
+        log_user (np.ndarray): User index per time log.
+        log_start (np.ndarray): int64 time log starts.
+        log_end (np.ndarray): int64 time log ends.
+        attendance_user (np.ndarray): User index per attendance record.
+        attendance_start (np.ndarray): int64 check-in times.
+        attendance_end (np.ndarray): int64 check-out times.
+        edges (np.ndarray): int64 period edges (epoch seconds, day aligned).
+        work_minutes_per_day (int): Expected minutes per working day per user.
+
+    Returns:
+        Dict[str, np.ndarray]: (group_count, periods) matrices for "logged", "overlap",
+        "overlapping_logs", "attended" and "expected" (minutes / counts).
+    """
+    periods = edges.size - 1
+    size = group_count * periods
+
+    def by_group(values_user, bucket, weights):
+        group = user_group[values_user]
+        keep = group >= 0
+        flat = group[keep] * periods + bucket[keep]
+        return np.bincount(flat, weights=weights[keep], minlength=size).reshape(group_count, periods)
+
+    # Logged time, split across period boundaries
+    source, bucket, seconds = split_intervals(log_start, log_end, edges)
+    logged = by_group(log_user[source], bucket, seconds) / SECONDS_PER_MINUTE
+
+    # Overlaps are attributed to the period the overlapping log starts in
+    clipped_start = np.clip(log_start, edges[0], edges[-1])
+    clipped_end = np.clip(log_end, edges[0], edges[-1])
+    overlap = overlap_seconds(log_user, clipped_start, clipped_end)
+    start_bucket = np.clip(np.searchsorted(edges, clipped_start, side="right") - 1, 0, periods - 1)
+    overlap_minutes = by_group(log_user, start_bucket, overlap) / SECONDS_PER_MINUTE
+    overlapping_logs = by_group(log_user, start_bucket, (overlap > 0).astype(np.float64))
+
+    source, bucket, seconds = split_intervals(attendance_start, attendance_end, edges)
+    attended = by_group(attendance_user[source], bucket, seconds) / SECONDS_PER_MINUTE
+
+    # Expected time: working days in each period times headcount of each group
+    days = edges.astype("datetime64[s]").astype("datetime64[D]")
+    working_days = np.busday_count(days[:-1], days[1:])
+    headcount = np.bincount(user_group[user_group >= 0], minlength=group_count)
+    expected = np.outer(headcount, working_days) * work_minutes_per_day
+
+    return {
+        "logged": logged,
+        "overlap": overlap_minutes,
+        "overlapping_logs": overlapping_logs,
+        "attended": attended,
+        "expected": expected.astype(np.float64),
+    }
@@ -1,9 +1,18 @@
+import multiprocessing
+import threading
 from passlib.context import CryptContext
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+from app.utils.env_utils import EnvironmentVariable, get_env
+from app.utils.server_utils import available_cpus
 
 # Initialize password context for hashing and verification
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Long-lived pool for bulk hashing, created on first use and shut down with the app
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
 def hash_password(password: str) -> str:
     """
     Hashes the provided password using bcrypt.
@@ -16,6 +25,55 @@ def hash_password(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+def default_hash_workers() -> int:
+    """
+    This server process's share of the CPUs.
+
+    Each of the WEB_CONCURRENCY workers started by serve.py gets its own pool,
+    so together they use about one hashing process per CPU.
+    """
+    web_workers = int(get_env(EnvironmentVariable.WEB_CONCURRENCY) or 1)
+    return max(1, available_cpus() // max(1, web_workers))
+
+def hash_passwords(passwords: List[str], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Hashes many passwords in parallel worker processes.
+
+    Argon2 is CPU bound, so processes (not threads) are used to spread the work
+    over all cores. Small inputs are hashed in-process to skip the pool start-up.
+
+    The worker pool is shared between calls. Its workers are spawned rather than
+    forked: forking from a multithreaded server can copy locks held by other
+    threads into the child and deadlock it.
+
+    Args:
+        passwords (List[str]): The plain-text passwords to be hashed.
+        max_workers (Optional[int]): Number of worker processes (defaults to
+            `default_hash_workers()`); only used when the shared pool is created.
+
+    Returns:
+        List[str]: The hashed passwords, in input order.
+    """
+    if len(passwords) < 8 or max_workers == 1:
+        return [hash_password(password) for password in passwords]
+
+    global _hash_pool
+    workers = max_workers or default_hash_workers()
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        pool = _hash_pool
+    chunksize = max(1, len(passwords) // (workers * 4))
+    return list(pool.map(hash_password, passwords, chunksize=chunksize))
+
+def shutdown_hash_pool() -> None:
+    """Stop the password hashing worker processes, if they were started."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown()
+            _hash_pool = None
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies if the provided plain password matches the hashed password.
@@ -0,0 +1,462 @@
+"""
+Read-through cache for small, rarely written tenant reference data.
+
+Roles, permissions, departments, teams and company settings are read on almost
+every request but change rarely. Repositories read them through
+`reference_cache`, which stores plain column snapshots (never session-bound ORM
+instances) under keys scoped to the tenant schema of the session:
+
+    <tenant_schema>:<namespace>:<key>
+
+Write methods of those repositories call `reference_cache.invalidate` after
+their commit, dropping every key of the namespace for that tenant. When the
+session still holds uncommitted writes (a unit-of-work `RequestSession`, whose
+`commit()` only flushes), the namespace is dropped once the transaction
+commits, and forgotten if it rolls back; a session with uncommitted writes
+never stores what it reads, so other requests only ever see committed rows.
+
+Two backends are available, selected with REFERENCE_CACHE_BACKEND:
+
+- "memory" (default): an in-process LRU with a per-entry TTL. Invalidation only
+  reaches the current process; other workers see the change when their entry
+  expires, so keep REFERENCE_CACHE_TTL_SECONDS short.
+- "redis": any Redis-compatible server (Redis, Valkey, KeyDB, ...) at
+  REFERENCE_CACHE_URL, shared by all workers. Needs the `redis` package.
+
+"none" disables caching. Hit/miss/invalidation counters are kept per tenant and
+namespace in `reference_cache.metrics`.
+
+The same backend holds `table_versions`: per-tenant, per-table counters bumped
+after every commit that wrote to a table, used to build HTTP ETags.
+"""
+import logging
+import pickle
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.utils.env_utils import EnvironmentVariable, get_env
+
+logger = logging.getLogger(__name__)
+
+TENANT_SCHEMA_KEY = "tenant_schema"
+CACHE_BACKENDS = ("memory", "redis", "none")
+
+
+def tenant_scope(db_session: Session) -> Optional[str]:
+    """
+    Return the tenant schema a session is bound to, as recorded by `get_tenant_session`/`switch_schema`.
+
+    Returns None when the session carries no schema, in which case nothing is cached.
+    """
+    info = getattr(db_session, "info", None)
+    if not isinstance(info, dict):
+        return None
+    scope = info.get(TENANT_SCHEMA_KEY)
+    return scope if isinstance(scope, str) else None
+
+
+class CacheBackend(ABC):
+    """Minimal key/value and counter interface the reference cache and table versions need."""
+
+    name = "base"
+    # Whether all application processes see the same entries and counters
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under `key`, or None when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every entry whose key starts with `prefix`; returns how many were removed."""
+
+    @abstractmethod
+    def get_counters(self, keys: List[str]) -> List[Optional[int]]:
+        """Return the counters stored under `keys` (None for missing ones)."""
+
+    @abstractmethod
+    def init_counter(self, key: str, value: int) -> None:
+        """Set a counter only if it does not exist yet."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Increment a counter (creating it at 1) and return the new value."""
+
+
+class LRUTTLCache(CacheBackend):
+    """Thread-safe in-process LRU cache with a per-entry time to live. Counters are never evicted."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get_counters(self, keys: List[str]) -> List[Optional[int]]:
+        with self._lock:
+            return [self._counters.get(key) for key in keys]
+
+    def init_counter(self, key: str, value: int) -> None:
+        with self._lock:
+            self._counters.setdefault(key, value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache(CacheBackend):
+    """
+    Backend for a Redis-compatible server.
+
+    Values are pickled; the server must only be reachable by the application.
+    Connection errors are logged and treated as misses so a cache outage never
+    fails a request.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client, key_prefix: str = "taskeri:reference:"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCache":
+        try:
+            import redis
+        except ImportError as e:
+            raise ValueError("REFERENCE_CACHE_BACKEND=redis requires the 'redis' package") from e
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            payload = self.client.get(self.key_prefix + key)
+        except Exception:
+            logger.warning("Reference cache read failed", exc_info=True)
+            return None
+        return pickle.loads(payload) if payload is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        try:
+            self.client.setex(self.key_prefix + key, ttl_seconds, pickle.dumps(value))
+        except Exception:
+            logger.warning("Reference cache write failed", exc_info=True)
+
+    def delete_prefix(self, prefix: str) -> int:
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.key_prefix}{prefix}*"))
+            return self.client.delete(*keys) if keys else 0
+        except Exception:
+            logger.warning("Reference cache invalidation failed", exc_info=True)
+            return 0
+
+    def get_counters(self, keys: List[str]) -> List[Optional[int]]:
+        values = self.client.mget([self.key_prefix + key for key in keys])
+        return [int(value) if value is not None else None for value in values]
+
+    def init_counter(self, key: str, value: int) -> None:
+        self.client.set(self.key_prefix + key, value, nx=True)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(self.key_prefix + key)
+
+
+class CacheMetrics:
+    """Thread-safe per-tenant, per-namespace hit/miss/invalidation counters."""
+
+    EVENTS = ("hits", "misses", "invalidations")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tenants: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+    def record(self, tenant: str, namespace: str, event: str) -> None:
+        with self._lock:
+            namespaces = self._tenants.setdefault(tenant, {})
+            counters = namespaces.setdefault(namespace, dict.fromkeys(self.EVENTS, 0))
+            counters[event] += 1
+
+    def get(self, tenant: str) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {namespace: dict(counters) for namespace, counters in self._tenants.get(tenant, {}).items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tenants.clear()
+
+
+class ReferenceCache:
+    """Tenant-scoped read-through cache of model rows."""
+
+    def __init__(self, backend: Optional[CacheBackend], ttl_seconds: int = 60):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.metrics = CacheMetrics()
+
+    @classmethod
+    def from_env(cls) -> "ReferenceCache":
+        backend_name = get_env(EnvironmentVariable.REFERENCE_CACHE_BACKEND, "memory").lower()
+        if backend_name not in CACHE_BACKENDS:
+            raise ValueError(f"Invalid reference cache backend: {backend_name}")
+        ttl_seconds = int(get_env(EnvironmentVariable.REFERENCE_CACHE_TTL_SECONDS, "60"))
+
+        backend = None
+        if backend_name == "memory":
+            backend = LRUTTLCache(int(get_env(EnvironmentVariable.REFERENCE_CACHE_MAX_ENTRIES, "1024")))
+        elif backend_name == "redis":
+            backend = RedisCache.from_url(get_env(EnvironmentVariable.REFERENCE_CACHE_URL, "redis://localhost:6379/0"))
+        return cls(backend, ttl_seconds)
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name if self.backend else "none"
+
+    def get_rows(self, db_session: Session, model, namespace: str, key: str, loader: Callable[[], List]) -> List:
+        """
+        Return the model instances produced by `loader`, served from the cache when possible.
+
+        On a miss the loader's own (session-bound) instances are returned and their
+        column values are stored. On a hit, new transient instances are built from
+        the stored values; they are detached from any session, so callers must
+        treat them as read-only.
+
+        Args:
+            db_session (Session): Session the loader runs on; decides the tenant scope.
+            model: Mapped class the rows belong to.
+            namespace (str): Cache namespace invalidated by the model's writes.
+            key (str): Key of this particular read within the namespace.
+            loader (Callable[[], List]): Runs the query on a miss.
+
+        Returns:
+            List: Model instances.
+        """
+        tenant = tenant_scope(db_session)
+        if self.backend is None or tenant is None:
+            return loader()
+
+        cache_key = f"{tenant}:{namespace}:{key}"
+        rows = self.backend.get(cache_key)
+        if rows is not None:
+            self.metrics.record(tenant, namespace, "hits")
+            return [model(**row) for row in rows]
+
+        self.metrics.record(tenant, namespace, "misses")
+        instances = loader()
+        if _has_uncommitted_writes(db_session):
+            # The rows may include this transaction's own writes, which can still be rolled back
+            return instances
+        columns = [attribute.key for attribute in inspect(model).column_attrs]
+        self.backend.set(
+            cache_key,
+            [{column: getattr(instance, column) for column in columns} for instance in instances],
+            self.ttl_seconds,
+        )
+        return instances
+
+    def invalidate(self, db_session: Session, namespace: str) -> None:
+        """
+        Drop every cached key of `namespace` for the session's tenant. Call after commit.
+
+        While the session's writes are not committed yet, the namespace is only
+        recorded on the session and dropped after its commit: dropping it earlier
+        would let a concurrent request cache the old rows again.
+        """
+        tenant = tenant_scope(db_session)
+        if self.backend is None or tenant is None:
+            return
+        if _has_uncommitted_writes(db_session):
+            db_session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).add((self, tenant, namespace))
+            return
+        self._drop(tenant, namespace)
+
+    def _drop(self, tenant: str, namespace: str) -> None:
+        self.backend.delete_prefix(f"{tenant}:{namespace}:")
+        self.metrics.record(tenant, namespace, "invalidations")
+
+    def stats(self, tenant: str) -> dict:
+        """Counters for a tenant, in the shape of `ReferenceCacheStats`."""
+        namespaces = self.metrics.get(tenant)
+        hits = sum(counters["hits"] for counters in namespaces.values())
+        misses = sum(counters["misses"] for counters in namespaces.values())
+        return {
+            "tenant_schema": tenant,
+            "backend": self.backend_name,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "invalidations": sum(counters["invalidations"] for counters in namespaces.values()),
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "namespaces": namespaces,
+        }
+
+
+class TableVersions:
+    """
+    Per-tenant, per-table version counters.
+
+    Sessions record the tables they write to (ORM flushes and Core
+    INSERT/UPDATE/DELETE run through the session); after a successful commit each
+    of those tables, plus the tables emptied by ON DELETE CASCADE/SET NULL, gets
+    its counter incremented. Counters start at a random value so versions handed
+    out before a restart or eviction are never reused.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend]):
+        self.backend = backend
+        self._dependents: Dict[str, set] = {}
+
+    @staticmethod
+    def _key(tenant: str, table: str) -> str:
+        return f"{tenant}:version:{table}"
+
+    def get(self, tenant: str, tables: List[str]) -> Optional[List[int]]:
+        """Current versions of `tables`, or None when versions are unavailable."""
+        if self.backend is None:
+            return None
+        keys = [self._key(tenant, table) for table in tables]
+        try:
+            versions = self.backend.get_counters(keys)
+            if None in versions:
+                for key, version in zip(keys, versions):
+                    if version is None:
+                        self.backend.init_counter(key, secrets.randbits(48))
+                versions = self.backend.get_counters(keys)
+        except Exception:
+            logger.warning("Reading table versions failed", exc_info=True)
+            return None
+        return versions
+
+    def bump(self, tenant: str, tables) -> None:
+        if self.backend is None:
+            return
+        for table in tables:
+            key = self._key(tenant, table)
+            try:
+                self.backend.init_counter(key, secrets.randbits(48))
+                self.backend.incr(key)
+            except Exception:
+                logger.error("Bumping version of %s.%s failed", tenant, table, exc_info=True)
+
+    def cascade(self, table) -> set:
+        """Names of the tables whose rows a DELETE on `table` can change through foreign keys."""
+        if table.name not in self._dependents:
+            found, pending = set(), [table.name]
+            while pending:
+                target = pending.pop()
+                for candidate in table.metadata.tables.values():
+                    if candidate.name in found:
+                        continue
+                    for foreign_key in candidate.foreign_keys:
+                        referenced = foreign_key.target_fullname.rsplit(".", 1)[0]
+                        if referenced == target and foreign_key.ondelete in ("CASCADE", "SET NULL"):
+                            found.add(candidate.name)
+                            pending.append(candidate.name)
+                            break
+            self._dependents[table.name] = found
+        return self._dependents[table.name]
+
+
+reference_cache = ReferenceCache.from_env()
+table_versions = TableVersions(reference_cache.backend)
+
+WRITTEN_TABLES_KEY = "written_tables"
+PENDING_INVALIDATIONS_KEY = "pending_invalidations"
+
+
+def _has_uncommitted_writes(db_session: Session) -> bool:
+    """Whether the session holds unflushed changes or flushed writes its transaction has not committed."""
+    if WRITTEN_TABLES_KEY in db_session.info:
+        return True
+    return bool(getattr(db_session, "new", None) or getattr(db_session, "dirty", None)
+                or getattr(db_session, "deleted", None))
+
+
+def _record_written(session: Session, table, deleted: bool = False) -> None:
+    written = session.info.setdefault(WRITTEN_TABLES_KEY, set())
+    written.add(table.name)
+    if deleted:
+        written.update(table_versions.cascade(table))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session, flush_context):
+    if tenant_scope(session) is None:
+        return
+    for instance in session.new:
+        _record_written(session, inspect(instance).mapper.local_table)
+    for instance in session.dirty:
+        if session.is_modified(instance, include_collections=False):
+            _record_written(session, inspect(instance).mapper.local_table)
+    for instance in session.deleted:
+        _record_written(session, inspect(instance).mapper.local_table, deleted=True)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_executed_tables(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    session = orm_execute_state.session
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and tenant_scope(session) is not None:
+        _record_written(session, table, deleted=orm_execute_state.is_delete)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_written_tables(session):
+    written = session.info.pop(WRITTEN_TABLES_KEY, None)
+    tenant = tenant_scope(session)
+    if written and tenant:
+        table_versions.bump(tenant, written)
+    for cache, scope, namespace in session.info.pop(PENDING_INVALIDATIONS_KEY, ()):
+        cache._drop(scope, namespace)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_tables(session):
+    session.info.pop(WRITTEN_TABLES_KEY, None)
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
@@ -1,8 +1,16 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.pool import Pool
 from fastapi import Request, HTTPException
+from starlette.concurrency import run_in_threadpool
 from contextlib import contextmanager
+import os
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Callable, Dict, Iterator, Optional, Union
 from app.utils.env_utils import EnvironmentVariable, get_env
+from app.utils.tracing_utils import span
 
 # === Base Model ===
 Base = declarative_base()
@@ -16,9 +24,47 @@ GLOBAL_DB_URL = (
     f"{get_env(EnvironmentVariable.DB_NAME)}"
 )
 
+# Every connection runs with a UTC session time zone, so CURRENT_TIMESTAMP and
+# the values written by `current_timestamp()` agree whatever the server's zone
+UTC_CONNECT_ARGS = {"time_zone": "+00:00"}
+
 # === GLOBAL ENGINE & SESSION ===
-global_engine = create_engine(GLOBAL_DB_URL, echo=True, pool_pre_ping=True)
-GlobalSessionLocal = sessionmaker(bind=global_engine, autocommit=False, autoflush=False)
+global_engine = create_engine(GLOBAL_DB_URL, echo=True, pool_pre_ping=True, connect_args=UTC_CONNECT_ARGS)
+# Objects stay loaded after commit: the write path builds its responses from
+# them without reading the rows back
+GlobalSessionLocal = sessionmaker(bind=global_engine, autocommit=False, autoflush=False, expire_on_commit=False)
+
+# One engine per tenant schema, created on the tenant's first session and shared
+# by all its sessions after that, so connections are pooled and compiled
+# statements are cached (SQLAlchemy keeps the compiled cache per engine).
+_tenant_engines: Dict[str, Engine] = {}
+_tenant_engines_lock = Lock()
+
+def _dispose_engines_after_fork() -> None:
+    # A forked worker (gunicorn, --preload, multiprocessing "fork") inherits the
+    # parent's pooled connections; sharing those sockets corrupts both sides.
+    # Drop them in the child without closing them for the parent.
+    global_engine.dispose(close=False)
+    for engine in list(_tenant_engines.values()):
+        engine.dispose(close=False)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_engines_after_fork)
+
+# Schema holding the tenant registry (tenant_users) and global users
+GLOBAL_SCHEMA = "taskeri_global"
+
+def current_timestamp() -> datetime:
+    """
+    Python-side default for TIMESTAMP columns: the current UTC time, naive, in whole seconds.
+
+    The value is set on the object before the INSERT/UPDATE (the columns keep
+    their CURRENT_TIMESTAMP server defaults for other writers), so the ORM knows
+    it afterwards and never has to read the row back. TIMESTAMP columns hold
+    whole seconds, and both engines set the session time zone to UTC
+    (`UTC_CONNECT_ARGS`).
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
 
 @contextmanager
 def get_global_db():
@@ -36,6 +82,38 @@ def get_global_db():
     finally:
         db.close()
 
+def get_tenant_engine(schema_name: str) -> Engine:
+    """
+    Return the engine of a tenant schema, creating it on first use.
+
+    Each tenant engine keeps a small pool (DB_TENANT_POOL_SIZE idle connections,
+    default 2), since a worker holds one per active tenant.
+
+    Args:
+        schema_name (str): The name of the tenant's MySQL schema.
+
+    Returns:
+        Engine: Engine connected to the tenant schema.
+    """
+    engine = _tenant_engines.get(schema_name)
+    if engine is None:
+        with _tenant_engines_lock:
+            engine = _tenant_engines.get(schema_name)
+            if engine is None:
+                tenant_db_url = (
+                    f"mysql+mysqlconnector://{get_env(EnvironmentVariable.DB_USERNAME)}:"
+                    f"{get_env(EnvironmentVariable.DB_PASSWORD)}@"
+                    f"{get_env(EnvironmentVariable.DB_HOST)}:"
+                    f"{get_env(EnvironmentVariable.DB_PORT)}/"
+                    f"{schema_name}"
+                )
+                engine = create_engine(
+                    tenant_db_url, echo=True, pool_pre_ping=True, connect_args=UTC_CONNECT_ARGS,
+                    pool_size=int(get_env(EnvironmentVariable.DB_TENANT_POOL_SIZE, "2")),
+                )
+                _tenant_engines[schema_name] = engine
+    return engine
+
 def get_tenant_session(schema_name: str) -> Session:
     """
     Create a new SQLAlchemy session connected to a specific tenant schema.
@@ -46,23 +124,185 @@ def get_tenant_session(schema_name: str) -> Session:
     Returns:
         Session: SQLAlchemy database session scoped to the tenant schema.
     """
-    tenant_db_url = (
-        f"mysql+mysqlconnector://{get_env(EnvironmentVariable.DB_USERNAME)}:"
-        f"{get_env(EnvironmentVariable.DB_PASSWORD)}@"
-        f"{get_env(EnvironmentVariable.DB_HOST)}:"
-        f"{get_env(EnvironmentVariable.DB_PORT)}/"
-        f"{schema_name}"
-    )
-    tenant_engine = create_engine(tenant_db_url, echo=True, pool_pre_ping=True)
-    TenantSessionLocal = sessionmaker(bind=tenant_engine, autocommit=False, autoflush=False)
-    return TenantSessionLocal()
+    with span("get_tenant_session", schema=schema_name):
+        # The schema is recorded in Session.info so per-tenant caches can scope their keys
+        return Session(bind=get_tenant_engine(schema_name), autoflush=False, expire_on_commit=False,
+                       info={"tenant_schema": schema_name})
+
+def _use_global_schema(session: Session, transaction, connection) -> None:
+    connection.exec_driver_sql(f"USE {GLOBAL_SCHEMA}")
+
+def open_global_request_session() -> Session:
+    """
+    Create a session on the global schema for a public route.
+
+    Nothing is checked out from the pool until the first query; `USE taskeri_global`
+    is then issued on the connection as its transaction begins. Requests that
+    never query (CORS preflight, docs) cost no database round trip.
+
+    Returns:
+        Session: SQLAlchemy session for the global schema.
+    """
+    db = GlobalSessionLocal(info={"tenant_schema": GLOBAL_SCHEMA})
+    event.listen(db, "after_begin", _use_global_schema)
+    return db
+
+class RequestSession:
+    """
+    Request-scoped proxy around a SQLAlchemy session.
+
+    The session is created on first attribute access, so requests that never
+    touch the database create none. `release()` closes it at the end of the
+    request; a streamed response that still reads from it after the endpoint
+    returned takes it over with `hand_off()` and closes it once streaming ends.
+    Using the proxy after it was closed opens a fresh session.
+
+    In unit-of-work mode `commit()` only flushes: repositories keep calling it,
+    their statements run (so errors and generated keys show up where they did
+    before), and `commit_request()` commits once when the request succeeded.
+    Code that must make its writes durable before the request ends uses
+    `commit_now()`.
+
+    Args:
+        factory (Callable[[], Session]): Creates the underlying session.
+        dispose_bind (bool): Also dispose the session's engine on close (for
+            engines created for a single session).
+        unit_of_work (bool): Defer commits to the end of the request.
+    """
+
+    def __init__(self, factory: Callable[[], Session], dispose_bind: bool = False, unit_of_work: bool = False):
+        self._factory = factory
+        self._dispose_bind = dispose_bind
+        self._session: Optional[Session] = None
+        self.unit_of_work = unit_of_work
+        self.pending_commit = False
+        self.handed_off = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the underlying session has been created."""
+        return self._session is not None
+
+    def _get(self) -> Session:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+    def commit(self) -> None:
+        """Commit, or in unit-of-work mode flush and leave the commit to `commit_request()`."""
+        if self.unit_of_work:
+            self._get().flush()
+            self.pending_commit = True
+        else:
+            self.commit_now()
+
+    def commit_now(self) -> None:
+        """Commit immediately, even in unit-of-work mode."""
+        self._get().commit()
+        self.pending_commit = False
+
+    def commit_request(self) -> None:
+        """Commit the writes deferred by `commit()`, if there are any."""
+        if self.pending_commit and self._session is not None:
+            self.commit_now()
+
+    def rollback(self) -> None:
+        """Roll back everything not committed yet, including deferred commits."""
+        self.pending_commit = False
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self, rollback: bool = False) -> None:
+        """Close the underlying session, if any, rolling back first when `rollback` is set."""
+        session, self._session = self._session, None
+        self.pending_commit = False
+        if session is None:
+            return
+        try:
+            if rollback:
+                session.rollback()
+        finally:
+            session.close()
+            if self._dispose_bind:
+                session.get_bind().dispose()
+
+    def release(self) -> None:
+        """Close the session at the end of the request, unless a streamed response took it over."""
+        if not self.handed_off:
+            self.close()
+
+    def hand_off(self) -> Callable[[], None]:
+        """Keep the session open past the request and return the callable that closes it."""
+        self.handed_off = True
+        return self.close
+
+def hand_off(db: Union[Session, RequestSession]) -> Callable[[], None]:
+    """
+    Take over the request's session for a streamed response.
+
+    Args:
+        db (Union[Session, RequestSession]): Session the response body reads from.
+
+    Returns:
+        Callable[[], None]: Closes the session; call it once streaming ends.
+    """
+    if isinstance(db, RequestSession):
+        return db.hand_off()
+    return db.close
+
+def commit_now(db: Union[Session, RequestSession]) -> None:
+    """
+    Commit immediately, bypassing the request's unit of work.
+
+    For writes that other systems rely on before the request ends (another
+    database, emails, independently committed batches).
+
+    Args:
+        db (Union[Session, RequestSession]): Session to commit.
+    """
+    if isinstance(db, RequestSession):
+        db.commit_now()
+    else:
+        db.commit()
+
+class PoolStats:
+    """Connection checkouts and checkins across all pools, to detect leaked connections."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.checkins = 0
+
+    def _checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def _checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    @property
+    def checked_out(self) -> int:
+        """Connections currently checked out of any pool."""
+        return self.checkouts - self.checkins
+
+pool_stats = PoolStats()
+event.listen(Pool, "checkout", pool_stats._checkout)
+event.listen(Pool, "checkin", pool_stats._checkin)
 
 async def get_db(request: Request) -> Session:
     """
     FastAPI dependency to provide a database session per request.
 
     If the middleware has attached a tenant-specific session to `request.state.db`,
-    it uses that. Otherwise, it defaults to a global session.
+    it uses that: the deferred commits of its unit of work are committed when the
+    endpoint succeeded and rolled back when it raised, and the session is
+    released as soon as the endpoint is done. Otherwise
+    (public routes such as login and `/tenant-users/`) it defaults to a lazily
+    connected global session.
 
     Args:
         request (Request): FastAPI request object.
@@ -73,13 +313,21 @@ async def get_db(request: Request) -> Session:
     db = getattr(request.state, "db", None)
 
     if db is None:
-        db = GlobalSessionLocal()
+        db = open_global_request_session()
         try:
             yield db
         finally:
             db.close()
     else:
-        yield db
+        try:
+            yield db
+        except Exception:
+            db.close(rollback=True)
+            raise
+        else:
+            await run_in_threadpool(db.commit_request)
+        finally:
+            db.release()
 
 def switch_schema(db: Session, schema_name: str):
     """
@@ -95,7 +343,35 @@ def switch_schema(db: Session, schema_name: str):
         HTTPException: If the schema switch fails.
     """
     try:
-        db.execute(text(f"USE {schema_name};"))
-        db.commit()
+        with span("switch_schema", schema=schema_name):
+            db.execute(text(f"USE {schema_name};"))
+            db.commit()
+        db.info["tenant_schema"] = schema_name
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to switch schema: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to switch schema: {str(e)}")
+
+def iter_keyset(db: Session, stmt, key_column, batch_size: int = 1000) -> Iterator:
+    """
+    Iterate over the rows of a SELECT one bounded page at a time.
+
+    Pages are fetched with keyset pagination on `key_column` (which must be
+    unique, indexed and part of the selected columns), so each round trip reads
+    at most `batch_size` rows and memory use does not grow with the table size.
+
+    Args:
+        db (Session): SQLAlchemy session.
+        stmt: Column-level SELECT without ORDER BY/LIMIT.
+        key_column: Unique column to page on, usually the primary key.
+        batch_size (int): Number of rows fetched per page.
+
+    Yields:
+        Row: Result rows in ascending `key_column` order.
+    """
+    last_key = None
+    while True:
+        page_stmt = stmt if last_key is None else stmt.where(key_column > last_key)
+        rows = db.execute(page_stmt.order_by(key_column).limit(batch_size)).all()
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        last_key = getattr(rows[-1], key_column.key)
@@ -1,6 +1,9 @@
-from fastapi_mail import FastMail, MessageSchema
-from app.utils.mail_config import conf
+from app.utils.mail_config import get_mail_config
+from typing import Iterable, Tuple
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 async def send_account_creation_email_async(to_email: str, first_name: str, password: str):
     """
@@ -14,6 +17,9 @@ async def send_account_creation_email_async(to_email: str, first_name: str, pass
     The email contains the recipient's email and password and advises them
     to log in and change their password as soon as possible.
     """
+    # fastapi_mail (and its Jinja2 setup) is only loaded once an email is sent
+    from fastapi_mail import FastMail, MessageSchema
+
     subject = "Welcome to Our Platform - Account Created"
     body = f"""
     Hi {first_name},<br><br>
@@ -32,7 +38,7 @@ async def send_account_creation_email_async(to_email: str, first_name: str, pass
         subtype="html"
     )
 
-    fm = FastMail(conf)
+    fm = FastMail(get_mail_config())
     await fm.send_message(message)
 
 def send_account_creation_email(to_email: str, first_name: str, password: str):
@@ -45,3 +51,18 @@ def send_account_creation_email(to_email: str, first_name: str, password: str):
         # loop is running, create a task (do NOT call asyncio.run again)
         loop.create_task(send_account_creation_email_async(to_email, first_name, password))
 
+async def send_account_creation_emails_async(recipients: Iterable[Tuple[str, str, str]]):
+    """
+    Sends welcome emails to many new accounts, one after another.
+
+    Meant to run as a background task after a bulk import; a failing recipient
+    is logged and does not stop the remaining ones.
+
+    Args:
+        recipients (Iterable[Tuple[str, str, str]]): (email, first name, password) per account.
+    """
+    for to_email, first_name, password in recipients:
+        try:
+            await send_account_creation_email_async(to_email, first_name, password)
+        except Exception:
+            logger.error("Failed to send account creation email to %s", to_email, exc_info=True)
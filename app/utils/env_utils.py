@@ -17,6 +17,8 @@ class EnvironmentVariable(str, Enum):
     DB_USERNAME = "DB_USERNAME"
     DB_URL = "DB_URL"
     DB_PORT = "DB_PORT"
+    DB_UNIT_OF_WORK = "DB_UNIT_OF_WORK"
+    DB_TENANT_POOL_SIZE = "DB_TENANT_POOL_SIZE"
     
 
     SECRET_KEY = "SECRET_KEY"
@@ -25,6 +27,41 @@ class EnvironmentVariable(str, Enum):
     
     HOST = "HOST"
     PORT = "PORT"
+    WEB_CONCURRENCY = "WEB_CONCURRENCY"
+    SERVER_BACKLOG = "SERVER_BACKLOG"
+    SERVER_KEEP_ALIVE_SECONDS = "SERVER_KEEP_ALIVE_SECONDS"
+    SERVER_LIMIT_MAX_REQUESTS = "SERVER_LIMIT_MAX_REQUESTS"
+    SERVER_GRACEFUL_TIMEOUT_SECONDS = "SERVER_GRACEFUL_TIMEOUT_SECONDS"
+
+    NOTIFICATION_RETENTION_DAYS = "NOTIFICATION_RETENTION_DAYS"
+    NOTIFICATION_RETENTION_MODE = "NOTIFICATION_RETENTION_MODE"
+    NOTIFICATION_RETENTION_BATCH_SIZE = "NOTIFICATION_RETENTION_BATCH_SIZE"
+    NOTIFICATION_RETENTION_INTERVAL_SECONDS = "NOTIFICATION_RETENTION_INTERVAL_SECONDS"
+    NOTIFICATION_RETENTION_IN_APP = "NOTIFICATION_RETENTION_IN_APP"
+    NOTIFICATION_RETENTION_STATS_FILE = "NOTIFICATION_RETENTION_STATS_FILE"
+
+    USER_IMPORT_HASH_WORKERS = "USER_IMPORT_HASH_WORKERS"
+
+    REFERENCE_CACHE_BACKEND = "REFERENCE_CACHE_BACKEND"
+    REFERENCE_CACHE_TTL_SECONDS = "REFERENCE_CACHE_TTL_SECONDS"
+    REFERENCE_CACHE_MAX_ENTRIES = "REFERENCE_CACHE_MAX_ENTRIES"
+    REFERENCE_CACHE_URL = "REFERENCE_CACHE_URL"
+
+    COMPRESSION_MINIMUM_SIZE = "COMPRESSION_MINIMUM_SIZE"
+    COMPRESSION_GZIP_LEVEL = "COMPRESSION_GZIP_LEVEL"
+    COMPRESSION_BROTLI_QUALITY = "COMPRESSION_BROTLI_QUALITY"
+
+    QUERY_STATS_REPEAT_THRESHOLD = "QUERY_STATS_REPEAT_THRESHOLD"
+
+    METRICS_MULTIPROC_DIR = "METRICS_MULTIPROC_DIR"
+    METRICS_MAX_TENANTS = "METRICS_MAX_TENANTS"
+    METRICS_AUTH_TOKEN = "METRICS_AUTH_TOKEN"
+
+    TRACE_EXPORTER = "TRACE_EXPORTER"
+    TRACE_FILE = "TRACE_FILE"
+    TRACE_OTLP_ENDPOINT = "TRACE_OTLP_ENDPOINT"
+    TRACE_SAMPLE_RATE = "TRACE_SAMPLE_RATE"
+    TRACE_SLOW_MS = "TRACE_SLOW_MS"
 
 def get_env(key: EnvironmentVariable, default: str = None) -> str:
     """Get environment variable value."""
@@ -0,0 +1,91 @@
+"""
+HTTP conditional GET support (ETag / If-None-Match).
+
+ETags are derived from the tenant's table versions (see `cache_utils.table_versions`)
+rather than from the response body, so a matching If-None-Match is answered with
+304 Not Modified before the endpoint runs its queries or serialises anything.
+
+With the in-process ("memory") cache backend each worker keeps its own versions,
+so the ETag also embeds a time bucket of REFERENCE_CACHE_TTL_SECONDS: another
+worker may answer 304 for a change it has not seen for at most that long. The
+"redis" backend shares versions between workers and needs no bucket.
+"""
+import hashlib
+import time
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.utils.cache_utils import reference_cache, table_versions, tenant_scope
+from app.utils.db_utils import get_db
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(request: Request, tenant: str, tables, weak: bool = True,
+               per_user: bool = False) -> Optional[str]:
+    """
+    Build the ETag of a GET request from the versions of the tables its response reads.
+
+    Args:
+        request (Request): Incoming request; its path and query string are part of the tag.
+        tenant (str): Tenant schema name.
+        tables: Names of the tables the response is built from.
+        weak (bool): Return a weak (W/) validator.
+        per_user (bool): Include the authenticated user, for responses that differ per user.
+
+    Returns:
+        Optional[str]: The ETag, or None when table versions are unavailable.
+    """
+    tables = sorted(tables)
+    versions = table_versions.get(tenant, tables)
+    if versions is None:
+        return None
+
+    parts = [tenant, request.url.path, str(sorted(request.query_params.multi_items()))]
+    parts += [f"{table}={version}" for table, version in zip(tables, versions)]
+    if per_user:
+        parts.append(f"user={getattr(request.state, 'user_id', None)}")
+    if not table_versions.backend.shared:
+        parts.append(f"bucket={int(time.time() // reference_cache.ttl_seconds)}")
+
+    digest = hashlib.blake2b("|".join(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110, 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def conditional_get(*tables: str, weak: bool = True, per_user: bool = False):
+    """
+    FastAPI dependency factory answering conditional GETs from table versions.
+
+    Add it to a route's `dependencies`; it runs before the endpoint and raises a
+    304 when If-None-Match matches, otherwise it sets ETag on the response.
+
+    Args:
+        *tables (str): Tables the endpoint's response is built from.
+        weak (bool): Use weak validators (fine for lists).
+        per_user (bool): The response differs per authenticated user.
+    """
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        tenant = tenant_scope(db)
+        if tenant is None or table_versions.backend is None:
+            return
+        etag = build_etag(request, tenant, tables, weak=weak, per_user=per_user)
+        if etag is None:
+            return
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -0,0 +1,121 @@
+"""
+Streaming CSV / NDJSON writers for export endpoints.
+
+Rows are consumed lazily and written out in small chunks, so an export never
+holds more than one chunk of encoded output in memory.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from app.models.dtos.export_dtos import ExportFormat
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+# Number of rows encoded before a chunk is handed to the ASGI server
+ROWS_PER_CHUNK = 500
+
+
+def _export_value(value):
+    """Convert a column value into something CSV/JSON can represent."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def iter_csv(rows: Iterable[Sequence], columns: Sequence[str]) -> Iterator[str]:
+    """
+    Encode rows as CSV, yielding one chunk every `ROWS_PER_CHUNK` rows.
+
+    Args:
+        rows (Iterable[Sequence]): Row tuples in `columns` order.
+        columns (Sequence[str]): Column names written as the header line.
+
+    Yields:
+        str: CSV text chunks.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    count = 0
+    for row in rows:
+        writer.writerow([_export_value(value) for value in row])
+        count += 1
+        if count % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows: Iterable[Sequence], columns: Sequence[str]) -> Iterator[str]:
+    """
+    Encode rows as newline-delimited JSON objects, chunked like `iter_csv`.
+
+    Args:
+        rows (Iterable[Sequence]): Row tuples in `columns` order.
+        columns (Sequence[str]): Keys of each JSON object.
+
+    Yields:
+        str: NDJSON text chunks.
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({
+            column: _export_value(value) for column, value in zip(columns, row)
+        }))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines = []
+
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_response(
+    rows: Iterable[Sequence],
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    filename: str,
+    on_close: Optional[Callable[[], None]] = None
+) -> StreamingResponse:
+    """
+    Build a StreamingResponse that writes `rows` as CSV or NDJSON.
+
+    Args:
+        rows (Iterable[Sequence]): Lazily produced row tuples.
+        columns (Sequence[str]): Column names, in row order.
+        export_format (ExportFormat): Output format.
+        filename (str): Download name without extension.
+        on_close (Optional[Callable]): Called once streaming ends or is aborted,
+            e.g. to release the database session used by `rows`.
+
+    Returns:
+        StreamingResponse: Response streaming the encoded rows.
+    """
+    encoder = iter_csv if export_format == ExportFormat.CSV else iter_ndjson
+
+    def body() -> Iterator[str]:
+        try:
+            yield from encoder(rows, columns)
+        finally:
+            if on_close is not None:
+                on_close()
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'}
+    )
@@ -1,5 +1,9 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from pydantic_settings import BaseSettings
-from fastapi_mail import ConnectionConfig
+
+if TYPE_CHECKING:
+    from fastapi_mail import ConnectionConfig
 
 class MailSettings(BaseSettings):
     """
@@ -24,17 +28,29 @@ class MailSettings(BaseSettings):
         "extra": "allow"  # allow extra keys in the .env file without errors
     }
 
-# Load mail settings from the environment variables in .env file
-mail_settings = MailSettings()
-
-# Create FastAPI-Mail ConnectionConfig using the loaded settings
-conf = ConnectionConfig(
-    MAIL_USERNAME=mail_settings.mail_username,
-    MAIL_PASSWORD=mail_settings.mail_password,
-    MAIL_FROM=mail_settings.mail_from,
-    MAIL_PORT=mail_settings.mail_port,
-    MAIL_SERVER=mail_settings.mail_server,
-    MAIL_STARTTLS=True,      # Gmail requires STARTTLS on port 587
-    MAIL_SSL_TLS=False,      # SSL should be False when using STARTTLS
-    USE_CREDENTIALS=True     # Enable authentication with credentials
-)
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_mail_settings() -> MailSettings:
+    """
+    Load the mail settings from the environment (and .env) on first use.
+
+    Importing the application does not need SMTP settings; a missing variable
+    only fails the first email that is sent.
+    """
+    return MailSettings()
+
+@lru_cache(maxsize=1)
+def get_mail_config() -> "ConnectionConfig":
+    """Build the FastAPI-Mail ConnectionConfig on first use."""
+    from fastapi_mail import ConnectionConfig
+
+    mail_settings = get_mail_settings()
+    return ConnectionConfig(
+        MAIL_USERNAME=mail_settings.mail_username,
+        MAIL_PASSWORD=mail_settings.mail_password,
+        MAIL_FROM=mail_settings.mail_from,
+        MAIL_PORT=mail_settings.mail_port,
+        MAIL_SERVER=mail_settings.mail_server,
+        MAIL_STARTTLS=True,      # Gmail requires STARTTLS on port 587
+        MAIL_SSL_TLS=False,      # SSL should be False when using STARTTLS
+        USE_CREDENTIALS=True     # Enable authentication with credentials
+    )
@@ -0,0 +1,354 @@
+"""
+Request and database metrics in the Prometheus text format.
+
+`RequestMetrics` keeps every series in one flat array of float64 slots. The
+slots are laid out when the metrics are created, from the application's route
+templates (never raw paths, so `/tasks/1` and `/tasks/2` share a series):
+
+- requests per route template, method and status code,
+- a latency histogram per route template,
+- SQL statements and database time per route template,
+- requests per tenant (the first METRICS_MAX_TENANTS tenants seen get their own
+  series, later ones are counted as "other"),
+- SQL executions by compiled-statement cache outcome,
+- gauges: in-flight requests, connections checked out of the pools, overflow of
+  the global pool.
+
+Recording a request is a handful of additions to pre-computed slot indexes, with
+no lock: `MetricsMiddleware` only records from the event loop thread.
+
+With METRICS_MULTIPROC_DIR set, each worker process keeps its slots in a
+memory-mapped file in that directory, and `/metrics` (served by any worker)
+adds up the files of all workers. Counters of exited workers are kept, so
+totals never go backwards; gauges only count live workers. Files are named
+after a hash of the slot layout, so those left by a deployment with other
+routes are ignored. Clear the directory when the server starts (serve.py does).
+"""
+import hashlib
+import mmap
+import os
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.utils.env_utils import EnvironmentVariable, get_env
+
+# Upper bounds of the latency histogram buckets, in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Status codes with their own series; any other code is reported by class ("4xx")
+STATUS_CODES = (200, 201, 204, 206, 304, 400, 401, 403, 404, 409, 412, 422, 429, 500, 502, 503)
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+UNMATCHED_ROUTE = "<unmatched>"
+OTHER_TENANT = "other"
+
+GAUGES = ("in_flight", "pool_checked_out", "pool_overflow")
+CACHE_OUTCOMES = ("hit", "miss", "uncached")
+
+_FILE_NAME = re.compile(r"^metrics_(?P<layout>[0-9a-f]+)_(?P<pid>\d+)\.bin$")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class RequestMetrics:
+    """
+    Pre-allocated request, tenant and database series.
+
+    Args:
+        routes (Iterable[Tuple[str, str]]): (method, route template) pairs to allocate.
+        max_tenants (int): Tenants with their own series; later ones count as "other".
+        directory (Optional[str]): Shared directory for multi-process mode, or None.
+    """
+
+    def __init__(self, routes: Iterable[Tuple[str, str]], max_tenants: int = 256, directory: Optional[str] = None):
+        self.routes: List[Tuple[str, str]] = sorted(set(routes)) + [("", UNMATCHED_ROUTE)]
+        self.route_index: Dict[Tuple[str, str], int] = {route: i for i, route in enumerate(self.routes)}
+        self.max_tenants = max_tenants
+        self.directory = directory
+
+        self.statuses = [str(code) for code in STATUS_CODES] + list(STATUS_CLASSES)
+        self.status_index = {code: i for i, code in enumerate(STATUS_CODES)}
+
+        # Slot layout: one contiguous block per family
+        routes_count, statuses_count, buckets_count = len(self.routes), len(self.statuses), len(LATENCY_BUCKETS) + 1
+        self.requests_offset = 0
+        self.histogram_offset = self.requests_offset + routes_count * statuses_count
+        # Per route: one count per bucket (not cumulative), then the sum
+        self.histogram_stride = buckets_count + 1
+        self.statements_offset = self.histogram_offset + routes_count * self.histogram_stride
+        self.db_seconds_offset = self.statements_offset + routes_count
+        self.tenants_offset = self.db_seconds_offset + routes_count
+        self.gauges_offset = self.tenants_offset + max_tenants + 1
+        self.cache_offset = self.gauges_offset + len(GAUGES)
+        self.size = self.cache_offset + len(CACHE_OUTCOMES)
+
+        signature = repr((self.routes, self.statuses, LATENCY_BUCKETS, max_tenants, GAUGES, CACHE_OUTCOMES))
+        self.layout = hashlib.sha1(signature.encode()).hexdigest()[:12]
+
+        # Pre-rendered label sets, by slot family
+        self.route_labels = [_labels(route=template, method=method) for method, template in self.routes]
+        self.request_labels = [
+            [_labels(route=template, method=method, status=status) for status in self.statuses]
+            for method, template in self.routes
+        ]
+        self.bucket_labels = [
+            [_labels(route=template, method=method, le=str(bound)) for bound in LATENCY_BUCKETS]
+            + [_labels(route=template, method=method, le="+Inf")]
+            for method, template in self.routes
+        ]
+
+        self._pid: Optional[int] = None
+        self._open()
+
+    # --- storage -------------------------------------------------------
+
+    def _open(self) -> None:
+        """Allocate this process's slots (a shared file in multi-process mode)."""
+        self._pid = os.getpid()
+        self.tenants: Dict[str, int] = {}
+        if self.directory is None:
+            self._buffer = bytearray(self.size * 8)
+        else:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"metrics_{self.layout}_{self._pid}.bin")
+            self._tenants_path = path[:-len(".bin")] + ".tenants"
+            # A file left by an exited process with the same pid is continued:
+            # its counters stay in the totals, its gauges are reset below
+            with open(path, "ab+") as file:
+                if file.tell() != self.size * 8:
+                    file.truncate(0)
+                    file.truncate(self.size * 8)
+                    open(self._tenants_path, "w").close()
+                self._buffer = mmap.mmap(file.fileno(), self.size * 8)
+            with open(self._tenants_path, "a+") as file:
+                file.seek(0)
+                for tenant in file.read().splitlines()[:self.max_tenants]:
+                    self.tenants[tenant] = len(self.tenants)
+        self.values = memoryview(self._buffer).cast("d")
+        for gauge in range(len(GAUGES)):
+            self.values[self.gauges_offset + gauge] = 0
+
+    def _slots(self) -> memoryview:
+        if self._pid != os.getpid():
+            # Forked after the metrics were created: never write to the parent's slots
+            self._open()
+        return self.values
+
+    def _tenant_slot(self, tenant: str) -> int:
+        slot = self.tenants.get(tenant)
+        if slot is None:
+            if len(self.tenants) >= self.max_tenants:
+                return self.max_tenants
+            slot = self.tenants[tenant] = len(self.tenants)
+            if self.directory is not None:
+                with open(self._tenants_path, "a") as file:
+                    file.write(tenant.replace("\n", " ") + "\n")
+        return slot
+
+    # --- recording -----------------------------------------------------
+
+    def route_slot(self, method: str, template: Optional[str]) -> int:
+        """Index of a (method, route template) pair; unknown routes share one series."""
+        return self.route_index.get((method, template), len(self.routes) - 1)
+
+    def request_started(self) -> None:
+        self._slots()[self.gauges_offset] += 1
+
+    def request_finished(self, route: int, status: int, seconds: float, statements: int = 0,
+                         db_seconds: float = 0.0, tenant: Optional[str] = None) -> None:
+        """
+        Record a finished request.
+
+        Args:
+            route (int): Slot from `route_slot`.
+            status (int): Response status code.
+            seconds (float): Time from the request arriving to the response being sent.
+            statements (int): SQL statements the request ran.
+            db_seconds (float): Time spent in those statements.
+            tenant (Optional[str]): Tenant of an authenticated request.
+        """
+        values = self._slots()
+        values[self.gauges_offset] -= 1
+
+        status_slot = self.status_index.get(status)
+        if status_slot is None:
+            status_slot = len(STATUS_CODES) + min(max(status // 100, 1), 5) - 1
+        values[self.requests_offset + route * len(self.statuses) + status_slot] += 1
+
+        histogram = self.histogram_offset + route * self.histogram_stride
+        values[histogram + bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        values[histogram + self.histogram_stride - 1] += seconds
+
+        if statements:
+            values[self.statements_offset + route] += statements
+            values[self.db_seconds_offset + route] += db_seconds
+        if tenant is not None:
+            values[self.tenants_offset + self._tenant_slot(tenant)] += 1
+
+    def set_pool_gauges(self, checked_out: int, overflow: int) -> None:
+        values = self._slots()
+        values[self.gauges_offset + 1] = checked_out
+        values[self.gauges_offset + 2] = overflow
+
+    def set_cache_outcomes(self, hits: int, misses: int, uncached: int) -> None:
+        values = self._slots()
+        values[self.cache_offset] = hits
+        values[self.cache_offset + 1] = misses
+        values[self.cache_offset + 2] = uncached
+
+    # --- exposition ----------------------------------------------------
+
+    def _collect(self) -> Tuple[List[float], List[float], Dict[str, float]]:
+        """
+        Add up the slots of every process.
+
+        Returns:
+            (counters, gauges, tenants): summed slots of all processes, slots
+            summed over live processes only (for gauges), requests per tenant.
+        """
+        if self.directory is None:
+            values = list(self._slots())
+            tenants = {name: values[self.tenants_offset + slot] for name, slot in self.tenants.items()}
+            if values[self.tenants_offset + self.max_tenants]:
+                tenants[OTHER_TENANT] = values[self.tenants_offset + self.max_tenants]
+            return values, values, tenants
+
+        self._slots()
+        counters, gauges = [0.0] * self.size, [0.0] * self.size
+        tenants: Dict[str, float] = {}
+        for name in os.listdir(self.directory):
+            match = _FILE_NAME.match(name)
+            if match is None or match["layout"] != self.layout:
+                continue
+            path = os.path.join(self.directory, name)
+            with open(path, "rb") as file:
+                data = file.read()
+            if len(data) != self.size * 8:
+                continue
+            values = memoryview(data).cast("d")
+            alive = _pid_alive(int(match["pid"]))
+            for i, value in enumerate(values):
+                if value:
+                    counters[i] += value
+                    if alive:
+                        gauges[i] += value
+            try:
+                with open(path[:-len(".bin")] + ".tenants") as file:
+                    names = file.read().splitlines()
+            except FileNotFoundError:
+                names = []
+            for slot, tenant in enumerate(names[:self.max_tenants]):
+                tenants[tenant] = tenants.get(tenant, 0.0) + values[self.tenants_offset + slot]
+            if values[self.tenants_offset + self.max_tenants]:
+                tenants[OTHER_TENANT] = tenants.get(OTHER_TENANT, 0.0) + values[self.tenants_offset + self.max_tenants]
+        return counters, gauges, tenants
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text exposition format (version 0.0.4)."""
+        counters, gauges, tenants = self._collect()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family("taskeri_http_requests_total", "counter", "HTTP requests by route template, method and status.")
+        statuses = len(self.statuses)
+        for route in range(len(self.routes)):
+            base = self.requests_offset + route * statuses
+            for status in range(statuses):
+                value = counters[base + status]
+                if value:
+                    lines.append(f"taskeri_http_requests_total{self.request_labels[route][status]} {_format(value)}")
+
+        family("taskeri_http_request_duration_seconds", "histogram",
+               "Time from request arrival to the last response byte, by route template.")
+        for route in range(len(self.routes)):
+            base = self.histogram_offset + route * self.histogram_stride
+            buckets = counters[base:base + self.histogram_stride - 1]
+            count = sum(buckets)
+            if not count:
+                continue
+            cumulative = 0.0
+            for bucket, value in enumerate(buckets):
+                cumulative += value
+                lines.append(f"taskeri_http_request_duration_seconds_bucket{self.bucket_labels[route][bucket]} "
+                             f"{_format(cumulative)}")
+            labels = self.route_labels[route]
+            lines.append(f"taskeri_http_request_duration_seconds_sum{labels} {_format(counters[base + self.histogram_stride - 1])}")
+            lines.append(f"taskeri_http_request_duration_seconds_count{labels} {_format(count)}")
+
+        family("taskeri_db_statements_total", "counter", "SQL statements run by requests, by route template.")
+        for route in range(len(self.routes)):
+            value = counters[self.statements_offset + route]
+            if value:
+                lines.append(f"taskeri_db_statements_total{self.route_labels[route]} {_format(value)}")
+
+        family("taskeri_db_statement_seconds_total", "counter", "Time spent in SQL statements, by route template.")
+        for route in range(len(self.routes)):
+            value = counters[self.db_seconds_offset + route]
+            if value:
+                lines.append(f"taskeri_db_statement_seconds_total{self.route_labels[route]} {_format(value)}")
+
+        family("taskeri_tenant_requests_total", "counter", "Authenticated requests per tenant.")
+        for tenant, value in sorted(tenants.items()):
+            lines.append(f"taskeri_tenant_requests_total{_labels(tenant=tenant)} {_format(value)}")
+
+        family("taskeri_db_compiled_cache_total", "counter", "SQL executions by compiled-statement cache outcome.")
+        for i, outcome in enumerate(CACHE_OUTCOMES):
+            lines.append(f"taskeri_db_compiled_cache_total{_labels(outcome=outcome)} {_format(counters[self.cache_offset + i])}")
+
+        for i, (name, help_text) in enumerate((
+            ("taskeri_http_requests_in_flight", "Requests being processed."),
+            ("taskeri_db_connections_checked_out", "Connections checked out of all connection pools."),
+            ("taskeri_db_pool_overflow", "Connections open beyond the global pool's size."),
+        )):
+            family(name, "gauge", help_text)
+            lines.append(f"{name} {_format(gauges[self.gauges_offset + i])}")
+
+        return "\n".join(lines) + "\n"
+
+
+def route_templates(routes: Sequence) -> List[Tuple[str, str]]:
+    """(method, path template) pairs of an application's routes."""
+    pairs = []
+    for route in routes:
+        for method in getattr(route, "methods", None) or ():
+            pairs.append((method, route.path))
+    return pairs
+
+
+def metrics_directory() -> Optional[str]:
+    return get_env(EnvironmentVariable.METRICS_MULTIPROC_DIR) or None
+
+
+def clear_metrics_directory(directory: str) -> None:
+    """Remove the metric files of earlier runs (call before starting the workers)."""
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if name.startswith("metrics_"):
+            os.remove(os.path.join(directory, name))
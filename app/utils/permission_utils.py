@@ -2,7 +2,6 @@ from typing import List, Callable
 from fastapi import HTTPException, Depends, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy import select, exists, and_, or_
-from app.auth import auth_service
 from app.models.user_role import UserRole
 from app.models.role import Role
 from app.models.permission import Permission
@@ -11,6 +10,12 @@ from app.models.task import Task
 from app.models.task_assignment import TaskAssignment
 from app.models.project import Project
 
+def _auth_service():
+    # app.auth imports app.utils, which imports this module, so it is resolved
+    # when a dependency is built rather than at import time
+    from app.auth import auth_service
+    return auth_service
+
 class PermissionChecker:
     """
     Handles authorization logic for checking user permissions.
@@ -55,7 +60,7 @@ class PermissionChecker:
         """
         async def permission_dependency(
             request: Request,
-            user_data: dict = Depends(auth_service.verify_user)
+            user_data: dict = Depends(_auth_service().verify_user)
         ) -> dict:
             user_id = user_data.get("user_id")
             db = request.state.db
@@ -86,7 +91,7 @@ class PermissionChecker:
         """
         async def permissions_dependency(
             request: Request,
-            user_data: dict = Depends(auth_service.verify_user)
+            user_data: dict = Depends(_auth_service().verify_user)
         ) -> dict:
             user_id = user_data.get("user_id")
             db = request.state.db
@@ -127,7 +132,7 @@ class PermissionChecker:
         """
         async def ownership_dependency(
             request: Request,
-            user_data: dict = Depends(auth_service.verify_user)
+            user_data: dict = Depends(_auth_service().verify_user)
         ) -> dict:
             user_id = user_data.get("user_id")
             db = request.state.db
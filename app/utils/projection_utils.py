@@ -0,0 +1,86 @@
+"""
+Column-projection read models for list endpoints.
+
+List repositories select only the columns their response DTO needs (their
+`LIST_COLUMNS`) as plain rows: no ORM entities are built and nothing enters the
+session identity map. Rows support attribute access, so DTOs validate straight
+from them.
+
+Endpoints can additionally take a `fields=` query parameter (comma separated
+DTO field names). Only those columns are then selected, rows are validated into
+a partial DTO (every field optional) and only the requested fields are
+rendered.
+"""
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, create_model
+
+from app.utils.response_utils import render
+
+FIELDS_DESCRIPTION = "Comma separated response fields to return, e.g. 'id,name'. Defaults to all fields."
+
+
+def parse_fields(fields: Optional[str], model) -> Optional[FrozenSet[str]]:
+    """
+    Parse a `fields=` query parameter against a DTO.
+
+    Args:
+        fields (Optional[str]): Comma separated field names, or None/empty for all fields.
+        model: Response DTO class.
+
+    Returns:
+        Optional[FrozenSet[str]]: The requested fields, or None for all fields.
+
+    Raises:
+        HTTPException: 400 if a name is not a field of `model`.
+    """
+    if not fields:
+        return None
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = sorted(requested - set(model.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(model.model_fields)}"
+        )
+    return requested or None
+
+
+def projection_columns(columns: Sequence, fields: Optional[FrozenSet[str]]) -> list:
+    """
+    Trim a repository's `LIST_COLUMNS` to the requested fields.
+
+    The first column (the key) is always kept so the SELECT is never empty and
+    the row order stays meaningful.
+    """
+    if fields is None:
+        return list(columns)
+    return [column for index, column in enumerate(columns) if index == 0 or column.key in fields]
+
+
+@lru_cache(maxsize=None)
+def _partial_model(model):
+    overrides = {name: (Optional[field.annotation], None) for name, field in model.model_fields.items()}
+    return create_model(f"Partial{model.__name__}", __base__=model, **overrides)
+
+
+def read_model(model, fields: Optional[FrozenSet[str]]):
+    """Return `model`, or its cached partial variant (every field optional) when fields are trimmed."""
+    return model if fields is None else _partial_model(model)
+
+
+def render_list(model, items: List[BaseModel], fields: Optional[FrozenSet[str]] = None,
+                response: Optional[Response] = None) -> Response:
+    """
+    Render a list of `read_model(model, fields)` instances, keeping only the requested fields.
+
+    Args:
+        model: Response DTO class.
+        items (List[BaseModel]): Validated items.
+        fields (Optional[FrozenSet[str]]): Fields to keep, None for all.
+        response (Optional[Response]): Injected route Response whose headers are kept.
+    """
+    include = {"__all__": set(fields)} if fields is not None else None
+    return render(List[read_model(model, fields)], items, response=response, include=include)
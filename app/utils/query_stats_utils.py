@@ -0,0 +1,161 @@
+"""
+Per-request SQL statement counting and N+1 detection.
+
+Every engine is instrumented through SQLAlchemy's `before_cursor_execute` and
+`after_cursor_execute` events. While a `track_queries()` block is active (the
+`QueryStatsMiddleware` opens one per request) each statement is counted, timed
+and reduced to a fingerprint: whitespace collapsed, literals and `IN (...)`
+lists replaced by placeholders. A fingerprint that runs many times in one
+request is the signature of an N+1 loop.
+
+The current `QueryStats` lives in a context variable, so it follows the request
+into FastAPI's threadpool and into tasks started by middleware. Outside a
+`track_queries()` block the event handlers do nothing.
+
+Tests can cap the number of statements a block of code may run:
+
+    with statement_budget(3):
+        controller.get_tasks(...)
+
+Independently of any block, `compiled_cache_stats` counts how often SQLAlchemy
+found each executed statement in its compiled cache. A steady stream of misses
+means some construct gets a new cache key per call (e.g. a literal baked into
+the SQL) and is recompiled every time.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?|%\(\w+\)s|:\w+)\s*,?)+\)", re.IGNORECASE)
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+def fingerprint(statement: str) -> str:
+    """Normalise a SQL statement so that executions differing only in values compare equal."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _LITERAL.sub("?", statement)
+    return _IN_LIST.sub("IN (...)", statement)
+
+
+class QueryStats:
+    """Statement count, total database time and fingerprint counts for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.cache_misses = 0
+        self.fingerprints: Counter = Counter()
+
+    def record(self, statement: str, duration: float, cache_miss: bool = False) -> None:
+        self.count += 1
+        self.duration += duration
+        self.cache_misses += cache_miss
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """Fingerprints executed at least `threshold` times, most frequent first."""
+        return [(statement, count) for statement, count in self.fingerprints.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        """Render the stats as a `Server-Timing` header value."""
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} statements"'
+
+
+class CompiledCacheStats:
+    """
+    Process-wide outcomes of SQLAlchemy's compiled-statement cache.
+
+    `hits` and `misses` count cacheable statements; `uncached` counts statements
+    that could not be cached at all (no cache key, caching disabled, driver-level
+    `exec_driver_sql`).
+    """
+
+    def __init__(self):
+        self.outcomes: Counter = Counter()
+
+    def record(self, outcome: CacheStats) -> None:
+        self.outcomes[outcome] += 1
+
+    @property
+    def hits(self) -> int:
+        return self.outcomes[CacheStats.CACHE_HIT]
+
+    @property
+    def misses(self) -> int:
+        return self.outcomes[CacheStats.CACHE_MISS]
+
+    @property
+    def uncached(self) -> int:
+        return sum(self.outcomes.values()) - self.hits - self.misses
+
+    def hit_ratio(self) -> float:
+        """Share of cacheable statements served from the compiled cache."""
+        cacheable = self.hits + self.misses
+        return self.hits / cacheable if cacheable else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "uncached": self.uncached, "hit_ratio": self.hit_ratio()}
+
+    def reset(self) -> None:
+        self.outcomes.clear()
+
+
+compiled_cache_stats = CompiledCacheStats()
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the stats of the active `track_queries()` block, if any."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the SQL statements run inside the block (nested blocks count separately)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def statement_budget(limit: int, label: str = "block") -> Iterator[QueryStats]:
+    """
+    Fail with an AssertionError when the block runs more than `limit` SQL statements.
+
+    The error lists the repeated statements, which is usually where the budget went.
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        repeated = "".join(f"\n  {count}x {statement}" for statement, count in stats.repeated())
+        raise AssertionError(f"{label} ran {stats.count} SQL statements, budget is {limit}{repeated}")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and context is not None:
+        context._query_stats_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_statement(conn, cursor, statement, parameters, context, executemany):
+    if context is None:
+        return
+    outcome = context.cache_hit
+    compiled_cache_stats.record(outcome)
+    stats = _current.get()
+    started = getattr(context, "_query_stats_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started, outcome is CacheStats.CACHE_MISS)
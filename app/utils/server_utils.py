@@ -0,0 +1,75 @@
+"""
+Settings for running the API under uvicorn in production.
+
+`server_options()` turns the environment into keyword arguments for
+`uvicorn.run`:
+
+- WEB_CONCURRENCY: worker processes (default: one per CPU available to the process),
+- SERVER_BACKLOG: listen(2) backlog of the shared socket (default 2048),
+- SERVER_KEEP_ALIVE_SECONDS: idle keep-alive timeout (default 65, longer than the
+  usual 60 s idle timeout of load balancers, so they never reuse a connection
+  the worker is closing),
+- SERVER_LIMIT_MAX_REQUESTS: recycle a worker after this many requests (0 = never),
+- SERVER_GRACEFUL_TIMEOUT_SECONDS: time a stopping worker gets to finish its
+  in-flight requests (default 30).
+
+uvloop and httptools are used when installed, asyncio and h11 otherwise.
+"""
+import importlib.util
+import os
+from typing import Any, Dict, Optional
+
+from app.utils.env_utils import EnvironmentVariable, get_env
+
+APP = "app.app:app"
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks and cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def _is_installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def event_loop() -> str:
+    return "uvloop" if _is_installed("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if _is_installed("httptools") else "h11"
+
+
+def _int_env(key: EnvironmentVariable, default: int) -> int:
+    value = get_env(key)
+    return int(value) if value else default
+
+
+def server_options(host: str, port: int) -> Dict[str, Any]:
+    """
+    Build the `uvicorn.run` keyword arguments for a production server.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments, including the app import string.
+    """
+    limit_max_requests: Optional[int] = _int_env(EnvironmentVariable.SERVER_LIMIT_MAX_REQUESTS, 0) or None
+    return {
+        "app": APP,
+        "host": host,
+        "port": port,
+        "workers": _int_env(EnvironmentVariable.WEB_CONCURRENCY, available_cpus()),
+        "loop": event_loop(),
+        "http": http_protocol(),
+        "backlog": _int_env(EnvironmentVariable.SERVER_BACKLOG, 2048),
+        "timeout_keep_alive": _int_env(EnvironmentVariable.SERVER_KEEP_ALIVE_SECONDS, 65),
+        "limit_max_requests": limit_max_requests,
+        "timeout_graceful_shutdown": _int_env(EnvironmentVariable.SERVER_GRACEFUL_TIMEOUT_SECONDS, 30),
+        "reload": False,
+    }
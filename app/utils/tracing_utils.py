@@ -0,0 +1,368 @@
+"""
+Lightweight request tracing.
+
+A trace is a tree of spans for one HTTP request. `TracingMiddleware` opens the
+root span; below it, spans are recorded for:
+
+- the token check of `MultiTenantMiddleware` and the permission checks of
+  `AuthorizationMiddleware`,
+- every public method of the controllers and repositories (`@traced`),
+- opening a tenant session and `switch_schema`,
+- every SQL statement (through SQLAlchemy's cursor events),
+- dumping and encoding JSON responses.
+
+The current span lives in a context variable, like the per-request
+`QueryStats`, so it follows the request into FastAPI's threadpool. Outside a
+trace, `span()` and `@traced` methods only read that variable.
+
+Spans are recorded for every request, and the sampling decision is taken once
+the request is over: a trace is exported when it was picked at the configured
+rate, when the caller's `traceparent` header asked for it, or when the request
+was slower than the slow threshold. Exported traces are queued and written by
+a background thread, in the OTLP/JSON format, either as JSON lines to a local
+file or POSTed to an OTLP/HTTP collector (`<endpoint>/v1/traces`).
+
+Configured with TRACE_EXPORTER (`file` or `otlp`; unset disables tracing),
+TRACE_FILE, TRACE_OTLP_ENDPOINT, TRACE_SAMPLE_RATE and TRACE_SLOW_MS.
+"""
+import functools
+import inspect
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.env_utils import EnvironmentVariable, get_env
+from app.utils.query_stats_utils import fingerprint
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "taskeri"
+
+# OTLP span kinds
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+# Spans kept per trace; a runaway loop should not hold the whole request in memory
+MAX_SPANS = 2000
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("trace", "name", "span_id", "parent_id", "kind", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str], kind: int = KIND_INTERNAL,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.name = name
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes if attributes is not None else {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def child(self, name: str, kind: int = KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> "Span":
+        """Start a span below this one."""
+        return self.trace.add(Span(self.trace, name, self.span_id, kind, attributes))
+
+    def set_error(self, exc: BaseException) -> None:
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def end(self) -> None:
+        self.end_ns = time.time_ns()
+
+    @property
+    def duration(self) -> float:
+        """Seconds between start and end (or now, while the span is open)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+
+class Trace:
+    """The spans of one request."""
+
+    __slots__ = ("trace_id", "spans", "sampled", "dropped")
+
+    def __init__(self, trace_id: Optional[str] = None, sampled: bool = False):
+        self.trace_id = trace_id or _new_id(128)
+        self.spans: List[Span] = []
+        self.sampled = sampled
+        self.dropped = 0
+
+    def add(self, span: Span) -> Span:
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+        return span
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span of the current request, if it is traced."""
+    return _current_span.get()
+
+
+@contextmanager
+def activate(span: Span) -> Iterator[Span]:
+    """Make `span` the parent of spans started in the block, and end it afterwards."""
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.set_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """
+    Record the block as a span of the current trace (yields None outside a trace).
+
+        with span("switch_schema", schema=schema_name):
+            ...
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    with activate(parent.child(name, attributes=attributes)) as child:
+        yield child
+
+
+def _traced_function(name: str, function):
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def traced_coroutine(*args, **kwargs):
+            parent = _current_span.get()
+            if parent is None:
+                return await function(*args, **kwargs)
+            with activate(parent.child(name)):
+                return await function(*args, **kwargs)
+        return traced_coroutine
+
+    @functools.wraps(function)
+    def traced_function(*args, **kwargs):
+        parent = _current_span.get()
+        if parent is None:
+            return function(*args, **kwargs)
+        with activate(parent.child(name)):
+            return function(*args, **kwargs)
+    return traced_function
+
+
+def traced(cls):
+    """
+    Class decorator recording each public method call as a `<Class>.<method>` span.
+
+    Static and class methods, properties and generator functions are left as they are.
+    """
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith("_") or not inspect.isfunction(value) or inspect.isgeneratorfunction(value):
+            continue
+        setattr(cls, attribute, _traced_function(f"{cls.__name__}.{attribute}", value))
+    return cls
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """Trace id, parent span id and sampled flag of a W3C `traceparent` header, if valid."""
+    match = _TRACEPARENT.match(value or "")
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_span(conn, cursor, statement, parameters, context, executemany):
+    parent = _current_span.get()
+    if parent is not None and context is not None:
+        # The statement is normalised at export time, off the request path
+        context._trace_span = parent.child("sql", KIND_CLIENT, {"db.statement": statement})
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_statement_span(conn, cursor, statement, parameters, context, executemany):
+    statement_span = getattr(context, "_trace_span", None)
+    if statement_span is not None:
+        statement_span.end()
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_statement_span(exception_context):
+    statement_span = getattr(exception_context.execution_context, "_trace_span", None)
+    if statement_span is not None:
+        statement_span.set_error(exception_context.original_exception)
+        statement_span.end()
+
+
+def _attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    if key == "db.statement":
+        value = fingerprint(value)
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(trace: Trace, span: Span) -> dict:
+    otlp = {
+        "traceId": trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        # A span still open when the trace is exported (e.g. a statement whose
+        # error event never fired) ends with the trace
+        "endTimeUnixNano": str(span.end_ns or trace.spans[0].end_ns or span.start_ns),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+def to_otlp(traces: List[Trace], service_name: str = SERVICE_NAME) -> dict:
+    """Render traces as an OTLP/JSON `ExportTraceServiceRequest`."""
+    return {"resourceSpans": [{
+        "resource": {"attributes": [_attribute("service.name", service_name)]},
+        "scopeSpans": [{
+            "scope": {"name": __name__},
+            "spans": [_otlp_span(trace, span) for trace in traces for span in trace.spans],
+        }],
+    }]}
+
+
+class SpanExporter(ABC):
+    """
+    Queues finished traces and writes them in batches from a background thread.
+
+    Subclasses implement `write` for their destination.
+
+    The thread starts with the first export (in each worker process). When the
+    queue is full, traces are dropped and counted rather than slowing requests down.
+
+    Args:
+        max_queue (int): Traces waiting to be written before new ones are dropped.
+        batch_size (int): Traces written per batch.
+    """
+
+    def __init__(self, max_queue: int = 1000, batch_size: int = 64):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def export(self, trace: Trace) -> None:
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Write the queued traces and stop the background thread."""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        self._pid = None
+
+    @abstractmethod
+    def write(self, payload: bytes) -> None:
+        """Send one batch, rendered as OTLP/JSON, to the destination."""
+
+    def _start(self) -> None:
+        self._queue = queue.Queue(self.max_queue)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._pid = os.getpid()
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            traces = [trace for trace in batch if trace is not None]
+            if traces:
+                try:
+                    self.write(orjson.dumps(to_otlp(traces)))
+                except Exception:
+                    logger.warning("Failed to export %d traces", len(traces), exc_info=True)
+            if batch[-1] is None:
+                return
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends each batch as one line of OTLP/JSON to `path` (the collector's file exporter format)."""
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+
+    def write(self, payload: bytes) -> None:
+        with open(self.path, "ab") as file:
+            file.write(payload + b"\n")
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """POSTs each batch as OTLP/JSON to an OTLP/HTTP collector."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0, **kwargs):
+        super().__init__(**kwargs)
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def write(self, payload: bytes) -> None:
+        # Imported here: only the exporter thread needs it
+        from urllib.request import Request, urlopen
+
+        request = Request(self.url, data=payload, headers={"Content-Type": "application/json"}, method="POST")
+        with urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+def exporter_from_env() -> Optional[SpanExporter]:
+    """The exporter selected by TRACE_EXPORTER, or None when tracing is disabled."""
+    kind = (get_env(EnvironmentVariable.TRACE_EXPORTER) or "").lower()
+    if kind == "file":
+        return FileSpanExporter(get_env(EnvironmentVariable.TRACE_FILE, "traces.jsonl"))
+    if kind == "otlp":
+        return OtlpHttpSpanExporter(get_env(EnvironmentVariable.TRACE_OTLP_ENDPOINT, "http://localhost:4318"))
+    if kind:
+        raise ValueError(f"Invalid trace exporter: {kind}")
+    return None
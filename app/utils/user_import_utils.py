@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+from typing import List
+
+
+def parse_user_import(body: bytes, content_type: str) -> List[dict]:
+    """
+    Parse a bulk user import payload into raw row dictionaries.
+
+    CSV payloads need a header row (e.g. `email,first_name,last_name,password,
+    department_id,team_id,role_id`); JSON payloads are an array of objects with
+    the same keys. Empty CSV cells are treated as missing values.
+
+    Args:
+        body (bytes): Raw request body.
+        content_type (str): Request content type (`text/csv` or `application/json`).
+
+    Returns:
+        List[dict]: One dictionary per row, in file order.
+
+    Raises:
+        ValueError: If the payload cannot be parsed.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("Import payload must be UTF-8 encoded")
+
+    if media_type in ("text/csv", "application/csv"):
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames:
+            raise ValueError("CSV import needs a header row")
+        return [
+            {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+            for row in reader
+        ]
+
+    if media_type == "application/json":
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON import must be an array of objects")
+        return rows
+
+    raise ValueError("Unsupported content type, use text/csv or application/json")
@@ -20,6 +20,7 @@ from .attendance_view import router as attendance_router
 from .userproject_view import router as userproject_router
 from .invoice_view import router as invoice_router
 from .notification_view import router as notification_router
+from .report_view import router as report_router
 
 routers = [
     login_router,
@@ -43,6 +44,7 @@ routers = [
     attendance_router,
     userproject_router,
     invoice_router,
-    notification_router
+    notification_router,
+    report_router
 ]
 
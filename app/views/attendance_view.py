@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.orm import Session
 from typing import List
 from app.models.dtos.attendance_dtos import AttendanceResponse
+from app.models.dtos.export_dtos import ExportFormat
 from app.controllers.attendance_controller import AttendanceController
 from app.models.attendance import Attendance
 from app.utils.db_utils import get_db
@@ -65,3 +66,31 @@ def get_user_attendance(
     """
     controller = AttendanceController(db)
     return controller.get_user_attendance(user_id)
+
+
+@router.get("/my/export")
+def export_my_attendance(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Stream all attendance records of the current user as a CSV or NDJSON download.
+    """
+    controller = AttendanceController(db)
+    return controller.export_user_attendance(current_user.get("user_id"), export_format)
+
+
+@router.get("/user/{user_id}/export")
+def export_user_attendance(
+    user_id: int,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Stream all attendance records of a specific user as a CSV or NDJSON download.
+    """
+    controller = AttendanceController(db)
+    return controller.export_user_attendance(user_id, export_format)
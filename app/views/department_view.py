@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.dtos.department_dtos import DepartmentCreate, DepartmentUpdate, DepartmentResponse
 from app.controllers.department_controller import DepartmentController
 from app.utils import get_db
+from app.utils.etag_utils import conditional_get
 from typing import List
 from app.auth import auth_service
 
@@ -32,7 +33,7 @@ def create_department(
     """
     return controller.create_department(data)
 
-@router.get("/", response_model=List[DepartmentResponse])
+@router.get("/", response_model=List[DepartmentResponse], dependencies=[Depends(conditional_get("departments"))])
 def get_all_departments(
     request: Request,
     db: Session = Depends(get_db),
@@ -42,6 +43,8 @@ def get_all_departments(
     """
     Get a list of all departments.
 
+    Supports conditional requests: a matching If-None-Match returns 304.
+
     Permission requirements (handled by middleware):
     - 'read_department' permission
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from sqlalchemy.orm import Session
 from app.controllers.file_attachment_controller import FileAttachmentController
 from app.models.dtos.file_attachment_dtos import (
@@ -6,8 +6,10 @@ from app.models.dtos.file_attachment_dtos import (
     FileAttachmentUpdate,
     FileAttachmentResponse
 )
+from app.models.dtos.export_dtos import ExportFormat
 from app.utils import get_db
-from typing import List
+from app.utils.projection_utils import FIELDS_DESCRIPTION, parse_fields, render_list
+from typing import List, Optional
 from app.auth import auth_service
 
 router = APIRouter(prefix="/attachments", tags=["File Attachments"])
@@ -33,6 +35,7 @@ def create_file_attachment(
 @router.get("/", response_model=List[FileAttachmentResponse])
 def get_all_attachments(
     request: Request,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     controller: FileAttachmentController = Depends(get_file_attachment_controller),
     current_user: dict = Depends(auth_service.verify_user)
 ):
@@ -41,8 +44,24 @@ def get_all_attachments(
 
     Returns a list of all file attachments across tasks. 
     Useful for admins or analytics tools needing to inspect uploads.
+    `fields` limits the selected columns and the returned keys.
     """
-    return controller.get_all_attachments()
+    fields = parse_fields(fields, FileAttachmentResponse)
+    return render_list(FileAttachmentResponse, controller.get_all_attachments(fields), fields)
+
+@router.get("/export")
+def export_attachments(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    controller: FileAttachmentController = Depends(get_file_attachment_controller),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Stream all file attachments as a CSV or NDJSON download.
+
+    Rows are fetched page by page, so the export works for any number of attachments.
+    """
+    return controller.export_attachments(export_format)
 
 @router.get("/task/{task_id}", response_model=List[FileAttachmentResponse])
 def get_attachments_by_task(
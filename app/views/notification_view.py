@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from typing import List
-from app.models.dtos.notification_dtos import NotificationCreate, NotificationResponse
+from app.models.dtos.notification_dtos import NotificationCreate, NotificationResponse, NotificationRetentionStats
 from app.controllers.notification_controller import NotificationController
 from app.utils import get_db
 from app.auth import auth_service
+from app.utils.etag_utils import conditional_get
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
@@ -39,6 +40,17 @@ def get_notifications_for_user(
     """
     return controller.get_notifications_for_user(user_id)
 
+@router.get("/retention/stats", response_model=NotificationRetentionStats)
+def get_retention_stats(
+    request: Request,
+    controller: NotificationController = Depends(get_notification_controller),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Get notification retention counters (rows pruned/compacted) for the current tenant.
+    """
+    return controller.get_retention_stats(f"tenant_{current_user['tenant_name']}")
+
 @router.get("/{notification_id}", response_model=NotificationResponse)
 def get_notification(
     notification_id: int,
@@ -83,7 +95,8 @@ def delete_notification(
 
 from fastapi import Query
 
-@router.get("/get/me", response_model=List[NotificationResponse])
+@router.get("/get/me", response_model=List[NotificationResponse],
+            dependencies=[Depends(conditional_get("notifications", per_user=True))])
 def get_my_notifications(
     request: Request,
     unread_only: bool = Query(False),
@@ -93,7 +106,7 @@ def get_my_notifications(
 ):
     """
     Get all notifications for the current user.
-    Supports filtering by unread_only.
+    Supports filtering by unread_only and conditional requests (If-None-Match returns 304).
     Permission check required for 'read_notification'.
     """
     return controller.get_notifications_for_user(
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, status, Query, Path, HTTPException
+from fastapi import APIRouter, Depends, status, Query, Path, HTTPException, Response
 from app.controllers.project_controller import ProjectController
 from app.models.dtos.project_dtos import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectStatistics
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.auth import auth_service
+from app.utils.etag_utils import conditional_get
+from app.utils.response_utils import render
+from app.utils.projection_utils import FIELDS_DESCRIPTION, parse_fields, render_list
 
 router = APIRouter(
     prefix="/projects",
@@ -28,21 +31,27 @@ async def create_project(
     """
     return controller.create_project(project_data)
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=List[ProjectResponse], dependencies=[Depends(conditional_get("projects"))])
 async def get_all_projects(
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     controller: ProjectController = Depends(),
     current_user: dict = Depends(auth_service.verify_user)
 ):
     """
     Retrieve all projects in the system.
 
+    Supports conditional requests: a matching If-None-Match returns 304.
+    `fields` limits the selected columns and the returned keys.
+
     Permission requirements (handled by middleware):
     - 'read_projects' permission
 
     Business logic:
     - Users with access can see the full list of projects
     """
-    return controller.get_all_projects()
+    fields = parse_fields(fields, ProjectResponse)
+    return render_list(ProjectResponse, controller.get_all_projects(fields), fields, response=response)
 
 @router.get("/statistics", response_model=ProjectStatistics)
 async def get_project_statistics(
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import TYPE_CHECKING, Optional
+
+from app.models.dtos.report_dtos import ReportPeriod, ReportGroupBy, UtilizationReportResponse, ReferenceCacheStats
+from app.utils import get_db
+from app.auth import auth_service
+
+if TYPE_CHECKING:
+    from app.controllers.report_controller import ReportController
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["Reports"],
+    responses={404: {"description": "Not found"}}
+)
+
+def get_report_controller(db: Session = Depends(get_db)) -> "ReportController":
+    # The report controller pulls in numpy; load it with the first report request
+    from app.controllers.report_controller import ReportController
+    return ReportController(db)
+
+@router.get("/utilization", response_model=UtilizationReportResponse)
+def get_utilization_report(
+    request: Request,
+    start_date: date,
+    end_date: date,
+    period: ReportPeriod = Query(ReportPeriod.WEEK),
+    group_by: ReportGroupBy = Query(ReportGroupBy.USER),
+    team_id: Optional[int] = Query(None, description="Only include users of this team"),
+    department_id: Optional[int] = Query(None, description="Only include users of this department"),
+    company_id: Optional[int] = Query(None, description="Company whose work hours per day apply"),
+    controller: "ReportController" = Depends(get_report_controller),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Weekly or monthly utilization per user, team or department.
+
+    Compares logged minutes (time logs) and attended minutes (attendance) with the
+    expected minutes from `CompanySettings.work_hours_per_day`, and reports minutes
+    double-counted by overlapping time logs.
+
+    Permission requirements (handled by middleware):
+    - 'view_statistics' permission
+    """
+    return controller.get_utilization_report(
+        period, group_by, start_date, end_date,
+        team_id=team_id, department_id=department_id, company_id=company_id
+    )
+
+@router.get("/cache", response_model=ReferenceCacheStats)
+def get_cache_stats(
+    request: Request,
+    controller: "ReportController" = Depends(get_report_controller),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Reference data cache counters (hits, misses, invalidations) for the current tenant.
+
+    Permission requirements (handled by middleware):
+    - 'view_statistics' permission
+    """
+    return controller.get_cache_stats(f"tenant_{current_user['tenant_name']}")
@@ -7,6 +7,11 @@ from app.models.dtos import (
 from typing import List, Dict, Optional
 from datetime import date
 from app.auth import auth_service
+from app.utils.etag_utils import conditional_get
+from app.utils.response_utils import render
+from app.utils.projection_utils import FIELDS_DESCRIPTION, parse_fields, render_list
+from app.models.dtos.task_dtos import TaskBulkCreateRequest, TaskBulkPatchRequest, TaskBulkResponse
+from app.models.dtos.export_dtos import ExportFormat
 import logging
 
 router = APIRouter(
@@ -29,6 +34,39 @@ async def create_task(
     """
     return controller.create_task(task_data)
 
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def bulk_create_tasks(
+    request: TaskBulkCreateRequest,
+    controller: TaskController = Depends(),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Create up to 500 tasks in one transaction.
+
+    Returns a result per item; items with a missing project or assignee are skipped.
+
+    Permission requirements (handled by middleware):
+    - 'create_task' permission
+    """
+    return controller.bulk_create_tasks(request)
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def bulk_patch_tasks(
+    request: TaskBulkPatchRequest,
+    controller: TaskController = Depends(),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Change status, priority, due date and assignees of up to 500 tasks in one transaction.
+
+    Returns a result per item; missing tasks and unknown assignees are skipped.
+
+    Permission requirements (handled by middleware):
+    - 'update_task' permission (for tasks assigned to the user)
+    - 'update_any_task' permission (for any task)
+    """
+    return controller.bulk_patch_tasks(request)
+
 @router.get("/statistics", response_model=TaskStatistics)
 async def get_task_statistics(
     controller: TaskController = Depends(),
@@ -46,6 +84,25 @@ async def get_task_statistics(
     """
     return controller.get_task_statistics()
 
+@router.get("/export")
+async def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv or ndjson"),
+    project_id: Optional[int] = Query(None, description="Only export tasks of this project"),
+    controller: TaskController = Depends(),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Stream tasks as a CSV or NDJSON download.
+    
+    Permission requirements (handled by middleware):
+    - 'read_task' permission
+    
+    Business logic:
+    - Rows are read from the database in fixed-size pages and written as they arrive,
+      so memory use does not depend on the number of tasks
+    """
+    return controller.export_tasks(export_format, project_id)
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int, 
@@ -67,7 +124,13 @@ async def get_task(
     
     return controller.get_task(task_id)
 
-@router.get("/{task_id}/details", response_model=TaskDetailResponse)
+@router.get(
+    "/{task_id}/details",
+    response_model=TaskDetailResponse,
+    dependencies=[Depends(conditional_get(
+        "tasks", "task_assignments", "users", "comments", "file_attachments", "projects", weak=False
+    ))]
+)
 async def get_task_details(
     task_id: int, 
     controller: TaskController = Depends(),
@@ -75,6 +138,8 @@ async def get_task_details(
 ):
     """
     Get detailed information about a task including relationships.
+
+    Supports conditional requests: a matching If-None-Match returns 304.
     
     Permission requirements (handled by middleware):
     - 'read_task' permission (for tasks assigned to the user)
@@ -90,6 +155,7 @@ async def get_task_details(
 @router.get("/project/{project_id}", response_model=List[TaskResponse])
 async def get_tasks_by_project(
     project_id: int, 
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     controller: TaskController = Depends(),
     current_user: dict = Depends(auth_service.verify_user)
 ):
@@ -102,8 +168,10 @@ async def get_tasks_by_project(
     Business logic:
     - Users can view tasks for projects they're involved with
     - Admins/Managers can view all project tasks
+    - `fields` limits the selected columns and the returned keys
     """
-    return controller.get_tasks_by_project(project_id)
+    fields = parse_fields(fields, TaskResponse)
+    return render_list(TaskResponse, controller.get_tasks_by_project(project_id, fields), fields)
 
 @router.get("/user/{user_id}", response_model=List[TaskResponse])
 async def get_tasks_by_user(
@@ -111,7 +179,7 @@ async def get_tasks_by_user(
     request: Request,
     controller: TaskController = Depends(),
     current_user: dict = Depends(auth_service.verify_user)
-) -> List[TaskResponse]:
+):
     """
     Get all tasks assigned to a specific user.
     
@@ -123,8 +191,7 @@ async def get_tasks_by_user(
     - Users can always view their own tasks
     - Viewing others' tasks requires the 'read_any_user_task' permission
     """
-            
-    return controller.get_tasks_by_user(user_id)
+    return render(List[TaskResponse], controller.get_tasks_by_user(user_id))
 
 @router.get("/", response_model=TaskListResponse)
 async def get_tasks_paginated(
@@ -160,7 +227,7 @@ async def get_tasks_paginated(
         project_id=project_id,
         search_term=search_term
     )
-    return controller.get_tasks_paginated(page, page_size, filter_params)
+    return render(TaskListResponse, controller.get_tasks_paginated(page, page_size, filter_params))
 
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(
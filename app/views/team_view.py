@@ -4,6 +4,7 @@ from app.models.dtos.team_dtos import TeamCreate, TeamUpdate, TeamResponse, Team
 from app.models.dtos.user_dtos import UserResponse
 from typing import List
 from app.utils import get_db
+from app.utils.etag_utils import conditional_get
 from app.auth import auth_service
 
 router = APIRouter(prefix= "/teams", tags=["Teams"])
@@ -12,7 +13,7 @@ router = APIRouter(prefix= "/teams", tags=["Teams"])
 # READ
 # -----------------------------
 
-@router.get("", response_model=List[TeamResponse])
+@router.get("", response_model=List[TeamResponse], dependencies=[Depends(conditional_get("teams"))])
 async def get_all_teams(
     request: Request,
     controller: TeamController = Depends(),
@@ -21,6 +22,8 @@ async def get_all_teams(
     """
     Endpoint to retrieve all teams.
 
+    Supports conditional requests: a matching If-None-Match returns 304.
+
     Business logic:
     - Useful for dashboards, HR, and organization charts
     """
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.orm import Session
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Optional
+from datetime import datetime, date
 
-from app.models.dtos.timelog_dtos import TimeLogCreate, TimeLogUpdate, TimeLogResponse
+from app.models.dtos.timelog_dtos import (
+    TimeLogCreate, TimeLogUpdate, TimeLogResponse, TimeLogTotalsGroupBy, TimeLogTotalsResponse
+)
+from app.models.dtos.export_dtos import ExportFormat
 from app.controllers.timelog_controller import TimeLogController
 from app.utils.db_utils import get_db
 from app.auth import auth_service  # Assumes JWT or session-based auth that returns current user info
@@ -48,6 +51,35 @@ def get_my_time_logs(
     return controller.get_time_logs_by_user(user_id=current_user["user_id"])
 
 
+@router.get("/my/export")
+def export_my_time_logs(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Stream all time logs of the current user as a CSV or NDJSON download.
+    """
+    controller = TimeLogController(db)
+    return controller.export_time_logs_by_user(current_user["user_id"], export_format)
+
+
+@router.get("/user/{user_id}/export")
+def export_user_time_logs(
+    user_id: int,
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Stream all time logs of a specific user as a CSV or NDJSON download (e.g. for payroll).
+    """
+    controller = TimeLogController(db)
+    return controller.export_time_logs_by_user(user_id, export_format)
+
+
 @router.get("/task/{task_id}", response_model=List[TimeLogResponse])
 def get_time_logs_by_task(
     task_id: int,
@@ -78,6 +110,28 @@ def get_user_time_logs_by_time_range(
     return controller.get_user_logs_by_time_range(user_id, start_date, end_date)
 
 
+@router.get("/totals", response_model=TimeLogTotalsResponse)
+def get_time_log_totals(
+    request: Request,
+    start_date: date,
+    end_date: date,
+    group_by: TimeLogTotalsGroupBy = Query(TimeLogTotalsGroupBy.USER),
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Get total logged minutes per user, task, project or day over a date range.
+
+    Totals come from the daily rollup table, so the cost does not depend on
+    how many raw time logs fall into the range.
+    """
+    controller = TimeLogController(db)
+    return controller.get_totals(group_by, start_date, end_date, user_id, task_id, project_id)
+
+
 @router.get("/{time_log_id}", response_model=TimeLogResponse)
 def get_time_log(
     time_log_id: int,
@@ -1,10 +1,13 @@
-from typing import List
-from fastapi import HTTPException, status, APIRouter, Depends, Request
+from typing import List, Optional
+from fastapi import HTTPException, status, APIRouter, Depends, Request, Query, BackgroundTasks
 from app.controllers import UserController
-from app.models.dtos import UserCreate, UserUpdate, UserResponse
+from app.models.dtos import UserCreate, UserUpdate, UserResponse, UserListResponse
+from app.models.dtos.user_dtos import UserImportResponse
 from sqlalchemy.sql import text
 from app.utils.db_utils import get_db 
+from app.utils.response_utils import render
 from app.auth import auth_service
+from starlette.concurrency import run_in_threadpool
 
 
 router = APIRouter(prefix="/users", tags=["User"])
@@ -23,6 +26,47 @@ async def create_user(
     return controller.create_user(user_create, current_user)
 
 
+@router.post("/import", response_model=UserImportResponse)
+async def import_users(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    controller: UserController = Depends(),
+    current_user: dict = Depends(auth_service.verify_user)
+) -> UserImportResponse:
+    """
+    Endpoint to create many users from a CSV (`text/csv`) or JSON (`application/json`) body.
+
+    Rows are imported independently; the response reports the outcome of every row.
+    Welcome emails are sent in the background after the response.
+
+    Permission requirements (handled by middleware):
+    - 'create_user' permission
+    """
+    rows = controller.parse_import(await request.body(), request.headers.get("content-type", ""))
+    # Hashing and batch inserts take a while; keep them off the event loop
+    return await run_in_threadpool(controller.import_users, rows, current_user, background_tasks)
+
+
+@router.get("/list", response_model=UserListResponse)
+async def list_users(
+    request: Request,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=500, description="Number of users per page"),
+    team_id: Optional[int] = Query(None, description="Filter by team"),
+    department_id: Optional[int] = Query(None, description="Filter by department"),
+    role_id: Optional[int] = Query(None, description="Filter by role"),
+    controller: UserController = Depends(),
+    current_user: dict = Depends(auth_service.verify_user)
+):
+    """
+    Endpoint to retrieve a page of users with their primary role.
+
+    Permission requirements (handled by middleware):
+    - 'read_any_user' permission
+    """
+    return render(UserListResponse, controller.list_users(page, page_size, team_id, department_id, role_id))
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
@@ -49,7 +93,7 @@ async def get_all_users(
     request: Request,
     controller: UserController = Depends(),
     current_user: dict = Depends(auth_service.verify_user)
-) -> List[UserResponse]:
+):
     """
     Endpoint to retrieve all users.
 
@@ -59,7 +103,7 @@ async def get_all_users(
     Business logic:
     - Only users with 'read_any_user' permission can access the full user list
     """
-    return controller.get_all_users()
+    return render(List[UserResponse], controller.get_all_users())
 
 
 
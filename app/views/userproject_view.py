@@ -3,7 +3,8 @@ from app.controllers.userproject_controller import UserProjectController
 from app.models.dtos.user_dtos import UserResponse
 from app.models.dtos.project_dtos import ProjectResponse
 from app.auth import auth_service
-from typing import List
+from app.utils.projection_utils import FIELDS_DESCRIPTION, parse_fields, render_list
+from typing import List, Optional
 
 router = APIRouter(
     prefix="/project-users",
@@ -37,13 +38,15 @@ async def remove_user_from_project(
 @router.get("/{project_id}/users", response_model=List[UserResponse])
 async def get_users_for_project(
     project_id: int = Path(..., gt=0, description="Project ID (must be positive)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     controller: UserProjectController = Depends(),
     current_user: dict = Depends(auth_service.verify_user)
 ):
     """
-    List all users assigned to a project with full user details.
+    List all users assigned to a project with full user details (or only `fields`).
     """
-    return controller.get_users(project_id)
+    fields = parse_fields(fields, UserResponse)
+    return render_list(UserResponse, controller.get_users(project_id, fields), fields)
 
 @router.get("/users/{user_id}/projects", response_model=List[ProjectResponse])
 async def get_projects_for_user(
@@ -0,0 +1,65 @@
+"""
+Benchmark for response compression.
+
+Renders task lists of several sizes the way `/tasks` does (TypeAdapter +
+orjson), then compresses each body with the encoders `CompressionMiddleware`
+uses and reports bytes on the wire and CPU time per response:
+
+- identity: the uncompressed body,
+- gzip at the configured level,
+- Brotli at the configured quality (skipped when `brotli` is not installed).
+
+Bodies below the middleware's minimum size are sent uncompressed, so those rows
+show the cost that the threshold avoids.
+
+    python -m benchmarks.bench_compression [--sizes 5 50 500 5000] [--repeat 20]
+"""
+import argparse
+import time
+from typing import List
+
+from app.models.dtos.task_dtos import TaskResponse
+from app.utils.response_utils import render, validate_list
+from app.middleware.compression_middleware import BrotliEncoder, GzipEncoder, brotli
+from benchmarks.bench_serialization import synthetic_tasks
+
+
+def cpu_time(function, repeat: int) -> float:
+    """Best process CPU time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        function()
+        best = min(best, time.process_time() - started)
+    return best * 1000
+
+
+def encode(factory, body: bytes) -> bytes:
+    encoder = factory()
+    return encoder.compress(body) + encoder.finish()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500, 5000], help="tasks per response")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--gzip-level", type=int, default=6)
+    parser.add_argument("--brotli-quality", type=int, default=4)
+    args = parser.parse_args()
+
+    encoders = {"gzip": lambda: GzipEncoder(args.gzip_level)}
+    if brotli is not None:
+        encoders["br"] = lambda: BrotliEncoder(args.brotli_quality)
+
+    print(f"{'tasks':>6} {'encoding':>9} {'bytes':>10} {'ratio':>7} {'cpu ms':>8}")
+    for size in args.sizes:
+        body = render(List[TaskResponse], validate_list(TaskResponse, synthetic_tasks(size))).body
+        print(f"{size:>6} {'identity':>9} {len(body):>10} {1:>7.2f} {0:>8.3f}")
+        for name, factory in encoders.items():
+            compressed = encode(factory, body)
+            elapsed = cpu_time(lambda: encode(factory, body), args.repeat)
+            print(f"{size:>6} {name:>9} {len(compressed):>10} {len(body) / len(compressed):>7.2f} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark for rendering task pages as JSON.
+
+Builds `--tasks` task rows (attribute objects shaped like the ORM rows) and
+compares the previous pipeline with the one the list endpoints use now:
+
+- baseline: `TaskResponse.from_orm` per row, then FastAPI's response_model pass
+  (`serialize_response`: validate + JSON-mode dump) and the stdlib-json
+  `JSONResponse`,
+- adapter: one cached `TypeAdapter` validation for the whole list, then
+  `render` (adapter dump + orjson), which FastAPI returns as-is.
+
+    python -m benchmarks.bench_serialization [--tasks 1000] [--repeat 50]
+"""
+import argparse
+import asyncio
+import json
+import time
+import warnings
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.models.dtos.task_dtos import TaskResponse
+from app.utils.response_utils import render, validate_list
+
+PRIORITIES = ("Low", "Medium", "High")
+STATUSES = ("To Do", "In Progress", "Technical Review", "Done")
+
+
+def synthetic_tasks(count: int) -> list:
+    """Build task rows with the attributes `TaskResponse` reads."""
+    created = datetime(2025, 1, 1, 9, 0)
+    return [
+        SimpleNamespace(
+            id=i,
+            name=f"Task {i}",
+            project_id=i % 40 + 1,
+            description=f"Description of task {i} " * 4,
+            priority=PRIORITIES[i % 3],
+            status=STATUSES[i % 4],
+            due_date=date(2025, 6, 1) + timedelta(days=i % 90),
+            created_at=created + timedelta(minutes=i),
+            updated_at=created + timedelta(minutes=2 * i),
+            assigned_users=[i % 25 + 1, i % 31 + 2],
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def baseline(rows, field) -> bytes:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        tasks = [TaskResponse.from_orm(row) for row in rows]
+    content = asyncio.run(serialize_response(field=field, response_content=tasks))
+    return JSONResponse(content).body
+
+
+def adapter(rows) -> bytes:
+    return render(List[TaskResponse], validate_list(TaskResponse, rows)).body
+
+
+def timed(function, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = synthetic_tasks(args.tasks)
+    field = create_model_field("response", List[TaskResponse], mode="serialization")
+
+    assert json.loads(baseline(rows, field)) == json.loads(adapter(rows)), "pipelines disagree"
+
+    baseline_ms = timed(lambda: baseline(rows, field), args.repeat)
+    adapter_ms = timed(lambda: adapter(rows), args.repeat)
+    print(f"{args.tasks} tasks, best of {args.repeat}")
+    print(f"  from_orm + response_model + json: {baseline_ms:8.2f} ms")
+    print(f"  TypeAdapter + orjson:             {adapter_ms:8.2f} ms")
+    print(f"  speed-up:                         {baseline_ms / adapter_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark for the prebuilt hot-path statements.
+
+Runs each hot lookup against an in-memory SQLite database (so the time is
+almost entirely SQLAlchemy's Python overhead) in two forms:
+
+- rebuilt: the construct is built per call, as the code did before
+  (`query(...).filter(...)`, `select(exists().where(...))`),
+- prebuilt: the module/class-level statement with bound parameters.
+
+Both forms hit the compiled cache after the first call; the difference is the
+cost of building the construct and computing its cache key on every call. The
+compiled-cache counters are printed per run.
+
+    python -m benchmarks.bench_statement_cache [--calls 5000]
+"""
+import argparse
+import time
+
+from sqlalchemy import BigInteger, and_, create_engine, exists, insert, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.middleware.authorization_middleware import PERMISSION_EXISTS
+from app.models.permission import Permission
+from app.models.role import Role
+from app.models.role_permission import RolePermission
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.repositories.task_repository import TaskRepository
+from app.repositories.user_repository import UserRepository
+from app.utils.db_utils import Base
+from app.utils.query_stats_utils import compiled_cache_stats
+
+TABLES = [User, Role, UserRole, Permission, RolePermission, Task, TaskAssignment]
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    # SQLite only auto-increments INTEGER primary keys (as in test/conftest.py)
+    return "INTEGER"
+
+
+def rebuilt_lookups(db):
+    return {
+        "get_task_by_id": lambda i: db.query(Task).filter(Task.id == i % 100 + 1).first(),
+        "get_task_assignments": lambda i: [row[0] for row in db.query(TaskAssignment.user_id).filter(
+            TaskAssignment.task_id == i % 100 + 1).all()],
+        "get_user_by_email": lambda i: db.query(User).filter(User.email == f"user{i % 10 + 1}@example.com").first(),
+        "permission EXISTS": lambda i: db.scalar(select(exists().where(and_(
+            UserRole.user_id == i % 10 + 1,
+            UserRole.role_id == RolePermission.role_id,
+            RolePermission.permission_id == Permission.id,
+            Permission.name == "read_task"
+        )))),
+    }
+
+
+def prebuilt_lookups(db):
+    tasks, users = TaskRepository(db), UserRepository(db)
+    return {
+        "get_task_by_id": lambda i: tasks.get_task_by_id(i % 100 + 1),
+        "get_task_assignments": lambda i: tasks.get_task_assignments(i % 100 + 1),
+        "get_user_by_email": lambda i: users.get_user_by_email(f"user{i % 10 + 1}@example.com"),
+        "permission EXISTS": lambda i: db.scalar(PERMISSION_EXISTS, {"user_id": i % 10 + 1, "permission": "read_task"}),
+    }
+
+
+def setup_database():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in TABLES])
+    with engine.begin() as connection:
+        connection.execute(insert(User), [
+            {"id": i, "email": f"user{i}@example.com", "password_hash": "x", "first_name": "User", "last_name": str(i)}
+            for i in range(1, 11)
+        ])
+        connection.execute(insert(Role), [{"id": 1, "name": "Employee"}])
+        connection.execute(insert(UserRole), [{"user_id": i, "role_id": 1} for i in range(1, 11)])
+        connection.execute(insert(Permission), [{"id": 1, "name": "read_task"}])
+        connection.execute(insert(RolePermission), [{"role_id": 1, "permission_id": 1}])
+        connection.execute(insert(Task), [{"id": i, "project_id": 1, "name": f"Task {i}"} for i in range(1, 101)])
+        connection.execute(insert(TaskAssignment), [
+            {"task_id": i, "user_id": i % 10 + 1} for i in range(1, 101)
+        ])
+    return engine
+
+
+def run(lookup, calls: int) -> float:
+    """Microseconds per call after one warm-up call."""
+    lookup(0)
+    started = time.perf_counter()
+    for i in range(calls):
+        lookup(i)
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = setup_database()
+    db = sessionmaker(bind=engine, autoflush=False)()
+    forms = {"rebuilt": rebuilt_lookups(db), "prebuilt": prebuilt_lookups(db)}
+
+    print(f"{'lookup':<22} {'form':<9} {'us/call':>8} {'hits':>7} {'misses':>7}")
+    for name in forms["prebuilt"]:
+        for form, lookups in forms.items():
+            compiled_cache_stats.reset()
+            per_call = run(lookups[name], args.calls)
+            db.rollback()
+            print(f"{name:<22} {form:<9} {per_call:>8.1f} "
+                  f"{compiled_cache_stats.hits:>7} {compiled_cache_stats.misses:>7}")
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark for the request unit of work on write-heavy endpoints.
+
+Runs the controller/repository code of a few write endpoints against a
+file-backed SQLite database (synchronous=FULL, so every commit is a durable
+disk flush like an InnoDB redo-log flush) through a `RequestSession`, once per
+simulated request, in both modes:
+
+- per-commit: every repository `commit()` commits (DB_UNIT_OF_WORK=false),
+- unit-of-work: repositories only flush and the request commits once.
+
+Endpoints:
+
+- POST /tasks with three assignees (task, assignments, notifications),
+- POST /comments,
+- the tenant part of POST /users/create (user, then the default role).
+
+    python -m benchmarks.bench_unit_of_work [--requests 200]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import BigInteger, create_engine, event, insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.comment_controller import CommentController
+from app.controllers.task_controller import TaskController
+from app.models.comment import Comment
+from app.models.dtos.task_dtos import CommentCreate, TaskCreate
+from app.models.notification import Notification
+from app.models.role import Role
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.repositories.user_repository import UserRepository
+from app.utils.db_utils import Base, RequestSession
+
+TABLES = [User, Role, UserRole, Task, TaskAssignment, Notification, Comment]
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    # SQLite only auto-increments INTEGER primary keys (as in test/conftest.py)
+    return "INTEGER"
+
+
+def create_task(db, i: int):
+    TaskController(db).create_task(TaskCreate(project_id=1, name=f"Task {i}", assigned_user_ids=[1, 2, 3]))
+
+
+def create_comment(db, i: int):
+    CommentController(db).create_comment(CommentCreate(task_id=1, user_id=1, content=f"Comment {i}"))
+
+
+def create_user(db, i: int):
+    repository = UserRepository(db)
+    user = repository.create_user(f"new{i}@example.com", "x", "New", str(i), None, None)
+    repository.assign_role_to_user(user.id, 2)
+
+
+ENDPOINTS = {
+    "POST /tasks": create_task,
+    "POST /comments": create_comment,
+    "POST /users/create": create_user,
+}
+
+
+def setup_database(path: str):
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def full_sync(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA synchronous=FULL")
+
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in TABLES])
+    with engine.begin() as connection:
+        connection.execute(insert(Role), [{"id": 1, "name": "Admin"}, {"id": 2, "name": "Employee"}])
+        connection.execute(insert(User), [
+            {"id": i, "email": f"user{i}@example.com", "password_hash": "x", "first_name": "User", "last_name": str(i)}
+            for i in (1, 2, 3)
+        ])
+        connection.execute(insert(Task), [{"id": 1, "project_id": 1, "name": "Seed"}])
+    return engine
+
+
+def run(engine, endpoint, unit_of_work: bool, requests: int, offset: int):
+    """Run `requests` simulated requests; return (ms per request, commits per request)."""
+    factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    commits = []
+    listener = lambda connection: commits.append(1)
+    event.listen(engine, "commit", listener)
+    started = time.perf_counter()
+    for i in range(offset, offset + requests):
+        db = RequestSession(factory, unit_of_work=unit_of_work)
+        try:
+            endpoint(db, i)
+            db.commit_request()
+        finally:
+            db.release()
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "commit", listener)
+    return elapsed / requests * 1000, len(commits) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = setup_database(os.path.join(directory, "bench.db"))
+        print(f"{'endpoint':<20} {'mode':<13} {'ms/request':>10} {'commits':>8}")
+        offset = 0
+        for name, endpoint in ENDPOINTS.items():
+            for mode, unit_of_work in (("per-commit", False), ("unit-of-work", True)):
+                per_request, commits = run(engine, endpoint, unit_of_work, args.requests, offset)
+                offset += args.requests
+                print(f"{name:<20} {mode:<13} {per_request:>10.3f} {commits:>8.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark for the vectorized utilization computation on synthetic data.
+
+Generates a year of time logs and attendance for a 1000-person tenant
+(~4 logs and one attendance record per working day per user) and compares
+`compute_utilization` against a straightforward per-row Python loop.
+
+    python -m benchmarks.bench_utilization [--users 1000] [--loop-users 100]
+
+The Python loop is timed on `--loop-users` users only and extrapolated, since
+running it for the whole tenant takes minutes.
+"""
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+
+from app.services.utilization import compute_utilization, period_edges, to_epoch_seconds
+
+DAY = 86400
+
+
+def synthetic_year(users: int, seed: int = 7):
+    """Build synthetic time log and attendance arrays for one calendar year."""
+    rng = np.random.default_rng(seed)
+    days = np.arange(np.datetime64("2025-01-01"), np.datetime64("2026-01-01"))
+    workdays = days[np.is_busday(days)].astype("datetime64[s]").astype(np.int64)
+
+    # Attendance: one record per user and working day, roughly 08:00-17:00
+    attendance_user = np.repeat(np.arange(users), workdays.size)
+    day_start = np.tile(workdays, users)
+    attendance_start = day_start + 8 * 3600 + rng.integers(-1800, 1800, day_start.size)
+    attendance_end = attendance_start + 9 * 3600 + rng.integers(-1800, 1800, day_start.size)
+
+    # Time logs: four per attendance day, some of them overlapping
+    per_day = 4
+    log_user = np.repeat(attendance_user, per_day)
+    slot = np.tile(np.arange(per_day), attendance_user.size)
+    log_start = np.repeat(attendance_start, per_day) + slot * 2 * 3600 + rng.integers(0, 1200, log_user.size)
+    log_end = log_start + rng.integers(45 * 60, 150 * 60, log_user.size)
+
+    return log_user, log_start, log_end, attendance_user, attendance_start, attendance_end
+
+
+def python_loop(user_group, group_count, log_user, log_start, log_end,
+                attendance_user, attendance_start, attendance_end, edges, work_minutes):
+    """Reference implementation iterating row by row."""
+    periods = len(edges) - 1
+    logged = [[0.0] * periods for _ in range(group_count)]
+    attended = [[0.0] * periods for _ in range(group_count)]
+    overlap = [[0.0] * periods for _ in range(group_count)]
+
+    def add(matrix, user, start, end):
+        group = user_group[user]
+        for b in range(periods):
+            seconds = min(end, edges[b + 1]) - max(start, edges[b])
+            if seconds > 0:
+                matrix[group][b] += seconds / 60
+
+    logs_by_user = {}
+    for user, start, end in zip(log_user, log_start, log_end):
+        add(logged, user, start, end)
+        logs_by_user.setdefault(user, []).append((start, end))
+    for user, start, end in zip(attendance_user, attendance_start, attendance_end):
+        add(attended, user, start, end)
+
+    for user, intervals in logs_by_user.items():
+        intervals.sort()
+        running_end = None
+        for start, end in intervals:
+            if running_end is not None and start < running_end:
+                b = max(i for i in range(periods) if edges[i] <= start)
+                overlap[user_group[user]][b] += (min(end, running_end) - start) / 60
+            running_end = end if running_end is None else max(running_end, end)
+    return logged, attended, overlap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--loop-users", type=int, default=100)
+    parser.add_argument("--period", choices=["week", "month"], default="week")
+    args = parser.parse_args()
+
+    data = synthetic_year(args.users)
+    edges = to_epoch_seconds(period_edges(date(2025, 1, 1), date(2025, 12, 31), args.period)).astype(np.int64)
+    user_group = np.arange(args.users)
+    print(f"users={args.users} time_logs={data[0].size:,} attendance={data[3].size:,} periods={edges.size - 1}")
+
+    started = time.perf_counter()
+    compute_utilization(user_group, args.users, *data, edges, 480)
+    vectorized = time.perf_counter() - started
+    print(f"vectorized (all users): {vectorized * 1000:9.1f} ms")
+
+    subset = args.loop_users
+    log_mask = data[0] < subset
+    attendance_mask = data[3] < subset
+    rows = [
+        data[0][log_mask].tolist(), data[1][log_mask].tolist(), data[2][log_mask].tolist(),
+        data[3][attendance_mask].tolist(), data[4][attendance_mask].tolist(), data[5][attendance_mask].tolist(),
+    ]
+    started = time.perf_counter()
+    python_loop(user_group.tolist(), subset, *rows, edges.tolist(), 480)
+    loop = time.perf_counter() - started
+    estimate = loop * args.users / subset
+    print(f"python loop ({subset} users): {loop * 1000:9.1f} ms  -> ~{estimate:.1f} s for {args.users} users")
+    print(f"speed-up: ~{estimate / vectorized:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
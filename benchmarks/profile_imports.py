@@ -0,0 +1,80 @@
+"""
+Import-time profile of the application.
+
+Imports `--module` (default `app.app`) in a fresh interpreter with
+`-X importtime` and reports:
+
+- the wall-clock time of the cold import,
+- the modules with the largest self and cumulative import time,
+- the time spent per top-level package (app, fastapi, pydantic, sqlalchemy, ...).
+
+Run it after adding a dependency or a module-level singleton to see what it
+costs every worker at start-up (test/test_import_budget.py enforces a limit).
+
+    python -m benchmarks.profile_imports [--module app.app] [--top 20]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile(module: str) -> List[ImportTime]:
+    """Import `module` in a new interpreter and parse its `-X importtime` report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        capture_output=True, text=True, env=os.environ.copy(), check=True
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def wall_time(module: str) -> float:
+    """Seconds a fresh interpreter takes to import `module`."""
+    code = f"import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+    result = subprocess.run([sys.executable, "-W", "ignore", "-c", code],
+                            capture_output=True, text=True, env=os.environ.copy(), check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def by_package(times: List[ImportTime]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for entry in times:
+        totals[entry.module.split(".")[0]] += entry.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.app")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    times = profile(args.module)
+    print(f"cold import of {args.module}: {wall_time(args.module) * 1000:.0f} ms wall, "
+          f"{len(times)} modules\n")
+
+    print(f"{'self ms':>8} {'cumul ms':>9}  module")
+    for entry in sorted(times, key=lambda entry: entry.self_us, reverse=True)[:args.top]:
+        print(f"{entry.self_us / 1000:>8.1f} {entry.cumulative_us / 1000:>9.1f}  {entry.module}")
+
+    print(f"\n{'self ms':>8}  package")
+    for package, self_us in list(by_package(times).items())[:args.top]:
+        print(f"{self_us / 1000:>8.1f}  {package}")
+
+
+if __name__ == "__main__":
+    main()
@@ -167,12 +167,31 @@ CREATE TABLE time_logs (
     FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
 );
 
+-- Daily totals per (user, task), kept in sync with time_logs by the application
+CREATE TABLE time_log_daily_rollups (
+    day           DATE NOT NULL,
+    user_id       BIGINT NOT NULL,
+    task_id       BIGINT NOT NULL,
+    project_id    BIGINT NOT NULL,
+    total_minutes BIGINT NOT NULL DEFAULT 0,
+    log_count     INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, user_id, task_id),
+    INDEX ix_time_log_rollups_user_day (user_id, day),
+    INDEX ix_time_log_rollups_task_day (task_id, day),
+    INDEX ix_time_log_rollups_project_day (project_id, day),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+);
+
 CREATE TABLE attendance (
     id         BIGINT AUTO_INCREMENT PRIMARY KEY,
     user_id    BIGINT NOT NULL,
     check_in   TIMESTAMP NOT NULL,
     check_out  TIMESTAMP DEFAULT NULL,
-    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    -- user_id while checked in, NULL after check-out: one open record per user
+    open_user_id BIGINT GENERATED ALWAYS AS (CASE WHEN check_out IS NULL THEN user_id END) VIRTUAL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    UNIQUE INDEX uq_attendance_open_user (open_user_id)
 );
 
 -- Leave requests (vacation, sick leave, etc.)
@@ -192,10 +211,25 @@ CREATE TABLE leave_requests (
 CREATE TABLE notifications (
     id         BIGINT AUTO_INCREMENT PRIMARY KEY,
     user_id    BIGINT NOT NULL,
+    task_id    BIGINT NULL,
     message    TEXT NOT NULL,
     read_status BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE SET NULL,
+    INDEX ix_notifications_read_created (read_status, created_at),
+    INDEX ix_notifications_user_task (user_id, task_id)
+);
+
+-- Read notifications moved out of the hot table by the retention job
+CREATE TABLE notifications_archive (
+    id          BIGINT PRIMARY KEY,
+    user_id     BIGINT NOT NULL,
+    message     TEXT NOT NULL,
+    read_status BOOLEAN DEFAULT TRUE,
+    created_at  TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_notifications_archive_user_id (user_id)
 );
 
 CREATE TABLE activity_logs (
@@ -0,0 +1,51 @@
+# serve.py
+"""
+Production entry point: a uvicorn supervisor with one worker per CPU.
+
+    python serve.py
+
+Settings come from the environment (see app/utils/server_utils.py). Workers
+that exit (after SERVER_LIMIT_MAX_REQUESTS requests, or on a crash) are
+replaced by the supervisor. For local development use main.py, which reloads
+on code changes.
+
+Notification retention runs in one separate process rather than in every
+worker; its counters reach the workers through NOTIFICATION_RETENTION_STATS_FILE
+(a file in the temporary directory unless set).
+"""
+import logging
+import multiprocessing
+import os
+import tempfile
+
+import uvicorn
+
+from app.services.notification_retention import run_retention_forever
+from app.utils.env_utils import EnvironmentVariable, get_env
+from app.utils.metrics_utils import clear_metrics_directory, metrics_directory
+from app.utils.server_utils import server_options
+
+if __name__ == "__main__":
+    host = get_env(EnvironmentVariable.HOST, "0.0.0.0")
+    port = int(get_env(EnvironmentVariable.PORT, "10000"))
+    options = server_options(host, port)
+    if metrics_directory():
+        # Workers add their metric files as they start; drop the previous run's
+        clear_metrics_directory(metrics_directory())
+
+    # Inherited by the workers and the retention process, which are spawned
+    os.environ[EnvironmentVariable.WEB_CONCURRENCY.value] = str(options["workers"])
+    os.environ[EnvironmentVariable.NOTIFICATION_RETENTION_IN_APP.value] = "false"
+    os.environ.setdefault(EnvironmentVariable.NOTIFICATION_RETENTION_STATS_FILE.value,
+                          os.path.join(tempfile.gettempdir(), f"taskeri_retention_{port}.json"))
+
+    logging.basicConfig(level=logging.INFO)
+    retention = multiprocessing.get_context("spawn").Process(
+        target=run_retention_forever, name="notification-retention", daemon=True
+    )
+    retention.start()
+    logging.getLogger(__name__).info(
+        "Starting %d workers (%s, %s) and the notification retention process",
+        options["workers"], options["loop"], options["http"]
+    )
+    uvicorn.run(**options)
@@ -0,0 +1,63 @@
+"""
+Shared test configuration.
+
+Some tests run repositories against an in-memory SQLite database. The models use
+BIGINT primary keys, which SQLite only auto-increments when declared as INTEGER,
+so BigInteger is rendered as INTEGER for SQLite DDL. MySQL's
+`INSERT ... ON DUPLICATE KEY UPDATE` is rendered as SQLite's equivalent upsert.
+
+`STATEMENT_BUDGETS` caps the SQL statements an endpoint's controller call may
+run; tests check it through the `statement_budget` fixture.
+"""
+import pytest
+from sqlalchemy import BigInteger, literal_column
+from sqlalchemy.dialects.mysql.dml import OnDuplicateClause
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from app.utils import query_stats_utils
+
+# Maximum number of SQL statements per endpoint
+STATEMENT_BUDGETS = {
+    "GET /users": 1,
+    "GET /users/list": 1,
+    "GET /tasks/": 3,
+    "GET /tasks/{task_id}/details": 5,
+    "PUT /tasks/{task_id}": 3,
+    "DELETE /tasks/{task_id}": 3,
+    "PUT /comments/{comment_id}": 3,
+    "DELETE /comments/{comment_id}": 3,
+}
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    return "INTEGER"
+
+
+@compiles(OnDuplicateClause, "sqlite")
+def _compile_on_duplicate_key_update_sqlite(clause, compiler, **kw):
+    # The "inserted" namespace of MySQL is "excluded" in SQLite
+    excluded = {column: literal_column(f"excluded.{column.name}") for column in clause.inserted_alias.columns}
+    assignments = []
+    for name, value in clause.update.items():
+        value = replacement_traverse(value, {}, lambda element: excluded.get(element))
+        assignments.append(f"{name} = {compiler.process(value, **kw)}")
+    return "ON CONFLICT DO UPDATE SET " + ", ".join(assignments)
+
+
+@pytest.fixture
+def statement_budget(request):
+    """
+    Return `budget(endpoint)`, a context manager failing the test when the block
+    runs more SQL statements than `STATEMENT_BUDGETS[endpoint]`.
+
+    unittest.TestCase classes get it as `self.statement_budget` by using
+    `@pytest.mark.usefixtures("statement_budget")`.
+    """
+    def budget(endpoint: str):
+        return query_stats_utils.statement_budget(STATEMENT_BUDGETS[endpoint], label=endpoint)
+
+    if request.cls is not None:
+        request.cls.statement_budget = staticmethod(budget)
+    return budget
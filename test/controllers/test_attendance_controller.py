@@ -1,6 +1,14 @@
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
 from app.controllers.attendance_controller import AttendanceController
+from app.repositories.attendance_repository import AttendanceRepository
 from app.models.attendance import Attendance
 from datetime import datetime
 
@@ -38,6 +46,36 @@ class TestAttendanceController(unittest.TestCase):
         self.assertEqual(called_args['user_id'], 1)
         self.assertIsInstance(called_args['check_out'], datetime)
 
+    def test_create_attendance_maps_only_open_record_conflicts(self):
+        repository = AttendanceRepository(self.mock_db_session)
+        duplicate = Exception("1062 (23000): Duplicate entry '1' for key 'attendance.uq_attendance_open_user'")
+        self.mock_db_session.execute.side_effect = IntegrityError("INSERT", {}, duplicate)
+
+        self.assertIsNone(repository.create_attendance(1, datetime.utcnow()))
+
+        missing_user = Exception("1452 (23000): Cannot add or update a child row: a foreign key constraint fails")
+        self.mock_db_session.execute.side_effect = IntegrityError("INSERT", {}, missing_user)
+
+        with self.assertRaises(IntegrityError):
+            repository.create_attendance(99, datetime.utcnow())
+        self.assertEqual(self.mock_db_session.rollback.call_count, 2)
+
+    @patch('app.repositories.attendance_repository.AttendanceRepository.create_attendance')
+    def test_create_attendance_already_checked_in(self, mock_create_attendance):
+        mock_create_attendance.return_value = None
+
+        with self.assertRaises(HTTPException) as context:
+            self.attendance_controller.create_attendance(user_id=1)
+        self.assertEqual(context.exception.status_code, 409)
+
+    @patch('app.repositories.attendance_repository.AttendanceRepository.close_open_attendance')
+    def test_close_attendance_not_checked_in(self, mock_close_open_attendance):
+        mock_close_open_attendance.return_value = None
+
+        with self.assertRaises(HTTPException) as context:
+            self.attendance_controller.close_attendance(user_id=1)
+        self.assertEqual(context.exception.status_code, 404)
+
     @patch('app.repositories.attendance_repository.AttendanceRepository.get_attendance_for_user')
     def test_get_user_attendance(self, mock_get_attendance_for_user):
         mock_attendance_list = [
@@ -52,5 +90,79 @@ class TestAttendanceController(unittest.TestCase):
         self.assertEqual(response[0].user_id, 1)
         mock_get_attendance_for_user.assert_called_once_with(1)
 
+
+class TestAttendanceConcurrency(unittest.TestCase):
+    """Hammers check-in/check-out from many threads against a real (SQLite) database."""
+
+    THREADS = 8
+    ROUNDS = 25
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.engine = create_engine(f"sqlite:///{self.path}", connect_args={"timeout": 30})
+        with self.engine.begin() as connection:
+            # Same open-record scheme as the MySQL schema, with a SQLite rowid primary key
+            connection.execute(text(
+                "CREATE TABLE attendance ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "user_id INTEGER NOT NULL, "
+                "check_in TIMESTAMP NOT NULL, "
+                "check_out TIMESTAMP, "
+                "open_user_id INTEGER GENERATED ALWAYS AS "
+                "(CASE WHEN check_out IS NULL THEN user_id END) VIRTUAL)"
+            ))
+            connection.execute(text(
+                "CREATE UNIQUE INDEX uq_attendance_open_user ON attendance (open_user_id)"
+            ))
+        self.Session = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def test_concurrent_check_in_and_check_out(self):
+        created, closed, errors = [], [], []
+        lock = threading.Lock()
+        barrier = threading.Barrier(self.THREADS)
+
+        def worker():
+            session = self.Session()
+            repository = AttendanceRepository(session)
+            try:
+                barrier.wait()
+                for _ in range(self.ROUNDS):
+                    attendance = repository.create_attendance(1, datetime.utcnow())
+                    if attendance:
+                        with lock:
+                            created.append(attendance.id)
+                    attendance = repository.close_open_attendance(1, datetime.utcnow())
+                    if attendance:
+                        with lock:
+                            closed.append(attendance.id)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                session.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self.engine.connect() as connection:
+            rows = connection.execute(text("SELECT id, check_out FROM attendance ORDER BY id")).all()
+        open_ids = [row.id for row in rows if row.check_out is None]
+
+        # Never more than one open record, and every success maps to exactly one row
+        self.assertLessEqual(len(open_ids), 1)
+        self.assertEqual(sorted(created), [row.id for row in rows])
+        self.assertEqual(len(closed), len(set(closed)))
+        self.assertEqual(sorted(closed), [row.id for row in rows if row.check_out is not None])
+        self.assertGreater(len(closed), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
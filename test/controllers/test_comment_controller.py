@@ -13,21 +13,24 @@ class TestCommentController(unittest.TestCase):
         self.created_at_str = datetime.utcnow().isoformat()
 
     @patch('app.repositories.comment_repository.CommentRepository.create_comment')
+    @patch('app.repositories.comment_repository.CommentRepository.get_author')
     @patch('app.repositories.comment_repository.CommentRepository.get_comment_by_id')
-    def test_create_comment(self, mock_get_comment_by_id, mock_create_comment):
+    def test_create_comment(self, mock_get_comment_by_id, mock_get_author, mock_create_comment):
         comment_data = CommentCreate(task_id=1, user_id=1, content="Test comment")
         mock_comment = MagicMock(id=1, **comment_data.dict())
         mock_comment.created_at = self.created_at_str
         mock_user = MagicMock(id=1, first_name="Test", last_name="User", email="test@example.com")
         mock_create_comment.return_value = mock_comment
-        mock_get_comment_by_id.return_value = (mock_comment, mock_user)
+        mock_get_author.return_value = mock_user
 
         response = self.comment_controller.create_comment(comment_data)
 
         self.assertEqual(response.content, "Test comment")
         self.assertEqual(response.user_id, 1)
+        self.assertEqual(response.user.first_name, "Test")
         mock_create_comment.assert_called_once_with(comment_data)
-        mock_get_comment_by_id.assert_called_once_with(1)
+        mock_get_author.assert_called_once_with(1)
+        mock_get_comment_by_id.assert_not_called()
 
     @patch('app.repositories.comment_repository.CommentRepository.get_comment_by_id')
     def test_get_comment(self, mock_get_comment_by_id):
@@ -69,7 +72,7 @@ class TestCommentController(unittest.TestCase):
 
         self.assertEqual(response.content, "Updated comment")
         mock_update_comment.assert_called_once_with(1, comment_update)
-        mock_get_comment_by_id.assert_called_with(1)
+        mock_get_comment_by_id.assert_called_once_with(1)
 
     @patch('app.repositories.comment_repository.CommentRepository.get_comment_by_id')
     @patch('app.repositories.comment_repository.CommentRepository.delete_comment')
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 from app.controllers.file_attachment_controller import FileAttachmentController
 from app.models.dtos.file_attachment_dtos import FileAttachmentCreate, FileAttachmentUpdate
@@ -31,11 +32,13 @@ class TestFileAttachmentController(unittest.TestCase):
         mock_attachment1.id = 1
         mock_attachment1.task_id = 1
         mock_attachment1.file_path = "/path/to/file1"
+        mock_attachment1.uploaded_at = datetime(2025, 5, 1, 10, 0)
 
         mock_attachment2 = MagicMock()
         mock_attachment2.id = 2
         mock_attachment2.task_id = 2
         mock_attachment2.file_path = "/path/to/file2"
+        mock_attachment2.uploaded_at = datetime(2025, 5, 2, 10, 0)
 
         mock_get_all.return_value = [mock_attachment1, mock_attachment2]
 
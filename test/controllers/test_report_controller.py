@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from datetime import date, datetime
+import numpy as np
+from fastapi import HTTPException
+from app.controllers.report_controller import ReportController
+from app.models.dtos.report_dtos import ReportPeriod, ReportGroupBy
+from app.services.utilization import to_epoch_seconds
+
+def seconds(*values):
+    return to_epoch_seconds(list(values)).astype(np.int64)
+
+class TestReportController(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_db_session = MagicMock()
+        self.report_controller = ReportController(self.mock_db_session)
+
+    @patch('app.repositories.report_repository.ReportRepository.get_work_hours_per_day')
+    @patch('app.repositories.report_repository.ReportRepository.get_attendance_intervals')
+    @patch('app.repositories.report_repository.ReportRepository.get_time_log_intervals')
+    @patch('app.repositories.report_repository.ReportRepository.get_users')
+    def test_get_utilization_report_by_team(self, mock_users, mock_logs, mock_attendance, mock_hours):
+        mock_users.return_value = {
+            "id": np.array([1, 2, 3]),
+            "team_id": np.array([10, 10, -1]),
+            "department_id": np.array([5, 5, 5]),
+        }
+        mock_logs.return_value = {
+            "user_id": np.array([1, 2, 99]),
+            "start": seconds(datetime(2025, 5, 12, 9), datetime(2025, 5, 13, 9), datetime(2025, 5, 13, 9)),
+            "end": seconds(datetime(2025, 5, 12, 13), datetime(2025, 5, 13, 13), datetime(2025, 5, 13, 17)),
+        }
+        mock_attendance.return_value = {
+            "user_id": np.array([1]),
+            "start": seconds(datetime(2025, 5, 12, 8)),
+            "end": seconds(datetime(2025, 5, 12, 16)),
+        }
+        mock_hours.return_value = 8
+
+        response = self.report_controller.get_utilization_report(
+            ReportPeriod.WEEK, ReportGroupBy.TEAM, date(2025, 5, 12), date(2025, 5, 18)
+        )
+
+        self.assertEqual(len(response.rows), 1)
+        row = response.rows[0]
+        self.assertEqual(row.group_id, 10)
+        self.assertEqual(row.logged_minutes, 480.0)
+        self.assertEqual(row.attended_minutes, 480.0)
+        self.assertEqual(row.expected_minutes, 4800.0)
+        self.assertEqual(row.utilization, 0.1)
+
+    def test_get_utilization_report_invalid_range(self):
+        with self.assertRaises(HTTPException) as context:
+            self.report_controller.get_utilization_report(
+                ReportPeriod.MONTH, ReportGroupBy.USER, date(2025, 5, 31), date(2025, 5, 1)
+            )
+        self.assertEqual(context.exception.status_code, 400)
+
+    @patch('app.controllers.report_controller.reference_cache')
+    def test_get_cache_stats(self, mock_cache):
+        mock_cache.stats.return_value = {
+            "tenant_schema": "tenant_test", "backend": "memory", "ttl_seconds": 60,
+            "hits": 3, "misses": 1, "invalidations": 0, "hit_ratio": 0.75,
+            "namespaces": {"roles": {"hits": 3, "misses": 1, "invalidations": 0}},
+        }
+
+        response = self.report_controller.get_cache_stats("tenant_test")
+
+        self.assertEqual(response.hit_ratio, 0.75)
+        self.assertEqual(response.namespaces["roles"].hits, 3)
+        mock_cache.stats.assert_called_once_with("tenant_test")
+
+if __name__ == "__main__":
+    unittest.main()
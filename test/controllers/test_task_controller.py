@@ -1,8 +1,18 @@
 import unittest
 from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.controllers.task_controller import TaskController
 from app.models.dtos import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, TaskStatistics
-from datetime import date
+from app.models.dtos.task_dtos import TaskBulkCreateRequest, TaskBulkPatchRequest
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.notification import Notification
+from app.models.user import User
+from app.utils.db_utils import Base
+from datetime import date, datetime
+from types import SimpleNamespace
 
 class TestTaskController(unittest.TestCase):
 
@@ -92,7 +102,7 @@ class TestTaskController(unittest.TestCase):
 
         self.assertEqual(len(response), 2)
         self.assertEqual(response[0].name, "Task 1")
-        mock_get_tasks_by_project.assert_called_once_with(1)
+        mock_get_tasks_by_project.assert_called_once_with(1, None)
 
     @patch('app.repositories.task_repository.TaskRepository.update_task')
     def test_update_task(self, mock_update_task):
@@ -141,6 +151,109 @@ class TestTaskController(unittest.TestCase):
         self.assertEqual(response.tasks_by_status["To Do"], 5)
         self.assertEqual(response.tasks_by_priority["High"], 6)
         mock_get_task_statistics.assert_called_once()
+    @patch('app.repositories.task_repository.TaskRepository.get_assignments_for_tasks')
+    @patch('app.repositories.task_repository.TaskRepository.get_task_rows')
+    @patch('app.repositories.task_repository.TaskRepository.bulk_create_tasks')
+    @patch('app.repositories.task_repository.TaskRepository.get_existing_ids')
+    def test_bulk_create_tasks(self, mock_get_existing_ids, mock_bulk_create_tasks,
+                               mock_get_task_rows, mock_get_assignments):
+        mock_get_existing_ids.side_effect = [{1}, {5}]
+        mock_bulk_create_tasks.return_value = [40]
+        mock_get_task_rows.return_value = {40: SimpleNamespace(
+            id=40, project_id=1, name="Ok", description=None, priority="Medium", status="To Do",
+            due_date=None, created_at=datetime(2025, 5, 18), updated_at=datetime(2025, 5, 18)
+        )}
+        mock_get_assignments.return_value = {40: [5]}
+
+        response = self.task_controller.bulk_create_tasks(TaskBulkCreateRequest(items=[
+            TaskCreate(project_id=1, name="Ok", assigned_user_ids=[5]),
+            TaskCreate(project_id=2, name="No project"),
+            TaskCreate(project_id=1, name="No user", assigned_user_ids=[6]),
+        ]))
+
+        self.assertEqual((response.succeeded, response.failed), (1, 2))
+        self.assertEqual(response.results[0].id, 40)
+        self.assertEqual(response.results[0].task.assigned_users, [5])
+        self.assertEqual(response.results[1].error, "Project not found")
+        self.assertEqual(response.results[2].error, "Users not found: [6]")
+        created = mock_bulk_create_tasks.call_args[0][0]
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0]["name"], "Ok")
+
+
+class TestTaskBulkPatch(unittest.TestCase):
+    """Runs the bulk patch against SQLite and checks the statements it issues."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[
+            User.__table__, Task.__table__, TaskAssignment.__table__, Notification.__table__
+        ])
+        with self.engine.begin() as connection:
+            connection.execute(insert(User), [
+                {"id": i, "email": f"u{i}@example.com", "password_hash": "x", "first_name": "U", "last_name": str(i)}
+                for i in (1, 2, 3)
+            ])
+            connection.execute(insert(Task), [
+                {"id": i, "project_id": 1, "name": f"Task {i}", "priority": "Medium", "status": "To Do",
+                 "due_date": date(2025, 6, i)}
+                for i in (1, 2, 3)
+            ])
+            connection.execute(insert(TaskAssignment), [
+                {"task_id": 1, "user_id": 1}, {"task_id": 1, "user_id": 2}, {"task_id": 2, "user_id": 1}
+            ])
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: self.statements.append(statement))
+        self.session = sessionmaker(bind=self.engine)()
+        self.task_controller = TaskController(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_bulk_patch_tasks(self):
+        response = self.task_controller.bulk_patch_tasks(TaskBulkPatchRequest.model_validate({"items": [
+            {"id": 1, "status": "Done", "assigned_user_ids": [2, 3]},
+            {"id": 2, "priority": "High", "due_date": None},
+            {"id": 3, "status": "In Progress", "priority": "Low"},
+            {"id": 9, "status": "Done"},
+            {"id": 3, "status": "Done"},
+            {"id": 2, "assigned_user_ids": [7]},
+        ]}))
+
+        self.assertEqual((response.succeeded, response.failed), (3, 3))
+        self.assertEqual([r.outcome for r in response.results],
+                         ["updated", "updated", "updated", "not_found", "failed", "failed"])
+        self.assertEqual(response.results[0].task.assigned_users, [2, 3])
+        self.assertEqual(response.results[0].task.status, "Done")
+        self.assertIsNone(response.results[1].task.due_date)
+        self.assertEqual(response.results[2].task.priority, "Low")
+
+        updates = [s for s in self.statements if s.startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(len([s for s in self.statements if s.startswith("DELETE")]), 1)
+
+        with self.engine.connect() as connection:
+            tasks = {row.id: row for row in connection.execute(select(Task.id, Task.status, Task.priority, Task.due_date))}
+            assignments = set(connection.execute(select(TaskAssignment.task_id, TaskAssignment.user_id)).all())
+            notified = connection.execute(
+                select(Notification.user_id, Notification.message).order_by(Notification.user_id)
+            ).all()
+        self.assertEqual(tasks[1].status, "Done")
+        self.assertEqual(tasks[2].priority, "High")
+        self.assertIsNone(tasks[2].due_date)
+        self.assertEqual(tasks[3].due_date, date(2025, 6, 3))
+        self.assertEqual(assignments, {(1, 2), (1, 3), (2, 1)})
+        # Only the removed and the added assignee hear about it
+        self.assertEqual([tuple(row) for row in notified], [
+            (1, "You have been removed from task 'Task 1'"),
+            (3, "You have been assigned to task 'Task 1'"),
+        ])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,9 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from datetime import datetime
+from datetime import datetime, date
+from fastapi import HTTPException
 from app.controllers.timelog_controller import TimeLogController
-from app.models.dtos.timelog_dtos import TimeLogCreate, TimeLogUpdate, TimeLogResponse
+from app.models.dtos.timelog_dtos import TimeLogCreate, TimeLogUpdate, TimeLogResponse, TimeLogTotalsGroupBy
 
 class TestTimeLogController(unittest.TestCase):
 
@@ -122,5 +123,25 @@ class TestTimeLogController(unittest.TestCase):
         self.assertEqual(response[0].id, 1)
         mock_get_user_logs_by_time_range.assert_called_once_with(1, start_time, end_time)
 
+    @patch('app.repositories.timelog_rollup_repository.TimeLogRollupRepository.get_totals')
+    def test_get_totals(self, mock_get_totals):
+        mock_get_totals.return_value = [(4, 480, 3), (7, 95, 2)]
+
+        response = self.timelog_controller.get_totals(
+            TimeLogTotalsGroupBy.PROJECT, date(2025, 5, 1), date(2025, 5, 31), user_id=1
+        )
+
+        self.assertEqual(len(response.items), 2)
+        self.assertEqual(response.items[0].key, 4)
+        self.assertEqual(response.items[0].total_minutes, 480)
+        mock_get_totals.assert_called_once_with(
+            "project", date(2025, 5, 1), date(2025, 5, 31), user_id=1, task_id=None, project_id=None
+        )
+
+    def test_get_totals_invalid_range(self):
+        with self.assertRaises(HTTPException) as context:
+            self.timelog_controller.get_totals(TimeLogTotalsGroupBy.USER, date(2025, 5, 31), date(2025, 5, 1))
+        self.assertEqual(context.exception.status_code, 400)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,16 @@
 import unittest
+import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.controllers.user_controller import UserController
+from app.models.user import User
+from app.models.role import Role
+from app.models.user_role import UserRole
+from app.utils.db_utils import Base
 from app.models.dtos.user_dtos import UserCreate, UserUpdate, UserResponse
 from app.models.dtos.role_dtos import RoleResponse
 
@@ -158,6 +167,165 @@ class TestUserController(unittest.TestCase):
         self.assertEqual(response[0].name, "Admin")
         self.mock_repo.get_user_roles.assert_called_once_with(1)
 
+    def test_list_users(self):
+        created = datetime(2025, 5, 1, 9, 0)
+        row = MagicMock(id=1, email="a@example.com", first_name="A", last_name="B",
+                        department_id=2, team_id=3, created_at=created, updated_at=created, role_id=4)
+        self.mock_repo.list_users.return_value = ([row], 41)
+
+        response = self.user_controller.list_users(page=2, page_size=20, team_id=3)
+
+        self.assertEqual(response.total, 41)
+        self.assertEqual(response.items[0].role_id, 4)
+        self.assertEqual(response.items[0].created_at, created.isoformat())
+        self.mock_repo.list_users.assert_called_once_with(
+            team_id=3, department_id=None, role_id=None, page=2, page_size=20
+        )
+
+    @patch("app.controllers.user_controller.get_global_db")
+    @patch("app.controllers.user_controller.TenantUserRepository")
+    @patch("app.controllers.user_controller.hash_passwords")
+    def test_import_users(self, mock_hash_passwords, mock_tenant_repo_class, mock_get_global_db):
+        mock_get_global_db.return_value.__enter__.return_value = MagicMock()
+        tenant_repo = mock_tenant_repo_class.return_value
+        tenant_repo.get_existing_emails.return_value = {"global@example.com"}
+        mock_hash_passwords.side_effect = lambda passwords, max_workers=None: [f"hash-{p}" for p in passwords]
+
+        self.mock_repo.get_existing_emails.return_value = {"taken@example.com"}
+        self.mock_repo.get_role_by_name.return_value = MagicMock(id=2)
+        self.mock_repo.get_existing_ids.side_effect = lambda model, ids: {1, 2, 3} & set(ids)
+        self.mock_repo.bulk_create_users.return_value = {"a@example.com": 10, "b@example.com": 11}
+        background_tasks = MagicMock()
+
+        rows = [
+            {"email": "a@example.com", "first_name": "Ann", "last_name": "Lee", "password": "pw-a"},
+            {"email": "b@example.com", "first_name": "Bob", "last_name": "Ray", "role_id": "1", "team_id": "3"},
+            {"email": "A@example.com", "first_name": "Ann", "last_name": "Again"},
+            {"email": "not-an-email", "first_name": "X", "last_name": "Y"},
+            {"email": "taken@example.com", "first_name": "T", "last_name": "T"},
+            {"email": "global@example.com", "first_name": "G", "last_name": "G"},
+            {"email": "c@example.com", "first_name": "C", "last_name": "C", "team_id": 99},
+        ]
+
+        response = self.user_controller.import_users(rows, {"tenant_name": "tenant_acme"}, background_tasks)
+
+        self.assertEqual((response.total, response.created, response.failed), (7, 2, 5))
+        self.assertEqual([r.status for r in response.results],
+                         ["created", "created", "failed", "failed", "failed", "failed", "failed"])
+        self.assertEqual(response.results[1].user_id, 11)
+        self.assertEqual(response.results[2].error, "Duplicate email in import")
+        self.assertTrue(response.results[3].error.startswith("email"))
+        self.assertEqual(response.results[4].error, "Email already registered")
+        self.assertEqual(response.results[5].error, "Email already registered")
+        self.assertEqual(response.results[6].error, "Unknown team: 99")
+
+        users, role_ids = self.mock_repo.bulk_create_users.call_args[0]
+        self.assertEqual([u["email"] for u in users], ["a@example.com", "b@example.com"])
+        self.assertEqual(users[0]["password_hash"], "hash-pw-a")
+        self.assertEqual(role_ids, [2, 1])
+        tenant_repo.bulk_create.assert_called_once_with(["a@example.com", "b@example.com"], "tenant_acme")
+        self.mock_repo.db_session.commit.assert_called_once()
+
+        recipients = background_tasks.add_task.call_args[0][1]
+        self.assertEqual(recipients[0], ("a@example.com", "Ann", "pw-a"))
+        self.assertEqual(len(recipients), 2)
+
+    @patch("app.controllers.user_controller.get_global_db")
+    @patch("app.controllers.user_controller.TenantUserRepository")
+    @patch("app.controllers.user_controller.hash_passwords")
+    def test_import_users_unregisters_emails_of_failed_batch(self, mock_hash_passwords, mock_tenant_repo_class,
+                                                              mock_get_global_db):
+        mock_get_global_db.return_value.__enter__.return_value = MagicMock()
+        tenant_repo = mock_tenant_repo_class.return_value
+        tenant_repo.get_existing_emails.return_value = set()
+        mock_hash_passwords.side_effect = lambda passwords, max_workers=None: [f"hash-{p}" for p in passwords]
+        self.mock_repo.get_existing_emails.return_value = set()
+        self.mock_repo.get_role_by_name.return_value = MagicMock(id=2)
+        self.mock_repo.get_existing_ids.return_value = set()
+        self.mock_repo.bulk_create_users.return_value = {"a@example.com": 10}
+        self.mock_repo.db_session.commit.side_effect = SQLAlchemyError("deadlock")
+
+        rows = [{"email": "a@example.com", "first_name": "Ann", "last_name": "Lee"}]
+        response = self.user_controller.import_users(rows, {"tenant_name": "tenant_acme"}, MagicMock())
+
+        self.assertEqual((response.created, response.failed), (0, 1))
+        self.mock_repo.db_session.rollback.assert_called_once()
+        tenant_repo.bulk_delete.assert_called_once_with(["a@example.com"], "tenant_acme")
+
+    @patch("app.controllers.user_controller.get_global_db")
+    @patch("app.controllers.user_controller.TenantUserRepository")
+    def test_import_users_reports_non_string_email(self, mock_tenant_repo_class, mock_get_global_db):
+        mock_get_global_db.return_value.__enter__.return_value = MagicMock()
+        mock_tenant_repo_class.return_value.get_existing_emails.return_value = set()
+        self.mock_repo.get_existing_emails.return_value = set()
+        self.mock_repo.get_existing_ids.return_value = set()
+
+        rows = [{"email": 123, "first_name": "X", "last_name": "Y"}]
+        response = self.user_controller.import_users(rows, {"tenant_name": "tenant_acme"}, MagicMock())
+
+        self.assertEqual(response.failed, 1)
+        self.assertEqual(response.results[0].email, "123")
+        self.assertTrue(response.results[0].error.startswith("email"))
+
+
+@pytest.mark.usefixtures("statement_budget")
+class TestUserListingQueries(unittest.TestCase):
+    """Runs the user listing against SQLite within the endpoints' statement budgets."""
+
+    USERS = 60
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(
+            self.engine, tables=[User.__table__, Role.__table__, UserRole.__table__]
+        )
+        created = datetime(2025, 1, 1)
+        with self.engine.begin() as connection:
+            connection.execute(insert(Role), [{"id": 1, "name": "Admin"}, {"id": 2, "name": "Employee"}])
+            connection.execute(insert(User), [
+                {
+                    "id": i, "email": f"user{i}@example.com", "password_hash": "x",
+                    "first_name": "User", "last_name": str(i),
+                    "team_id": i % 3, "department_id": i % 2,
+                    "created_at": created, "updated_at": created
+                }
+                for i in range(1, self.USERS + 1)
+            ])
+            # Every user is an employee, every tenth one an admin as well
+            connection.execute(insert(UserRole), [
+                {"user_id": i, "role_id": 2} for i in range(1, self.USERS + 1)
+            ] + [
+                {"user_id": i, "role_id": 1} for i in range(10, self.USERS + 1, 10)
+            ])
+
+        self.session = sessionmaker(bind=self.engine)()
+        self.user_controller = UserController(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_get_all_users_single_statement(self):
+        with self.statement_budget("GET /users"):
+            users = self.user_controller.get_all_users()
+
+        self.assertEqual(len(users), self.USERS)
+        self.assertEqual(users[9].role_id, 1)
+        self.assertEqual(users[0].role_id, 2)
+
+    def test_list_users_paginated_and_filtered(self):
+        with self.statement_budget("GET /users/list"):
+            response = self.user_controller.list_users(page=2, page_size=5, team_id=1)
+
+        self.assertEqual(response.total, 20)
+        self.assertEqual([user.id for user in response.items], [16, 19, 22, 25, 28])
+
+        with self.statement_budget("GET /users/list"):
+            response = self.user_controller.list_users(page=1, page_size=50, role_id=1)
+        self.assertEqual([user.id for user in response.items], [10, 20, 30, 40, 50, 60])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
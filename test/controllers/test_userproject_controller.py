@@ -52,7 +52,7 @@ class TestUserProjectController(unittest.TestCase):
 
         self.assertEqual(len(response), 2)
         self.assertEqual(response[0].email, "user1@example.com")
-        mock_get_users_for_project.assert_called_once_with(1)
+        mock_get_users_for_project.assert_called_once_with(1, None)
 
     @patch('app.repositories.userproject_repository.UserProjectRepository.get_projects_for_user')
     def test_get_projects(self, mock_get_projects_for_user):
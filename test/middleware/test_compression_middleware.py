@@ -0,0 +1,94 @@
+import asyncio
+import gzip
+import unittest
+import brotli
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from app.middleware.compression_middleware import CompressionMiddleware, choose_encoding
+
+BODY = b'{"name": "Task"}, ' * 200
+
+def call(response, accept_encoding="gzip, br", minimum_size=1024):
+    """Run `response` through the middleware and return (status, headers, body chunks)."""
+    middleware = CompressionMiddleware(response, minimum_size=minimum_size)
+    scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"",
+             "headers": [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []}
+    messages = []
+
+    async def receive():
+        # Never disconnects; StreamingResponse cancels this wait once it is done
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start = messages[0]
+    headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    return start["status"], headers, [message["body"] for message in messages[1:]]
+
+class TestCompressionMiddleware(unittest.TestCase):
+
+    def test_choose_encoding(self):
+        self.assertEqual(choose_encoding("gzip, br", ("br", "gzip")), "br")
+        self.assertEqual(choose_encoding("br;q=0.5, gzip", ("br", "gzip")), "gzip")
+        self.assertEqual(choose_encoding("*", ("br", "gzip")), "br")
+        self.assertIsNone(choose_encoding("identity", ("br", "gzip")))
+        self.assertIsNone(choose_encoding("gzip;q=0", ("gzip",)))
+
+    def test_brotli_preferred(self):
+        status, headers, chunks = call(Response(BODY, media_type="application/json"))
+
+        self.assertEqual(headers["content-encoding"], "br")
+        self.assertEqual(headers["vary"], "Accept-Encoding")
+        self.assertEqual(int(headers["content-length"]), len(chunks[0]))
+        self.assertEqual(brotli.decompress(b"".join(chunks)), BODY)
+
+    def test_gzip_fallback(self):
+        _, headers, chunks = call(Response(BODY, media_type="application/json"), accept_encoding="gzip")
+
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertEqual(gzip.decompress(b"".join(chunks)), BODY)
+
+    def test_small_and_unaccepted_responses_are_unchanged(self):
+        _, headers, chunks = call(Response(b'{"id": 1}', media_type="application/json"))
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(chunks, [b'{"id": 1}'])
+
+        _, headers, chunks = call(Response(BODY, media_type="application/json"), accept_encoding=None)
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(headers["vary"], "Accept-Encoding")
+
+    def test_binary_content_is_not_compressed(self):
+        _, headers, _ = call(Response(BODY, media_type="application/pdf"))
+        self.assertNotIn("content-encoding", headers)
+
+    def test_streaming_response_is_compressed_per_chunk(self):
+        async def rows():
+            for _ in range(3):
+                yield BODY.decode()
+
+        _, headers, chunks = call(StreamingResponse(rows(), media_type="text/csv"), accept_encoding="gzip")
+
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", headers)
+        self.assertGreater(len([chunk for chunk in chunks if chunk]), 1)
+        self.assertEqual(gzip.decompress(b"".join(chunks)), BODY * 3)
+
+    def test_small_stream_is_buffered_and_sent_unchanged(self):
+        async def parts():
+            yield "a,b\n"
+            yield "1,2\n"
+
+        _, headers, chunks = call(StreamingResponse(parts(), media_type="text/csv"))
+
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(b"".join(chunks), b"a,b\n1,2\n")
+
+    def test_strong_etag_is_weakened(self):
+        response = PlainTextResponse(BODY.decode(), headers={"ETag": '"abc"'})
+        _, headers, _ = call(response)
+        self.assertEqual(headers["etag"], 'W/"abc"')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from starlette.responses import JSONResponse
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.middleware.query_stats_middleware import QueryStatsMiddleware
+
+class TestMetricsMiddleware(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        self.app = FastAPI()
+
+        @self.app.get("/items/{item_id}")
+        def get_item(item_id: int):
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            if item_id == 0:
+                raise HTTPException(status_code=404, detail="Item not found")
+            return {"id": item_id}
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def build(self, auth_token=None, reject=False):
+        app = self.app
+        if reject:
+            async def app(scope, receive, send):
+                # Stands in for AuthorizationMiddleware refusing a request before routing
+                await JSONResponse({"detail": "Not authenticated"}, status_code=401)(scope, receive, send)
+        metrics = MetricsMiddleware(app, router=self.app.router, auth_token=auth_token)
+        return metrics, QueryStatsMiddleware(metrics)
+
+    def call(self, middleware, path, headers=()):
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": list(headers)}
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(middleware(scope, receive, send))
+        return messages[0]["status"], b"".join(message.get("body", b"") for message in messages[1:]).decode()
+
+    def test_requests_are_recorded_under_route_template(self):
+        metrics, middleware = self.build()
+        self.call(middleware, "/items/1")
+        self.call(middleware, "/items/2")
+        self.call(middleware, "/items/0")
+
+        status, body = self.call(middleware, "/metrics")
+        self.assertEqual(status, 200)
+        self.assertIn('taskeri_http_requests_total{route="/items/{item_id}",method="GET",status="200"} 2', body)
+        self.assertIn('taskeri_http_requests_total{route="/items/{item_id}",method="GET",status="404"} 1', body)
+        self.assertIn('taskeri_db_statements_total{route="/items/{item_id}",method="GET"} 6', body)
+        self.assertIn("taskeri_db_pool_overflow 0", body)
+        self.assertNotIn("/items/1", body)
+
+    def test_rejected_request_keeps_its_template(self):
+        metrics, middleware = self.build(reject=True)
+        self.call(middleware, "/items/7")
+
+        body = metrics.metrics.render()
+        self.assertIn('taskeri_http_requests_total{route="/items/{item_id}",method="GET",status="401"} 1', body)
+
+    def test_metrics_endpoint_requires_token(self):
+        _, middleware = self.build(auth_token="secret")
+
+        self.assertEqual(self.call(middleware, "/metrics")[0], 401)
+        self.assertEqual(self.call(middleware, "/metrics", [(b"authorization", b"Bearer wrong")])[0], 401)
+        self.assertEqual(self.call(middleware, "/metrics", [(b"authorization", b"Bearer secret")])[0], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
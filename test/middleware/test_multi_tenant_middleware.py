@@ -0,0 +1,144 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from app.middleware.multi_tenant_middleware import MultiTenantMiddleware
+from app.utils.db_utils import hand_off, pool_stats
+
+def state_db(request):
+    return PlainTextResponse(str(getattr(request.state, "db", None)))
+
+def count_items(request):
+    count = request.state.db.execute(text("SELECT count(*) FROM items")).scalar()
+    return PlainTextResponse(str(count))
+
+def fail(request):
+    request.state.db.execute(text("INSERT INTO items VALUES (99)"))
+    raise RuntimeError("boom")
+
+def idle(request):
+    return PlainTextResponse("idle")
+
+def export(request):
+    db = request.state.db
+    rows = db.execute(text("SELECT id FROM items ORDER BY id"))
+    close = hand_off(db)
+
+    def body():
+        try:
+            for (item_id,) in rows:
+                yield f"{item_id}\n"
+        finally:
+            close()
+
+    return StreamingResponse(body(), media_type="text/plain")
+
+ROUTES = [
+    Route("/tasks", state_db, methods=["GET", "OPTIONS"]),
+    Route("/token", state_db, methods=["POST"]),
+    Route("/openapi.json", state_db),
+    Route("/tenant-users/", state_db, methods=["POST"]),
+    Route("/items", count_items),
+    Route("/fail", fail),
+    Route("/idle", idle),
+    Route("/export", export),
+]
+
+def call(method, path, token=None):
+    """Run a request through the middleware and return (status, body)."""
+    app = Starlette(routes=ROUTES)
+    app.add_middleware(MultiTenantMiddleware)
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    scope = {"type": "http", "method": method, "path": path, "raw_path": path.encode(),
+             "query_string": b"", "headers": headers, "root_path": "", "scheme": "http",
+             "server": ("testserver", 80), "client": ("testclient", 1)}
+    messages = []
+
+    async def receive():
+        # Never disconnects; StreamingResponse cancels this wait once it is done
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    try:
+        asyncio.run(app(scope, receive, send))
+    except Exception:
+        # Starlette's error middleware sends the 500 response, then re-raises
+        pass
+    return messages[0]["status"], b"".join(message.get("body", b"") for message in messages[1:])
+
+class TestMultiTenantMiddleware(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{os.path.join(self.directory.name, 'tenant.db')}"
+        engine = create_engine(self.url)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            connection.execute(text("INSERT INTO items VALUES (1), (2), (3)"))
+        engine.dispose()
+        # Like get_tenant_engine: one engine per tenant, shared by its sessions
+        self.engine = create_engine(self.url)
+
+        self.sessions_opened = 0
+        patcher = patch("app.middleware.multi_tenant_middleware.get_tenant_session", side_effect=self._tenant_session)
+        self.mock_tenant_session = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch("app.middleware.multi_tenant_middleware.auth_service.verify_token",
+                        return_value={"user_id": 1, "tenant_id": 1, "tenant_name": "acme"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def _tenant_session(self, schema_name):
+        self.sessions_opened += 1
+        return sessionmaker(bind=self.engine)()
+
+    def test_options_and_public_routes_open_no_session(self):
+        for method, path in [("OPTIONS", "/tasks"), ("POST", "/token"), ("GET", "/openapi.json"), ("POST", "/tenant-users/")]:
+            status, body = call(method, path)
+            self.assertEqual(status, 200)
+            self.assertEqual(body, b"None")
+
+        self.mock_tenant_session.assert_not_called()
+
+    def test_missing_token_is_rejected(self):
+        status, _ = call("GET", "/tasks")
+        self.assertEqual(status, 401)
+
+    def test_session_is_opened_on_first_use(self):
+        self.assertEqual(call("GET", "/idle", token="t"), (200, b"idle"))
+        self.assertEqual(self.sessions_opened, 0)
+
+        self.assertEqual(call("GET", "/items", token="t"), (200, b"3"))
+        self.mock_tenant_session.assert_called_once_with("tenant_acme")
+
+    def test_soak_leaks_no_connections(self):
+        baseline = pool_stats.checked_out
+        checkouts = pool_stats.checkouts
+
+        for _ in range(25):
+            self.assertEqual(call("GET", "/items", token="t"), (200, b"3"))
+            self.assertEqual(call("GET", "/fail", token="t")[0], 500)
+            self.assertEqual(call("GET", "/idle", token="t"), (200, b"idle"))
+            self.assertEqual(call("GET", "/export", token="t"), (200, b"1\n2\n3\n"))
+
+        self.assertEqual(self.sessions_opened, 75)
+        self.assertGreaterEqual(pool_stats.checkouts - checkouts, 75)
+        self.assertEqual(pool_stats.checked_out, baseline)
+        # The failed requests' inserts were rolled back
+        self.assertEqual(call("GET", "/items", token="t"), (200, b"3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from starlette.responses import Response
+from app.middleware.query_stats_middleware import QueryStatsMiddleware
+
+class TestQueryStatsMiddleware(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def call(self, app):
+        middleware = QueryStatsMiddleware(app, repeat_threshold=3)
+        scope = {"type": "http", "method": "GET", "path": "/tasks", "query_string": b"", "headers": []}
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        with self.assertLogs("app.middleware.query_stats_middleware", level="DEBUG") as logs:
+            asyncio.run(middleware(scope, receive, send))
+        headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+        return headers, logs.output
+
+    def test_server_timing_and_repeated_statements(self):
+        async def app(scope, receive, send):
+            with self.engine.connect() as connection:
+                for task_id in range(4):
+                    connection.execute(text("SELECT :id"), {"id": task_id})
+            await Response(b"[]", media_type="application/json")(scope, receive, send)
+
+        headers, logs = self.call(app)
+
+        self.assertRegex(headers["server-timing"], r'^db;dur=[\d.]+;desc="4 statements"$')
+        self.assertIn("GET /tasks: 4 SQL statements", logs[0])
+        self.assertIn("Possible N+1 in GET /tasks: statement ran 4 times: SELECT ?", logs[1])
+
+    def test_request_without_statements(self):
+        headers, logs = self.call(Response(b"{}", media_type="application/json"))
+
+        self.assertEqual(headers["server-timing"], 'db;dur=0.00;desc="0 statements"')
+        self.assertEqual(len(logs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
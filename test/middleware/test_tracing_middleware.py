@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+from fastapi import FastAPI
+from app.middleware.tracing_middleware import TracingMiddleware
+from app.utils.tracing_utils import span
+
+class CollectingExporter:
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+class TestTracingMiddleware(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = CollectingExporter()
+        self.app = FastAPI()
+
+        @self.app.get("/items/{item_id}")
+        def get_item(item_id: int):
+            with span("lookup"):
+                return {"id": item_id}
+
+    def call(self, path, sample_rate=0.0, slow_seconds=60.0, headers=()):
+        middleware = TracingMiddleware(self.app, self.exporter, sample_rate=sample_rate, slow_seconds=slow_seconds)
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": list(headers)}
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(middleware(scope, receive, send))
+        return messages[0]["status"]
+
+    def test_fast_unsampled_request_is_not_exported(self):
+        self.assertEqual(self.call("/items/1"), 200)
+        self.assertEqual(self.exporter.traces, [])
+
+    def test_sampled_request_is_exported_with_route_template(self):
+        self.call("/items/1", sample_rate=1.0)
+
+        (trace,) = self.exporter.traces
+        root = trace.spans[0]
+        self.assertEqual(root.name, "GET /items/{item_id}")
+        self.assertEqual(root.attributes["http.status_code"], 200)
+        self.assertEqual(root.attributes["http.target"], "/items/1")
+        self.assertEqual(root.attributes["sampling.reason"], "rate")
+        lookup = next(recorded for recorded in trace.spans if recorded.name == "lookup")
+        self.assertEqual(lookup.trace, trace)
+        self.assertTrue(all(recorded.end_ns is not None for recorded in trace.spans))
+
+    def test_slow_request_is_always_exported(self):
+        self.call("/items/1", sample_rate=0.0, slow_seconds=0.0)
+
+        (trace,) = self.exporter.traces
+        self.assertEqual(trace.spans[0].attributes["sampling.reason"], "slow")
+
+    def test_traceparent_joins_the_callers_trace(self):
+        trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+        self.call("/items/1", headers=[(b"traceparent", f"00-{trace_id}-{parent_id}-01".encode())])
+
+        (trace,) = self.exporter.traces
+        self.assertEqual(trace.trace_id, trace_id)
+        self.assertEqual(trace.spans[0].parent_id, parent_id)
+
+    def test_unmatched_request_keeps_its_path(self):
+        self.assertEqual(self.call("/missing", sample_rate=1.0), 404)
+        self.assertEqual(self.exporter.traces[0].spans[0].name, "GET /missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
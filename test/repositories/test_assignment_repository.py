@@ -0,0 +1,72 @@
+import unittest
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.repositories.assignment_repository import AssignmentRepository, diff_assignments
+from app.models.task_assignment import TaskAssignment
+from app.models.notification import Notification
+from app.utils.db_utils import Base
+
+class TestAssignmentRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[TaskAssignment.__table__, Notification.__table__])
+        with self.engine.begin() as connection:
+            connection.execute(insert(TaskAssignment), [
+                {"task_id": 1, "user_id": 1}, {"task_id": 1, "user_id": 2},
+                {"task_id": 2, "user_id": 2}, {"task_id": 2, "user_id": 3},
+            ])
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: self.statements.append(statement))
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = AssignmentRepository(self.session, TaskAssignment, "task_id", notification_column="task_id")
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_diff_assignments(self):
+        diff = diff_assignments([1, 2, 3], [3, 4, 4, 2])
+        self.assertEqual(diff.added, [4])
+        self.assertEqual(diff.removed, [1])
+        self.assertFalse(diff_assignments([1], [1]).changed)
+
+    def test_sync_writes_only_changes(self):
+        diffs = self.repository.sync({1: [2, 4], 2: [2, 3], 3: [5]})
+        self.session.commit()
+
+        self.assertEqual(diffs[1].added, [4])
+        self.assertEqual(diffs[1].removed, [1])
+        self.assertFalse(diffs[2].changed)
+        self.assertEqual(diffs[3].added, [5])
+        # One SELECT, one DELETE and one INSERT for all owners together
+        self.assertEqual([s.split()[0] for s in self.statements], ["SELECT", "DELETE", "INSERT"])
+
+        with self.engine.connect() as connection:
+            rows = set(connection.execute(select(TaskAssignment.task_id, TaskAssignment.user_id)).all())
+        self.assertEqual(rows, {(1, 2), (1, 4), (2, 2), (2, 3), (3, 5)})
+
+    def test_sync_unchanged_writes_nothing(self):
+        diffs = self.repository.sync({2: [3, 2]})
+        self.assertFalse(diffs[2].changed)
+        self.assertEqual([s.split()[0] for s in self.statements], ["SELECT"])
+
+    def test_notify_only_affected_users(self):
+        diffs = self.repository.sync({1: [2, 4], 2: [2, 3]})
+        created = self.repository.notify(diffs, {1: "Alpha", 2: "Beta"}, "Added to {name}", "Removed from {name}")
+        self.session.commit()
+
+        self.assertEqual(created, 2)
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                select(Notification.user_id, Notification.task_id, Notification.message).order_by(Notification.user_id)
+            ).all()
+        self.assertEqual([tuple(row) for row in rows], [(1, 1, "Removed from Alpha"), (4, 1, "Added to Alpha")])
+
+if __name__ == "__main__":
+    unittest.main()
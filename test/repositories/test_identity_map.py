@@ -0,0 +1,94 @@
+import unittest
+import pytest
+from datetime import date, datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.controllers.comment_controller import CommentController
+from app.controllers.task_controller import TaskController
+from app.models.comment import Comment
+from app.models.dtos.task_dtos import CommentUpdate, TaskUpdate
+from app.models.file_attachment import FileAttachment
+from app.models.notification import Notification
+from app.models.project import Project
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.time_log_rollup import TimeLogDailyRollup
+from app.models.user import User
+from app.utils.db_utils import Base
+from app.utils.query_stats_utils import track_queries
+
+TABLES = [User, Project, Task, TaskAssignment, Notification, Comment, FileAttachment, TimeLogDailyRollup]
+
+@pytest.mark.usefixtures("statement_budget")
+class TestIdentityMap(unittest.TestCase):
+    """Primary-key lookups are loaded once per request and reused from the session."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[model.__table__ for model in TABLES])
+        with self.engine.begin() as connection:
+            connection.execute(insert(User), [
+                {"id": i, "email": f"user{i}@example.com", "password_hash": "x", "first_name": "User", "last_name": str(i)}
+                for i in (1, 2)
+            ])
+            connection.execute(insert(Project), [{"id": 1, "name": "Apollo", "start_date": date(2025, 1, 1)}])
+            connection.execute(insert(Task), [{"id": 1, "project_id": 1, "name": "Seed"}])
+            connection.execute(insert(TaskAssignment), [{"task_id": 1, "user_id": 1}])
+            connection.execute(insert(Comment), [
+                {"id": 1, "task_id": 1, "user_id": 1, "content": "First", "created_at": datetime(2025, 1, 1)}
+            ])
+        # Same session settings as the application's session factories
+        self.session = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def statements(self, stats):
+        return [statement.split()[0] for statement in stats.fingerprints.elements()]
+
+    def test_get_task_details_loads_the_task_once(self):
+        with self.statement_budget("GET /tasks/{task_id}/details"), track_queries() as stats:
+            details = TaskController(self.session).get_task_details(1)
+
+        self.assertEqual(details.name, "Seed")
+        self.assertEqual(details.assigned_users, [1])
+        self.assertEqual(details.project.name, "Apollo")
+        self.assertEqual(sum(1 for s in stats.fingerprints if "FROM tasks" in s), 1)
+
+    def test_update_task_selects_once(self):
+        with self.statement_budget("PUT /tasks/{task_id}"), track_queries() as stats:
+            response = TaskController(self.session).update_task(1, TaskUpdate(name="Renamed"))
+
+        self.assertEqual(response.name, "Renamed")
+        self.assertEqual(response.assigned_users, [1])
+        self.assertEqual(sorted(self.statements(stats)), ["SELECT", "SELECT", "UPDATE"])
+
+    def test_update_task_with_assignees_does_not_read_them_back(self):
+        with track_queries() as stats:
+            response = TaskController(self.session).update_task(1, TaskUpdate(assigned_user_ids=[2, 1]))
+
+        self.assertEqual(response.assigned_users, [1, 2])
+        # The task and the current assignments are read once each
+        self.assertEqual(self.statements(stats).count("SELECT"), 2)
+
+    def test_delete_task(self):
+        with self.statement_budget("DELETE /tasks/{task_id}"):
+            TaskController(self.session).delete_task(1)
+        self.assertIsNone(self.session.get(Task, 1))
+
+    def test_update_comment_reuses_the_loaded_comment(self):
+        with self.statement_budget("PUT /comments/{comment_id}"), track_queries() as stats:
+            response = CommentController(self.session).update_comment(1, CommentUpdate(content="Edited"), 1)
+
+        self.assertEqual(response.content, "Edited")
+        self.assertEqual(sorted(self.statements(stats)), ["SELECT", "SELECT", "UPDATE"])
+
+    def test_delete_comment_reuses_the_loaded_comment(self):
+        with self.statement_budget("DELETE /comments/{comment_id}"), track_queries() as stats:
+            CommentController(self.session).delete_comment(1, 1)
+
+        self.assertEqual(sorted(self.statements(stats)), ["DELETE", "SELECT", "SELECT"])
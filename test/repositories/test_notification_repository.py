@@ -0,0 +1,58 @@
+import unittest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.repositories.notification_repository import NotificationRepository, TASK_UPDATE_MESSAGE_PREFIX
+from app.models.notification import Notification
+from app.utils.db_utils import Base
+
+class TestCompactTaskUpdateNotifications(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[Notification.__table__])
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = NotificationRepository(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _insert(self, rows):
+        with self.engine.begin() as connection:
+            connection.execute(insert(Notification), [
+                {"id": id, "user_id": user_id, "task_id": task_id, "message": message}
+                for id, user_id, task_id, message in rows
+            ])
+
+    def _remaining_ids(self):
+        with self.engine.connect() as connection:
+            return connection.scalars(select(Notification.id).order_by(Notification.id)).all()
+
+    def test_keeps_newest_update_per_user_and_task(self):
+        update = TASK_UPDATE_MESSAGE_PREFIX + "Release"
+        self._insert([
+            (1, 1, 10, update), (2, 1, 10, update), (3, 1, 10, update),
+            # Another task with the same name
+            (4, 1, 11, update),
+            (5, 2, 10, update), (6, 2, 10, update),
+            # Not an update notification
+            (7, 1, 10, "You were assigned to task Release"),
+        ])
+
+        removed = self.repository.compact_task_update_notifications(batch_size=2)
+
+        self.assertEqual(removed, 3)
+        self.assertEqual(self._remaining_ids(), [3, 4, 6, 7])
+
+    def test_rows_without_task_are_left_alone(self):
+        update = TASK_UPDATE_MESSAGE_PREFIX + "Release"
+        self._insert([(1, 1, None, update), (2, 1, None, update)])
+
+        self.assertEqual(self.repository.compact_task_update_notifications(), 0)
+        self.assertEqual(self._remaining_ids(), [1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
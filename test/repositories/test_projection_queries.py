@@ -0,0 +1,56 @@
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.file_attachment import FileAttachment
+from app.models.project import Project
+from app.models.task import Task
+from app.repositories.file_attachment_repository import FileAttachmentRepository
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.utils.db_utils import Base
+
+class TestProjectionQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[Project.__table__, Task.__table__, FileAttachment.__table__])
+        with self.engine.begin() as connection:
+            connection.execute(Project.__table__.insert(), [
+                {"id": 1, "name": "Apollo", "start_date": date(2025, 1, 1), "status": "In Progress"}
+            ])
+            connection.execute(Task.__table__.insert(), [
+                {"id": 1, "project_id": 1, "name": "Design"}, {"id": 2, "project_id": 1, "name": "Build"}
+            ])
+            connection.execute(FileAttachment.__table__.insert(), [{"id": 1, "task_id": 1, "file_path": "/a.pdf"}])
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: self.statements.append(statement))
+        self.session = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_list_queries_load_no_entities(self):
+        self.assertEqual([row.name for row in ProjectRepository(self.session).get_all_projects()], ["Apollo"])
+        self.assertEqual(len(TaskRepository(self.session).get_tasks_by_project(1)), 2)
+        self.assertEqual(FileAttachmentRepository(self.session).get_all()[0].file_path, "/a.pdf")
+
+        self.assertEqual(len(self.session.identity_map), 0)
+
+    def test_fields_trim_the_select(self):
+        rows = TaskRepository(self.session).get_tasks_by_project(1, frozenset({"name"}))
+
+        self.assertEqual([tuple(row) for row in rows], [(1, "Design"), (2, "Build")])
+        select_list = self.statements[-1].split("FROM")[0]
+        self.assertNotIn("description", select_list)
+        self.assertNotIn("due_date", select_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
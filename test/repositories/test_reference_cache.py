@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.company_settings import CompanySettings
+from app.models.dtos.company_settings_dtos import CompanySettingsCreate, CompanySettingsUpdate
+from app.models.role import Role
+from app.repositories.company_settings_repository import CompanySettingsRepository
+from app.repositories.role_repository import RoleRepository
+from app.utils.cache_utils import LRUTTLCache, ReferenceCache
+from app.utils.db_utils import Base, RequestSession
+
+class TestReferenceCacheRepositories(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[Role.__table__, CompanySettings.__table__])
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: self.statements.append(statement))
+        self.session = sessionmaker(bind=self.engine, info={"tenant_schema": "tenant_test"})()
+
+        self.cache = ReferenceCache(LRUTTLCache(), ttl_seconds=60)
+        for module in ("role_repository", "company_settings_repository"):
+            patch(f"app.repositories.{module}.reference_cache", self.cache).start()
+        self.addCleanup(patch.stopall)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def selects(self):
+        return [s for s in self.statements if s.startswith("SELECT")]
+
+    def test_list_roles_is_served_from_cache(self):
+        repository = RoleRepository(self.session)
+        repository.create_roles_bulk(["Admin", "Manager"])
+        self.statements.clear()
+
+        first = repository.list_roles()
+        second = RoleRepository(self.session).list_roles()
+
+        self.assertEqual(len(self.selects()), 1)
+        self.assertEqual(sorted(role.name for role in first), sorted(role.name for role in second))
+
+    def test_write_invalidates(self):
+        repository = RoleRepository(self.session)
+        repository.create_role("Admin")
+        self.assertEqual([role.name for role in repository.list_roles()], ["Admin"])
+
+        role = repository.create_role("Manager")
+        self.assertEqual(sorted(r.name for r in repository.list_roles()), ["Admin", "Manager"])
+
+        repository.update_role(role.id, "Lead")
+        self.assertEqual(sorted(r.name for r in repository.list_roles()), ["Admin", "Lead"])
+
+        stats = self.cache.stats("tenant_test")
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["invalidations"], 3)
+
+    def test_company_settings_update_uses_session_row(self):
+        repository = CompanySettingsRepository(self.session)
+        repository.create(CompanySettingsCreate(company_id=1, timezone="UTC", work_hours_per_day=8))
+        repository.get_by_company_id(1)
+        cached = repository.get_by_company_id(1)
+        self.assertEqual(cached.work_hours_per_day, 8)
+
+        updated = repository.update(1, CompanySettingsUpdate(work_hours_per_day=6))
+        self.assertEqual(updated.work_hours_per_day, 6)
+        self.assertEqual(repository.get_by_company_id(1).work_hours_per_day, 6)
+
+        self.assertTrue(repository.delete(1))
+        self.assertIsNone(repository.get_by_company_id(1))
+
+
+class TestReferenceCacheUnitOfWork(unittest.TestCase):
+    """Concurrent requests on separate connections, writes committed once per request."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.engine = create_engine(f"sqlite:///{self.path}")
+        Base.metadata.create_all(self.engine, tables=[Role.__table__])
+        self.factory = sessionmaker(bind=self.engine, info={"tenant_schema": "tenant_test"})
+
+        self.cache = ReferenceCache(LRUTTLCache(), ttl_seconds=60)
+        patch("app.repositories.role_repository.reference_cache", self.cache).start()
+        self.addCleanup(patch.stopall)
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def request(self):
+        db = RequestSession(self.factory, unit_of_work=True)
+        self.addCleanup(db.close)
+        return db, RoleRepository(db)
+
+    def test_invalidation_waits_for_commit(self):
+        writer, writes = self.request()
+        writes.create_role("Admin")
+
+        # A concurrent request reads (and caches) the committed state
+        _, reads = self.request()
+        self.assertEqual(reads.list_roles(), [])
+
+        writer.commit_request()
+        _, later = self.request()
+        self.assertEqual([role.name for role in later.list_roles()], ["Admin"])
+
+    def test_uncommitted_rows_are_not_cached(self):
+        writer, writes = self.request()
+        writes.create_role("Admin")
+        self.assertEqual([role.name for role in writes.list_roles()], ["Admin"])
+
+        writer.close(rollback=True)
+        _, later = self.request()
+        self.assertEqual(later.list_roles(), [])
+        self.assertEqual(self.cache.stats("tenant_test")["invalidations"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from datetime import date
+from unittest.mock import patch
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.middleware.authorization_middleware import IS_ADMIN, PERMISSION_EXISTS, PROJECT_ACCESS, TASK_ACCESS
+from app.models.permission import Permission
+from app.models.project import Project
+from app.models.role import Role
+from app.models.role_permission import RolePermission
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.repositories.task_repository import TaskRepository
+from app.repositories.user_repository import UserRepository
+from app.utils.db_utils import Base, _tenant_engines, get_tenant_session
+from app.utils.query_stats_utils import track_queries
+
+TABLES = [User, Role, UserRole, Permission, RolePermission, Project, Task, TaskAssignment]
+
+class TestStatementCache(unittest.TestCase):
+    """Hot lookups run prebuilt statements that SQLAlchemy compiles once."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[model.__table__ for model in TABLES])
+        with self.engine.begin() as connection:
+            connection.execute(insert(User), [
+                {"id": i, "email": f"user{i}@example.com", "password_hash": "x", "first_name": "User", "last_name": str(i)}
+                for i in (1, 2, 3)
+            ])
+            connection.execute(insert(Role), [{"id": 1, "name": "Admin"}, {"id": 2, "name": "Employee"}])
+            connection.execute(insert(UserRole), [{"user_id": 1, "role_id": 1}, {"user_id": 2, "role_id": 2}])
+            connection.execute(insert(Permission), [{"id": 1, "name": "read_task"}, {"id": 2, "name": "delete_task"}])
+            connection.execute(insert(RolePermission), [
+                {"role_id": 1, "permission_id": 1}, {"role_id": 1, "permission_id": 2}, {"role_id": 2, "permission_id": 1}
+            ])
+            connection.execute(insert(Project), [{"id": 1, "name": "Apollo", "start_date": date(2025, 1, 1)}])
+            connection.execute(insert(Task), [{"id": 1, "project_id": 1, "name": "Seed"}])
+            connection.execute(insert(TaskAssignment), [{"task_id": 1, "user_id": 2}])
+        self.session = sessionmaker(bind=self.engine, autoflush=False)()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_repository_lookups(self):
+        tasks = TaskRepository(self.session)
+        users = UserRepository(self.session)
+
+        self.assertEqual(tasks.get_task_by_id(1).name, "Seed")
+        self.assertIsNone(tasks.get_task_by_id(99))
+        self.assertEqual(tasks.get_task_assignments(1), [2])
+        self.assertEqual(tasks.get_task_assignments(99), [])
+        self.assertEqual(users.get_user_by_email("user3@example.com").id, 3)
+        self.assertIsNone(users.get_user_by_email("nobody@example.com"))
+
+    def test_authorization_statements(self):
+        def scalar(statement, **params):
+            return self.session.scalar(statement, params)
+
+        self.assertTrue(scalar(PERMISSION_EXISTS, user_id=2, permission="read_task"))
+        self.assertFalse(scalar(PERMISSION_EXISTS, user_id=2, permission="delete_task"))
+        self.assertFalse(scalar(PERMISSION_EXISTS, user_id=3, permission="read_task"))
+        # Assignee, admin, and neither
+        self.assertTrue(scalar(TASK_ACCESS, resource_id=1, user_id=2))
+        self.assertTrue(scalar(TASK_ACCESS, resource_id=1, user_id=1))
+        self.assertFalse(scalar(TASK_ACCESS, resource_id=1, user_id=3))
+        self.assertFalse(scalar(TASK_ACCESS, resource_id=99, user_id=1))
+        self.assertTrue(scalar(PROJECT_ACCESS, resource_id=1, user_id=1))
+        self.assertFalse(scalar(PROJECT_ACCESS, resource_id=1, user_id=2))
+        self.assertTrue(scalar(IS_ADMIN, user_id=1))
+        self.assertFalse(scalar(IS_ADMIN, user_id=2))
+
+    def test_repeated_calls_hit_the_compiled_cache(self):
+        tasks = TaskRepository(self.session)
+        users = UserRepository(self.session)
+
+        def hot_path(i):
+            tasks.get_task_by_id(i)
+            tasks.get_task_assignments(i)
+            users.get_user_by_email(f"user{i}@example.com")
+            self.session.scalar(PERMISSION_EXISTS, {"user_id": i, "permission": f"permission_{i}"})
+
+        hot_path(1)
+        with track_queries() as stats:
+            for i in range(2, 12):
+                hot_path(i)
+
+        self.assertEqual(stats.count, 40)
+        self.assertEqual(stats.cache_misses, 0)
+
+    @patch("app.utils.db_utils.create_engine")
+    def test_tenant_sessions_share_the_compiled_cache(self, mock_create_engine):
+        mock_create_engine.return_value = self.engine
+        self.addCleanup(_tenant_engines.pop, "tenant_test", None)
+
+        def request(i):
+            # Each request opens its own session on the tenant's engine
+            session = get_tenant_session("tenant_test")
+            try:
+                UserRepository(session).get_user_by_email(f"user{i}@example.com")
+                session.scalar(PERMISSION_EXISTS, {"user_id": i, "permission": "read_task"})
+            finally:
+                session.close()
+
+        request(1)
+        with track_queries() as stats:
+            for i in range(2, 6):
+                request(i)
+
+        self.assertEqual(stats.count, 8)
+        self.assertEqual(stats.cache_misses, 0)
@@ -0,0 +1,54 @@
+import unittest
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.controllers.task_controller import TaskController
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.utils.db_utils import Base
+
+@pytest.mark.usefixtures("statement_budget")
+class TestTaskPagination(unittest.TestCase):
+    """Runs the paginated task listing against SQLite within its statement budget."""
+
+    TASKS = 30
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[Task.__table__, TaskAssignment.__table__])
+        created = datetime(2025, 1, 1)
+        with self.engine.begin() as connection:
+            connection.execute(insert(Task), [
+                {"id": i, "project_id": 1, "name": f"Task {i}",
+                 "created_at": created, "updated_at": created + timedelta(minutes=i)}
+                for i in range(1, self.TASKS + 1)
+            ])
+            # Every task is assigned to two users
+            connection.execute(insert(TaskAssignment), [
+                {"task_id": i, "user_id": user_id}
+                for i in range(1, self.TASKS + 1) for user_id in (i, i + 100)
+            ])
+        self.session = sessionmaker(bind=self.engine)()
+        self.task_controller = TaskController(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_page_loads_assignments_in_one_statement(self):
+        with self.statement_budget("GET /tasks/") as stats:
+            response = self.task_controller.get_tasks_paginated(page=1, page_size=25)
+
+        self.assertEqual(response.total, self.TASKS)
+        self.assertEqual(len(response.items), 25)
+        self.assertEqual(response.items[0].id, self.TASKS)
+        self.assertEqual(response.items[0].assigned_users, [self.TASKS, self.TASKS + 100])
+        self.assertEqual(stats.repeated(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from datetime import date, datetime
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.dtos.timelog_dtos import TimeLogCreate, TimeLogUpdate
+from app.models.department import Department
+from app.models.project import Project
+from app.models.team import Team
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.time_log import TimeLog
+from app.models.time_log_rollup import TimeLogDailyRollup
+from app.models.user import User
+from app.repositories.task_repository import TaskRepository
+from app.repositories.timelog_repository import TimeLogRepository
+from app.repositories.timelog_rollup_repository import TimeLogRollupRepository
+from app.utils.db_utils import Base
+
+class TestTimeLogRollupRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        event.listen(self.engine, "connect",
+                     lambda connection, record: connection.execute("PRAGMA foreign_keys=ON"))
+        Base.metadata.create_all(self.engine, tables=[
+            Department.__table__, Team.__table__, User.__table__, Project.__table__, Task.__table__,
+            TaskAssignment.__table__, TimeLog.__table__, TimeLogDailyRollup.__table__
+        ])
+        with self.engine.begin() as connection:
+            connection.execute(User.__table__.insert(), [
+                {"id": 1, "email": "ana@example.com", "first_name": "Ana", "last_name": "Berisha",
+                 "password_hash": "x"}
+            ])
+            connection.execute(Project.__table__.insert(), [
+                {"id": 1, "name": "Apollo", "start_date": date(2025, 1, 1)},
+                {"id": 2, "name": "Gemini", "start_date": date(2025, 1, 1)}
+            ])
+            connection.execute(Task.__table__.insert(), [
+                {"id": 1, "project_id": 1, "name": "Design"}, {"id": 2, "project_id": 1, "name": "Build"}
+            ])
+        self.session = sessionmaker(bind=self.engine)()
+        self.time_logs = TimeLogRepository(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def log(self, task_id, start, minutes):
+        end = start.replace(hour=start.hour + minutes // 60, minute=start.minute + minutes % 60)
+        return self.time_logs.create_time_log(1, TimeLogCreate(task_id=task_id, start_time=start, end_time=end))
+
+    def rollups(self):
+        rows = self.session.execute(
+            select(TimeLogDailyRollup.day, TimeLogDailyRollup.task_id, TimeLogDailyRollup.project_id,
+                   TimeLogDailyRollup.total_minutes, TimeLogDailyRollup.log_count)
+            .order_by(TimeLogDailyRollup.day, TimeLogDailyRollup.task_id)
+        ).all()
+        return [tuple(row) for row in rows]
+
+    def test_create_adds_to_the_day(self):
+        self.log(1, datetime(2025, 5, 1, 9, 0), 90)
+        self.log(1, datetime(2025, 5, 1, 13, 0), 30)
+        self.log(2, datetime(2025, 5, 2, 9, 0), 60)
+
+        self.assertEqual(self.rollups(), [
+            (date(2025, 5, 1), 1, 1, 120, 2),
+            (date(2025, 5, 2), 2, 1, 60, 1),
+        ])
+
+    def test_update_moves_the_contribution(self):
+        time_log = self.log(1, datetime(2025, 5, 1, 9, 0), 90)
+
+        self.time_logs.update_time_log(
+            time_log.id, TimeLogUpdate(start_time=datetime(2025, 5, 3, 9, 0), duration=45)
+        )
+
+        self.assertEqual(self.rollups(), [(date(2025, 5, 3), 1, 1, 45, 1)])
+
+    def test_delete_removes_empty_rollups(self):
+        first = self.log(1, datetime(2025, 5, 1, 9, 0), 90)
+        second = self.log(1, datetime(2025, 5, 1, 13, 0), 30)
+
+        self.time_logs.delete_time_log(first.id)
+        self.assertEqual(self.rollups(), [(date(2025, 5, 1), 1, 1, 30, 1)])
+
+        self.time_logs.delete_time_log(second.id)
+        self.assertEqual(self.rollups(), [])
+
+    def test_rebuild_matches_incremental_rollups(self):
+        self.log(1, datetime(2025, 5, 1, 9, 0), 90)
+        self.log(1, datetime(2025, 5, 1, 13, 0), 30)
+        self.log(2, datetime(2025, 5, 2, 9, 0), 60)
+        incremental = self.rollups()
+
+        self.assertEqual(TimeLogRollupRepository(self.session).rebuild(), 2)
+        self.assertEqual(self.rollups(), incremental)
+
+    def test_task_delete_cascades_to_rollups(self):
+        self.log(1, datetime(2025, 5, 1, 9, 0), 90)
+        self.log(2, datetime(2025, 5, 1, 9, 0), 60)
+
+        TaskRepository(self.session).delete_task(1)
+
+        self.assertEqual(self.rollups(), [(date(2025, 5, 1), 2, 1, 60, 1)])
+
+    def test_task_project_move_refiles_rollups(self):
+        self.log(1, datetime(2025, 5, 1, 9, 0), 90)
+
+        TaskRepository(self.session).update_task(1, {"project_id": 2})
+
+        self.assertEqual(self.rollups(), [(date(2025, 5, 1), 1, 2, 90, 1)])
+        totals = TimeLogRollupRepository(self.session).get_totals("project", date(2025, 5, 1), date(2025, 5, 1))
+        self.assertEqual([tuple(row) for row in totals], [(2, 90, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+from datetime import datetime
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.attendance import Attendance
+from app.models.role import Role
+from app.models.tenant_user import TenantUser
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.repositories.attendance_repository import AttendanceRepository
+from app.repositories.user_repository import UserRepository
+from app.utils.cache_utils import LRUTTLCache, TableVersions
+from app.utils.db_utils import Base, RequestSession
+
+class TestUnitOfWork(unittest.TestCase):
+    """Repository writes through a unit-of-work RequestSession against SQLite."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[User.__table__, Role.__table__, UserRole.__table__])
+        with self.engine.begin() as connection:
+            connection.execute(insert(Role), [{"id": 1, "name": "Admin"}, {"id": 2, "name": "Employee"}])
+
+        self.commits = []
+        event.listen(self.engine, "commit", lambda connection: self.commits.append(connection))
+        self.db = RequestSession(sessionmaker(bind=self.engine), unit_of_work=True)
+        self.repository = UserRepository(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def count(self, model):
+        with self.engine.connect() as connection:
+            return connection.execute(select(func.count()).select_from(model)).scalar()
+
+    def test_request_commits_once(self):
+        user = self.repository.create_user("ana@example.com", "x", "Ana", "B", None, None)
+        self.assertIsNotNone(user.id)
+        self.assertTrue(self.repository.assign_role_to_user(user.id, 2))
+        self.assertEqual(self.commits, [])
+
+        self.db.commit_request()
+        self.assertEqual(len(self.commits), 1)
+        self.assertEqual((self.count(User), self.count(UserRole)), (1, 1))
+
+    def test_failed_request_keeps_nothing(self):
+        user = self.repository.create_user("ana@example.com", "x", "Ana", "B", None, None)
+        self.repository.assign_role_to_user(user.id, 2)
+
+        self.db.close(rollback=True)
+        self.assertEqual(self.commits, [])
+        self.assertEqual((self.count(User), self.count(UserRole)), (0, 0))
+
+    def test_close_without_open_attendance_keeps_earlier_writes(self):
+        Base.metadata.create_all(self.engine, tables=[Attendance.__table__])
+        user = self.repository.create_user("ana@example.com", "x", "Ana", "B", None, None)
+
+        self.assertIsNone(AttendanceRepository(self.db).close_open_attendance(user.id, datetime(2026, 10, 19, 17)))
+        self.db.commit_request()
+        self.assertEqual(self.count(User), 1)
+
+    def test_delete_user_bumps_tenant_tables(self):
+        Base.metadata.create_all(self.engine, tables=[TenantUser.__table__])
+        with self.engine.begin() as connection:
+            connection.execute(insert(User), [{"id": 1, "email": "ana@example.com", "password_hash": "x",
+                                               "first_name": "Ana", "last_name": "B"}])
+            connection.execute(insert(TenantUser), [{"email": "ana@example.com", "tenant_schema": "test"}])
+        db = RequestSession(sessionmaker(bind=self.engine, info={"tenant_schema": "tenant_test"}), unit_of_work=True)
+        self.addCleanup(db.close)
+        versions = TableVersions(LRUTTLCache())
+        before = versions.get("tenant_test", ["users"])
+
+        @contextmanager
+        def global_db():
+            session = sessionmaker(bind=self.engine)()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        with patch("app.utils.cache_utils.table_versions", versions), \
+                patch("app.repositories.user_repository.get_global_db", global_db):
+            self.assertIsNotNone(UserRepository(db).delete_user(1))
+            db.commit_request()
+
+        self.assertEqual(db.info["tenant_schema"], "tenant_test")
+        self.assertNotEqual(versions.get("tenant_test", ["users"]), before)
+        self.assertIsNone(versions.backend.get_counters(["taskeri_global:version:users"])[0])
+        self.assertEqual((self.count(User), self.count(TenantUser)), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from datetime import date, datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.controllers.comment_controller import CommentController
+from app.controllers.leave_request_controller import LeaveRequestController
+from app.controllers.project_controller import ProjectController
+from app.controllers.task_controller import TaskController
+from app.controllers.timelog_controller import TimeLogController
+from app.models.comment import Comment
+from app.models.department import Department
+from app.models.dtos.leave_request_dtos import LeaveRequestCreate
+from app.models.dtos.project_dtos import ProjectCreate
+from app.models.dtos.task_dtos import CommentCreate, TaskCreate
+from app.models.dtos.timelog_dtos import TimeLogCreate
+from app.models.leave_request import LeaveRequest
+from app.models.notification import Notification
+from app.models.project import Project
+from app.models.task import Task
+from app.models.task_assignment import TaskAssignment
+from app.models.team import Team
+from app.models.time_log import TimeLog
+from app.models.time_log_rollup import TimeLogDailyRollup
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+from app.utils.db_utils import Base
+from app.utils.query_stats_utils import track_queries
+
+TABLES = [Department, Team, User, Project, Task, TaskAssignment, Notification, Comment,
+          LeaveRequest, TimeLog, TimeLogDailyRollup]
+
+class TestWritePath(unittest.TestCase):
+    """Create endpoints write their rows and build the response without reading them back."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[model.__table__ for model in TABLES])
+        with self.engine.begin() as connection:
+            connection.execute(insert(User), [
+                {"id": i, "email": f"user{i}@example.com", "password_hash": "x", "first_name": "User", "last_name": str(i)}
+                for i in (1, 2)
+            ])
+            connection.execute(insert(Project), [{"id": 1, "name": "Apollo", "start_date": date(2025, 1, 1)}])
+            connection.execute(insert(Task), [{"id": 1, "project_id": 1, "name": "Seed"}])
+        # Same session settings as the application's session factories
+        self.session = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def statements(self, stats):
+        return [statement.split()[0] for statement in stats.fingerprints.elements()]
+
+    def test_create_task_only_writes(self):
+        with track_queries() as stats:
+            response = TaskController(self.session).create_task(
+                TaskCreate(project_id=1, name="Build", assigned_user_ids=[2, 1, 2])
+            )
+
+        self.assertEqual(self.statements(stats), ["INSERT", "INSERT", "INSERT"])
+        self.assertEqual(response.assigned_users, [1, 2])
+        self.assertIsNotNone(response.created_at)
+
+    def test_create_project_only_writes(self):
+        with track_queries() as stats:
+            response = ProjectController(self.session).create_project(
+                ProjectCreate(name="Gemini", start_date=date(2025, 2, 1))
+            )
+
+        self.assertEqual(self.statements(stats), ["INSERT"])
+        self.assertEqual(response.status, "Not Started")
+
+    def test_create_leave_request_only_writes(self):
+        with track_queries() as stats:
+            response = LeaveRequestController(self.session).create_leave_request(
+                LeaveRequestCreate(leave_type="Vacation", start_date=date(2025, 3, 1), end_date=date(2025, 3, 5)), 1
+            )
+
+        self.assertEqual(self.statements(stats), ["INSERT"])
+        self.assertEqual(response.status, "Pending")
+
+    def test_create_time_log_writes_log_and_rollup(self):
+        with track_queries() as stats:
+            response = TimeLogController(self.session).create_time_log(
+                1, TimeLogCreate(task_id=1, start_time=datetime(2025, 3, 3, 9), end_time=datetime(2025, 3, 3, 11))
+            )
+
+        self.assertEqual(self.statements(stats), ["INSERT", "INSERT"])
+        self.assertEqual(response.duration, 120)
+
+    def test_create_user_only_writes(self):
+        with track_queries() as stats:
+            user = UserRepository(self.session).create_user("new@example.com", "x", "New", "User", None, None)
+            created_at = user.created_at
+
+        self.assertEqual(self.statements(stats), ["INSERT"])
+        self.assertIsNotNone(created_at)
+
+    def test_create_comment_reads_only_the_author(self):
+        with track_queries() as stats:
+            response = CommentController(self.session).create_comment(
+                CommentCreate(task_id=1, user_id=2, content="Looks good")
+            )
+
+        self.assertEqual(self.statements(stats), ["INSERT", "SELECT"])
+        self.assertIn("FROM users", list(stats.fingerprints)[1])
+        self.assertEqual(response.user.last_name, "2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from app.services.notification_retention import (
+    RetentionSettings, RetentionMetrics, run_retention_for_tenant, run_retention_for_all_tenants,
+    run_retention_forever
+)
+
+class TestNotificationRetention(unittest.TestCase):
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            RetentionSettings(mode="truncate")
+
+    @patch('app.services.notification_retention.retention_metrics', new_callable=RetentionMetrics)
+    @patch('app.services.notification_retention.switch_schema')
+    @patch('app.services.notification_retention.get_tenant_session')
+    @patch('app.repositories.notification_repository.NotificationRepository.prune_read_notifications')
+    @patch('app.repositories.notification_repository.NotificationRepository.compact_task_update_notifications')
+    def test_run_retention_for_tenant(self, mock_compact, mock_prune, mock_get_session, mock_switch, mock_metrics):
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+        mock_compact.return_value = 4
+        mock_prune.return_value = 120
+        settings = RetentionSettings(retention_days=7, mode="archive", batch_size=50)
+
+        result = run_retention_for_tenant("tenant_acme", settings)
+
+        self.assertEqual(result, {"compacted": 4, "pruned": 120})
+        mock_compact.assert_called_once_with(batch_size=50)
+        self.assertEqual(mock_prune.call_args[1]['batch_size'], 50)
+        self.assertTrue(mock_prune.call_args[1]['archive'])
+        # The cutoff is in UTC, like the created_at values it is compared with
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=7)
+        self.assertLess(abs(mock_prune.call_args[1]['older_than'] - cutoff), timedelta(seconds=5))
+        mock_switch.assert_called_once_with(mock_session, "tenant_acme")
+        mock_session.close.assert_called_once()
+        # The tenant engine is shared, so its pool outlives the run
+        mock_session.get_bind.return_value.dispose.assert_not_called()
+
+        stats = mock_metrics.get("tenant_acme")
+        self.assertEqual(stats["pruned_total"], 120)
+        self.assertEqual(stats["compacted_total"], 4)
+        self.assertEqual(stats["archived_total"], 120)
+
+    @patch('app.services.notification_retention.run_retention_for_tenant')
+    @patch('app.repositories.tenant_user_repository.TenantUserRepository.list_tenant_schemas')
+    @patch('app.services.notification_retention.get_global_db')
+    def test_failing_tenant_does_not_stop_others(self, mock_global_db, mock_list, mock_run):
+        mock_global_db.return_value.__enter__.return_value = MagicMock()
+        mock_list.return_value = ["acme", "globex"]
+        mock_run.side_effect = [Exception("boom"), {"compacted": 0, "pruned": 3}]
+
+        results = run_retention_for_all_tenants(RetentionSettings())
+
+        self.assertEqual(results, {"tenant_globex": {"compacted": 0, "pruned": 3}})
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_metrics_are_shared_through_the_stats_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "retention.json")
+
+        # The retention process records, a server worker reads
+        RetentionMetrics(path).record("tenant_acme", pruned=5, compacted=2, archived=False)
+        stats = RetentionMetrics(path).get("tenant_acme")
+
+        self.assertEqual((stats["runs"], stats["pruned_total"], stats["compacted_total"]), (1, 5, 2))
+        self.assertIsInstance(stats["last_run_at"], datetime)
+        self.assertIsNone(RetentionMetrics(path).get("tenant_globex"))
+        self.assertEqual(RetentionMetrics(os.path.join(directory.name, "missing.json")).snapshot(), [])
+
+    @patch('app.services.notification_retention.run_retention_for_all_tenants')
+    @patch('app.services.notification_retention.time.sleep')
+    def test_run_forever_until_interrupted(self, mock_sleep, mock_run):
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt]
+        mock_run.side_effect = [Exception("boom"), {}]
+        settings = RetentionSettings(interval_seconds=60)
+
+        run_retention_forever(settings)
+
+        mock_sleep.assert_called_with(60)
+        self.assertEqual(mock_run.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
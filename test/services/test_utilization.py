@@ -0,0 +1,65 @@
+import unittest
+from datetime import date, datetime
+import numpy as np
+from app.services.utilization import (
+    period_edges, split_intervals, overlap_seconds, compute_utilization, to_epoch_seconds
+)
+
+def ts(*args):
+    return int(to_epoch_seconds([datetime(*args)]).astype(np.int64)[0])
+
+class TestUtilization(unittest.TestCase):
+
+    def test_period_edges_week(self):
+        edges = period_edges(date(2025, 5, 14), date(2025, 5, 27), "week")
+        self.assertEqual(edges, [date(2025, 5, 14), date(2025, 5, 19), date(2025, 5, 26), date(2025, 5, 28)])
+
+    def test_period_edges_month(self):
+        edges = period_edges(date(2025, 11, 15), date(2026, 1, 31), "month")
+        self.assertEqual(edges, [date(2025, 11, 15), date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)])
+
+    def test_split_intervals_across_edges(self):
+        edges = np.array([0, 100, 200, 300], dtype=np.int64)
+        start = np.array([10, 150, 250, 400], dtype=np.int64)
+        end = np.array([50, 260, 260, 500], dtype=np.int64)
+
+        source, bucket, seconds = split_intervals(start, end, edges)
+
+        self.assertEqual(source.tolist(), [0, 1, 1, 2])
+        self.assertEqual(bucket.tolist(), [0, 1, 2, 2])
+        self.assertEqual(seconds.tolist(), [40, 50, 60, 10])
+
+    def test_overlap_seconds_per_user(self):
+        user = np.array([0, 0, 0, 1], dtype=np.int64)
+        start = np.array([100, 0, 150, 10], dtype=np.int64)
+        end = np.array([200, 120, 160, 300], dtype=np.int64)
+
+        overlap = overlap_seconds(user, start, end)
+
+        # Log 0 overlaps log 1 by 20s, log 2 lies inside log 0; user 1 is independent
+        self.assertEqual(overlap.tolist(), [20, 0, 10, 0])
+
+    def test_compute_utilization(self):
+        edges = to_epoch_seconds([date(2025, 5, 12), date(2025, 5, 19)]).astype(np.int64)
+        user_group = np.array([0, 0, 1], dtype=np.int64)
+        log_user = np.array([0, 0, 2], dtype=np.int64)
+        log_start = np.array([ts(2025, 5, 12, 9), ts(2025, 5, 12, 10), ts(2025, 5, 13, 9)], dtype=np.int64)
+        log_end = np.array([ts(2025, 5, 12, 11), ts(2025, 5, 12, 12), ts(2025, 5, 13, 10)], dtype=np.int64)
+        attendance_user = np.array([1], dtype=np.int64)
+        attendance_start = np.array([ts(2025, 5, 12, 8)], dtype=np.int64)
+        attendance_end = np.array([ts(2025, 5, 12, 16)], dtype=np.int64)
+
+        totals = compute_utilization(
+            user_group, 2, log_user, log_start, log_end,
+            attendance_user, attendance_start, attendance_end, edges, 480
+        )
+
+        self.assertEqual(totals["logged"][:, 0].tolist(), [240.0, 60.0])
+        self.assertEqual(totals["overlap"][:, 0].tolist(), [60.0, 0.0])
+        self.assertEqual(totals["overlapping_logs"][:, 0].tolist(), [1.0, 0.0])
+        self.assertEqual(totals["attended"][:, 0].tolist(), [480.0, 0.0])
+        # Five working days, two users in group 0 and one in group 1
+        self.assertEqual(totals["expected"][:, 0].tolist(), [4800.0, 2400.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Cold import of app.app in a fresh interpreter, in seconds. About 2.2 s on a
+# single CPU today; fail well before a regression doubles worker start-up.
+IMPORT_BUDGET_SECONDS = 3.5
+
+# Loaded on first use only (first email, first report request)
+LAZY_MODULES = ("fastapi_mail", "jinja2", "numpy")
+
+MEASURE = """
+import sys, time
+started = time.perf_counter()
+import app.app
+print(time.perf_counter() - started)
+print("loaded:" + ",".join(sorted(name for name in {lazy!r} if name in sys.modules)))
+"""
+
+def cold_import(env=None):
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", MEASURE.format(lazy=LAZY_MODULES)],
+        capture_output=True, text=True, env=env if env is not None else os.environ.copy(),
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    if result.returncode != 0:
+        raise AssertionError(f"import app.app failed:\n{result.stderr}")
+    elapsed, loaded = result.stdout.strip().splitlines()[-2:]
+    return float(elapsed), [name for name in loaded[len("loaded:"):].split(",") if name]
+
+class TestImportBudget(unittest.TestCase):
+
+    def test_cold_import_within_budget(self):
+        # Best of two runs, so a busy machine does not fail the build
+        elapsed = min(cold_import()[0] for _ in range(2))
+        self.assertLess(
+            elapsed, IMPORT_BUDGET_SECONDS,
+            f"import app.app took {elapsed:.2f}s (budget {IMPORT_BUDGET_SECONDS}s); "
+            "see python -m benchmarks.profile_imports"
+        )
+
+    def test_heavy_modules_are_loaded_lazily(self):
+        _, loaded = cold_import()
+        self.assertEqual(loaded, [])
+
+    def test_import_does_not_need_mail_or_token_settings(self):
+        env = {key: value for key, value in os.environ.items()
+               if not key.startswith("MAIL_") and key not in ("SECRET_KEY", "ALGORITHM")}
+        env["RAILWAY_ENVIRONMENT_NAME"] = "test"  # skip loading a local .env
+        cold_import(env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
+import os
 import unittest
-from app.utils.auth_utils import hash_password, verify_password
+from unittest.mock import patch
+from app.utils.auth_utils import default_hash_workers, hash_password, hash_passwords, shutdown_hash_pool, verify_password
 
 class TestAuthUtils(unittest.TestCase):
 
@@ -15,5 +17,22 @@ class TestAuthUtils(unittest.TestCase):
         self.assertTrue(verify_password(password, hashed))
         self.assertFalse(verify_password("wrongpassword", hashed))
 
+    def test_hash_passwords_parallel(self):
+        self.addCleanup(shutdown_hash_pool)
+        passwords = [f"password{i}" for i in range(10)]
+        hashed = hash_passwords(passwords, max_workers=2)
+        self.assertEqual(len(hashed), 10)
+        for password, value in zip(passwords, hashed):
+            self.assertTrue(verify_password(password, value))
+
+    @patch("app.utils.auth_utils.available_cpus", return_value=8)
+    def test_hash_workers_share_the_cpus_between_server_workers(self, _):
+        with patch.dict(os.environ, {"WEB_CONCURRENCY": "4"}):
+            self.assertEqual(default_hash_workers(), 2)
+        with patch.dict(os.environ, {"WEB_CONCURRENCY": "16"}):
+            self.assertEqual(default_hash_workers(), 1)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(default_hash_workers(), 8)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,139 @@
+import fnmatch
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from app.models.role import Role
+from app.utils.cache_utils import LRUTTLCache, RedisCache, ReferenceCache, tenant_scope
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of the Redis client API the backend uses."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def scan_iter(self, match):
+        return [key for key in self.values if fnmatch.fnmatchcase(key, match)]
+
+    def delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+
+class TestLRUTTLCache(unittest.TestCase):
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = LRUTTLCache(clock=clock)
+        cache.set("a", [1], ttl_seconds=10)
+        clock.now = 9
+        self.assertEqual(cache.get("a"), [1])
+        clock.now = 10
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUTTLCache(max_entries=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_delete_prefix(self):
+        cache = LRUTTLCache()
+        cache.set("tenant_a:roles:all", 1, 60)
+        cache.set("tenant_a:teams:all", 2, 60)
+        cache.set("tenant_b:roles:all", 3, 60)
+        self.assertEqual(cache.delete_prefix("tenant_a:roles:"), 1)
+        self.assertIsNone(cache.get("tenant_a:roles:all"))
+        self.assertEqual(cache.get("tenant_a:teams:all"), 2)
+        self.assertEqual(cache.get("tenant_b:roles:all"), 3)
+
+
+class TestRedisCache(unittest.TestCase):
+
+    def test_round_trip_and_delete_prefix(self):
+        client = FakeRedis()
+        cache = RedisCache(client)
+        cache.set("tenant_a:roles:all", [{"id": 1, "name": "Admin"}], 60)
+        cache.set("tenant_b:roles:all", [], 60)
+
+        self.assertEqual(cache.get("tenant_a:roles:all"), [{"id": 1, "name": "Admin"}])
+        self.assertEqual(cache.delete_prefix("tenant_a:"), 1)
+        self.assertIsNone(cache.get("tenant_a:roles:all"))
+        self.assertEqual(cache.get("tenant_b:roles:all"), [])
+
+    def test_client_errors_are_misses(self):
+        client = MagicMock()
+        client.get.side_effect = ConnectionError("down")
+        self.assertIsNone(RedisCache(client).get("key"))
+
+
+class TestReferenceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ReferenceCache(LRUTTLCache(), ttl_seconds=60)
+        self.session = SimpleNamespace(info={"tenant_schema": "tenant_a"})
+        self.loader = MagicMock(return_value=[Role(id=1, name="Admin")])
+
+    def test_tenant_scope(self):
+        self.assertEqual(tenant_scope(self.session), "tenant_a")
+        self.assertIsNone(tenant_scope(SimpleNamespace(info={})))
+        self.assertIsNone(tenant_scope(MagicMock()))
+
+    def test_hit_returns_detached_copies(self):
+        self.cache.get_rows(self.session, Role, "roles", "all", self.loader)
+        roles = self.cache.get_rows(self.session, Role, "roles", "all", self.loader)
+
+        self.loader.assert_called_once()
+        self.assertIsInstance(roles[0], Role)
+        self.assertEqual((roles[0].id, roles[0].name), (1, "Admin"))
+        self.assertEqual(self.cache.metrics.get("tenant_a"), {"roles": {"hits": 1, "misses": 1, "invalidations": 0}})
+
+    def test_keys_are_scoped_per_tenant(self):
+        other = SimpleNamespace(info={"tenant_schema": "tenant_b"})
+        self.cache.get_rows(self.session, Role, "roles", "all", self.loader)
+        self.cache.get_rows(other, Role, "roles", "all", self.loader)
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_invalidate(self):
+        self.cache.get_rows(self.session, Role, "roles", "all", self.loader)
+        self.cache.invalidate(self.session, "roles")
+        self.cache.get_rows(self.session, Role, "roles", "all", self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
+        stats = self.cache.stats("tenant_a")
+        self.assertEqual((stats["hits"], stats["misses"], stats["invalidations"]), (0, 2, 1))
+
+    def test_unscoped_session_is_not_cached(self):
+        session = MagicMock()
+        self.cache.get_rows(session, Role, "roles", "all", self.loader)
+        self.cache.get_rows(session, Role, "roles", "all", self.loader)
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_disabled_backend(self):
+        cache = ReferenceCache(None)
+        cache.get_rows(self.session, Role, "roles", "all", self.loader)
+        cache.get_rows(self.session, Role, "roles", "all", self.loader)
+        self.assertEqual(self.loader.call_count, 2)
+        self.assertEqual(cache.stats("tenant_a")["backend"], "none")
+
+
+if __name__ == "__main__":
+    unittest.main()
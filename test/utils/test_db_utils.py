@@ -1,7 +1,13 @@
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
-from app.utils.db_utils import get_global_db, get_tenant_session, switch_schema
-from sqlalchemy.orm import Session
+from types import SimpleNamespace
+from app.utils.db_utils import (
+    RequestSession, commit_now, get_db, get_global_db, get_tenant_session, hand_off, switch_schema,
+    open_global_request_session, _dispose_engines_after_fork, _tenant_engines, global_engine
+)
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.sql import text
 
 class TestDBUtils(unittest.TestCase):
@@ -16,18 +22,141 @@ class TestDBUtils(unittest.TestCase):
         mock_session.close.assert_called_once()
 
     @patch("app.utils.db_utils.create_engine")
-    @patch("app.utils.db_utils.sessionmaker")
-    def test_get_tenant_session(self, mock_sessionmaker, mock_create_engine):
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = mock_engine
-        mock_session = MagicMock(spec=Session)
-        mock_sessionmaker.return_value = lambda: mock_session
+    def test_get_tenant_session(self, mock_create_engine):
+        engine = create_engine("sqlite://")
+        mock_create_engine.return_value = engine
+        self.addCleanup(_tenant_engines.pop, "tenant_test", None)
+        self.addCleanup(engine.dispose)
+
+        first = get_tenant_session("tenant_test")
+        second = get_tenant_session("tenant_test")
 
-        session = get_tenant_session("tenant_test")
-        self.assertEqual(session, mock_session)
+        # One engine per tenant: its pool and compiled cache serve every session
         mock_create_engine.assert_called_once()
+        self.assertEqual(mock_create_engine.call_args.kwargs["connect_args"], {"time_zone": "+00:00"})
+        self.assertIs(first.get_bind(), engine)
+        self.assertIs(second.get_bind(), engine)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.info["tenant_schema"], "tenant_test")
+        first.close()
+        second.close()
+
+    @patch("app.utils.db_utils._use_global_schema")
+    def test_global_request_session_connects_lazily(self, mock_use_schema):
+        engine = create_engine("sqlite://")
+        with patch("app.utils.db_utils.GlobalSessionLocal", sessionmaker(bind=engine)):
+            db = open_global_request_session()
+        self.assertEqual(db.info["tenant_schema"], "taskeri_global")
+        self.assertFalse(db.in_transaction())
+        mock_use_schema.assert_not_called()
+
+        db.execute(text("SELECT 1"))
+        mock_use_schema.assert_called_once()
+        db.close()
+        engine.dispose()
+
+    def test_request_session_is_created_on_first_use(self):
+        mock_session = MagicMock(spec=Session)
+        factory = MagicMock(return_value=mock_session)
+        db = RequestSession(factory)
+
+        db.release()
+        factory.assert_not_called()
+
+        db.execute(text("SELECT 1"))
+        db.close(rollback=True)
+        factory.assert_called_once()
+        mock_session.rollback.assert_called_once()
+        mock_session.close.assert_called_once()
+        self.assertFalse(db.started)
+
+    def test_handed_off_request_session_outlives_release(self):
+        mock_session = MagicMock(spec=Session)
+        db = RequestSession(lambda: mock_session, dispose_bind=True)
+        db.execute(text("SELECT 1"))
+
+        close = hand_off(db)
+        db.release()
+        mock_session.close.assert_not_called()
+
+        close()
+        mock_session.close.assert_called_once()
+        mock_session.get_bind.return_value.dispose.assert_called_once()
+
+    def test_unit_of_work_defers_commits_to_the_request(self):
+        mock_session = MagicMock(spec=Session)
+        db = RequestSession(lambda: mock_session, unit_of_work=True)
+
+        db.commit()
+        db.commit()
+        mock_session.flush.assert_called()
+        mock_session.commit.assert_not_called()
+
+        db.commit_request()
+        mock_session.commit.assert_called_once()
+        db.commit_request()
+        mock_session.commit.assert_called_once()
+
+    def test_commit_now_bypasses_the_unit_of_work(self):
+        mock_session = MagicMock(spec=Session)
+        db = RequestSession(lambda: mock_session, unit_of_work=True)
+        db.commit()
+        commit_now(db)
+        mock_session.commit.assert_called_once()
+        self.assertFalse(db.pending_commit)
+
+        plain_session = MagicMock(spec=Session)
+        commit_now(plain_session)
+        plain_session.commit.assert_called_once()
+
+    def test_get_db_commits_request_session_on_success(self):
+        mock_session = MagicMock(spec=Session)
+        db = RequestSession(lambda: mock_session, unit_of_work=True)
+        request = SimpleNamespace(state=SimpleNamespace(db=db))
+
+        async def run():
+            dependency = get_db(request)
+            yielded = await dependency.__anext__()
+            yielded.commit()
+            with self.assertRaises(StopAsyncIteration):
+                await dependency.__anext__()
+
+        asyncio.run(run())
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    def test_get_db_rolls_back_request_session_on_error(self):
+        mock_session = MagicMock(spec=Session)
+        db = RequestSession(lambda: mock_session, unit_of_work=True)
+        request = SimpleNamespace(state=SimpleNamespace(db=db))
+
+        async def run():
+            dependency = get_db(request)
+            yielded = await dependency.__anext__()
+            yielded.commit()
+            with self.assertRaises(ValueError):
+                await dependency.athrow(ValueError("endpoint failed"))
+
+        asyncio.run(run())
+        mock_session.commit.assert_not_called()
+        mock_session.rollback.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    def test_forked_worker_gets_a_fresh_pool(self):
+        tenant_engine = create_engine("sqlite://")
+        self.addCleanup(tenant_engine.dispose)
+        with patch.dict(_tenant_engines, {"tenant_test": tenant_engine}):
+            pools = [global_engine.pool, tenant_engine.pool]
+            with patch.object(pools[0], "dispose") as mock_dispose, \
+                    patch.object(pools[1], "dispose") as mock_tenant_dispose:
+                _dispose_engines_after_fork()
+
+        # The inherited connections are dropped without being closed for the parent
+        mock_dispose.assert_not_called()
+        mock_tenant_dispose.assert_not_called()
+        self.assertIsNot(global_engine.pool, pools[0])
+        self.assertIsNot(tenant_engine.pool, pools[1])
 
-    
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -4,7 +4,7 @@ from app.utils.email_utils import send_account_creation_email
 
 class TestEmailUtils(unittest.TestCase):
 
-    @patch("app.utils.email_utils.FastMail.send_message")
+    @patch("fastapi_mail.FastMail.send_message")
     def test_send_account_creation_email(self, mock_send_message):
         mock_send_message.return_value = None
 
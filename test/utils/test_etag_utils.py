@@ -0,0 +1,119 @@
+import unittest
+from unittest.mock import patch
+from fastapi import HTTPException, Response
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+from app.models.department import Department
+from app.models.role import Role
+from app.models.team import Team
+from app.models.user import User
+from app.repositories.role_repository import RoleRepository
+from app.repositories.team_repository import TeamRepository
+from app.utils.cache_utils import LRUTTLCache, TableVersions
+from app.utils.db_utils import Base
+from app.utils.etag_utils import conditional_get, etag_matches
+
+def make_request(path="/teams", if_none_match=None, user_id=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    request = Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": headers})
+    if user_id is not None:
+        request.state.user_id = user_id
+    return request
+
+class TestEtagUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine, tables=[Team.__table__, Role.__table__])
+        self.session = sessionmaker(bind=self.engine, info={"tenant_schema": "tenant_test"})()
+
+        self.versions = TableVersions(LRUTTLCache())
+        patch("app.utils.cache_utils.table_versions", self.versions).start()
+        patch("app.utils.etag_utils.table_versions", self.versions).start()
+        self.addCleanup(patch.stopall)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def check(self, dependency, **kwargs):
+        response = Response()
+        dependency(make_request(**kwargs), response, db=self.session)
+        return response.headers.get("etag")
+
+    def test_etag_matches(self):
+        self.assertTrue(etag_matches('W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches('"x", W/"abc"', 'W/"abc"'))
+        self.assertTrue(etag_matches("*", '"abc"'))
+        self.assertFalse(etag_matches('"abd"', '"abc"'))
+        self.assertFalse(etag_matches(None, '"abc"'))
+
+    def test_matching_request_returns_304(self):
+        dependency = conditional_get("teams")
+        etag = self.check(dependency)
+        self.assertTrue(etag.startswith('W/"'))
+
+        with self.assertRaises(HTTPException) as context:
+            self.check(dependency, if_none_match=etag)
+        self.assertEqual(context.exception.status_code, 304)
+        self.assertEqual(context.exception.headers["ETag"], etag)
+
+    def test_commit_changes_etag(self):
+        dependency = conditional_get("teams")
+        before = self.check(dependency)
+
+        TeamRepository(self.session).create_team("Core", 1)
+        after = self.check(dependency, if_none_match=before)
+
+        self.assertNotEqual(before, after)
+        self.assertEqual(self.check(dependency), after)
+
+    def test_core_statement_changes_etag(self):
+        dependency = conditional_get("teams")
+        before = self.check(dependency)
+
+        self.session.execute(delete(Team).where(Team.id == 1))
+        self.session.commit()
+
+        self.assertNotEqual(self.check(dependency), before)
+
+    def test_bulk_create_changes_etag(self):
+        dependency = conditional_get("roles")
+        before = self.check(dependency)
+
+        RoleRepository(self.session).create_roles_bulk(["Admin", "Manager"])
+
+        self.assertNotEqual(self.check(dependency), before)
+
+    def test_rollback_keeps_etag(self):
+        dependency = conditional_get("teams")
+        before = self.check(dependency)
+
+        self.session.add(Team(name="Core", department_id=1))
+        self.session.flush()
+        self.session.rollback()
+
+        self.assertEqual(self.check(dependency), before)
+
+    def test_strong_and_per_user_tags(self):
+        dependency = conditional_get("teams", weak=False, per_user=True)
+        first = self.check(dependency, user_id=1)
+        self.assertTrue(first.startswith('"'))
+        self.assertNotEqual(first, self.check(dependency, user_id=2))
+
+    def test_unscoped_session_has_no_etag(self):
+        self.session.info.clear()
+        self.assertIsNone(self.check(conditional_get("teams")))
+
+    def test_delete_cascades_to_dependent_tables(self):
+        cascade = self.versions.cascade(Department.__table__)
+        self.assertIn(Team.__table__.name, cascade)
+        self.assertIn(User.__table__.name, cascade)
+
+
+if __name__ == "__main__":
+    unittest.main()
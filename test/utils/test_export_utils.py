@@ -0,0 +1,57 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from datetime import datetime
+from types import SimpleNamespace
+from app.models.dtos.export_dtos import ExportFormat
+from app.utils.export_utils import iter_csv, iter_ndjson, export_response
+from app.utils.db_utils import iter_keyset
+from app.models.time_log import TimeLog
+from sqlalchemy import select
+
+class TestExportUtils(unittest.TestCase):
+
+    def test_iter_csv(self):
+        rows = [(1, datetime(2025, 5, 17, 10, 0), None), (2, datetime(2025, 5, 18, 9, 30), 45)]
+
+        output = "".join(iter_csv(rows, ["id", "start_time", "duration"]))
+
+        self.assertEqual(
+            output.splitlines(),
+            ["id,start_time,duration", "1,2025-05-17T10:00:00,", "2,2025-05-18T09:30:00,45"]
+        )
+
+    @patch('app.utils.export_utils.ROWS_PER_CHUNK', 2)
+    def test_iter_ndjson_chunks(self):
+        rows = ((i, f"file_{i}.pdf") for i in range(5))
+
+        chunks = list(iter_ndjson(rows, ["id", "file_path"]))
+
+        self.assertEqual(len(chunks), 3)
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(json.loads(lines[4]), {"id": 4, "file_path": "file_4.pdf"})
+
+    def test_export_response_headers(self):
+        response = export_response([], ["id"], ExportFormat.NDJSON, "tasks")
+
+        self.assertEqual(response.media_type, "application/x-ndjson")
+        self.assertIn('filename="tasks.ndjson"', response.headers["content-disposition"])
+
+    def test_iter_keyset_pages(self):
+        mock_db = MagicMock()
+        pages = [
+            [SimpleNamespace(id=1), SimpleNamespace(id=2)],
+            [SimpleNamespace(id=3)],
+        ]
+        mock_db.execute.return_value.all.side_effect = pages
+        stmt = select(TimeLog.id)
+
+        rows = list(iter_keyset(mock_db, stmt, TimeLog.id, batch_size=2))
+
+        self.assertEqual([row.id for row in rows], [1, 2, 3])
+        self.assertEqual(mock_db.execute.call_count, 2)
+        second_stmt = mock_db.execute.call_args_list[1][0][0]
+        self.assertIn("time_logs.id >", str(second_stmt))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from app.utils.metrics_utils import RequestMetrics, clear_metrics_directory
+
+ROUTES = [("GET", "/tasks/{task_id}"), ("PUT", "/tasks/{task_id}"), ("GET", "/users")]
+
+def samples(text):
+    """Map each sample line of an exposition to its value."""
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines() if line and not line.startswith("#")
+    }
+
+class TestRequestMetrics(unittest.TestCase):
+
+    def test_render_requests_histogram_and_statements(self):
+        metrics = RequestMetrics(ROUTES)
+        route = metrics.route_slot("GET", "/tasks/{task_id}")
+        for seconds in (0.003, 0.02, 0.3):
+            metrics.request_started()
+            metrics.request_finished(route, 200, seconds, statements=2, db_seconds=0.001, tenant="acme")
+        metrics.request_started()
+        metrics.request_finished(route, 418, 0.001)
+
+        values = samples(metrics.render())
+        labels = 'method="GET",route="/tasks/{task_id}"'
+        self.assertEqual(values['taskeri_http_requests_total{route="/tasks/{task_id}",method="GET",status="200"}'], 3)
+        self.assertEqual(values['taskeri_http_requests_total{route="/tasks/{task_id}",method="GET",status="4xx"}'], 1)
+        self.assertEqual(values['taskeri_http_request_duration_seconds_bucket{route="/tasks/{task_id}",method="GET",le="0.005"}'], 2)
+        self.assertEqual(values['taskeri_http_request_duration_seconds_bucket{route="/tasks/{task_id}",method="GET",le="0.025"}'], 3)
+        self.assertEqual(values['taskeri_http_request_duration_seconds_bucket{route="/tasks/{task_id}",method="GET",le="+Inf"}'], 4)
+        self.assertEqual(values['taskeri_http_request_duration_seconds_count{route="/tasks/{task_id}",method="GET"}'], 4)
+        self.assertAlmostEqual(values['taskeri_http_request_duration_seconds_sum{route="/tasks/{task_id}",method="GET"}'], 0.324)
+        self.assertEqual(values['taskeri_db_statements_total{route="/tasks/{task_id}",method="GET"}'], 6)
+        self.assertEqual(values['taskeri_tenant_requests_total{tenant="acme"}'], 3)
+        self.assertEqual(values["taskeri_http_requests_in_flight"], 0)
+        # Series without any request are not rendered
+        self.assertNotIn("PUT", metrics.render())
+        self.assertNotIn(labels, values)
+
+    def test_unknown_routes_and_tenant_overflow(self):
+        metrics = RequestMetrics(ROUTES, max_tenants=2)
+        unknown = metrics.route_slot("GET", None)
+        for tenant in ("a", "b", "c", "d"):
+            metrics.request_started()
+            metrics.request_finished(unknown, 404, 0.001, tenant=tenant)
+
+        values = samples(metrics.render())
+        self.assertEqual(values['taskeri_http_requests_total{route="<unmatched>",method="",status="404"}'], 4)
+        self.assertEqual(values['taskeri_tenant_requests_total{tenant="a"}'], 1)
+        self.assertEqual(values['taskeri_tenant_requests_total{tenant="other"}'], 2)
+
+    def test_gauges(self):
+        metrics = RequestMetrics(ROUTES)
+        metrics.request_started()
+        metrics.set_pool_gauges(checked_out=3, overflow=1)
+        metrics.set_cache_outcomes(hits=10, misses=2, uncached=1)
+
+        values = samples(metrics.render())
+        self.assertEqual(values["taskeri_http_requests_in_flight"], 1)
+        self.assertEqual(values["taskeri_db_connections_checked_out"], 3)
+        self.assertEqual(values["taskeri_db_pool_overflow"], 1)
+        self.assertEqual(values['taskeri_db_compiled_cache_total{outcome="hit"}'], 10)
+
+class TestMultiProcessMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_workers_are_added_up(self):
+        # A worker that has exited (its pid no longer exists)
+        with patch("app.utils.metrics_utils.os.getpid", return_value=2 ** 22 + 1):
+            exited = RequestMetrics(ROUTES, directory=self.directory)
+            route = exited.route_slot("GET", "/users")
+            exited.request_started()
+            exited.request_started()
+            exited.request_finished(route, 200, 0.01, tenant="acme")
+            exited.set_pool_gauges(checked_out=5, overflow=0)
+
+        current = RequestMetrics(ROUTES, directory=self.directory)
+        current.request_started()
+        current.request_finished(current.route_slot("GET", "/users"), 200, 0.01, tenant="acme")
+        current.request_started()
+        current.request_finished(current.route_slot("GET", "/users"), 200, 0.01, tenant="globex")
+        current.set_pool_gauges(checked_out=1, overflow=0)
+
+        values = samples(current.render())
+        self.assertEqual(values['taskeri_http_requests_total{route="/users",method="GET",status="200"}'], 3)
+        self.assertEqual(values['taskeri_tenant_requests_total{tenant="acme"}'], 2)
+        self.assertEqual(values['taskeri_tenant_requests_total{tenant="globex"}'], 1)
+        # Gauges of the exited worker (one request still in flight) are ignored
+        self.assertEqual(values["taskeri_http_requests_in_flight"], 0)
+        self.assertEqual(values["taskeri_db_connections_checked_out"], 1)
+
+    def test_files_of_another_layout_are_ignored(self):
+        other = RequestMetrics(ROUTES[:1], directory=self.directory)
+        other.request_started()
+        other.request_finished(0, 200, 0.01)
+
+        values = samples(RequestMetrics(ROUTES, directory=self.directory).render())
+        self.assertFalse(any(name.startswith("taskeri_http_requests_total") for name in values))
+
+    def test_clear_metrics_directory(self):
+        RequestMetrics(ROUTES, directory=self.directory)
+        clear_metrics_directory(self.directory)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
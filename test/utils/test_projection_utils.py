@@ -0,0 +1,53 @@
+import json
+import unittest
+from datetime import date, datetime
+from types import SimpleNamespace
+from fastapi import HTTPException
+from app.models.dtos.project_dtos import ProjectResponse
+from app.repositories.project_repository import ProjectRepository
+from app.utils.projection_utils import parse_fields, projection_columns, read_model, render_list
+from app.utils.response_utils import validate_list
+
+class TestProjectionUtils(unittest.TestCase):
+
+    def test_parse_fields(self):
+        self.assertIsNone(parse_fields(None, ProjectResponse))
+        self.assertIsNone(parse_fields(" , ", ProjectResponse))
+        self.assertEqual(parse_fields("id, name", ProjectResponse), frozenset({"id", "name"}))
+
+    def test_unknown_field_is_rejected(self):
+        with self.assertRaises(HTTPException) as context:
+            parse_fields("name,budget", ProjectResponse)
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertIn("budget", context.exception.detail)
+
+    def test_projection_columns_keep_the_key(self):
+        columns = projection_columns(ProjectRepository.LIST_COLUMNS, frozenset({"name"}))
+        self.assertEqual([column.key for column in columns], ["id", "name"])
+        self.assertEqual(len(projection_columns(ProjectRepository.LIST_COLUMNS, None)), 7)
+
+    def test_read_model(self):
+        self.assertIs(read_model(ProjectResponse, None), ProjectResponse)
+        partial = read_model(ProjectResponse, frozenset({"name"}))
+        self.assertIs(partial, read_model(ProjectResponse, frozenset({"status"})))
+        self.assertTrue(issubclass(partial, ProjectResponse))
+
+    def test_render_list_returns_only_requested_fields(self):
+        fields = frozenset({"name"})
+        rows = [SimpleNamespace(id=1, name="Apollo"), SimpleNamespace(id=2, name="Gemini")]
+
+        rendered = render_list(ProjectResponse, validate_list(read_model(ProjectResponse, fields), rows), fields)
+
+        self.assertEqual(json.loads(rendered.body), [{"name": "Apollo"}, {"name": "Gemini"}])
+
+    def test_render_list_without_fields(self):
+        row = SimpleNamespace(id=1, name="Apollo", description=None, start_date=date(2025, 1, 1),
+                              end_date=None, status="In Progress", created_at=datetime(2025, 1, 1, 9, 0))
+
+        rendered = render_list(ProjectResponse, validate_list(ProjectResponse, [row]))
+
+        self.assertEqual(json.loads(rendered.body)[0]["status"], "In Progress")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from sqlalchemy import column, create_engine, literal_column, select, table, text
+from sqlalchemy.pool import StaticPool
+from app.utils.query_stats_utils import (
+    compiled_cache_stats, current_query_stats, fingerprint, statement_budget, track_queries
+)
+
+class TestQueryStatsUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        with self.engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+            connection.execute(text("INSERT INTO items VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_fingerprint_ignores_values(self):
+        self.assertEqual(
+            fingerprint("SELECT *\n  FROM items WHERE id = 7 AND name = 'it''s'"),
+            "SELECT * FROM items WHERE id = ? AND name = ?"
+        )
+        self.assertEqual(
+            fingerprint("SELECT * FROM items WHERE id IN (%s, %s, %s)"),
+            fingerprint("SELECT * FROM items WHERE id IN (%s)")
+        )
+
+    def test_track_queries_counts_statements(self):
+        self.assertIsNone(current_query_stats())
+        with track_queries() as stats, self.engine.connect() as connection:
+            self.assertIs(current_query_stats(), stats)
+            for item_id in (1, 2, 3):
+                connection.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+            connection.execute(text("SELECT count(*) FROM items"))
+
+        self.assertIsNone(current_query_stats())
+        self.assertEqual(stats.count, 4)
+        self.assertGreater(stats.duration, 0)
+        self.assertEqual(stats.repeated(), [("SELECT name FROM items WHERE id = ?", 3)])
+        self.assertIn('desc="4 statements"', stats.server_timing())
+
+    def test_statement_budget_lists_repeated_statements(self):
+        with self.assertRaises(AssertionError) as raised:
+            with statement_budget(2, label="GET /items"), self.engine.connect() as connection:
+                for item_id in (1, 2, 3):
+                    connection.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+
+        message = str(raised.exception)
+        self.assertIn("GET /items ran 3 SQL statements, budget is 2", message)
+        self.assertIn("3x SELECT name FROM items WHERE id = ?", message)
+
+    def test_statements_outside_a_block_are_ignored(self):
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            pass
+        self.assertEqual(stats.count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+    def test_compiled_cache_outcomes(self):
+        items = table("items", column("id"), column("name"))
+        compiled_cache_stats.reset()
+        with track_queries() as stats, self.engine.connect() as connection:
+            for item_id in (1, 2, 3):
+                connection.execute(select(items.c.name).where(items.c.id == item_id))
+            # A literal rendered into the SQL gives every call its own cache key
+            for item_id in (1, 2):
+                connection.execute(select(items.c.name).where(items.c.id == literal_column(str(item_id))))
+            connection.exec_driver_sql("SELECT 1")
+
+        self.assertEqual(stats.cache_misses, 3)
+        self.assertEqual(compiled_cache_stats.hits, 2)
+        self.assertEqual(compiled_cache_stats.misses, 3)
+        self.assertEqual(compiled_cache_stats.uncached, 1)
+        self.assertEqual(compiled_cache_stats.snapshot()["hit_ratio"], 0.4)
@@ -0,0 +1,52 @@
+import json
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from app.models.dtos.task_dtos import TaskResponse, TaskListResponse
+from app.utils.response_utils import FastJSONResponse, render, type_adapter, validate_list
+
+def task_row(task_id):
+    return SimpleNamespace(
+        id=task_id, name=f"Task {task_id}", project_id=3, description=None,
+        priority="High", status="In Progress", due_date=date(2025, 6, 1),
+        created_at=datetime(2025, 5, 1, 9, 30), updated_at=datetime(2025, 5, 2, 10, 0),
+        assigned_users=[1, 2]
+    )
+
+class TestResponseUtils(unittest.TestCase):
+
+    def test_type_adapter_is_cached(self):
+        self.assertIs(type_adapter(List[TaskResponse]), type_adapter(List[TaskResponse]))
+
+    def test_validate_list(self):
+        tasks = validate_list(TaskResponse, [task_row(1), task_row(2)])
+        self.assertIsInstance(tasks[0], TaskResponse)
+        self.assertEqual([task.id for task in tasks], [1, 2])
+
+    def test_render_matches_default_encoding(self):
+        page = TaskListResponse(items=validate_list(TaskResponse, [task_row(1)]), total=1, page=1, page_size=20)
+
+        rendered = render(TaskListResponse, page)
+
+        self.assertEqual(rendered.media_type, "application/json")
+        self.assertEqual(json.loads(rendered.body), jsonable_encoder(page))
+
+    def test_render_keeps_dependency_headers(self):
+        response = Response()
+        response.headers["ETag"] = 'W/"abc"'
+
+        rendered = render(List[TaskResponse], [], status_code=200, response=response)
+
+        self.assertEqual(rendered.headers["etag"], 'W/"abc"')
+        self.assertEqual(rendered.headers["content-length"], "2")
+
+    def test_decimal_is_encoded_as_string(self):
+        self.assertEqual(FastJSONResponse({"amount": Decimal("1.50")}).body, b'{"amount":"1.50"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import unittest
+from unittest.mock import patch
+from app.utils.server_utils import available_cpus, server_options
+
+class TestServerUtils(unittest.TestCase):
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults(self):
+        options = server_options("0.0.0.0", 10000)
+
+        self.assertEqual(options["app"], "app.app:app")
+        self.assertEqual(options["workers"], available_cpus())
+        self.assertEqual(options["backlog"], 2048)
+        self.assertEqual(options["timeout_keep_alive"], 65)
+        self.assertIsNone(options["limit_max_requests"])
+        self.assertEqual(options["timeout_graceful_shutdown"], 30)
+        self.assertFalse(options["reload"])
+
+    @patch.dict(os.environ, {
+        "WEB_CONCURRENCY": "3", "SERVER_BACKLOG": "512", "SERVER_KEEP_ALIVE_SECONDS": "120",
+        "SERVER_LIMIT_MAX_REQUESTS": "10000", "SERVER_GRACEFUL_TIMEOUT_SECONDS": "15"
+    }, clear=True)
+    def test_environment_overrides(self):
+        options = server_options("127.0.0.1", 8000)
+
+        self.assertEqual((options["host"], options["port"]), ("127.0.0.1", 8000))
+        self.assertEqual(options["workers"], 3)
+        self.assertEqual(options["backlog"], 512)
+        self.assertEqual(options["timeout_keep_alive"], 120)
+        self.assertEqual(options["limit_max_requests"], 10000)
+        self.assertEqual(options["timeout_graceful_shutdown"], 15)
+
+    @patch("app.utils.server_utils._is_installed")
+    def test_fast_loop_and_parser_when_installed(self, mock_is_installed):
+        mock_is_installed.return_value = True
+        options = server_options("0.0.0.0", 10000)
+        self.assertEqual((options["loop"], options["http"]), ("uvloop", "httptools"))
+
+        mock_is_installed.return_value = False
+        options = server_options("0.0.0.0", 10000)
+        self.assertEqual((options["loop"], options["http"]), ("asyncio", "h11"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from app.utils.tracing_utils import (
+    KIND_CLIENT, FileSpanExporter, Span, Trace, activate, current_span, parse_traceparent, span, to_otlp, traced
+)
+
+@traced
+class Repository:
+
+    def find(self, item_id):
+        with span("lookup", item_id=item_id):
+            return {"id": item_id}
+
+    async def find_async(self, item_id):
+        await asyncio.sleep(0)
+        return {"id": item_id}
+
+    def fail(self):
+        raise ValueError("boom")
+
+    def _helper(self):
+        return current_span()
+
+def start_trace():
+    trace = Trace()
+    return trace.add(Span(trace, "GET /items", None))
+
+class TestSpans(unittest.TestCase):
+
+    def test_no_spans_outside_a_trace(self):
+        self.assertEqual(Repository().find(1), {"id": 1})
+        with span("anything") as recorded:
+            self.assertIsNone(recorded)
+
+    def test_traced_methods_nest_under_the_current_span(self):
+        root = start_trace()
+        with activate(root):
+            Repository().find(1)
+            asyncio.run(Repository().find_async(2))
+
+        spans = {(recorded.name, recorded.attributes.get("item_id")): recorded for recorded in root.trace.spans}
+        find = spans[("Repository.find", None)]
+        self.assertEqual(find.parent_id, root.span_id)
+        self.assertEqual(spans[("lookup", 1)].parent_id, find.span_id)
+        self.assertEqual(spans[("Repository.find_async", None)].parent_id, root.span_id)
+        self.assertTrue(all(recorded.end_ns is not None for recorded in root.trace.spans))
+        self.assertIsNone(current_span())
+
+    def test_errors_and_private_methods(self):
+        root = start_trace()
+        with activate(root):
+            with self.assertRaises(ValueError):
+                Repository().fail()
+            # Private methods are not wrapped, so they see the caller's span
+            self.assertIs(Repository()._helper(), root)
+
+        self.assertEqual(root.trace.spans[1].error, "ValueError: boom")
+        self.assertIsNone(root.error)
+
+    def test_sql_statements_are_spans(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        root = start_trace()
+        with activate(root), engine.connect() as connection:
+            connection.execute(text("SELECT 1 WHERE 2 = :value"), {"value": 2})
+        engine.dispose()
+
+        statement = root.trace.spans[-1]
+        self.assertEqual((statement.name, statement.kind, statement.parent_id), ("sql", KIND_CLIENT, root.span_id))
+        self.assertIsNotNone(statement.end_ns)
+        # Literals are replaced when the span is exported
+        attributes = to_otlp([root.trace])["resourceSpans"][0]["scopeSpans"][0]["spans"][-1]["attributes"]
+        self.assertEqual(attributes, [{"key": "db.statement", "value": {"stringValue": "SELECT ? WHERE ? = ?"}}])
+
+    def test_parse_traceparent(self):
+        trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+        self.assertEqual(parse_traceparent(f"00-{trace_id}-{parent_id}-01"), (trace_id, parent_id, True))
+        self.assertEqual(parse_traceparent(f"00-{trace_id}-{parent_id}-00"), (trace_id, parent_id, False))
+        self.assertIsNone(parse_traceparent(f"00-{'0' * 32}-{parent_id}-01"))
+        self.assertIsNone(parse_traceparent("garbage"))
+        self.assertIsNone(parse_traceparent(None))
+
+class TestFileSpanExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_traces_are_written_as_otlp_json_lines(self):
+        path = os.path.join(self.directory, "traces.jsonl")
+        exporter = FileSpanExporter(path)
+        roots = [start_trace() for _ in range(3)]
+        for root in roots:
+            with activate(root):
+                Repository().find(1)
+            exporter.export(root.trace)
+        exporter.shutdown()
+
+        with open(path) as file:
+            batches = [json.loads(line) for line in file]
+        spans = [otlp for batch in batches
+                 for otlp in batch["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+        self.assertEqual(len(spans), 9)
+        self.assertEqual({otlp["traceId"] for otlp in spans}, {root.trace.trace_id for root in roots})
+        self.assertEqual(batches[0]["resourceSpans"][0]["resource"]["attributes"][0]["value"], {"stringValue": "taskeri"})
+        find = next(otlp for otlp in spans if otlp["name"] == "Repository.find")
+        self.assertEqual(find["status"], {"code": 0})
+        self.assertLessEqual(int(find["startTimeUnixNano"]), int(find["endTimeUnixNano"]))
+
+    def test_full_queue_drops_traces(self):
+        exporter = FileSpanExporter(os.path.join(self.directory, "traces.jsonl"), max_queue=1)
+        exporter.write = lambda payload: None
+        exporter._start()
+        exporter._queue.put(None)  # stop the thread so the queue stays full
+        exporter._thread.join()
+        exporter._queue.put(Trace())
+        exporter.export(Trace())
+        self.assertEqual(exporter.dropped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from app.utils.user_import_utils import parse_user_import
+
+class TestUserImportUtils(unittest.TestCase):
+
+    def test_parse_csv(self):
+        body = (
+            "\ufeffemail,first_name,last_name,team_id\n"
+            "a@example.com,Ann,Lee,3\n"
+            "b@example.com,Bob,Ray,\n"
+        ).encode("utf-8")
+
+        rows = parse_user_import(body, "text/csv; charset=utf-8")
+
+        self.assertEqual(rows, [
+            {"email": "a@example.com", "first_name": "Ann", "last_name": "Lee", "team_id": "3"},
+            {"email": "b@example.com", "first_name": "Bob", "last_name": "Ray"},
+        ])
+
+    def test_parse_json(self):
+        rows = parse_user_import(b'[{"email": "a@example.com", "role_id": 2}]', "application/json")
+        self.assertEqual(rows, [{"email": "a@example.com", "role_id": 2}])
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_user_import(b'{"email": "a@example.com"}', "application/json")
+        with self.assertRaises(ValueError):
+            parse_user_import(b"email\na@example.com", "text/plain")
+
+if __name__ == "__main__":
+    unittest.main()